@@ -49,9 +49,13 @@ else
     --attribute-definitions \
       AttributeName=account_id,AttributeType=S \
       AttributeName=created_at,AttributeType=N \
+      AttributeName=expiry_bucket,AttributeType=S \
+      AttributeName=end_date_time,AttributeType=N \
     --key-schema \
       AttributeName=account_id,KeyType=HASH \
       AttributeName=created_at,KeyType=RANGE \
+    --global-secondary-indexes \
+      'IndexName=expiry_bucket-end_date_time-index,KeySchema=[{AttributeName=expiry_bucket,KeyType=HASH},{AttributeName=end_date_time,KeyType=RANGE}],Projection={ProjectionType=ALL},ProvisionedThroughput={ReadCapacityUnits=1,WriteCapacityUnits=1}' \
     --provisioned-throughput ReadCapacityUnits=1,WriteCapacityUnits=1 \
     --endpoint-url "$ENDPOINT" \
     --no-cli-pager >/dev/null
@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Request
+from typing import Annotated
+
+from fastapi import APIRouter, Request, Security
+from fastapi.responses import JSONResponse
 
 from infrastructure.configuration.app import get_app_settings
-from infrastructure.security import get_limiter
+from infrastructure.health import get_health_status_registry
+from infrastructure.security import get_current_user, get_limiter
+from infrastructure.security.models import User
 
 router = APIRouter(tags=["System"])
 limiter = get_limiter()
@@ -22,3 +27,44 @@ def get_version(request: Request):  # pylint: disable=unused-argument
 def get_health(request: Request):  # pylint: disable=unused-argument
     """Healthcheck endpoint."""
     return {"status": "ok"}
+
+
+@router.get("/health/integrations")
+@limiter.limit("50/minute")
+def get_integration_health(
+    request: Request,  # pylint: disable=unused-argument
+    current_user: Annotated[User, Security(get_current_user)],  # pylint: disable=unused-argument
+):
+    """Last recorded integration healthcheck results (authenticated).
+
+    Served from the status registry filled by the scheduled healthchecks; no
+    integration is called. Error details stay in the logs.
+    """
+    snapshot = get_health_status_registry().snapshot()
+    integrations = {
+        name: {key: value for key, value in entry.items() if key != "error"} for name, entry in sorted(snapshot.items())
+    }
+    return {"integrations": integrations}
+
+
+# Liveness and readiness probes are polled by the orchestrator and are exempt from rate limits.
+@router.get("/health/liveness")
+def get_liveness():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "ok"}
+
+
+@router.get("/health/readiness")
+def get_readiness(request: Request):
+    """Readiness probe: 200 once every required startup phase has succeeded.
+
+    Optional warmups may still be running; their status is reported in the
+    payload but does not affect readiness.
+    """
+    readiness = getattr(request.app.state, "readiness", None)
+    if readiness is None:
+        return JSONResponse(status_code=503, content={"status": "starting", "phases": {}})
+    snapshot = readiness.snapshot()
+    if not snapshot["ready"]:
+        return JSONResponse(status_code=503, content={"status": "starting", "phases": snapshot["phases"]})
+    return {"status": "ready", "phases": snapshot["phases"]}
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Generate the plugin manifest used for lazy plugin discovery.
+
+Imports every package under packages/ and modules/, records which ones
+implement feature lifecycle hooks, and writes the index read when
+PLUGIN_MANIFEST_PATH is set. Re-run after adding, removing or renaming a
+hookimpl; --check exits non-zero when the committed manifest is stale.
+
+Usage:
+    python3 bin/generate_plugin_manifest.py [--output PATH] [--check]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(APP_ROOT))
+
+from infrastructure.plugins.manager import FEATURE_BASE_PATHS, get_plugin_manager  # noqa: E402
+from infrastructure.plugins.manifest import build_plugin_manifest, dump_plugin_manifest  # noqa: E402
+
+DEFAULT_OUTPUT = APP_ROOT / "infrastructure" / "plugins" / "plugin_manifest.json"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Manifest file to write")
+    parser.add_argument("--check", action="store_true", help="Fail if the manifest is out of date instead of writing it")
+    args = parser.parse_args()
+
+    # Package discovery uses paths relative to the app root.
+    os.chdir(APP_ROOT)
+    content = dump_plugin_manifest(build_plugin_manifest(get_plugin_manager(), FEATURE_BASE_PATHS))
+
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current != content:
+            print(f"{args.output} is out of date; run python3 bin/generate_plugin_manifest.py", file=sys.stderr)
+            return 1
+        return 0
+
+    args.output.write_text(content, encoding="utf-8")
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
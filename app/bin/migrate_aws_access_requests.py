@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Migrate aws_access_requests items to the expiry index layout.
+
+Converts string-encoded start_date_time/end_date_time values to numbers and
+adds expiry_bucket to unexpired requests so they appear in the sparse
+``expiry_bucket-end_date_time-index`` GSI queried by the revoke job.
+
+Run once after the GSI exists (terraform apply) and the new code is deployed;
+the migration skips items already in the new layout, so re-running it is safe.
+
+Usage:
+    python3 bin/migrate_aws_access_requests.py [--dry-run]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from modules.aws import aws_access_requests  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Count items to migrate without writing")
+    args = parser.parse_args()
+
+    result = aws_access_requests.migrate_to_expiry_index(dry_run=args.dry_run)
+    print(json.dumps(result))
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -89,7 +89,7 @@ class DirectoryClient:
             request = service.users().get(userKey=user_key)
             return request.execute()
 
-        return execute_google_api_call("get_user", api_call)
+        return execute_google_api_call("get_user", api_call, api="directory")
 
     def list_users(
         self,
@@ -130,7 +130,7 @@ class DirectoryClient:
 
             return all_users
 
-        return execute_google_api_call("list_users", api_call)
+        return execute_google_api_call("list_users", api_call, api="directory")
 
     def create_user(
         self,
@@ -158,7 +158,7 @@ class DirectoryClient:
             request = service.users().insert(body=body)
             return request.execute()
 
-        return execute_google_api_call("create_user", api_call)
+        return execute_google_api_call("create_user", api_call, api="directory")
 
     def update_user(
         self,
@@ -188,7 +188,7 @@ class DirectoryClient:
             request = service.users().update(userKey=user_key, body=body)
             return request.execute()
 
-        return execute_google_api_call("update_user", api_call)
+        return execute_google_api_call("update_user", api_call, api="directory")
 
     def delete_user(
         self,
@@ -217,7 +217,7 @@ class DirectoryClient:
             request.execute()
             return None
 
-        return execute_google_api_call("delete_user", api_call)
+        return execute_google_api_call("delete_user", api_call, api="directory")
 
     def get_group(
         self,
@@ -245,7 +245,7 @@ class DirectoryClient:
             request = service.groups().get(groupKey=group_key)
             return request.execute()
 
-        return execute_google_api_call("get_group", api_call)
+        return execute_google_api_call("get_group", api_call, api="directory")
 
     def list_groups(
         self,
@@ -286,7 +286,7 @@ class DirectoryClient:
 
             return all_groups
 
-        return execute_google_api_call("list_groups", api_call)
+        return execute_google_api_call("list_groups", api_call, api="directory")
 
     def health_check(
         self,
@@ -322,7 +322,7 @@ class DirectoryClient:
             request = service.customers().get(customerKey=customer_id)
             return cast(dict[str, Any], request.execute())
 
-        return execute_google_api_call("directory_health_check", api_call)
+        return execute_google_api_call("directory_health_check", api_call, api="directory")
 
     def create_group(
         self,
@@ -350,7 +350,7 @@ class DirectoryClient:
             request = service.groups().insert(body=body)
             return request.execute()
 
-        return execute_google_api_call("create_group", api_call)
+        return execute_google_api_call("create_group", api_call, api="directory")
 
     def update_group(
         self,
@@ -380,7 +380,7 @@ class DirectoryClient:
             request = service.groups().update(groupKey=group_key, body=body)
             return request.execute()
 
-        return execute_google_api_call("update_group", api_call)
+        return execute_google_api_call("update_group", api_call, api="directory")
 
     def delete_group(
         self,
@@ -409,7 +409,7 @@ class DirectoryClient:
             request.execute()
             return None
 
-        return execute_google_api_call("delete_group", api_call)
+        return execute_google_api_call("delete_group", api_call, api="directory")
 
     def list_members(
         self,
@@ -449,7 +449,7 @@ class DirectoryClient:
 
             return all_members
 
-        return execute_google_api_call("list_members", api_call)
+        return execute_google_api_call("list_members", api_call, api="directory")
 
     def add_member(
         self,
@@ -479,7 +479,7 @@ class DirectoryClient:
             request = service.members().insert(groupKey=group_key, body=body)
             return request.execute()
 
-        return execute_google_api_call("add_member", api_call)
+        return execute_google_api_call("add_member", api_call, api="directory")
 
     def remove_member(
         self,
@@ -510,7 +510,7 @@ class DirectoryClient:
             request.execute()
             return None
 
-        return execute_google_api_call("remove_member", api_call)
+        return execute_google_api_call("remove_member", api_call, api="directory")
 
     def get_member(
         self,
@@ -540,7 +540,7 @@ class DirectoryClient:
             request = service.members().get(groupKey=group_key, memberKey=member_key)
             return request.execute()
 
-        return execute_google_api_call("get_member", api_call)
+        return execute_google_api_call("get_member", api_call, api="directory")
 
     def has_member(
         self,
@@ -570,7 +570,7 @@ class DirectoryClient:
             request = service.members().hasMember(groupKey=group_key, memberKey=member_key)
             return request.execute()
 
-        return execute_google_api_call("has_member", api_call)
+        return execute_google_api_call("has_member", api_call, api="directory")
 
     def get_batch_users(
         self,
@@ -612,7 +612,7 @@ class DirectoryClient:
             users_by_key: dict[str, dict | None] = {k: results.get(k) for k in user_keys}
             return users_by_key
 
-        result = execute_google_api_call("get_batch_users", api_call)
+        result = execute_google_api_call("get_batch_users", api_call, api="directory")
         if result.is_success:
             return OperationResult.success(data=result.data, message="Batch users retrieved successfully")
         return result
@@ -657,7 +657,7 @@ class DirectoryClient:
             groups_by_key: dict[str, dict | None] = {k: results.get(k) for k in group_keys}
             return groups_by_key
 
-        result = execute_google_api_call("get_batch_groups", api_call)
+        result = execute_google_api_call("get_batch_groups", api_call, api="directory")
         if result.is_success:
             return OperationResult.success(data=result.data, message="Batch groups retrieved successfully")
         return result
@@ -706,7 +706,7 @@ class DirectoryClient:
 
             return all_groups
 
-        return execute_google_api_call("list_user_groups", api_call)
+        return execute_google_api_call("list_user_groups", api_call, api="directory")
 
     def get_batch_members_for_user(
         self,
@@ -755,7 +755,7 @@ class DirectoryClient:
             members_by_group: dict[str, dict | None] = {k: results.get(k) for k in group_keys}
             return members_by_group
 
-        result = execute_google_api_call("get_batch_members_for_user", api_call)
+        result = execute_google_api_call("get_batch_members_for_user", api_call, api="directory")
         if result.is_success:
             return OperationResult.success(
                 data=result.data,
@@ -813,7 +813,7 @@ class DirectoryClient:
 
             return members_by_group
 
-        result = execute_google_api_call("get_batch_group_members", api_call)
+        result = execute_google_api_call("get_batch_group_members", api_call, api="directory")
         if result.is_success:
             return OperationResult.success(data=result.data, message="Batch group members retrieved successfully")
         return result
@@ -1,5 +1,13 @@
-"""Low-level Google API execution utilities with retry and error handling."""
+"""Low-level Google API execution utilities with retry and error handling.
 
+Calls are paced by the process-wide ``GoogleApiRateController``: each API
+has an adaptive token bucket that slows down on 429s and honours
+``Retry-After``. A 429 without ``Retry-After`` waits out most of the quota
+window (``rate_limit_delay``), 5xx retries wait a full-jitter backoff, and
+every retry must be covered by the shared retry budget.
+"""
+
+import random
 import time
 from collections.abc import Callable
 from typing import Any
@@ -7,6 +15,12 @@ from typing import Any
 import structlog
 from googleapiclient.errors import HttpError
 
+from infrastructure.clients.google_workspace.rate_control import (
+    GoogleApiRateController,
+    full_jitter_delay,
+    get_google_api_rate_controller,
+    parse_retry_after,
+)
 from infrastructure.operations.result import OperationResult
 
 logger = structlog.get_logger()
@@ -16,33 +30,47 @@ logger = structlog.get_logger()
 ERROR_CONFIG: dict[str, Any] = {
     "retry_errors": [429, 500, 502, 503, 504],
     "rate_limit_delay": 60,
+    "max_backoff_seconds": 60,
     "default_max_retries": 3,
     "default_backoff_factor": 1.0,
 }
 
 
-def _calculate_retry_delay(attempt: int, status_code: int) -> float:
-    """Calculate retry delay based on attempt and error type.
+def _calculate_retry_delay(attempt: int, status_code: int, retry_after: float | None = None) -> float:
+    """Calculate retry delay based on attempt, error type and the server's Retry-After.
 
     Args:
         attempt: Current attempt number (0-indexed)
         status_code: HTTP status code from error response
+        retry_after: Seconds requested by the Retry-After header, if any
 
     Returns:
-        Delay in seconds before next retry
+        Delay in seconds before next retry: ``retry_after`` when given; for a
+        429 a delay between half and all of ``rate_limit_delay`` so per-minute
+        quotas can reset; otherwise a full-jitter backoff capped at
+        ``max_backoff_seconds``
     """
+    if retry_after is not None:
+        return retry_after
     if status_code == 429:
-        rate_limit_delay: float = ERROR_CONFIG["rate_limit_delay"]  # type: ignore
-        return float(rate_limit_delay)
-    else:
-        backoff_factor: float = ERROR_CONFIG["default_backoff_factor"]  # type: ignore
-        return float(backoff_factor) * (2**attempt)
+        rate_limit_delay = float(ERROR_CONFIG["rate_limit_delay"])
+        return random.uniform(rate_limit_delay / 2, rate_limit_delay)  # noqa: S311 -- retry jitter, not used for security
+    backoff_factor: float = ERROR_CONFIG["default_backoff_factor"]  # type: ignore
+    max_backoff: float = ERROR_CONFIG["max_backoff_seconds"]  # type: ignore
+    return full_jitter_delay(attempt, float(backoff_factor), float(max_backoff))
+
+
+def _api_name(operation_name: str) -> str:
+    """Derive the API from a dotted operation name, e.g. "drive.files.get" -> "drive"."""
+    return operation_name.split(".", 1)[0] if "." in operation_name else "default"
 
 
 def execute_google_api_call(
     operation_name: str,
     api_callable: Callable[[], Any],
     max_retries: int | None = None,
+    api: str | None = None,
+    rate_controller: GoogleApiRateController | None = None,
 ) -> OperationResult:
     """Execute a Google API call with retry logic and error handling.
 
@@ -50,6 +78,9 @@ def execute_google_api_call(
         operation_name: Name of operation for logging (e.g., "list_users")
         api_callable: Callable that executes the API call (e.g., request.execute)
         max_retries: Maximum retry attempts (uses default if None)
+        api: API whose rate limiter paces the call (derived from a dotted
+            operation name if None)
+        rate_controller: Rate controller to use (process-wide one if None)
 
     Returns:
         OperationResult with standardized status, message, data, error_code
@@ -64,19 +95,24 @@ def execute_google_api_call(
     max_attempts = max_retries if max_retries is not None else max_retries_config
     retry_errors_list: list[int] = ERROR_CONFIG["retry_errors"]  # type: ignore
     retry_codes = set(retry_errors_list)
+    controller = rate_controller or get_google_api_rate_controller()
+    limiter = controller.limiter(api or _api_name(operation_name))
+    controller.retry_budget.record_request()
 
     last_exception: Exception | None = None
 
     for attempt in range(max_attempts + 1):
         try:
-            log = logger.bind(operation=operation_name)
+            log = logger.bind(operation=operation_name, api=limiter.api)
             log.debug(
                 "google_api_call_attempt",
                 attempt=attempt + 1,
                 max_attempts=max_attempts + 1,
             )
 
+            limiter.acquire()
             result = api_callable()
+            limiter.record_success()
 
             if attempt > 0:
                 log.info("google_api_retry_success", attempt=attempt + 1)
@@ -94,18 +130,25 @@ def execute_google_api_call(
             last_exception = e
             is_last_attempt = attempt == max_attempts
             status_code = int(e.resp.status)
+            retry_after = parse_retry_after(e)
+            if status_code == 429:
+                limiter.record_throttle(retry_after)
+                log.warning("google_api_throttled", rate_per_second=round(limiter.rate, 3), retry_after=retry_after)
 
             # Retry logic for retryable errors
             if status_code in retry_codes and not is_last_attempt:
-                delay = _calculate_retry_delay(attempt, status_code)
-                log.warning(
-                    "google_api_retrying",
-                    attempt=attempt + 1,
-                    status_code=status_code,
-                    delay=delay,
-                )
-                time.sleep(delay)
-                continue
+                if controller.retry_budget.try_acquire():
+                    delay = _calculate_retry_delay(attempt, status_code, retry_after)
+                    limiter.record_retry()
+                    log.warning(
+                        "google_api_retrying",
+                        attempt=attempt + 1,
+                        status_code=status_code,
+                        delay=delay,
+                    )
+                    time.sleep(delay)
+                    continue
+                log.warning("google_api_retry_budget_exhausted", attempt=attempt + 1, status_code=status_code)
 
             # Non-retryable or last attempt
             log.error(
@@ -0,0 +1,324 @@
+"""Process-wide adaptive pacing and retry budget for Google Workspace API calls.
+
+Every call made through ``execute_google_api_call`` takes a token from the
+``AdaptiveRateLimiter`` of its API (``directory``, ``drive``, ``sheets``...).
+The limiter is an AIMD token bucket: its rate grows additively while calls
+succeed and is cut multiplicatively on a 429, and a ``Retry-After`` header
+pauses every caller of that API until it expires. Because the state is
+shared by all threads, concurrent callers that hit quota slow down together
+instead of retrying in lockstep.
+
+``RetryBudget`` caps retry amplification across all APIs: each request
+deposits a fraction of a retry token, each retry spends a whole one, and a
+small reserve refills over time so a quiet process can still retry.
+``GoogleApiRateController.stats()`` reports throttle events, retries and
+the effective request rate per API.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any
+
+from infrastructure.configuration.integrations.google import get_google_workspace_settings
+
+DEFAULT_WINDOW_SECONDS = 60.0
+DEFAULT_DECREASE_FACTOR = 0.5
+# At most one multiplicative decrease per cooldown, so one burst of 429s
+# from concurrent callers counts as a single congestion event.
+DEFAULT_DECREASE_COOLDOWN_SECONDS = 1.0
+
+
+def full_jitter_delay(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """Return a random delay between 0 and ``min(max_seconds, base_seconds * 2**attempt)``."""
+    return random.uniform(0, min(max_seconds, base_seconds * (2**attempt)))  # noqa: S311 -- retry jitter, not used for security
+
+
+def parse_retry_after(error: Any) -> float | None:
+    """Return the ``Retry-After`` delay of an HttpError in seconds, or None.
+
+    Accepts both forms of the header: a number of seconds or an HTTP date.
+    """
+    resp = getattr(error, "resp", None)
+    value = resp.get("retry-after") if hasattr(resp, "get") else None
+    if isinstance(value, (int, float)):
+        return max(float(value), 0.0)
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class AdaptiveRateLimiter:
+    """AIMD token bucket pacing the calls made to one Google API.
+
+    Args:
+        api: API name used in stats.
+        initial_rate: Starting rate in requests per second.
+        min_rate: Floor the rate is never cut below.
+        max_rate: Ceiling the rate never grows past.
+        additive_increase: Requests per second added for each second of
+            successful calls at the current rate.
+        decrease_factor: Factor applied to the rate on a throttle.
+        window_seconds: Window of the effective request rate.
+        clock: Monotonic clock in seconds (injectable for tests).
+        sleep: Sleep function (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        api: str,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        additive_increase: float = 1.0,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.api = api
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._rate = min(max(initial_rate, min_rate), max_rate)
+        self._additive_increase = additive_increase
+        self._decrease_factor = decrease_factor
+        self._window_seconds = window_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = 1.0
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._sent: deque[float] = deque()
+        self._requests = 0
+        self._throttles = 0
+        self._retries = 0
+        self._waited_seconds = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Current allowed rate in requests per second."""
+        with self._lock:
+            return self._rate
+
+    def acquire(self) -> float:
+        """Wait for a token at the current rate, or for a Retry-After pause to end.
+
+        The token is reserved up front (the bucket may go negative) and the
+        caller sleeps until it is due, so concurrent callers queue behind
+        each other at the current rate.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                # The bucket holds at most one second of calls at the current rate.
+                capacity = max(1.0, self._rate)
+                self._tokens = min(capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens -= 1
+                    delay = max(-self._tokens / self._rate, 0.0)
+                    self._requests += 1
+                    self._sent.append(now + delay)
+                    self._trim(now)
+                    self._waited_seconds += waited + delay
+                    break
+            self._sleep(delay)
+            waited += delay
+        if delay > 0:
+            self._sleep(delay)
+        return waited + delay
+
+    def record_success(self) -> None:
+        """Additive increase after a successful call."""
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + self._additive_increase / self._rate)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease after a throttled call, pausing for ``retry_after`` if given."""
+        with self._lock:
+            now = self._clock()
+            self._throttles += 1
+            if now - self._last_decrease >= DEFAULT_DECREASE_COOLDOWN_SECONDS:
+                self._rate = max(self._min_rate, self._rate * self._decrease_factor)
+                self._last_decrease = now
+                self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def record_retry(self) -> None:
+        """Count a retry of a call to this API."""
+        with self._lock:
+            self._retries += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the current rate, counters and effective request rate."""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            return {
+                "rate_per_second": round(self._rate, 3),
+                "effective_rate_per_second": round(len(self._sent) / self._window_seconds, 3),
+                "requests": self._requests,
+                "throttles": self._throttles,
+                "retries": self._retries,
+                "waited_seconds": round(self._waited_seconds, 3),
+                "paused_seconds": round(max(self._paused_until - now, 0.0), 3),
+            }
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self._window_seconds
+        while self._sent and self._sent[0] <= cutoff:
+            self._sent.popleft()
+
+
+class RetryBudget:
+    """Shared cap on retries as a fraction of requests.
+
+    Args:
+        ratio: Retry tokens deposited per request, e.g. 0.2 allows retries
+            to add at most 20% on top of the request volume.
+        min_per_second: Retry tokens refilled per second regardless of volume.
+        max_tokens: Maximum tokens held (defaults to ten seconds of refill,
+            and at least 10).
+        clock: Monotonic clock in seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        min_per_second: float,
+        max_tokens: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._max_tokens = max_tokens if max_tokens is not None else max(10.0, min_per_second * 10)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self._max_tokens
+        self._updated = clock()
+        self._allowed = 0
+        self._denied = 0
+
+    def record_request(self) -> None:
+        """Deposit the retry share of one request."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_acquire(self) -> bool:
+        """Spend one retry token; False when the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._allowed += 1
+                return True
+            self._denied += 1
+            return False
+
+    def stats(self) -> dict[str, Any]:
+        """Return the tokens left and the retries allowed and denied."""
+        with self._lock:
+            self._refill()
+            return {"tokens": round(self._tokens, 3), "allowed": self._allowed, "denied": self._denied}
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._max_tokens, self._tokens + (now - self._updated) * self._min_per_second)
+        self._updated = now
+
+
+class GoogleApiRateController:
+    """Per-API adaptive limiters and the shared retry budget.
+
+    Args:
+        initial_rate: Starting rate of each API in requests per second.
+        min_rate: Floor of each API's rate.
+        max_rate: Ceiling of each API's rate.
+        retry_budget: Budget shared by every API.
+        clock: Monotonic clock in seconds (injectable for tests).
+        sleep: Sleep function used while pacing (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        retry_budget: RetryBudget,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._initial_rate = initial_rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self.retry_budget = retry_budget
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._limiters: dict[str, AdaptiveRateLimiter] = {}
+
+    def limiter(self, api: str) -> AdaptiveRateLimiter:
+        """Return the limiter of ``api``, creating it on first use."""
+        limiter = self._limiters.get(api)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(api)
+                if limiter is None:
+                    limiter = AdaptiveRateLimiter(
+                        api,
+                        initial_rate=self._initial_rate,
+                        min_rate=self._min_rate,
+                        max_rate=self._max_rate,
+                        clock=self._clock,
+                        sleep=self._sleep,
+                    )
+                    self._limiters[api] = limiter
+        return limiter
+
+    def stats(self) -> dict[str, Any]:
+        """Return the stats of every API limiter and of the retry budget."""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {
+            "apis": {api: limiter.stats() for api, limiter in sorted(limiters.items())},
+            "retry_budget": self.retry_budget.stats(),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_google_api_rate_controller() -> GoogleApiRateController:
+    """Singleton provider for the process-wide Google API rate controller."""
+    settings = get_google_workspace_settings()
+    return GoogleApiRateController(
+        initial_rate=settings.GOOGLE_API_INITIAL_RATE_PER_SECOND,
+        min_rate=settings.GOOGLE_API_MIN_RATE_PER_SECOND,
+        max_rate=settings.GOOGLE_API_MAX_RATE_PER_SECOND,
+        retry_budget=RetryBudget(
+            ratio=settings.GOOGLE_API_RETRY_BUDGET_RATIO,
+            min_per_second=settings.GOOGLE_API_RETRY_BUDGET_MIN_PER_SECOND,
+        ),
+    )
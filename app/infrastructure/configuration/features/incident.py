@@ -14,6 +14,10 @@ class IncidentFeatureSettings(FeatureSettings):
         INCIDENT_CHANNEL: Slack channel ID for incident notifications
         SLACK_SECURITY_USER_GROUP_ID: Security team user group ID for mentions
         SLACK_NOTIFY_MGMT_USER_GROUP_ID: Notify management team user group ID for Notify product incidents
+        INCIDENT_BOOTSTRAP_STEP_TIMEOUT_SECONDS: Maximum run time of one incident bootstrap step (default: 30)
+        INCIDENT_BOOTSTRAP_MAX_WORKERS: Maximum number of incident bootstrap steps running at once (default: 6)
+        INCIDENT_FOLDER_INDEX_TTL_SECONDS: Seconds the product folder index is served before it is reloaded (default: 900)
+        INCIDENT_ONCALL_CACHE_TTL_SECONDS: Seconds the on-call users of a schedule are cached (default: 60, 0 disables)
 
     Example:
         ```python
@@ -29,6 +33,14 @@ class IncidentFeatureSettings(FeatureSettings):
     INCIDENT_CHANNEL: str | None = Field(default=None, alias="INCIDENT_CHANNEL")
     SLACK_SECURITY_USER_GROUP_ID: str | None = Field(default=None, alias="SLACK_SECURITY_USER_GROUP_ID")
     SLACK_NOTIFY_MGMT_USER_GROUP_ID: str | None = Field(default=None, alias="SLACK_NOTIFY_MGMT_USER_GROUP_ID")
+    INCIDENT_BOOTSTRAP_STEP_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        alias="INCIDENT_BOOTSTRAP_STEP_TIMEOUT_SECONDS",
+    )
+    INCIDENT_BOOTSTRAP_MAX_WORKERS: int = Field(default=6, ge=1, alias="INCIDENT_BOOTSTRAP_MAX_WORKERS")
+    INCIDENT_FOLDER_INDEX_TTL_SECONDS: float = Field(default=900.0, gt=0, alias="INCIDENT_FOLDER_INDEX_TTL_SECONDS")
+    INCIDENT_ONCALL_CACHE_TTL_SECONDS: float = Field(default=60.0, ge=0, alias="INCIDENT_ONCALL_CACHE_TTL_SECONDS")
 
 
 @lru_cache(maxsize=1)
@@ -17,6 +17,8 @@ class DirectorySettings(InfrastructureSettings):
     Environment Variables:
         DIRECTORY_PROVIDER: IDP backend to activate (default: google)
         DIRECTORY_REQUIRE_STARTUP_WARMUP: Fail startup if warmup fails (default: False)
+        DIRECTORY_BACKGROUND_WARMUP: Warm up after boot without blocking readiness
+            when startup warmup is not required (default: False)
         DIRECTORY_CACHE_TTL_SECONDS: In-process membership cache TTL (default: 60)
         DIRECTORY_MANAGED_GROUP_DOMAIN: Authoritative domain for managed group emails
         DIRECTORY_ENFORCE_MANAGED_GROUP_EMAIL: Reject managed groups missing email
@@ -45,6 +47,11 @@ class DirectorySettings(InfrastructureSettings):
         alias="DIRECTORY_REQUIRE_STARTUP_WARMUP",
         description="Opt in to fail-fast startup validation against the remote directory",
     )
+    background_warmup: bool = Field(
+        default=False,
+        alias="DIRECTORY_BACKGROUND_WARMUP",
+        description="Opt in to a non-blocking warmup against the remote directory when startup does not require it",
+    )
     startup_preload_groups: list[str] = Field(
         default_factory=list,
         description="Group keys to pre-load into cache at startup",
@@ -1,6 +1,7 @@
 """Server and development infrastructure settings."""
 
 from functools import lru_cache
+from ipaddress import ip_network
 from typing import Any
 
 from pydantic import Field, field_validator, model_validator
@@ -21,6 +22,28 @@ class ServerSettings(InfrastructureSettings):
         DEV_BYPASS_TOKEN: Static bearer token accepted in non-production environments
             only. Allows local smoke testing without a real Backstage instance.
             Must be a long random string. NEVER set in production.
+        JWT_VERIFIED_CACHE_MAX_ENTRIES: Max verified bearer tokens kept in the
+            in-process LRU (default: 1024, 0 disables the cache)
+        JWT_VERIFIED_CACHE_EXPIRY_SKEW_SECONDS: Seconds before ``exp`` at which a
+            cached verification stops being served (default: 30)
+        JWKS_REFRESH_INTERVAL_SECONDS: Background JWKS refresh interval; keep it
+            below the JWKS client cache lifespan of 3600s (default: 900)
+        PLUGIN_MANIFEST_PATH: Plugin manifest generated by
+            bin/generate_plugin_manifest.py; when set, feature plugins are
+            registered from it and imported lazily instead of walking
+            packages/ and modules/ (default: unset)
+        STARTUP_PHASE_TIMEOUT_SECONDS: Maximum run time of each startup phase
+            before boot is aborted (default: 120)
+        RATE_LIMIT_STORAGE_URI: Rate limiter storage; ``memory://`` keeps
+            counters per process, ``dynamodb://<table>`` shares them across
+            replicas (default: memory://)
+        RATE_LIMIT_BATCH_SIZE: Admitted requests per key buffered before the
+            shared counter is written (default: 10, 1 writes every request)
+        RATE_LIMIT_FLUSH_INTERVAL_SECONDS: Maximum age of buffered requests
+            before the shared counter is written (default: 1)
+        RATE_LIMIT_TRUSTED_PROXIES: JSON list of proxy addresses or CIDRs whose
+            X-Forwarded-For header is trusted for the client address
+            (default: [], the connecting address is used)
 
     Example:
         ```python
@@ -50,6 +73,57 @@ class ServerSettings(InfrastructureSettings):
         default=None,
         alias="DEV_BYPASS_TOKEN",
     )
+    JWT_VERIFIED_CACHE_MAX_ENTRIES: int = Field(
+        default=1024,
+        alias="JWT_VERIFIED_CACHE_MAX_ENTRIES",
+        ge=0,
+    )
+    JWT_VERIFIED_CACHE_EXPIRY_SKEW_SECONDS: int = Field(
+        default=30,
+        alias="JWT_VERIFIED_CACHE_EXPIRY_SKEW_SECONDS",
+        ge=0,
+    )
+    JWKS_REFRESH_INTERVAL_SECONDS: int = Field(
+        default=900,
+        alias="JWKS_REFRESH_INTERVAL_SECONDS",
+        gt=0,
+    )
+    PLUGIN_MANIFEST_PATH: str | None = Field(
+        default=None,
+        alias="PLUGIN_MANIFEST_PATH",
+    )
+    STARTUP_PHASE_TIMEOUT_SECONDS: float = Field(
+        default=120.0,
+        alias="STARTUP_PHASE_TIMEOUT_SECONDS",
+        gt=0,
+    )
+
+    RATE_LIMIT_STORAGE_URI: str = Field(
+        default="memory://",
+        alias="RATE_LIMIT_STORAGE_URI",
+    )
+    RATE_LIMIT_BATCH_SIZE: int = Field(
+        default=10,
+        alias="RATE_LIMIT_BATCH_SIZE",
+        ge=1,
+    )
+    RATE_LIMIT_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        alias="RATE_LIMIT_FLUSH_INTERVAL_SECONDS",
+        gt=0,
+    )
+    RATE_LIMIT_TRUSTED_PROXIES: list[str] = Field(
+        default_factory=list,
+        alias="RATE_LIMIT_TRUSTED_PROXIES",
+    )
+
+    @field_validator("RATE_LIMIT_TRUSTED_PROXIES")
+    @classmethod
+    def validate_trusted_proxies(cls, v: list[str]) -> list[str]:
+        """Reject entries that are not IP addresses or networks."""
+        for entry in v:
+            ip_network(entry, strict=False)
+        return v
 
     @field_validator("ISSUER_CONFIG", mode="before")
     @classmethod
@@ -19,6 +19,8 @@ class AwsSettings(IntegrationSettings):
         AWS_LOGGING_ACCOUNT_ROLE_ARN: Logging account role ARN
         AWS_SSO_INSTANCE_ID: AWS SSO instance ID
         AWS_SSO_INSTANCE_ARN: AWS SSO instance ARN
+        AWS_ACCOUNT_CATALOG_TTL_SECONDS: Seconds the organization account
+            catalog is served before a background reload (default: 900)
 
     Example:
         ```python
@@ -39,6 +41,7 @@ class AwsSettings(IntegrationSettings):
     LOGGING_ROLE_ARN: str = Field(default="", alias="AWS_LOGGING_ACCOUNT_ROLE_ARN")
     INSTANCE_ID: str = Field(default="", alias="AWS_SSO_INSTANCE_ID")
     INSTANCE_ARN: str = Field(default="", alias="AWS_SSO_INSTANCE_ARN")
+    ACCOUNT_CATALOG_TTL_SECONDS: float = Field(default=900.0, alias="AWS_ACCOUNT_CATALOG_TTL_SECONDS")
     ENDPOINT_URL: str | None = Field(
         default=None,
         alias="AWS_ENDPOINT_URL",
@@ -20,6 +20,11 @@ class GoogleWorkspaceSettings(IntegrationSettings):
         SRE_BOT_EMAIL: SRE Bot service account email
         GOOGLE_WORKSPACE_CUSTOMER_ID: Google Workspace customer ID (defaults to "my_customer")
         GCP_SRE_SERVICE_ACCOUNT_KEY_FILE: Path to service account key file
+        GOOGLE_API_INITIAL_RATE_PER_SECOND: Starting request rate of each Google API (default: 10)
+        GOOGLE_API_MIN_RATE_PER_SECOND: Floor the adaptive rate is never cut below (default: 0.5)
+        GOOGLE_API_MAX_RATE_PER_SECOND: Ceiling the adaptive rate never grows past (default: 50)
+        GOOGLE_API_RETRY_BUDGET_RATIO: Retries allowed per request across all APIs (default: 0.2)
+        GOOGLE_API_RETRY_BUDGET_MIN_PER_SECOND: Retries always allowed per second (default: 1)
 
     Example:
         ```python
@@ -36,6 +41,11 @@ class GoogleWorkspaceSettings(IntegrationSettings):
     SRE_BOT_EMAIL: str = Field(default="", alias="SRE_BOT_EMAIL")
     GOOGLE_WORKSPACE_CUSTOMER_ID: str = Field(default="my_customer", alias="GOOGLE_WORKSPACE_CUSTOMER_ID")
     GCP_SRE_SERVICE_ACCOUNT_KEY_FILE: str = Field(default="", alias="GCP_SRE_SERVICE_ACCOUNT_KEY_FILE")
+    GOOGLE_API_INITIAL_RATE_PER_SECOND: float = Field(default=10.0, gt=0, alias="GOOGLE_API_INITIAL_RATE_PER_SECOND")
+    GOOGLE_API_MIN_RATE_PER_SECOND: float = Field(default=0.5, gt=0, alias="GOOGLE_API_MIN_RATE_PER_SECOND")
+    GOOGLE_API_MAX_RATE_PER_SECOND: float = Field(default=50.0, gt=0, alias="GOOGLE_API_MAX_RATE_PER_SECOND")
+    GOOGLE_API_RETRY_BUDGET_RATIO: float = Field(default=0.2, ge=0, alias="GOOGLE_API_RETRY_BUDGET_RATIO")
+    GOOGLE_API_RETRY_BUDGET_MIN_PER_SECOND: float = Field(default=1.0, ge=0, alias="GOOGLE_API_RETRY_BUDGET_MIN_PER_SECOND")
 
 
 class GoogleResourcesConfig(IntegrationSettings):
@@ -12,6 +12,10 @@ class OpsGenieSettings(IntegrationSettings):
 
     Environment Variables:
         OPSGENIE_INTEGRATIONS_KEY: OpsGenie API integration key
+        OPSGENIE_CONNECT_TIMEOUT_SECONDS: TCP/TLS connect timeout (default: 3.05)
+        OPSGENIE_READ_TIMEOUT_SECONDS: Response read timeout (default: 10)
+        OPSGENIE_MAX_RETRIES: Retries for connection errors, 429 and 5xx (default: 3)
+        OPSGENIE_POOL_MAXSIZE: Keep-alive connections kept per host (default: 10)
 
     Example:
         ```python
@@ -24,6 +28,10 @@ class OpsGenieSettings(IntegrationSettings):
     """
 
     OPSGENIE_INTEGRATIONS_KEY: str | None = Field(default=None, alias="OPSGENIE_INTEGRATIONS_KEY")
+    OPSGENIE_CONNECT_TIMEOUT_SECONDS: float = Field(default=3.05, gt=0, alias="OPSGENIE_CONNECT_TIMEOUT_SECONDS")
+    OPSGENIE_READ_TIMEOUT_SECONDS: float = Field(default=10.0, gt=0, alias="OPSGENIE_READ_TIMEOUT_SECONDS")
+    OPSGENIE_MAX_RETRIES: int = Field(default=3, ge=0, alias="OPSGENIE_MAX_RETRIES")
+    OPSGENIE_POOL_MAXSIZE: int = Field(default=10, ge=1, alias="OPSGENIE_POOL_MAXSIZE")
 
 
 @lru_cache(maxsize=1)
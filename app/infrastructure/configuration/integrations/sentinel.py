@@ -14,6 +14,10 @@ class SentinelSettings(IntegrationSettings):
         SENTINEL_CUSTOMER_ID: Azure Sentinel workspace customer ID
         SENTINEL_LOG_TYPE: Log type identifier (default: DevSREBot)
         SENTINEL_SHARED_KEY: Azure Sentinel shared key for authentication
+        SENTINEL_SHIPPER_ENABLED: Ship events from a background batching queue (default: True)
+        SENTINEL_MAX_QUEUE_SIZE: Events buffered in memory before spilling or dropping (default: 10000)
+        SENTINEL_FLUSH_INTERVAL_SECONDS: Maximum age of a queued event before a flush (default: 5)
+        SENTINEL_SPILL_PATH: Optional JSON-lines file for events that cannot be queued or sent
 
     Example:
         ```python
@@ -29,6 +33,10 @@ class SentinelSettings(IntegrationSettings):
     SENTINEL_CUSTOMER_ID: str | None = Field(default=None, alias="SENTINEL_CUSTOMER_ID")
     SENTINEL_LOG_TYPE: str = Field(default="DevSREBot", alias="SENTINEL_LOG_TYPE")
     SENTINEL_SHARED_KEY: str | None = Field(default=None, alias="SENTINEL_SHARED_KEY")
+    SENTINEL_SHIPPER_ENABLED: bool = Field(default=True, alias="SENTINEL_SHIPPER_ENABLED")
+    SENTINEL_MAX_QUEUE_SIZE: int = Field(default=10_000, ge=1, alias="SENTINEL_MAX_QUEUE_SIZE")
+    SENTINEL_FLUSH_INTERVAL_SECONDS: float = Field(default=5.0, gt=0, alias="SENTINEL_FLUSH_INTERVAL_SECONDS")
+    SENTINEL_SPILL_PATH: str | None = Field(default=None, alias="SENTINEL_SPILL_PATH")
 
 
 @lru_cache(maxsize=1)
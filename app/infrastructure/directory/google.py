@@ -516,6 +516,53 @@ class GoogleDirectoryProvider:
 
         return OperationResult.success(data=group_result.data)
 
+    def get_groups_batch(self, group_keys: list[str]) -> OperationResult[dict[str, DirectoryGroup]]:
+        """Return canonical managed groups for multiple keys in a single batch call.
+
+        Uses the Google Admin batch API so cost is one network round-trip
+        regardless of the number of groups.
+
+        Args:
+            group_keys: Canonical managed-group emails or managed-group slugs.
+
+        Returns:
+            OperationResult: success with a dict mapping each requested key to
+            its DirectoryGroup; keys that do not resolve are omitted.
+        """
+        if not group_keys:
+            return OperationResult.success(data={})
+
+        keys_by_email: dict[str, list[str]] = {}
+        for group_key in group_keys:
+            keys_by_email.setdefault(self._normalize_email(group_key), []).append(group_key)
+        result = self._directory.get_batch_groups(list(keys_by_email))
+        if not result.is_success:
+            return self._typed_error(result)
+
+        if not isinstance(result.data, dict):
+            return OperationResult.permanent_error(
+                message="Batch directory groups payload is not a dict",
+                error_code="DIRECTORY_BATCH_GROUPS_PAYLOAD_INVALID",
+            )
+
+        groups: dict[str, DirectoryGroup] = {}
+        for email, requested_keys in keys_by_email.items():
+            item = result.data.get(email)
+            if not isinstance(item, dict):
+                continue
+            group_result = self._build_directory_group(item)
+            if not group_result.is_success or group_result.data is None:
+                self._logger.warning(
+                    "batch_group_unresolved",
+                    group_key=email,
+                    error_code=group_result.error_code,
+                )
+                continue
+            for group_key in requested_keys:
+                groups[group_key] = group_result.data
+
+        return OperationResult.success(data=groups)
+
     def add_group_member(
         self,
         group_key: str,
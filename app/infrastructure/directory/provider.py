@@ -97,6 +97,23 @@ class DirectoryProvider(Protocol):
         """
         ...
 
+    def get_groups_batch(self, group_keys: list[str]) -> OperationResult[dict[str, DirectoryGroup]]:
+        """Return canonical managed groups for multiple keys in a single batch call.
+
+        Implementors should use a provider-native batch API when available so
+        the cost is one network round-trip regardless of how many groups are
+        requested.
+
+        Args:
+            group_keys: Canonical managed-group emails or managed-group slugs.
+
+        Returns:
+            OperationResult: success with a dict mapping each requested key, as
+            given, to its DirectoryGroup.  Keys that do not resolve to a
+            managed group are omitted.
+        """
+        ...
+
     def add_group_member(
         self,
         group_key: str,
@@ -0,0 +1,28 @@
+"""Integration health status shared by the scheduler and the API.
+
+Usage:
+
+    from infrastructure.health import HEALTHY, get_health_status_registry
+
+    registry = get_health_status_registry()
+    registry.record("opsgenie", HEALTHY, duration_seconds=0.2)
+    snapshot = registry.snapshot()
+"""
+
+from infrastructure.health.registry import (
+    FAILED,
+    HEALTHY,
+    TIMED_OUT,
+    UNHEALTHY,
+    HealthStatusRegistry,
+    get_health_status_registry,
+)
+
+__all__ = [
+    "FAILED",
+    "HEALTHY",
+    "TIMED_OUT",
+    "UNHEALTHY",
+    "HealthStatusRegistry",
+    "get_health_status_registry",
+]
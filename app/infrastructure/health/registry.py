@@ -0,0 +1,56 @@
+"""Last known status of each integration dependency.
+
+The scheduled integration healthchecks record every outcome here, and the
+API reads it to report status without calling any dependency. Each entry
+keeps the latest status, duration, error and failure streak.
+"""
+
+import threading
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+
+HEALTHY = "healthy"
+UNHEALTHY = "unhealthy"
+TIMED_OUT = "timed_out"
+FAILED = "failed"
+
+
+class HealthStatusRegistry:
+    """Thread-safe record of the latest healthcheck outcome per integration."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    def record(self, name: str, status: str, duration_seconds: float | None = None, error: str | None = None) -> None:
+        """Record one healthcheck outcome and update the failure streak."""
+        now = datetime.now(UTC).isoformat()
+        with self._lock:
+            entry = self._entries.setdefault(name, {"consecutive_failures": 0, "last_healthy_at": None})
+            entry["status"] = status
+            entry["checked_at"] = now
+            entry["duration_seconds"] = round(duration_seconds, 4) if duration_seconds is not None else None
+            entry["error"] = error
+            if status == HEALTHY:
+                entry["consecutive_failures"] = 0
+                entry["last_healthy_at"] = now
+            else:
+                entry["consecutive_failures"] += 1
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Return a copy of one integration's entry, or None if never checked."""
+        with self._lock:
+            entry = self._entries.get(name)
+            return dict(entry) if entry else None
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of every entry."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._entries.items()}
+
+
+@lru_cache(maxsize=1)
+def get_health_status_registry() -> HealthStatusRegistry:
+    """Singleton provider for the process-wide integration status registry."""
+    return HealthStatusRegistry()
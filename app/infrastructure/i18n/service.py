@@ -115,6 +115,8 @@ class TranslationService:
                 except (FileNotFoundError, ValueError) as path_error:
                     logger.bind(path=str(path), error=str(path_error)).warning("i18n_path_load_skipped")
 
+            # Catalogs were edited in place; recompile so merged messages are precompiled too.
+            self._translator.compile_catalogs()
             self._is_initialized = True
 
             log = logger.bind(
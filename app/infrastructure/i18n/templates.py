@@ -0,0 +1,72 @@
+"""Precompiled message templates.
+
+Catalog messages are compiled once when a catalog is loaded. A single scan
+locates the ``{{name}}`` and ``{name}`` placeholders and splits the message
+into alternating literal and placeholder segments, so rendering is one
+lookup per placeholder and a join. Messages without placeholders render as
+their source string.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}|\{(\w+)\}")
+
+
+@dataclass(frozen=True, slots=True)
+class MessageTemplate:
+    """A message split into literal and placeholder segments.
+
+    Attributes:
+        source: Original message string.
+        segments: Literals at even indices, variable names at odd indices.
+        variables: Unique variable names in order of first occurrence.
+    """
+
+    source: str
+    segments: tuple[str, ...]
+    variables: tuple[str, ...]
+
+    @property
+    def is_static(self) -> bool:
+        """True when the message has no placeholders."""
+        return not self.variables
+
+    def missing_variable(self, variables: dict[str, Any]) -> str | None:
+        """Return the first placeholder without a value, or None."""
+        for name in self.variables:
+            if name not in variables:
+                return name
+        return None
+
+    def render(self, variables: dict[str, Any]) -> str:
+        """Substitute every placeholder; all variables must be present."""
+        if not self.variables:
+            return self.source
+        parts = list(self.segments)
+        parts[1::2] = [str(variables[name]) for name in self.segments[1::2]]
+        return "".join(parts)
+
+
+def compile_template(source: str) -> MessageTemplate:
+    """Compile a message string into a MessageTemplate.
+
+    Args:
+        source: Message with optional {{variable}} or {variable} placeholders.
+
+    Returns:
+        MessageTemplate for the message.
+    """
+    segments: list[str] = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(source):
+        segments.append(source[position : match.start()])
+        segments.append(match.group(1) or match.group(2))
+        position = match.end()
+    segments.append(source[position:])
+    return MessageTemplate(
+        source=source,
+        segments=tuple(segments),
+        variables=tuple(dict.fromkeys(segments[1::2])),
+    )
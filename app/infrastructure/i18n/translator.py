@@ -1,18 +1,27 @@
 """Translation service for retrieving and interpolating translated messages.
 
 Core component for i18n that integrates with infrastructure.events for notifications.
+
+Messages are compiled into MessageTemplates (see templates.py) whenever
+catalogs are loaded, so translating a message never re-parses it. Rendered
+messages with variables are kept in a small LRU keyed by the message and the
+values of its placeholders; messages without placeholders are returned as-is.
 """
 
-import re
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import structlog
 
 from infrastructure.i18n.loader import TranslationLoader
 from infrastructure.i18n.models import Locale, TranslationCatalog, TranslationKey
+from infrastructure.i18n.templates import MessageTemplate, compile_template
 
 logger = structlog.get_logger()
 
+DEFAULT_RENDER_CACHE_SIZE = 1024
+
 
 class Translator:
     """Service for translating messages with variable interpolation.
@@ -30,22 +39,31 @@ class Translator:
         self,
         loader: TranslationLoader,
         fallback_locale: Locale = Locale.EN_US,
+        render_cache_size: int = DEFAULT_RENDER_CACHE_SIZE,
     ):
         """Initialize Translator.
 
         Args:
             loader: TranslationLoader instance for loading translations.
             fallback_locale: Locale to use when key not found (default: en-US).
+            render_cache_size: Maximum number of rendered messages kept (0 disables).
         """
         self.loader = loader
         self.fallback_locale = fallback_locale
         self.catalogs: dict[Locale, TranslationCatalog] = {}
         self.log = logger.bind(fallback_locale=fallback_locale.value)
+        self._templates: dict[str, MessageTemplate] = {}
+        self._render_cache_size = render_cache_size
+        self._rendered: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
         self.log.info("initialized_translator")
 
     def load_all(self) -> None:
         """Load all available locales from loader."""
         self.catalogs = self.loader.load_all()
+        self.compile_catalogs()
         self.log.info("loaded_all_translations", locale_count=len(self.catalogs))
 
     def load_locale(self, locale: Locale) -> None:
@@ -58,6 +76,7 @@ class Translator:
             FileNotFoundError: If translation files not found.
         """
         self.catalogs[locale] = self.loader.load(locale)
+        self.compile_catalogs()
         self.log.info("loaded_locale_translations", locale=locale.value)
 
     def translate_message(
@@ -110,10 +129,45 @@ class Translator:
             )
             raise KeyError(f"Translation not found for key {key} in {locale.value} or fallback {self.fallback_locale.value}")
 
-        # Interpolate variables (always call to validate required variables)
-        message = self._interpolate(message, variables)
+        template = self._template(message)
+        if template.is_static:
+            return template.source
+        self._check_variables(template, variables)
+        return self._render(template, variables)
+
+    def compile_catalogs(self) -> None:
+        """Compile every loaded message and drop previously rendered messages.
 
-        return message
+        Called after catalogs are loaded; call it again after editing
+        catalogs in place (e.g. merging feature-package catalogs). Messages
+        that were not compiled here are compiled on first use.
+        """
+        templates: dict[str, MessageTemplate] = {}
+        for catalog in self.catalogs.values():
+            _compile_messages(catalog.messages, templates)
+        with self._lock:
+            self._templates = templates
+            self._rendered.clear()
+        self.log.info("compiled_translation_templates", template_count=len(templates))
+
+    def clear_render_cache(self) -> None:
+        """Drop rendered messages and reset the hit counters."""
+        with self._lock:
+            self._rendered.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def render_cache_stats(self) -> dict[str, Any]:
+        """Return template count, rendered cache size and hit rate."""
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "templates": len(self._templates),
+                "size": len(self._rendered),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / requests, 4) if requests else 0.0,
+            }
 
     def has_message(self, key: TranslationKey, locale: Locale) -> bool:
         """Check if translation exists for key in locale.
@@ -139,7 +193,8 @@ class Translator:
     def _interpolate(self, message: str, variables: dict[str, Any]) -> str:
         """Perform variable interpolation in message string.
 
-        Replaces {{variable_name}} with corresponding value from variables dict.
+        Replaces {{variable_name}} and {variable_name} with the corresponding
+        value from variables dict.
 
         Args:
             message: Message string with {{variable}} placeholders.
@@ -151,41 +206,51 @@ class Translator:
         Raises:
             ValueError: If variable not found in variables dict.
         """
-        # Support both double-brace ({{var}}) and single-brace ({var}) placeholders.
-        # Collect unique variable names from both patterns in order to validate
-        # required variables exist before performing replacements.
-        double_pattern = r"\{\{(\w+)\}\}"
-        single_pattern = r"\{(\w+)\}"
-
-        double_matches = re.findall(double_pattern, message)
-        single_matches = re.findall(single_pattern, message)
-
-        # We avoid double-counting variables that appear in both patterns
-        all_vars = []
-        for m in double_matches + single_matches:
-            if m not in all_vars:
-                all_vars.append(m)
-
-        for var_name in all_vars:
-            if var_name not in variables:
-                self.log.error(
-                    "missing_interpolation_variable",
-                    variable=var_name,
-                    available_variables=list(variables.keys()),
-                )
-                raise ValueError(f"Missing interpolation variable: {var_name}")
-
-        # Perform replacements. Replace double-brace patterns first to preserve
-        # any intention where both syntaxes might be present.
-        for var_name in double_matches:
-            value = variables[var_name]
-            message = message.replace(f"{{{{{var_name}}}}}", str(value))
-
-        for var_name in single_matches:
-            value = variables[var_name]
-            message = message.replace(f"{{{var_name}}}", str(value))
-
-        return message
+        template = self._template(message)
+        self._check_variables(template, variables)
+        return template.render(variables)
+
+    def _template(self, message: str) -> MessageTemplate:
+        template = self._templates.get(message)
+        if template is None:
+            template = compile_template(message)
+            with self._lock:
+                self._templates[message] = template
+        return template
+
+    def _check_variables(self, template: MessageTemplate, variables: dict[str, Any]) -> None:
+        missing = template.missing_variable(variables)
+        if missing is not None:
+            self.log.error(
+                "missing_interpolation_variable",
+                variable=missing,
+                available_variables=list(variables.keys()),
+            )
+            raise ValueError(f"Missing interpolation variable: {missing}")
+
+    def _render(self, template: MessageTemplate, variables: dict[str, Any]) -> str:
+        """Render a template, serving repeated renders from the LRU."""
+        values = tuple((type(variables[name]), variables[name]) for name in template.variables)
+        cache_key = (template.source, values)
+        try:
+            hash(cache_key)
+        except TypeError:
+            # Unhashable values (lists, dicts) are rendered without caching.
+            return template.render(variables)
+        with self._lock:
+            rendered = self._rendered.get(cache_key)
+            if rendered is not None:
+                self._rendered.move_to_end(cache_key)
+                self._hits += 1
+                return rendered
+            self._misses += 1
+        rendered = template.render(variables)
+        if self._render_cache_size > 0:
+            with self._lock:
+                self._rendered[cache_key] = rendered
+                while len(self._rendered) > self._render_cache_size:
+                    self._rendered.popitem(last=False)
+        return rendered
 
     def get_catalog(self, locale: Locale) -> TranslationCatalog | None:
         """Get complete catalog for a locale.
@@ -203,3 +268,12 @@ class Translator:
         self.catalogs.clear()
         self.load_all()
         self.log.info("reloaded_all_translations")
+
+
+def _compile_messages(messages: dict[str, Any], templates: dict[str, MessageTemplate]) -> None:
+    for value in messages.values():
+        if isinstance(value, str):
+            if value not in templates:
+                templates[value] = compile_template(value)
+        elif isinstance(value, dict):
+            _compile_messages(value, templates)
@@ -10,6 +10,10 @@ Dependencies:
     - structlog processors
 """
 
+import re
+import weakref
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 
@@ -64,23 +68,65 @@ SENSITIVE_PATTERNS = frozenset(
 )
 
 
-def _is_sensitive_key(key: str, patterns: frozenset[str]) -> bool:
-    key_lower = key.lower()
-    return any(pattern in key_lower for pattern in patterns)
+# Bound on memoized key decisions; event keys are a small, stable vocabulary.
+KEY_DECISION_CACHE_SIZE = 4096
 
+# Memoized matchers of live processors, for clear_key_decision_caches.
+_key_matchers: "weakref.WeakSet[Any]" = weakref.WeakSet()
 
-def _redact_recursive(value: Any, patterns: frozenset[str], mask_value: str) -> Any:
+
+def _sensitive_key_matcher(patterns: frozenset[str]) -> Callable[[str], bool]:
+    """Return a predicate telling whether a key contains any sensitive pattern.
+
+    The patterns are compiled into one case-insensitive alternation and each
+    key's decision is memoized, so repeated keys cost a dict lookup.
+    """
+    if not patterns:
+        return lambda key: False
+    regex = re.compile("|".join(re.escape(pattern) for pattern in sorted(patterns)), re.IGNORECASE)
+
+    @lru_cache(maxsize=KEY_DECISION_CACHE_SIZE)
+    def is_sensitive(key: str) -> bool:
+        return regex.search(key) is not None
+
+    _key_matchers.add(is_sensitive)
+    return is_sensitive
+
+
+def clear_key_decision_caches() -> None:
+    """Forget the memoized key decisions of every live redaction processor."""
+    for matcher in list(_key_matchers):
+        matcher.cache_clear()
+
+
+def _redact_recursive(value: Any, is_sensitive: Callable[[str], bool], mask_value: str) -> Any:
+    """Redact sensitive keys in nested dicts and lists.
+
+    Copy-on-write: containers without sensitive keys are returned as-is, and
+    a container is copied only when something inside it is redacted.
+    """
     if isinstance(value, dict):
-        redacted: dict[Any, Any] = {}
+        redacted: dict[Any, Any] | None = None
         for key, nested_value in value.items():
-            if isinstance(key, str) and _is_sensitive_key(key, patterns) and nested_value is not None:
-                redacted[key] = mask_value
+            if isinstance(key, str) and nested_value is not None and is_sensitive(key):
+                new_value = mask_value
             else:
-                redacted[key] = _redact_recursive(nested_value, patterns, mask_value)
-        return redacted
+                new_value = _redact_recursive(nested_value, is_sensitive, mask_value)
+            if new_value is not nested_value:
+                if redacted is None:
+                    redacted = dict(value)
+                redacted[key] = new_value
+        return value if redacted is None else redacted
 
     if isinstance(value, list):
-        return [_redact_recursive(item, patterns, mask_value) for item in value]
+        redacted_items: list[Any] | None = None
+        for index, item in enumerate(value):
+            new_item = _redact_recursive(item, is_sensitive, mask_value)
+            if new_item is not item:
+                if redacted_items is None:
+                    redacted_items = list(value)
+                redacted_items[index] = new_item
+        return value if redacted_items is None else redacted_items
 
     return value
 
@@ -92,7 +138,9 @@ def mask_sensitive_data(
     """Create a processor that masks sensitive data in log entries.
 
     Automatically detects and masks values for keys that contain
-    sensitive patterns (case-insensitive matching).
+    sensitive patterns (case-insensitive matching), at any depth of nested
+    dicts and lists. Events without sensitive keys are returned unchanged
+    and nothing is copied.
 
     Args:
         mask_value: The string to replace sensitive values with.
@@ -110,14 +158,10 @@ def mask_sensitive_data(
     if additional_patterns:
         patterns = patterns | additional_patterns
 
+    is_sensitive = _sensitive_key_matcher(patterns)
+
     def processor(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
-        masked_dict = {}
-        for key, value in event_dict.items():
-            if _is_sensitive_key(key, patterns) and value is not None:
-                masked_dict[key] = mask_value
-            else:
-                masked_dict[key] = _redact_recursive(value, patterns, mask_value)
-        return masked_dict
+        return _redact_recursive(event_dict, is_sensitive, mask_value)
 
     return processor
 
@@ -140,9 +184,10 @@ def truncate_large_values(max_length: int = 500):
     """
 
     def processor(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
-        for key, value in event_dict.items():
-            if isinstance(value, str) and len(value) > max_length:
-                event_dict[key] = value[:max_length] + f"...[truncated, {len(value)} chars total]"
+        oversized = [key for key, value in event_dict.items() if isinstance(value, str) and len(value) > max_length]
+        for key in oversized:
+            value = event_dict[key]
+            event_dict[key] = value[:max_length] + f"...[truncated, {len(value)} chars total]"
         return event_dict
 
     return processor
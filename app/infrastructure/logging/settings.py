@@ -2,19 +2,35 @@
 
 from functools import lru_cache
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from infrastructure.configuration.base import InfrastructureSettings
 
+LOG_LEVEL_NAMES = ("debug", "info", "warning", "error", "critical")
+
 
 class LoggingSettings(InfrastructureSettings):
-    """Configuration for structured logging redaction.
+    """Configuration for structured logging redaction and callsite capture.
 
     Environment Variables:
         REDACTION_EXTRA_KEYS: JSON array of extra deny-list key substrings.
+        LOG_CALLSITE_LEVELS: JSON array of levels whose events get code.*
+            callsite attributes (default: every level). Capturing the
+            callsite inspects the caller's frame on every event.
     """
 
     REDACTION_EXTRA_KEYS: tuple[str, ...] = Field(default=(), alias="REDACTION_EXTRA_KEYS")
+    LOG_CALLSITE_LEVELS: tuple[str, ...] = Field(default=LOG_LEVEL_NAMES, alias="LOG_CALLSITE_LEVELS")
+
+    @field_validator("LOG_CALLSITE_LEVELS")
+    @classmethod
+    def validate_callsite_levels(cls, v: tuple[str, ...]) -> tuple[str, ...]:
+        """Normalize level names to lowercase and reject unknown levels."""
+        levels = tuple(level.lower() for level in v)
+        unknown = sorted(set(levels) - set(LOG_LEVEL_NAMES))
+        if unknown:
+            raise ValueError(f"Unknown log levels in LOG_CALLSITE_LEVELS: {', '.join(unknown)}")
+        return levels
 
 
 @lru_cache(maxsize=1)
@@ -32,7 +32,12 @@ from structlog.stdlib import BoundLogger
 
 from infrastructure.configuration.app import AppSettings
 from infrastructure.logging.formatters import mask_sensitive_data
-from infrastructure.logging.settings import LoggingSettings, get_logging_settings
+from infrastructure.logging.settings import LOG_LEVEL_NAMES, LoggingSettings, get_logging_settings
+
+Processor = Callable[
+    [Any, str, MutableMapping[str, Any]],
+    Mapping[str, Any] | str | bytes | bytearray | tuple[Any, ...],
+]
 
 
 def _apply_otel_code_conventions(
@@ -95,6 +100,36 @@ def _apply_otel_code_conventions(
     return event_dict
 
 
+def _callsite_adder(levels: tuple[str, ...]) -> Processor:
+    """Build the callsite processor, limited to events at the given levels.
+
+    Runs after add_log_level, so the normalized ``level`` field selects the
+    events; other events skip the frame inspection entirely.
+    """
+    adder = structlog.processors.CallsiteParameterAdder(
+        parameters=[
+            CallsiteParameter.LINENO,
+            CallsiteParameter.FUNC_NAME,
+            CallsiteParameter.MODULE,  # For fully qualified function name
+            CallsiteParameter.PATHNAME,  # For code.file.path
+        ],
+        # Skip the level filter's own frame when looking for the caller.
+        additional_ignores=[__name__],
+    )
+    enabled = frozenset(levels)
+    if enabled >= set(LOG_LEVEL_NAMES):
+        return adder
+
+    def processor(
+        logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> Mapping[str, Any] | str | bytes | bytearray | tuple[Any, ...]:
+        if event_dict.get("level") in enabled:
+            return adder(logger, method_name, event_dict)
+        return event_dict
+
+    return processor
+
+
 def _is_test_environment() -> bool:
     """Detect if running in a test environment.
 
@@ -106,27 +141,15 @@ def _is_test_environment() -> bool:
 
 def _build_base_processors(
     logging_settings: LoggingSettings,
-) -> list[
-    Callable[
-        [Any, str, MutableMapping[str, Any]],
-        Mapping[str, Any] | str | bytes | bytearray | tuple[Any, ...],
-    ]
-]:
+) -> list[Processor]:
     return [
         # 1. Context propagation (must be first)
         structlog.contextvars.merge_contextvars,
         # 2. Add metadata
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        # 3. Add OpenTelemetry code attributes for debugging
-        structlog.processors.CallsiteParameterAdder(
-            parameters=[
-                CallsiteParameter.LINENO,
-                CallsiteParameter.FUNC_NAME,
-                CallsiteParameter.MODULE,  # For fully qualified function name
-                CallsiteParameter.PATHNAME,  # For code.file.path
-            ]
-        ),
+        # 3. Add OpenTelemetry code attributes for debugging (LOG_CALLSITE_LEVELS)
+        _callsite_adder(logging_settings.LOG_CALLSITE_LEVELS),
         # 4. Apply OpenTelemetry semantic conventions
         _apply_otel_code_conventions,
         # 5. Exception formatting
@@ -5,9 +5,11 @@ import pluggy
 from infrastructure.plugins.manager import (
     auto_discover_plugins,
     collect_feature_i18n_resources,
+    discover_feature_plugins,
     get_plugin_manager,
     register_feature_integrations,
 )
+from infrastructure.plugins.profiler import StartupProfiler
 
 # Singleton hookimpl marker for entire application
 hookimpl = pluggy.HookimplMarker("sre_bot")
@@ -18,4 +20,6 @@ __all__ = [
     "collect_feature_i18n_resources",
     "register_feature_integrations",
     "auto_discover_plugins",
+    "discover_feature_plugins",
+    "StartupProfiler",
 ]
@@ -2,33 +2,28 @@
 
 import importlib
 import pkgutil
+from collections.abc import Iterator
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pluggy
 import structlog
 
-logger = structlog.get_logger()
+if TYPE_CHECKING:
+    from infrastructure.plugins.profiler import StartupProfiler
 
+logger = structlog.get_logger()
 
-def auto_discover_plugins(
-    pm: pluggy.PluginManager,
-    base_paths: list[str],
-) -> None:
-    """Auto-discover and register plugins from base paths.
 
-    This function scans the specified base paths (e.g., "packages", "modules")
-    for Python packages and imports them. If a package has functions decorated
-    with @hookimpl, they are automatically registered with the plugin manager.
+def iter_plugin_packages(base_paths: list[str]) -> Iterator[str]:
+    """Yield the fully qualified name of every package under the base paths.
 
     Args:
-        pm: Plugin manager to register plugins with.
         base_paths: List of base paths to search (e.g., ["packages", "modules"]).
 
-    Example:
-        >>> pm = pluggy.PluginManager("sre_bot")
-        >>> pm.add_hookspecs(hookspecs.platforms)
-        >>> auto_discover_plugins(pm, base_paths=["packages", "modules"])
-        # Now pm has all @hookimpl functions from all packages
+    Yields:
+        Dotted package names, e.g. "packages.access.sync".
     """
     for base_path in base_paths:
         path = Path(base_path)
@@ -45,17 +40,43 @@ def auto_discover_plugins(
         # The prefix argument produces fully-qualified module names directly.
         for pkg_info in pkgutil.walk_packages([str(path)], prefix=f"{base_path}."):
             if pkg_info.ispkg:
-                module_name = pkg_info.name  # already fully qualified by walk_packages
-                try:
-                    # Import the package - this executes __init__.py
-                    # If __init__.py has @hookimpl functions, they get registered
-                    module = importlib.import_module(module_name)
-                    pm.register(module)
-                    logger.debug("plugin_registered", module=module_name)
-                except Exception as e:
-                    logger.error(
-                        "plugin_registration_failed",
-                        module=module_name,
-                        error=str(e),
-                        exc_info=True,
-                    )
+                yield pkg_info.name  # already fully qualified by walk_packages
+
+
+def auto_discover_plugins(
+    pm: pluggy.PluginManager,
+    base_paths: list[str],
+    profiler: StartupProfiler | None = None,
+) -> None:
+    """Auto-discover and register plugins from base paths.
+
+    This function scans the specified base paths (e.g., "packages", "modules")
+    for Python packages and imports them. If a package has functions decorated
+    with @hookimpl, they are automatically registered with the plugin manager.
+
+    Args:
+        pm: Plugin manager to register plugins with.
+        base_paths: List of base paths to search (e.g., ["packages", "modules"]).
+        profiler: Optional startup profiler recording per-package import time.
+
+    Example:
+        >>> pm = pluggy.PluginManager("sre_bot")
+        >>> pm.add_hookspecs(hookspecs.platforms)
+        >>> auto_discover_plugins(pm, base_paths=["packages", "modules"])
+        # Now pm has all @hookimpl functions from all packages
+    """
+    for module_name in iter_plugin_packages(base_paths):
+        try:
+            # Import the package - this executes __init__.py
+            # If __init__.py has @hookimpl functions, they get registered
+            with profiler.time_import(module_name) if profiler else nullcontext():
+                module = importlib.import_module(module_name)
+            pm.register(module)
+            logger.debug("plugin_registered", module=module_name)
+        except Exception as e:
+            logger.error(
+                "plugin_registration_failed",
+                module=module_name,
+                error=str(e),
+                exc_info=True,
+            )
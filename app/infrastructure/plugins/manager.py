@@ -10,8 +10,10 @@ from typing import TYPE_CHECKING
 import pluggy
 import structlog
 
+from infrastructure.configuration.infrastructure.server import get_server_settings
 from infrastructure.i18n.resources import I18nResourceRegistry
 from infrastructure.plugins.base import auto_discover_plugins
+from infrastructure.plugins.manifest import load_plugin_manifest, register_plugins_from_manifest
 from infrastructure.plugins.specs import FeatureLifecycleSpecs
 
 if TYPE_CHECKING:
@@ -19,8 +21,11 @@ if TYPE_CHECKING:
     from structlog.stdlib import BoundLogger
 
     from infrastructure.events.service import EventDispatcher
+    from infrastructure.plugins.profiler import StartupProfiler
     from integrations.slack.provider import SlackPlatformProvider
 
+FEATURE_BASE_PATHS = ["packages", "modules"]
+
 logger = structlog.get_logger()
 
 
@@ -38,6 +43,30 @@ def get_plugin_manager() -> pluggy.PluginManager:
     return pm
 
 
+def discover_feature_plugins(
+    pm: pluggy.PluginManager,
+    profiler: StartupProfiler | None = None,
+) -> None:
+    """Register feature plugins from the manifest, or by walking the packages.
+
+    When ``PLUGIN_MANIFEST_PATH`` is set, every manifest entry is registered as
+    a lazy proxy and imported on its first hook call; otherwise every package
+    under ``FEATURE_BASE_PATHS`` is imported eagerly.
+
+    Args:
+        pm: Plugin manager to register plugins with.
+        profiler: Optional startup profiler recording per-plugin import time.
+    """
+    manifest_path = get_server_settings().PLUGIN_MANIFEST_PATH
+    if manifest_path:
+        entries = load_plugin_manifest(manifest_path)
+        register_plugins_from_manifest(pm, entries, profiler=profiler)
+        logger.info("feature_plugins_loaded_from_manifest", path=manifest_path, manifest_entries=len(entries))
+        return
+
+    auto_discover_plugins(pm, base_paths=FEATURE_BASE_PATHS, profiler=profiler)
+
+
 def collect_feature_i18n_resources(
     logger: BoundLogger,
 ) -> I18nResourceRegistry:
@@ -54,7 +83,7 @@ def collect_feature_i18n_resources(
     """
     pm = get_plugin_manager()
 
-    auto_discover_plugins(pm, base_paths=["packages", "modules"])
+    discover_feature_plugins(pm)
     logger.info("feature_plugins_discovered", plugin_count=len(pm.get_plugins()))
 
     i18n_registry = I18nResourceRegistry()
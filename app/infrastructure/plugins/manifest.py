@@ -0,0 +1,245 @@
+"""Manifest-driven, lazy plugin discovery.
+
+``auto_discover_plugins`` imports every package under ``packages/`` and
+``modules/`` at startup, which pulls heavy dependencies (pandas, Google API
+clients, geoip2, Slack modal modules) in before the bot can serve anything.
+This module replaces the walk with a generated manifest that lists only the
+packages that implement hooks, together with the hooks each one implements.
+
+Each manifest entry is registered as a ``LazyPlugin``: a proxy exposing one
+hookimpl per manifest hook whose first call imports the real package and
+delegates to its implementation. Packages without hookimpls are never
+imported, and a plugin whose hooks never fire (e.g. Slack commands while
+Slack is disabled) is never imported either.
+
+Regenerate the manifest with ``python3 bin/generate_plugin_manifest.py``
+whenever a hookimpl is added, removed or renamed; a stale manifest fails
+loudly on the first hook call instead of silently dropping a feature.
+"""
+
+import importlib
+import inspect
+import json
+import threading
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+import pluggy
+import structlog
+
+from infrastructure.plugins.base import iter_plugin_packages
+
+if TYPE_CHECKING:
+    from infrastructure.plugins.profiler import StartupProfiler
+
+logger = structlog.get_logger()
+
+MANIFEST_VERSION = 1
+
+# Hookimpl options a lazy proxy can reproduce; wrappers must run around the
+# other implementations and cannot be deferred behind an import.
+_PROXYABLE_OPTS = ("tryfirst", "trylast", "optionalhook", "specname")
+
+
+@dataclass(frozen=True)
+class ManifestHook:
+    """One hookimpl advertised by a plugin package."""
+
+    name: str
+    argnames: tuple[str, ...]
+    opts: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One plugin package and the hooks it implements."""
+
+    module: str
+    hooks: tuple[ManifestHook, ...]
+
+
+def _impl_argnames(function: Callable[..., Any]) -> tuple[str, ...]:
+    """Return the required positional argument names pluggy passes to a hookimpl."""
+    parameters = inspect.signature(function).parameters.values()
+    return tuple(
+        param.name
+        for param in parameters
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD) and param.default is param.empty
+    )
+
+
+def inspect_plugin_module(pm: pluggy.PluginManager, module: ModuleType) -> tuple[ManifestHook, ...]:
+    """Return the hookimpls a module exposes, as pluggy would register them.
+
+    Args:
+        pm: Plugin manager whose project name identifies the hookimpl marker.
+        module: Imported plugin package.
+
+    Raises:
+        ValueError: If a hookimpl is a wrapper, which cannot be loaded lazily.
+    """
+    hooks: list[ManifestHook] = []
+    for name in sorted(dir(module)):
+        opts = pm.parse_hookimpl_opts(module, name)
+        if opts is None:
+            continue
+        if opts.get("wrapper") or opts.get("hookwrapper"):
+            raise ValueError(f"{module.__name__}.{name} is a hook wrapper and cannot be listed in the plugin manifest")
+        kept = {key: opts[key] for key in _PROXYABLE_OPTS if opts.get(key)}
+        hooks.append(ManifestHook(name=name, argnames=_impl_argnames(getattr(module, name)), opts=kept))
+    return tuple(hooks)
+
+
+def build_plugin_manifest(pm: pluggy.PluginManager, base_paths: list[str]) -> list[ManifestEntry]:
+    """Import every package under the base paths and index their hookimpls.
+
+    Unlike ``auto_discover_plugins`` an import error is raised, so a broken
+    package cannot be left out of the generated manifest unnoticed.
+
+    Args:
+        pm: Plugin manager whose project name identifies the hookimpl marker.
+        base_paths: List of base paths to search (e.g., ["packages", "modules"]).
+
+    Returns:
+        Manifest entries for packages that implement at least one hook.
+    """
+    entries: list[ManifestEntry] = []
+    for module_name in iter_plugin_packages(base_paths):
+        hooks = inspect_plugin_module(pm, importlib.import_module(module_name))
+        if hooks:
+            entries.append(ManifestEntry(module=module_name, hooks=hooks))
+    return entries
+
+
+def dump_plugin_manifest(entries: list[ManifestEntry]) -> str:
+    """Serialize manifest entries to stable, reviewable JSON."""
+    document = {
+        "version": MANIFEST_VERSION,
+        "plugins": [
+            {
+                "module": entry.module,
+                "hooks": [{"name": hook.name, "argnames": list(hook.argnames), "opts": hook.opts} for hook in entry.hooks],
+            }
+            for entry in entries
+        ],
+    }
+    return json.dumps(document, indent=2, sort_keys=True) + "\n"
+
+
+def load_plugin_manifest(path: str | Path) -> list[ManifestEntry]:
+    """Read a manifest written by ``dump_plugin_manifest``.
+
+    Args:
+        path: Location of the manifest JSON file.
+
+    Raises:
+        FileNotFoundError: If the manifest does not exist.
+        ValueError: If the manifest version is not supported.
+    """
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported plugin manifest version: {document.get('version')!r}")
+    return [
+        ManifestEntry(
+            module=plugin["module"],
+            hooks=tuple(
+                ManifestHook(name=hook["name"], argnames=tuple(hook["argnames"]), opts=dict(hook.get("opts", {})))
+                for hook in plugin["hooks"]
+            ),
+        )
+        for plugin in document["plugins"]
+    ]
+
+
+class LazyPlugin:
+    """Proxy plugin that imports its package on the first hook call.
+
+    Attributes:
+        module_name: Package the proxy stands in for.
+    """
+
+    def __init__(self, entry: ManifestEntry, profiler: StartupProfiler | None = None) -> None:
+        """Build one hookimpl stub per manifest hook.
+
+        Args:
+            entry: Manifest entry describing the package and its hooks.
+            profiler: Optional startup profiler recording the deferred import.
+        """
+        from infrastructure.plugins import hookimpl
+
+        self.module_name = entry.module
+        self._profiler = profiler
+        self._module: ModuleType | None = None
+        self._lock = threading.Lock()
+        for hook in entry.hooks:
+            setattr(self, hook.name, hookimpl(**hook.opts)(self._make_stub(hook)))
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the real package has been imported."""
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Import the real package once and return it."""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    with self._profiler.time_import(self.module_name) if self._profiler else nullcontext():
+                        module = importlib.import_module(self.module_name)
+                    logger.debug("lazy_plugin_loaded", module=self.module_name)
+                    self._module = module
+        return self._module
+
+    def _make_stub(self, hook: ManifestHook) -> Callable[..., Any]:
+        def stub(*args: Any) -> Any:
+            implementation = getattr(self.load(), hook.name, None)
+            if implementation is None:
+                raise RuntimeError(
+                    f"Plugin manifest is stale: {self.module_name} no longer defines {hook.name}; "
+                    "regenerate it with bin/generate_plugin_manifest.py"
+                )
+            return implementation(*args)
+
+        stub.__name__ = hook.name
+        stub.__qualname__ = f"LazyPlugin.{hook.name}"
+        stub.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+            [inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD) for name in hook.argnames]
+        )
+        return stub
+
+    def __repr__(self) -> str:
+        return f"LazyPlugin({self.module_name!r}, loaded={self.loaded})"
+
+
+def register_plugins_from_manifest(
+    pm: pluggy.PluginManager,
+    entries: list[ManifestEntry],
+    profiler: StartupProfiler | None = None,
+) -> list[LazyPlugin]:
+    """Register a lazy proxy for every manifest entry.
+
+    Proxies are registered under the package name, so ``pm.get_plugin`` and
+    ``pm.set_blocked`` behave as they do for eagerly imported packages.
+    Entries already registered are skipped.
+
+    Args:
+        pm: Plugin manager to register plugins with.
+        entries: Manifest entries loaded with ``load_plugin_manifest``.
+        profiler: Optional startup profiler recording deferred imports.
+
+    Returns:
+        The lazy plugins that were registered.
+    """
+    registered: list[LazyPlugin] = []
+    for entry in entries:
+        if pm.has_plugin(entry.module) or pm.is_blocked(entry.module):
+            continue
+        plugin = LazyPlugin(entry, profiler=profiler)
+        pm.register(plugin, name=entry.module)
+        registered.append(plugin)
+    logger.debug("manifest_plugins_registered", plugin_count=len(registered))
+    return registered
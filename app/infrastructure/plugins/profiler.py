@@ -0,0 +1,144 @@
+"""Startup profiler for plugin discovery and hook execution.
+
+Records how long each plugin module takes to import and how long each hook
+call takes, so the lifespan logs show which feature is slowing cold start.
+Timings are collected in-process with ``time.perf_counter`` and emitted once
+by ``log_summary``; nothing here runs on the request path.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import pluggy
+
+if TYPE_CHECKING:
+    from structlog.stdlib import BoundLogger
+
+
+@dataclass
+class HookTiming:
+    """Aggregated execution time of one hook."""
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    plugins: set[str] = field(default_factory=set)
+
+
+class StartupProfiler:
+    """Collects plugin import and hook execution timings during startup.
+
+    Attributes:
+        import_seconds: Import duration per plugin module name.
+        import_failures: Plugin module names whose import raised.
+        hook_timings: Aggregated execution time per hook name.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Initialize an empty profiler.
+
+        Args:
+            clock: Monotonic clock returning seconds (injectable for tests).
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started_at = clock()
+        self.import_seconds: dict[str, float] = {}
+        self.import_failures: list[str] = []
+        self.hook_timings: dict[str, HookTiming] = {}
+
+    @contextmanager
+    def time_import(self, module_name: str) -> Iterator[None]:
+        """Time the import of one plugin module.
+
+        Args:
+            module_name: Fully qualified module name being imported.
+        """
+        start = self._clock()
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self.import_failures.append(module_name)
+            raise
+        finally:
+            elapsed = self._clock() - start
+            with self._lock:
+                self.import_seconds[module_name] = self.import_seconds.get(module_name, 0.0) + elapsed
+
+    def record_hook(self, hook_name: str, plugin_names: list[str], seconds: float) -> None:
+        """Record one completed hook call.
+
+        Args:
+            hook_name: Name of the hook that was called.
+            plugin_names: Names of the plugins implementing the hook.
+            seconds: Wall time of the whole hook call.
+        """
+        with self._lock:
+            timing = self.hook_timings.setdefault(hook_name, HookTiming())
+            timing.calls += 1
+            timing.total_seconds += seconds
+            timing.plugins.update(plugin_names)
+
+    def attach(self, pm: pluggy.PluginManager) -> Callable[[], None]:
+        """Time every hook call made through a plugin manager.
+
+        Args:
+            pm: Plugin manager whose hook calls should be recorded.
+
+        Returns:
+            Callable that detaches the profiler from the plugin manager.
+        """
+        starts: dict[int, list[float]] = {}
+
+        def before(hook_name: str, hook_impls: list[Any], kwargs: dict[str, Any]) -> None:
+            starts.setdefault(threading.get_ident(), []).append(self._clock())
+
+        def after(outcome: Any, hook_name: str, hook_impls: list[Any], kwargs: dict[str, Any]) -> None:
+            stack = starts.get(threading.get_ident())
+            if not stack:
+                return
+            elapsed = self._clock() - stack.pop()
+            self.record_hook(hook_name, [impl.plugin_name for impl in hook_impls], elapsed)
+
+        return pm.add_hookcall_monitoring(before, after)
+
+    def summary(self, top: int = 10) -> dict[str, Any]:
+        """Return the collected timings, slowest first.
+
+        Args:
+            top: Maximum number of plugin imports to include.
+
+        Returns:
+            Dictionary with totals, the slowest imports and per-hook timings.
+        """
+        with self._lock:
+            imports = sorted(self.import_seconds.items(), key=lambda item: item[1], reverse=True)
+            hooks = sorted(self.hook_timings.items(), key=lambda item: item[1].total_seconds, reverse=True)
+            return {
+                "elapsed_seconds": round(self._clock() - self._started_at, 4),
+                "plugin_imports": len(imports),
+                "plugin_import_seconds": round(sum(seconds for _, seconds in imports), 4),
+                "slowest_imports": {name: round(seconds, 4) for name, seconds in imports[:top]},
+                "import_failures": list(self.import_failures),
+                "hooks": {
+                    name: {
+                        "calls": timing.calls,
+                        "seconds": round(timing.total_seconds, 4),
+                        "plugins": len(timing.plugins),
+                    }
+                    for name, timing in hooks
+                },
+            }
+
+    def log_summary(self, logger: BoundLogger, top: int = 10) -> None:
+        """Emit the collected timings as a single ``plugin_startup_profile`` event.
+
+        Args:
+            logger: Structured logger for startup events.
+            top: Maximum number of plugin imports to include.
+        """
+        logger.info("plugin_startup_profile", **self.summary(top=top))
@@ -9,6 +9,7 @@ Exports:
     extract_user_info_from_token: Extract user info from JWT token
     validate_jwt_token: Validate JWT token and extract payload
     get_current_user: FastAPI Security() dependency — validates JWT and returns User
+    VerifiedTokenCache: Bounded LRU of verified token digests and their claims
 """
 
 from infrastructure.security.current_user import get_current_user
@@ -18,7 +19,11 @@ from infrastructure.security.jwt import (
     get_issuer_from_token,
     validate_jwt_token,
 )
-from infrastructure.security.rate_limiter import get_limiter, setup_rate_limiter
+from infrastructure.security.rate_limiter import get_client_address, get_limiter, setup_rate_limiter
+from infrastructure.security.token_cache import (
+    VerifiedTokenCache,
+    get_verified_token_cache,
+)
 
 __all__ = [
     "JWKSManager",
@@ -27,6 +32,9 @@ __all__ = [
     "extract_user_info_from_token",
     "validate_jwt_token",
     "get_current_user",
+    "VerifiedTokenCache",
+    "get_verified_token_cache",
     "get_limiter",
+    "get_client_address",
     "setup_rate_limiter",
 ]
@@ -47,6 +47,10 @@ from infrastructure.configuration.infrastructure.server import (
 from infrastructure.security.jwks import JWKSManager, get_jwks_manager
 from infrastructure.security.jwt import validate_jwt_token
 from infrastructure.security.models import AuthPrincipalSource, User
+from infrastructure.security.token_cache import (
+    VerifiedTokenCache,
+    get_verified_token_cache,
+)
 
 logger = structlog.get_logger()
 
@@ -58,6 +62,7 @@ def get_current_user(
     security_scopes: SecurityScopes,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_bearer)],
     jwks_manager: Annotated[JWKSManager, Depends(get_jwks_manager)],
+    token_cache: Annotated[VerifiedTokenCache | None, Depends(get_verified_token_cache)] = None,
 ) -> User:
     """Validate a JWT Bearer token and return the authenticated principal.
 
@@ -79,6 +84,8 @@ def get_current_user(
             from all Security() declarations in the dependency chain.
         credentials: HTTP bearer credentials from the Authorization header.
         jwks_manager: JWKS manager singleton — injected, never constructed here.
+        token_cache: Verified-token cache singleton; repeat presentations of an
+            already verified token skip signature verification until ``exp``.
     Returns:
         Authenticated User with identity resolved from JWT claims.
 
@@ -115,7 +122,7 @@ def get_current_user(
             permissions=list(security_scopes.scopes),
         )
 
-    payload = validate_jwt_token(jwks_manager=jwks_manager, credentials=credentials)
+    payload = validate_jwt_token(jwks_manager=jwks_manager, credentials=credentials, token_cache=token_cache)
 
     token_scopes = _extract_token_scopes(payload)
     missing = [s for s in security_scopes.scopes if s not in token_scopes]
@@ -2,13 +2,20 @@
 
 This module provides JWKS client management and JWT token validation
 with support for multiple issuers.
+
+Signing keys are prefetched at startup and refreshed on a background thread
+so the request path only ever reads the PyJWKClient's in-memory JWK set; a
+network fetch on the request path only happens for a ``kid`` that has not yet
+been published when the last refresh ran.
 """
 
+import threading
+from collections.abc import Callable
 from functools import lru_cache
 from typing import Any
 
 import structlog
-from jwt import PyJWKClient, PyJWKClientError
+from jwt import PyJWKClient, PyJWKClientError, PyJWKSetError
 
 from infrastructure.configuration.infrastructure.server import (
     get_server_settings,
@@ -52,6 +59,10 @@ class JWKSManager:
             raise ValueError("issuer_config must be provided explicitly. Use get_jwks_manager() provider for DI.")
         self.issuer_config = issuer_config
         self.jwks_clients: dict[str, PyJWKClient] = {}
+        self.known_key_ids: dict[str, set[str]] = {}
+        self._key_removal_listeners: list[Callable[[str, set[str]], Any]] = []
+        self._refresh_stop_event: threading.Event | None = None
+        self._refresh_thread: threading.Thread | None = None
 
     def get_jwks_client(self, issuer: str) -> PyJWKClient | None:
         """Get or create JWKS client for the specified issuer.
@@ -100,24 +111,118 @@ class JWKSManager:
         else:
             self.jwks_clients.clear()
 
+    def add_key_removal_listener(self, listener: Callable[[str, set[str]], Any]) -> None:
+        """Register a callback invoked when a refresh drops signing keys.
+
+        Args:
+            listener: Called with ``(issuer, removed_key_ids)`` after a refresh
+                finds that previously published keys are gone.
+        """
+        self._key_removal_listeners.append(listener)
+
+    def refresh_keys(self, issuer: str) -> bool:
+        """Fetch the issuer's JWKS and replace the client's cached key set.
+
+        Failures keep the previously cached key set in place (fail-degraded);
+        they are logged and reported through the return value only.
+
+        Args:
+            issuer: The issuer whose keys should be refreshed
+
+        Returns:
+            True when the key set was fetched, False otherwise
+        """
+        jwks_client = self.get_jwks_client(issuer)
+        if jwks_client is None:
+            return False
+
+        try:
+            jwk_set = jwks_client.get_jwk_set(refresh=True)
+        except (PyJWKClientError, PyJWKSetError) as e:
+            log = logger.bind(issuer=issuer, error=str(e))
+            log.warning("jwks_key_refresh_failed")
+            return False
+
+        key_ids = {key.key_id for key in jwk_set.keys if key.key_id}
+        previous = self.known_key_ids.get(issuer)
+        self.known_key_ids[issuer] = key_ids
+        removed = previous - key_ids if previous is not None else set()
+        if removed:
+            log = logger.bind(issuer=issuer, removed_key_ids=sorted(removed))
+            log.info("jwks_signing_keys_removed")
+            for listener in self._key_removal_listeners:
+                listener(issuer, removed)
+
+        log = logger.bind(issuer=issuer, key_count=len(key_ids))
+        log.debug("jwks_keys_refreshed")
+        return True
+
+    def refresh_all_keys(self) -> int:
+        """Refresh the key set of every configured issuer.
+
+        Returns:
+            Number of issuers whose key set was refreshed successfully
+        """
+        if not self.issuer_config:
+            return 0
+        return sum(1 for issuer in list(self.issuer_config.keys()) if self.refresh_keys(issuer))
+
     def warmup(self) -> None:
-        """Pre-initialize JWKS clients for all configured issuers.
+        """Pre-initialize JWKS clients and prefetch keys for all configured issuers.
 
         Called during application startup to eagerly construct a PyJWKClient
-        for every issuer in the configuration.  Keys are not fetched from the
-        JWKS URI here; that happens on the first token validation.  Warmup only
-        ensures the client objects are created and cached so there is no
-        object-construction overhead on the first authenticated request.
+        for every issuer in the configuration and fetch its key set, so the
+        first authenticated request verifies against an in-memory JWK set.
+        A failed prefetch is logged and retried by the background refresh;
+        it never blocks startup.
         """
         if self.issuer_config is None:
             log = logger.bind()
             log.warning("jwks_warmup_skipped_no_issuer_config")
             return
-        for issuer in list(self.issuer_config.keys()):
-            self.get_jwks_client(issuer)
-        log = logger.bind(issuer_count=len(self.issuer_config))
+        refreshed = self.refresh_all_keys()
+        log = logger.bind(issuer_count=len(self.issuer_config), prefetched_issuer_count=refreshed)
         log.info("jwks_clients_warmed_up")
 
+    def start_background_refresh(self, interval_seconds: float) -> threading.Event:
+        """Start a daemon thread refreshing every issuer's keys on an interval.
+
+        Calling this again while a refresh thread is running is a no-op.
+
+        Args:
+            interval_seconds: Seconds between refresh sweeps
+
+        Returns:
+            The stop event; set it (or call stop_background_refresh) to stop.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive() and self._refresh_stop_event:
+            return self._refresh_stop_event
+
+        stop_event = threading.Event()
+
+        def _refresh_loop() -> None:
+            while not stop_event.wait(interval_seconds):
+                try:
+                    self.refresh_all_keys()
+                except Exception as e:
+                    log = logger.bind(error=str(e))
+                    log.exception("jwks_background_refresh_failed")
+
+        thread = threading.Thread(target=_refresh_loop, name="jwks-refresh", daemon=True)
+        thread.start()
+        self._refresh_stop_event = stop_event
+        self._refresh_thread = thread
+        log = logger.bind(interval_seconds=interval_seconds)
+        log.info("jwks_background_refresh_started")
+        return stop_event
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh thread if one is running."""
+        if self._refresh_stop_event is not None:
+            self._refresh_stop_event.set()
+        self._refresh_stop_event = None
+        self._refresh_thread = None
+
 
 @lru_cache(maxsize=1)
 def get_jwks_manager() -> JWKSManager:
@@ -4,6 +4,7 @@ This module provides JWT token validation with issuer verification
 and user information extraction from token claims.
 """
 
+import time
 from typing import Any
 
 import structlog
@@ -12,6 +13,7 @@ from fastapi.security import HTTPAuthorizationCredentials
 from jwt import PyJWTError, decode
 
 from infrastructure.security.jwks import JWKSManager
+from infrastructure.security.token_cache import VerifiedTokenCache
 
 logger = structlog.get_logger()
 
@@ -69,12 +71,18 @@ def extract_user_info_from_token(token: str) -> tuple[str | None, str | None]:
 def validate_jwt_token(
     jwks_manager: JWKSManager,
     credentials: HTTPAuthorizationCredentials,
+    token_cache: VerifiedTokenCache | None = None,
 ) -> dict[str, Any]:
     """Validate JWT token and extract payload.
 
+    When a token cache is supplied, a token that already passed full
+    validation is answered from the cache until its ``exp`` (minus the
+    cache's skew) without decoding or touching the JWKS client again.
+
     Args:
         credentials: HTTP authorization credentials containing JWT token
         jwks_manager: JWKS manager instance
+        token_cache: Optional cache of previously verified tokens
 
     Returns:
         The decoded and verified JWT payload
@@ -91,6 +99,13 @@ def validate_jwt_token(
 
     token = credentials.credentials
 
+    if token_cache is not None:
+        cached_payload = token_cache.get(token)
+        if cached_payload is not None:
+            return cached_payload
+
+    verification_started = time.perf_counter()
+
     # Extract issuer from token
     issuer = get_issuer_from_token(token)
     if not issuer:
@@ -136,6 +151,13 @@ def validate_jwt_token(
         )
         log = logger.bind(issuer=issuer)
         log.info("jwt_validation_successful")
+        if token_cache is not None:
+            token_cache.put(
+                token,
+                payload,
+                key_id=signing_key.key_id,
+                verification_seconds=time.perf_counter() - verification_started,
+            )
         return payload
     except (PyJWTError, Exception) as e:
         log = logger.bind(issuer=issuer, error=str(e))
@@ -0,0 +1,335 @@
+"""Shared-state storage for the slowapi rate limiter.
+
+The default ``memory://`` storage keeps counters per process, so every
+replica behind the load balancer enforces its own copy of each limit.
+``DynamoDBRateLimitStorage`` (``dynamodb://<table>``) keeps them in a
+DynamoDB table shared by all replicas and implements the limits library's
+sliding-window-counter strategy:
+
+- Each key has one counter item per window (``<key>/<window index>``),
+  incremented with an atomic ``UpdateItem ADD`` through ``StorageService``
+  and removed by the table's TTL two windows later.
+- A request is admitted when the previous window's count, weighted by the
+  part of it still inside the sliding window, plus the current count stays
+  within the limit.
+- Admitted hits are batched locally and written once ``batch_size`` hits are
+  pending or ``flush_interval_seconds`` have passed since the last write. The
+  value returned by each write refreshes the replica's view of the shared
+  count, so steady traffic costs about one write per ``batch_size`` requests
+  and no reads. When that count shows other replicas filled the window, the
+  hit that triggered the write is given back and rejected, so with
+  ``batch_size=1`` the limit holds across replicas; larger batches let each
+  replica admit up to ``batch_size - 1`` hits per key the others have not
+  seen yet.
+- The first request a replica sees for a key in a window (and the first
+  after the previous window closes) reads that window's counter with a
+  synchronous ``GetItem`` on the request path, adding one DynamoDB round
+  trip (typically a few milliseconds in-region) to that request. Later
+  requests in the window are decided from the local view.
+
+The table (``sre_bot_rate_limits`` in ``terraform/dynamodb.tf``) has the
+string partition key ``PK`` and TTL on ``expires_at``; the task role needs
+``GetItem``, ``UpdateItem`` and ``DeleteItem`` on it.
+
+Storage errors fail open: the request is admitted, unwritten hits stay
+pending for the next flush, and a warning is logged.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from math import floor
+from typing import Any
+from urllib.parse import urlsplit
+
+import structlog
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+
+from infrastructure.operations.status import OperationStatus
+from infrastructure.storage import get_storage_service
+from infrastructure.storage.protocol import StorageService
+
+logger = structlog.get_logger()
+
+DEFAULT_TABLE_NAME = "sre_bot_rate_limits"
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+KEY_ATTRIBUTE = "PK"
+COUNT_ATTRIBUTE = "hits"
+TTL_ATTRIBUTE = "expires_at"
+
+
+@dataclass
+class _WindowCounter:
+    """Local view of one window's shared counter.
+
+    Attributes:
+        synced: Count last read from or written to the table.
+        pending: Hits admitted by this replica and not written yet.
+        synced_at: Clock value of the last read or write.
+        window_end: End of the window the counter belongs to.
+        expires_at: Time after which the counter is no longer needed.
+    """
+
+    synced: int
+    synced_at: float
+    window_end: float
+    expires_at: float
+    pending: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.synced + self.pending
+
+
+class DynamoDBRateLimitStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """limits storage backed by a DynamoDB table, selected with ``dynamodb://<table>``.
+
+    The table needs a string partition key ``PK`` and TTL enabled on
+    ``expires_at``.
+
+    Args:
+        uri: Storage URI; its host part is the table name.
+        wrap_exceptions: Accepted for compatibility with limits storages.
+        storage: Storage service used for table I/O (defaults to the shared
+            ``get_storage_service()`` instance, resolved on first use).
+        batch_size: Admitted hits per key buffered before a write.
+        flush_interval_seconds: Maximum age of buffered hits before a write.
+        clock: Wall clock in epoch seconds (injectable for tests).
+    """
+
+    STORAGE_SCHEME = ["dynamodb"]
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        *,
+        storage: StorageService | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time,
+        **options: Any,
+    ) -> None:
+        super().__init__(uri, wrap_exceptions, **options)
+        self._table = (urlsplit(uri).netloc if uri else "") or DEFAULT_TABLE_NAME
+        self._storage = storage
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval = float(flush_interval_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counters: dict[str, _WindowCounter] = {}
+        self._next_sweep = 0.0
+        self._counts = {"writes": 0, "reads": 0, "errors": 0}
+
+    @property
+    def base_exceptions(self) -> tuple[type[Exception], ...]:
+        # StorageService reports failures as OperationResult, never raises.
+        return ()
+
+    # ------------------------------------------------------------------
+    # Sliding window counter
+    # ------------------------------------------------------------------
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = self._clock()
+        current_key, previous, current, previous_ttl = self._sliding_window(key, expiry, now)
+        with self._lock:
+            weighted = previous.total * previous_ttl / expiry + current.total
+            if floor(weighted) + amount > limit:
+                return False
+            current.pending += amount
+            due = current.pending >= self._batch_size or now - current.synced_at >= self._flush_interval
+        admitted = True
+        if due and self._flush(current_key, current, now):
+            with self._lock:
+                admitted = floor(previous.total * previous_ttl / expiry + current.total) <= limit
+            if not admitted:
+                # Other replicas filled the window since our last write.
+                self._give_back(current_key, current, amount)
+        if now >= self._next_sweep:
+            self._sweep(now)
+        return admitted
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = self._clock()
+        _, previous, current, previous_ttl = self._sliding_window(key, expiry, now)
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        with self._lock:
+            return previous.total, previous_ttl, current.total, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        for window_key in self.sliding_window_keys(key, expiry, self._clock()):
+            self.clear(window_key)
+
+    # ------------------------------------------------------------------
+    # limits Storage interface
+    # ------------------------------------------------------------------
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Add ``amount`` to ``key`` without batching and return the new count."""
+        value = self._write(key, amount, int(self._clock() + expiry))
+        return value if value is not None else 0
+
+    def get(self, key: str) -> int:
+        item = self._read(key)
+        if item is None:
+            return 0
+        expires_at = item.get(TTL_ATTRIBUTE)
+        if expires_at is not None and expires_at <= self._clock():
+            # DynamoDB removes expired items lazily; treat them as absent.
+            return 0
+        return int(item.get(COUNT_ATTRIBUTE, 0))
+
+    def get_expiry(self, key: str) -> float:
+        item = self._read(key)
+        return float(item[TTL_ATTRIBUTE]) if item and TTL_ATTRIBUTE in item else self._clock()
+
+    def check(self) -> bool:
+        result = self._service().get(self._table, {KEY_ATTRIBUTE: "__healthcheck__"})
+        return result.is_success or result.status == OperationStatus.NOT_FOUND
+
+    def reset(self) -> int | None:
+        """Drop every local counter; items in the table expire through TTL."""
+        with self._lock:
+            dropped = len(self._counters)
+            self._counters.clear()
+        return dropped
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+        self._service().delete(self._table, {KEY_ATTRIBUTE: key})
+
+    # ------------------------------------------------------------------
+    # Batching
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Write every pending hit (e.g. before shutdown)."""
+        now = self._clock()
+        with self._lock:
+            pending = [(key, counter) for key, counter in self._counters.items() if counter.pending]
+        for key, counter in pending:
+            self._flush(key, counter, now)
+
+    def stats(self) -> dict[str, int]:
+        """Return table call counters and the number of tracked windows."""
+        with self._lock:
+            return {**self._counts, "windows": len(self._counters)}
+
+    def _sliding_window(self, key: str, expiry: int, now: float) -> tuple[str, _WindowCounter, _WindowCounter, float]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        current_start = int(now / expiry) * expiry
+        previous = self._window(previous_key, current_start, expiry, now)
+        current = self._window(current_key, current_start + expiry, expiry, now)
+        previous_ttl = 0.0 if previous.total == 0 else (1 - (((now - expiry) / expiry) % 1)) * expiry
+        return current_key, previous, current, previous_ttl
+
+    def _window(self, window_key: str, window_end: float, expiry: int, now: float) -> _WindowCounter:
+        """Return the local counter of a window, reading it from the table when needed.
+
+        A window is read the first time this replica sees it, and the
+        previous window once more after it closed, so hits other replicas
+        wrote at its end are weighted too. These reads are synchronous and
+        add one table round trip to the request that triggers them.
+        """
+        with self._lock:
+            counter = self._counters.get(window_key)
+        if counter is not None and (window_end > now or counter.synced_at >= window_end):
+            return counter
+        if counter is not None and counter.pending:
+            self._flush(window_key, counter, now)
+            return counter
+
+        synced = self.get(window_key)
+        with self._lock:
+            counter = self._counters.setdefault(
+                window_key,
+                _WindowCounter(synced=synced, synced_at=now, window_end=window_end, expires_at=window_end + expiry),
+            )
+            counter.synced = max(counter.synced, synced)
+            counter.synced_at = now
+        return counter
+
+    def _flush(self, window_key: str, counter: _WindowCounter, now: float) -> bool:
+        """Write the pending hits of one window; returns True when the write succeeded."""
+        with self._lock:
+            amount, counter.pending = counter.pending, 0
+        if not amount:
+            return False
+        value = self._write(window_key, amount, int(counter.expires_at))
+        with self._lock:
+            if value is None:
+                counter.pending += amount
+                return False
+            counter.synced = max(counter.synced, value)
+            counter.synced_at = now
+        return True
+
+    def _give_back(self, window_key: str, counter: _WindowCounter, amount: int) -> None:
+        value = self._write(window_key, -amount, int(counter.expires_at))
+        if value is not None:
+            with self._lock:
+                counter.synced = value
+
+    def _sweep(self, now: float) -> None:
+        """Write hits idle for longer than the flush interval and drop closed windows."""
+        with self._lock:
+            self._next_sweep = now + self._flush_interval
+            idle = [
+                (key, counter)
+                for key, counter in self._counters.items()
+                if counter.pending and now - counter.synced_at >= self._flush_interval
+            ]
+        for key, counter in idle:
+            self._flush(key, counter, now)
+        with self._lock:
+            for key in [key for key, counter in self._counters.items() if counter.expires_at <= now and not counter.pending]:
+                del self._counters[key]
+
+    # ------------------------------------------------------------------
+    # Table I/O
+    # ------------------------------------------------------------------
+
+    def _service(self) -> StorageService:
+        if self._storage is None:
+            self._storage = get_storage_service()
+        return self._storage
+
+    def _write(self, key: str, amount: int, expires_at: int) -> int | None:
+        result = self._service().increment(
+            self._table,
+            {KEY_ATTRIBUTE: key},
+            COUNT_ATTRIBUTE,
+            amount,
+            ttl_attribute=TTL_ATTRIBUTE,
+            expires_at=expires_at,
+        )
+        self._record("writes", result.is_success)
+        if not result.is_success:
+            logger.warning("rate_limit_storage_unavailable", operation="increment", error=result.message)
+            return None
+        return int(result.data)
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        result = self._service().get(self._table, {KEY_ATTRIBUTE: key})
+        if result.status == OperationStatus.NOT_FOUND:
+            self._record("reads", True)
+            return None
+        self._record("reads", result.is_success)
+        if not result.is_success:
+            logger.warning("rate_limit_storage_unavailable", operation="get", error=result.message)
+            return None
+        return result.data
+
+    def _record(self, counter: str, succeeded: bool) -> None:
+        with self._lock:
+            self._counts[counter] += 1
+            self._counts["errors"] += int(not succeeded)
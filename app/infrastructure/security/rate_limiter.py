@@ -5,15 +5,26 @@ into the FastAPI app in server/server.py.
 
 App wiring (app.state.limiter and the RateLimitExceeded exception handler) is
 done once in server/server.py via setup_rate_limiter().
+
+Counters live in the storage named by RATE_LIMIT_STORAGE_URI. The default
+``memory://`` is per process; ``dynamodb://<table>`` shares them across
+replicas (see infrastructure/security/rate_limit_storage.py). Clients are
+keyed by their connecting address, or by the X-Forwarded-For entry appended
+by a trusted proxy (RATE_LIMIT_TRUSTED_PROXIES).
 """
 
 from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
+
+from infrastructure.configuration.infrastructure.server import get_server_settings
+from infrastructure.security.rate_limit_storage import DynamoDBRateLimitStorage
+
+DEFAULT_CLIENT_ADDRESS = "127.0.0.1"
 
 
 async def _rate_limit_handler(_request: Request, exc: Exception) -> JSONResponse:
@@ -22,10 +33,66 @@ async def _rate_limit_handler(_request: Request, exc: Exception) -> JSONResponse
     raise exc  # let FastAPI handle anything unexpected
 
 
+@lru_cache(maxsize=1)
+def _trusted_proxy_networks() -> tuple[IPv4Network | IPv6Network, ...]:
+    proxies = get_server_settings().RATE_LIMIT_TRUSTED_PROXIES
+    return tuple(ip_network(entry, strict=False) for entry in proxies)
+
+
+def _is_trusted_proxy(address: str, networks: tuple[IPv4Network | IPv6Network, ...]) -> bool:
+    try:
+        parsed = ip_address(address)
+    except ValueError:
+        return False
+    return any(parsed in network for network in networks)
+
+
+def get_client_address(request: Request) -> str:
+    """Return the client address used as the rate-limit key.
+
+    X-Forwarded-For is only consulted when the connecting address is a
+    trusted proxy. Entries are read right to left, skipping trusted proxies,
+    and the first other address is the client; anything left of it can be
+    set freely by the client and is ignored. An unparsable entry stops the
+    walk at the last address a trusted proxy vouched for.
+    """
+    peer = request.client.host if request.client and request.client.host else DEFAULT_CLIENT_ADDRESS
+    networks = _trusted_proxy_networks()
+    if not networks or not _is_trusted_proxy(peer, networks):
+        return peer
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if not forwarded_for:
+        return peer
+
+    client = peer
+    for hop in reversed(forwarded_for.split(",")):
+        hop = hop.strip()
+        try:
+            ip_address(hop)
+        except ValueError:
+            break
+        client = hop
+        if not _is_trusted_proxy(hop, networks):
+            break
+    return client
+
+
 @lru_cache(maxsize=1)
 def get_limiter() -> Limiter:
     """Return the application-scoped rate limiter singleton."""
-    return Limiter(key_func=get_remote_address)
+    settings = get_server_settings()
+    storage_uri = settings.RATE_LIMIT_STORAGE_URI
+    if storage_uri.split("://", 1)[0] in DynamoDBRateLimitStorage.STORAGE_SCHEME:
+        return Limiter(
+            key_func=get_client_address,
+            storage_uri=storage_uri,
+            storage_options={
+                "batch_size": settings.RATE_LIMIT_BATCH_SIZE,
+                "flush_interval_seconds": settings.RATE_LIMIT_FLUSH_INTERVAL_SECONDS,
+            },
+            strategy="sliding-window-counter",
+        )
+    return Limiter(key_func=get_client_address, storage_uri=storage_uri)
 
 
 def setup_rate_limiter(app: FastAPI) -> None:
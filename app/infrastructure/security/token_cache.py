@@ -0,0 +1,222 @@
+"""Verified JWT cache for the API authentication path.
+
+Backstage and other API clients reuse the same bearer token for its whole
+lifetime, so every request would otherwise repeat the unverified issuer
+decode, the JWKS signing-key lookup and the signature verification. This
+module keeps the claims of tokens that already passed full validation in a
+bounded LRU keyed on the SHA-256 digest of the token; the raw token is never
+stored.
+
+Entries are served only until ``exp`` minus a configurable skew, and entries
+verified with a signing key that disappears from the issuer's JWKS are
+dropped on the next key refresh (see ``JWKSManager.add_key_removal_listener``).
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import structlog
+
+from infrastructure.configuration.infrastructure.server import (
+    get_server_settings,
+)
+from infrastructure.security.jwks import get_jwks_manager
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class _CachedClaims:
+    claims: dict[str, Any]
+    issuer: str
+    key_id: str | None
+    serve_until: float
+
+
+class VerifiedTokenCache:
+    """Bounded, thread-safe LRU of verified token digests and their claims.
+
+    Attributes:
+        max_entries: Maximum number of cached tokens; 0 disables caching.
+        expiry_skew_seconds: Seconds before ``exp`` at which entries expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        expiry_skew_seconds: int = 30,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached tokens; 0 disables caching.
+            expiry_skew_seconds: Seconds subtracted from ``exp`` when deciding
+                how long a verification may be reused.
+            clock: Wall-clock source returning epoch seconds (injectable for tests).
+        """
+        self.max_entries = max_entries
+        self.expiry_skew_seconds = expiry_skew_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _CachedClaims] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._verifications = 0
+        self._verification_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_entries > 0
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Return cached claims for a previously verified token.
+
+        Args:
+            token: Raw bearer token.
+
+        Returns:
+            A copy of the verified claims, or None when the token is unknown
+            or its cached verification has expired.
+        """
+        if not self.enabled:
+            return None
+        digest = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.serve_until <= self._clock():
+                del self._entries[digest]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self._hits += 1
+            return dict(entry.claims)
+
+    def put(
+        self,
+        token: str,
+        claims: dict[str, Any],
+        key_id: str | None = None,
+        verification_seconds: float = 0.0,
+    ) -> None:
+        """Remember the claims of a token that passed full validation.
+
+        Tokens without a numeric ``exp``, or whose ``exp`` falls inside the
+        skew window, are not cached.
+
+        Args:
+            token: Raw bearer token that was verified.
+            claims: Verified claims returned by ``jwt.decode``.
+            key_id: ``kid`` of the signing key used for verification.
+            verification_seconds: Wall time the full verification took; used
+                to report the verification cost saved by cache hits.
+        """
+        with self._lock:
+            self._verifications += 1
+            self._verification_seconds += verification_seconds
+        if not self.enabled:
+            return
+
+        exp = claims.get("exp")
+        if not isinstance(exp, int | float) or isinstance(exp, bool):
+            return
+        serve_until = float(exp) - self.expiry_skew_seconds
+        if serve_until <= self._clock():
+            return
+
+        entry = _CachedClaims(
+            claims=dict(claims),
+            issuer=str(claims.get("iss", "")),
+            key_id=key_id,
+            serve_until=serve_until,
+        )
+        digest = self._digest(token)
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate_keys(self, issuer: str, key_ids: Iterable[str]) -> int:
+        """Drop entries verified with signing keys that are no longer published.
+
+        Args:
+            issuer: Issuer whose JWKS no longer contains the keys.
+            key_ids: ``kid`` values removed from the issuer's JWKS.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed_kids = set(key_ids)
+        with self._lock:
+            stale = [digest for digest, entry in self._entries.items() if entry.issuer == issuer and entry.key_id in removed_kids]
+            for digest in stale:
+                del self._entries[digest]
+            self._invalidations += len(stale)
+        if stale:
+            log = logger.bind(issuer=issuer, removed_entries=len(stale))
+            log.info("verified_token_cache_invalidated")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove every cached entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters, including the estimated verification cost saved.
+
+        ``verification_seconds_saved`` multiplies the hit count by the mean
+        duration of the full verifications observed so far.
+        """
+        with self._lock:
+            average = self._verification_seconds / self._verifications if self._verifications else 0.0
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "verifications": self._verifications,
+                "average_verification_seconds": average,
+                "verification_seconds_saved": self._hits * average,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """Singleton accessor for the verified token cache.
+
+    The cache subscribes to JWKS key removals so tokens signed with a retired
+    key are never served after the next key refresh.
+    """
+    settings = get_server_settings()
+    cache = VerifiedTokenCache(
+        max_entries=settings.JWT_VERIFIED_CACHE_MAX_ENTRIES,
+        expiry_skew_seconds=settings.JWT_VERIFIED_CACHE_EXPIRY_SKEW_SECONDS,
+    )
+    get_jwks_manager().add_key_removal_listener(cache.invalidate_keys)
+    return cache
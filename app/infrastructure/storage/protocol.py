@@ -4,6 +4,7 @@ Defines the runtime-checkable interface consumed by feature packages and
 infrastructure services. Concrete implementations can vary by backing store.
 """
 
+from collections.abc import Iterator
 from typing import Any, Protocol, runtime_checkable
 
 from infrastructure.operations.result import OperationResult
@@ -22,6 +23,17 @@ class StorageService(Protocol):
         pk_attribute: str,
     ) -> OperationResult: ...
 
+    def increment(
+        self,
+        table: str,
+        key: dict[str, Any],
+        attribute: str,
+        amount: int = 1,
+        *,
+        ttl_attribute: str | None = None,
+        expires_at: int | None = None,
+    ) -> OperationResult: ...
+
     def get(self, table: str, key: dict[str, Any]) -> OperationResult: ...
 
     def query(
@@ -33,3 +45,19 @@ class StorageService(Protocol):
     ) -> OperationResult: ...
 
     def delete(self, table: str, key: dict[str, Any]) -> OperationResult: ...
+
+    def batch_get(self, table: str, keys: list[dict[str, Any]], **kwargs: Any) -> OperationResult: ...
+
+    def batch_put(self, table: str, items: list[dict[str, Any]]) -> OperationResult: ...
+
+    def batch_delete(self, table: str, keys: list[dict[str, Any]]) -> OperationResult: ...
+
+    def transact_write(self, operations: list[dict[str, Any]]) -> OperationResult: ...
+
+    def scan(
+        self,
+        table: str,
+        segments: int = 1,
+        expression_values: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[OperationResult]: ...
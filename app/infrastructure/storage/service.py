@@ -7,13 +7,26 @@ type conversion via boto3's built-in ``TypeSerializer`` / ``TypeDeserializer``.
 Feature packages MUST NOT call boto3 clients directly. Instead, define a thin
 repository class that takes ``infrastructure.storage.protocol.StorageService``
 as a constructor argument and delegates all DynamoDB I/O here.
+
+Repositories that read or write many items should use the batch operations:
+``batch_get`` sends up to 100 keys per request and ``batch_put`` /
+``batch_delete`` up to 25 items, retrying unprocessed items with jittered
+exponential backoff. Batches are not atomic; ``transact_write`` is the
+all-or-nothing alternative. ``scan`` streams pages and can split the table
+into segments scanned in parallel.
 """
 
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
 from typing import Any, Protocol, cast
 
 import structlog
-from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from boto3.dynamodb.types import DYNAMODB_CONTEXT, TypeDeserializer, TypeSerializer
 from botocore.exceptions import BotoCoreError, ClientError
 
 from infrastructure.operations.result import OperationResult
@@ -26,6 +39,20 @@ logger = structlog.get_logger(__name__)
 _serializer = TypeSerializer()
 _deserializer = TypeDeserializer()
 
+# DynamoDB request limits.
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+TRANSACT_WRITE_MAX_ITEMS = 100
+# Unprocessed batch items are resubmitted with full-jitter exponential backoff.
+BATCH_RETRY_ATTEMPTS = 5
+BATCH_RETRY_BASE_DELAY_SECONDS = 0.05
+BATCH_RETRY_MAX_DELAY_SECONDS = 2.0
+# Pages buffered per segment before a parallel scan worker waits for the consumer.
+SCAN_BUFFERED_PAGES_PER_SEGMENT = 2
+# Numbers DynamoDB can store exactly (38 significant digits).
+_MAX_EXACT_INT = 10**38
+_SEGMENT_DONE = object()
+
 
 class DynamoDBClient(Protocol):
     def put_item(self, **kwargs: Any) -> dict[str, Any]: ...
@@ -34,16 +61,47 @@ class DynamoDBClient(Protocol):
 
     def delete_item(self, **kwargs: Any) -> dict[str, Any]: ...
 
+    def update_item(self, **kwargs: Any) -> dict[str, Any]: ...
+
+    def batch_get_item(self, **kwargs: Any) -> dict[str, Any]: ...
+
+    def batch_write_item(self, **kwargs: Any) -> dict[str, Any]: ...
+
+    def transact_write_items(self, **kwargs: Any) -> dict[str, Any]: ...
+
     def get_paginator(self, operation_name: str) -> Any: ...
 
 
+def _serialize_value(value: Any) -> dict[str, Any]:
+    """Serialize one value, skipping ``TypeSerializer`` for str, bool and int."""
+    kind = type(value)
+    if kind is str:
+        return {"S": value}
+    if kind is bool:
+        return {"BOOL": value}
+    if kind is int and -_MAX_EXACT_INT < value < _MAX_EXACT_INT:
+        return {"N": str(value)}
+    return _serializer.serialize(value)
+
+
+def _deserialize_value(value: dict[str, Any]) -> Any:
+    """Deserialize one attribute value, skipping ``TypeDeserializer`` for S, BOOL and N."""
+    if len(value) == 1:
+        ((tag, raw),) = value.items()
+        if tag == "S" or tag == "BOOL":
+            return raw
+        if tag == "N":
+            return DYNAMODB_CONTEXT.create_decimal(raw)
+    return _deserializer.deserialize(value)
+
+
 def _serialize_item(item: dict[str, Any]) -> dict[str, Any]:
     """Serialize a plain Python dict to DynamoDB attribute format.
 
     Skips None values — DynamoDB does not accept null attribute values in
     put_item or as key conditions.
     """
-    return {k: _serializer.serialize(v) for k, v in item.items() if v is not None}
+    return {k: _serialize_value(v) for k, v in item.items() if v is not None}
 
 
 def _deserialize_item(item: dict[str, Any]) -> dict[str, Any]:
@@ -52,7 +110,36 @@ def _deserialize_item(item: dict[str, Any]) -> dict[str, Any]:
     Numeric values are returned as ``Decimal`` by the boto3 deserializer.
     Callers that expect ``int``/``float`` should cast as needed.
     """
-    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+    return {k: _deserialize_value(v) for k, v in item.items()}
+
+
+def _serialize_values(values: dict[str, Any]) -> dict[str, Any]:
+    """Serialize an ``ExpressionAttributeValues`` mapping (None becomes NULL)."""
+    return {k: _serialize_value(v) for k, v in values.items()}
+
+
+def _serialize_transact_item(operation: dict[str, Any]) -> dict[str, Any]:
+    """Serialize the Item, Key and ExpressionAttributeValues of one transaction entry."""
+    serialized: dict[str, Any] = {}
+    for action, params in operation.items():
+        params = dict(params)
+        for field in ("Item", "Key"):
+            if field in params:
+                params[field] = _serialize_item(params[field])
+        if "ExpressionAttributeValues" in params:
+            params["ExpressionAttributeValues"] = _serialize_values(params["ExpressionAttributeValues"])
+        serialized[action] = params
+    return serialized
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before resubmitting unprocessed items."""
+    ceiling = min(BATCH_RETRY_MAX_DELAY_SECONDS, BATCH_RETRY_BASE_DELAY_SECONDS * 2**attempt)
+    return random.uniform(0, ceiling)  # noqa: S311 -- retry jitter, not used for security
+
+
+def _count_unprocessed(request_items: dict[str, Any]) -> int:
+    return sum(len(entry["Keys"]) if isinstance(entry, dict) else len(entry) for entry in request_items.values())
 
 
 class DynamoDBStorageService:
@@ -164,6 +251,64 @@ class DynamoDBStorageService:
         )
         return result
 
+    def increment(
+        self,
+        table: str,
+        key: dict[str, Any],
+        attribute: str,
+        amount: int = 1,
+        *,
+        ttl_attribute: str | None = None,
+        expires_at: int | None = None,
+    ) -> OperationResult:
+        """Atomically add ``amount`` to a numeric attribute and return the new value.
+
+        Uses ``UpdateItem`` with an ``ADD`` action, so concurrent writers never
+        lose increments and a missing item or attribute starts at zero. When
+        ``ttl_attribute`` is given, ``expires_at`` (epoch seconds) is written
+        only if the item has no expiry yet.
+
+        Args:
+            table: DynamoDB table name.
+            key: Plain Python dict with the item's primary key attributes.
+            attribute: Name of the numeric counter attribute.
+            amount: Value to add (may be negative).
+            ttl_attribute: Optional name of the table's TTL attribute.
+            expires_at: Expiry written to ``ttl_attribute`` on creation.
+
+        Returns:
+            ``OperationResult[int]`` with the counter value after the update.
+        """
+        update_expression = "ADD #counter :amount"
+        names = {"#counter": attribute}
+        values: dict[str, Any] = {":amount": _serialize_value(amount)}
+        if ttl_attribute is not None and expires_at is not None:
+            update_expression += " SET #ttl = if_not_exists(#ttl, :expires_at)"
+            names["#ttl"] = ttl_attribute
+            values[":expires_at"] = _serialize_value(expires_at)
+        try:
+            response = self._dynamodb.update_item(
+                TableName=table,
+                Key=_serialize_item(key),
+                UpdateExpression=update_expression,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ReturnValues="UPDATED_NEW",
+            )
+            result: OperationResult[Any] = OperationResult.success(data=response)
+        except (ClientError, BotoCoreError) as exc:
+            result = self._map_sdk_exception(exc)
+        if not result.is_success:
+            logger.error(
+                "storage_increment_error",
+                table=table,
+                error=result.message,
+                error_code=result.error_code,
+            )
+            return result
+        updated = _deserialize_item(result.data.get("Attributes") or {})
+        return OperationResult.success(data=int(updated.get(attribute, 0)))
+
     def delete(
         self,
         table: str,
@@ -196,6 +341,153 @@ class DynamoDBStorageService:
             )
         return result
 
+    # ------------------------------------------------------------------
+    # Batch and transactional writes
+    # ------------------------------------------------------------------
+
+    def batch_put(
+        self,
+        table: str,
+        items: list[dict[str, Any]],
+    ) -> OperationResult:
+        """Write (or overwrite) many items with ``BatchWriteItem``.
+
+        Items are sent 25 per request. The write is not atomic: when a
+        request fails or items stay unprocessed after every retry, the
+        earlier chunks remain written. Two items with the same primary key
+        in one chunk are rejected by DynamoDB.
+
+        Args:
+            table: DynamoDB table name.
+            items: Plain Python dicts.  Keys must include the table's primary key.
+
+        Returns:
+            ``OperationResult[int]`` with the number of items written, or error.
+        """
+        requests = [{"PutRequest": {"Item": _serialize_item(item)}} for item in items]
+        return self._batch_write(table, requests, "storage_batch_put")
+
+    def batch_delete(
+        self,
+        table: str,
+        keys: list[dict[str, Any]],
+    ) -> OperationResult:
+        """Delete many items by primary key with ``BatchWriteItem``.
+
+        Keys are sent 25 per request; like ``batch_put`` the delete is not
+        atomic.
+
+        Args:
+            table: DynamoDB table name.
+            keys: Plain Python dicts identifying the items.
+
+        Returns:
+            ``OperationResult[int]`` with the number of keys deleted, or error.
+        """
+        requests = [{"DeleteRequest": {"Key": _serialize_item(key)}} for key in keys]
+        return self._batch_write(table, requests, "storage_batch_delete")
+
+    def transact_write(self, operations: list[dict[str, Any]]) -> OperationResult:
+        """Apply up to 100 writes atomically with ``TransactWriteItems``.
+
+        Each operation uses the DynamoDB shape with plain Python values, e.g.
+        ``{"Put": {"TableName": "requests", "Item": {...},
+        "ConditionExpression": "attribute_not_exists(pk)"}}``. ``Item``,
+        ``Key`` and ``ExpressionAttributeValues`` are serialized
+        automatically; other parameters are passed through verbatim.
+
+        Args:
+            operations: ``Put``, ``Update``, ``Delete`` or ``ConditionCheck`` entries.
+
+        Returns:
+            ``OperationResult[None]``. A cancelled transaction returns an error
+            with ``error_code="TransactionCanceledException"`` and the
+            cancellation reason code of each operation (``"None"`` for those
+            that did not fail) as ``data``.
+        """
+        if len(operations) > TRANSACT_WRITE_MAX_ITEMS:
+            return OperationResult.permanent_error(
+                message=f"Transactions are limited to {TRANSACT_WRITE_MAX_ITEMS} operations, got {len(operations)}",
+                error_code="ValidationException",
+            )
+        if not operations:
+            return OperationResult.success(data=None)
+        transact_items = [_serialize_transact_item(operation) for operation in operations]
+        result: OperationResult[Any]
+        try:
+            self._dynamodb.transact_write_items(TransactItems=transact_items)
+            result = OperationResult.success(data=None)
+        except (ClientError, BotoCoreError) as exc:
+            result = self._map_sdk_exception(exc)
+            if result.error_code == "TransactionCanceledException":
+                reasons = cast(ClientError, exc).response.get("CancellationReasons", [])
+                result = OperationResult.error(
+                    status=result.status,
+                    message=result.message,
+                    error_code=result.error_code,
+                    retry_after=result.retry_after,
+                    data=[reason.get("Code") for reason in reasons],
+                )
+        if result.is_success:
+            logger.debug("storage_transact_write_ok", operations=len(operations))
+        else:
+            logger.error(
+                "storage_transact_write_error",
+                operations=len(operations),
+                error=result.message,
+                error_code=result.error_code,
+            )
+        return result
+
+    def _batch_write(self, table: str, requests: list[dict[str, Any]], event: str) -> OperationResult:
+        written = 0
+        result: OperationResult[Any] = OperationResult.success(data=0)
+        for start in range(0, len(requests), BATCH_WRITE_MAX_ITEMS):
+            chunk = requests[start : start + BATCH_WRITE_MAX_ITEMS]
+            result = self._submit_batch(self._dynamodb.batch_write_item, {table: chunk}, "UnprocessedItems")
+            if not result.is_success:
+                break
+            written += len(chunk)
+        if result.is_success:
+            logger.debug(f"{event}_ok", table=table, items=written)
+            return OperationResult.success(data=written)
+        logger.error(
+            f"{event}_error",
+            table=table,
+            written=written,
+            error=result.message,
+            error_code=result.error_code,
+        )
+        return result
+
+    def _submit_batch(
+        self,
+        method: Callable[..., dict[str, Any]],
+        request_items: dict[str, Any],
+        unprocessed_key: str,
+    ) -> OperationResult:
+        """Send one batch request, resubmitting unprocessed items with backoff.
+
+        Returns:
+            ``OperationResult[list[dict]]`` with every response received.
+        """
+        responses: list[dict[str, Any]] = []
+        for attempt in range(BATCH_RETRY_ATTEMPTS):
+            if attempt:
+                time.sleep(_backoff_delay(attempt - 1))
+            try:
+                response = method(RequestItems=request_items)
+            except (ClientError, BotoCoreError) as exc:
+                return self._map_sdk_exception(exc)
+            responses.append(response)
+            request_items = response.get(unprocessed_key) or {}
+            if not request_items:
+                return OperationResult.success(data=responses)
+        return OperationResult.transient_error(
+            message=f"{_count_unprocessed(request_items)} items unprocessed after {BATCH_RETRY_ATTEMPTS} attempts",
+            error_code=unprocessed_key,
+        )
+
     # ------------------------------------------------------------------
     # Read operations
     # ------------------------------------------------------------------
@@ -237,6 +529,136 @@ class DynamoDBStorageService:
             )
         return OperationResult.success(data=_deserialize_item(raw_item))
 
+    def batch_get(
+        self,
+        table: str,
+        keys: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> OperationResult:
+        """Get many items by primary key with ``BatchGetItem``.
+
+        Keys are de-duplicated and sent 100 per request.
+
+        Args:
+            table: DynamoDB table name.
+            keys: Plain Python dicts with each item's primary key attributes.
+            **kwargs: Per-table ``BatchGetItem`` parameters passed through
+                verbatim (``ConsistentRead``, ``ProjectionExpression``,
+                ``ExpressionAttributeNames``).
+
+        Returns:
+            ``OperationResult[list[dict]]`` with the deserialized items that
+            exist, in no particular order, or error.
+        """
+        unique_keys = list({tuple(sorted(key.items())): key for key in keys}.values())
+        raw_items: list[dict[str, Any]] = []
+        result: OperationResult[Any] = OperationResult.success(data=[])
+        for start in range(0, len(unique_keys), BATCH_GET_MAX_KEYS):
+            chunk = [_serialize_item(key) for key in unique_keys[start : start + BATCH_GET_MAX_KEYS]]
+            result = self._submit_batch(self._dynamodb.batch_get_item, {table: {"Keys": chunk, **kwargs}}, "UnprocessedKeys")
+            if not result.is_success:
+                break
+            for response in result.data:
+                raw_items.extend(response.get("Responses", {}).get(table, []))
+        if not result.is_success:
+            logger.error(
+                "storage_batch_get_error",
+                table=table,
+                error=result.message,
+                error_code=result.error_code,
+            )
+            return result
+        return OperationResult.success(data=[_deserialize_item(item) for item in raw_items])
+
+    def scan(
+        self,
+        table: str,
+        segments: int = 1,
+        expression_values: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[OperationResult]:
+        """Scan a table, yielding one result per page.
+
+        With ``segments`` greater than one the table is split into that many
+        segments, each paginated by its own worker thread, and pages are
+        yielded as they arrive, so page order is not deterministic. Closing
+        the iterator early stops the workers after their current page.
+
+        Args:
+            table: DynamoDB table name.
+            segments: Number of segments scanned in parallel.
+            expression_values: Optional placeholder → Python value mapping for
+                ``FilterExpression``; serialized automatically.
+            **kwargs: Additional DynamoDB scan parameters passed through
+                verbatim (``FilterExpression``, ``ProjectionExpression``,
+                ``ExpressionAttributeNames``, ``Limit``, etc.).
+
+        Yields:
+            ``OperationResult[list[dict]]`` per page of deserialized items. An
+            error result is yielded once and ends the scan.
+        """
+        if expression_values is not None:
+            kwargs["ExpressionAttributeValues"] = _serialize_values(expression_values)
+        if segments <= 1:
+            yield from self._scan_segment(table, kwargs)
+            return
+
+        pages: queue.Queue[Any] = queue.Queue(maxsize=segments * SCAN_BUFFERED_PAGES_PER_SEGMENT)
+        stop = threading.Event()
+
+        def offer(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def scan_segment(segment: int) -> None:
+            try:
+                for page in self._scan_segment(table, {**kwargs, "Segment": segment, "TotalSegments": segments}):
+                    offer(page)
+                    if stop.is_set():
+                        return
+            except Exception as exc:  # pylint: disable=broad-except
+                offer(exc)
+            finally:
+                offer(_SEGMENT_DONE)
+
+        executor = ThreadPoolExecutor(max_workers=segments, thread_name_prefix="storage-scan")
+        try:
+            for segment in range(segments):
+                executor.submit(scan_segment, segment)
+            remaining = segments
+            while remaining:
+                item = pages.get()
+                if item is _SEGMENT_DONE:
+                    remaining -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+                if not item.is_success:
+                    return
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def _scan_segment(self, table: str, scan_args: dict[str, Any]) -> Iterator[OperationResult]:
+        try:
+            for page in self._dynamodb.get_paginator("scan").paginate(TableName=table, **scan_args):
+                yield OperationResult.success(data=[_deserialize_item(item) for item in page.get("Items", [])])
+        except (ClientError, BotoCoreError) as exc:
+            result = self._map_sdk_exception(exc)
+            logger.error(
+                "storage_scan_error",
+                table=table,
+                segment=scan_args.get("Segment"),
+                error=result.message,
+                error_code=result.error_code,
+            )
+            yield result
+
     def query(
         self,
         table: str,
@@ -263,7 +685,7 @@ class DynamoDBStorageService:
         Returns:
             ``OperationResult[list[dict]]`` with deserialized items, or error.
         """
-        serialized_values = {k: _serializer.serialize(v) for k, v in expression_values.items()}
+        serialized_values = _serialize_values(expression_values)
         query_args: dict[str, Any] = {
             "TableName": table,
             "KeyConditionExpression": key_condition,
@@ -128,12 +128,33 @@ def classify_aws_error(exc: Exception) -> tuple[OperationStatus, str | None, int
         return OperationStatus.UNAUTHORIZED, code, None
     if code in transient_codes:
         return OperationStatus.TRANSIENT_ERROR, code, 60
+    # Failed write conditions are expected outcomes, not SDK faults.
     if code == "ConditionalCheckFailedException":
         return OperationStatus.PERMANENT_ERROR, code, None
+    if code == "TransactionCanceledException":
+        return _classify_cancelled_transaction(exc, response)
 
     raise exc
 
 
+def _classify_cancelled_transaction(
+    exc: ClientError, response: dict[str, Any]
+) -> tuple[OperationStatus, str | None, int | None]:
+    """Classify a cancelled transaction from the reason code of each operation.
+
+    Throttling and conflicts with concurrent transactions are transient; a
+    failed condition is permanent. Any other reason propagates ``exc``.
+    """
+    reasons = {reason.get("Code") for reason in response.get("CancellationReasons") or []} - {"None"}
+    if reasons & {"ThrottlingError", "ProvisionedThroughputExceeded"}:
+        return OperationStatus.TRANSIENT_ERROR, "TransactionCanceledException", 60
+    if "TransactionConflict" in reasons:
+        return OperationStatus.TRANSIENT_ERROR, "TransactionCanceledException", None
+    if reasons and reasons <= {"ConditionalCheckFailed"}:
+        return OperationStatus.PERMANENT_ERROR, "TransactionCanceledException", None
+    raise exc
+
+
 def handle_aws_api_errors(func):
     """Decorator to handle AWS API errors.
 
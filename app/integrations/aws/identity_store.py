@@ -1,7 +1,14 @@
 """AWS Identity Store module"""
 
+import random
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
 import pandas as pd
 import structlog
+from botocore.exceptions import ClientError  # type: ignore
 
 from infrastructure.configuration.integrations.aws import get_aws_settings
 from integrations.aws.client import execute_aws_api_call, handle_aws_api_errors
@@ -11,6 +18,12 @@ logger = structlog.get_logger()
 settings = get_aws_settings()
 INSTANCE_ID = settings.INSTANCE_ID
 ROLE_ARN = settings.ORG_ROLE_ARN
+THROTTLING_ERRS = settings.THROTTLING_ERRS
+GROUP_FIELDS = ("GroupId", "DisplayName", "Description", "IdentityStoreId")
+# Identity Store list operations are throttled per account; keep the fan-out modest.
+MEMBERSHIPS_MAX_WORKERS = 4
+MEMBERSHIPS_MAX_ATTEMPTS = 5
+MEMBERSHIPS_BACKOFF_SECONDS = 0.5
 
 
 def resolve_identity_store_id(kwargs):
@@ -266,6 +279,10 @@ def list_group_memberships(group_id, **kwargs):
 
     Returns:
         list: A list of group membership objects."""
+    return _list_group_memberships(group_id, **kwargs)
+
+
+def _list_group_memberships(group_id, **kwargs):
     kwargs = resolve_identity_store_id(kwargs)
     params = {
         "IdentityStoreId": kwargs.get("IdentityStoreId"),
@@ -282,6 +299,45 @@ def list_group_memberships(group_id, **kwargs):
     return response if response else []
 
 
+def _list_group_memberships_with_retry(
+    group_id: str,
+    max_attempts: int = MEMBERSHIPS_MAX_ATTEMPTS,
+    backoff_seconds: float = MEMBERSHIPS_BACKOFF_SECONDS,
+) -> list[dict[str, Any]]:
+    """List a group's memberships, retrying throttled calls with jittered exponential backoff.
+
+    Any other error, or throttling past ``max_attempts``, is raised.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return _list_group_memberships(group_id)
+        except ClientError as error:
+            code = error.response.get("Error", {}).get("Code")
+            if code not in THROTTLING_ERRS or attempt == max_attempts - 1:
+                raise
+            delay = random.uniform(0, backoff_seconds * (2**attempt))  # noqa: S311 -- retry jitter, not used for security
+            logger.info(
+                "aws_identity_store_group_memberships_throttled",
+                group_id=group_id,
+                attempt=attempt + 1,
+                delay_seconds=round(delay, 3),
+            )
+            time.sleep(delay)
+    return []
+
+
+def index_users_by_id(users: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index Identity Store users by UserId.
+
+    Args:
+        users (list): User objects as returned by ``list_users``.
+
+    Returns:
+        dict: User objects by UserId.
+    """
+    return {user["UserId"]: user for user in users if user.get("UserId")}
+
+
 @handle_aws_api_errors
 def list_groups_with_memberships(
     groups_filters: list | None = None,
@@ -290,14 +346,38 @@ def list_groups_with_memberships(
     """Retrieves groups with their members from the AWS Identity Center (identitystore)
 
     Args:
-        group_members (bool): Include group members in the response. Default is True.
-        members_details (bool): Include the details of the members. Default is True.
-        include_empty_groups (bool): Include groups without members. Default is True.
         groups_filters (list): A list of filters to apply to the groups. Default is None.
-        **kwargs: Additional keyword arguments for the API call. (passed to list_groups)
+        tolerate_errors (bool): Keep groups with members that could not be resolved. Default is False.
 
     Returns:
-        list: A list of group objects with their members. Any group without members will not be included.
+        list: A list of group objects with their members, in the order of ``list_groups``.
+        Any group without members will not be included.
+    """
+    return list(iter_groups_with_memberships(groups_filters, tolerate_errors, ordered=True))
+
+
+def iter_groups_with_memberships(
+    groups_filters: list | None = None,
+    tolerate_errors: bool = False,
+    max_workers: int = MEMBERSHIPS_MAX_WORKERS,
+    ordered: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Yield groups with their members as their memberships are fetched.
+
+    Users are listed once and indexed by UserId. Memberships are listed
+    concurrently, one group per task on up to ``max_workers`` threads, and
+    throttled calls are retried with backoff. A group whose memberships
+    cannot be listed is logged and left out.
+
+    Args:
+        groups_filters (list): A list of filters to apply to the groups. Default is None.
+        tolerate_errors (bool): Keep groups with members that could not be resolved. Default is False.
+        max_workers (int): Groups fetched concurrently.
+        ordered (bool): Yield groups in the order of ``list_groups`` instead of
+            as soon as each one completes.
+
+    Yields:
+        dict: A group object with its ``GroupMemberships``.
     """
     logger.info(
         "aws_identity_store_operation_started",
@@ -306,11 +386,11 @@ def list_groups_with_memberships(
         tolerate_errors=tolerate_errors,
     )
     groups = list_groups()
-    logger.info("aws_identity_store_groups_fetched", count=len(groups))
+    logger.info("aws_identity_store_groups_fetched", count=len(groups) if groups else 0)
 
     if not groups:
         logger.info("aws_identity_store_operation_complete", status="empty", count=0)
-        return []
+        return
 
     if groups_filters is not None:
         original_count = len(groups)
@@ -322,62 +402,64 @@ def list_groups_with_memberships(
             filtered_count=len(groups),
         )
 
-    filtered_groups = [
-        {k: v for k, v in group.items() if k in ["GroupId", "DisplayName", "Description", "IdentityStoreId"]} for group in groups
-    ]
-
-    users = list_users()
-    logger.info("aws_identity_store_users_fetched", count=len(users))
-    groups_with_memberships = []
+    filtered_groups = [{k: v for k, v in group.items() if k in GROUP_FIELDS} for group in groups]
+    if not filtered_groups:
+        logger.info("aws_identity_store_operation_complete", status="empty", count=0)
+        return
 
+    users_by_id = index_users_by_id(list_users() or [])
+    logger.info("aws_identity_store_users_fetched", count=len(users_by_id))
     logger.info("aws_identity_store_processing_groups", count=len(filtered_groups))
 
-    for group in filtered_groups:
-        error_occurred = False
-        group_id = group.get("GroupId")
-        group_name = group.get("DisplayName", "unknown")
+    count = 0
+    workers = max(1, min(max_workers, len(filtered_groups)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-group-memberships") as pool:
+        futures = {pool.submit(_list_group_memberships_with_retry, group["GroupId"]): group for group in filtered_groups}
+        for future in futures if ordered else as_completed(futures):
+            group = futures[future]
+            group_with_memberships = _resolve_group_memberships(group, future, users_by_id, tolerate_errors)
+            if group_with_memberships is not None:
+                count += 1
+                yield group_with_memberships
+
+    logger.info("aws_identity_store_operation_complete", status="complete", count=count)
 
-        logger.debug(
-            "aws_identity_store_processing_group",
+
+def _resolve_group_memberships(group, future, users_by_id, tolerate_errors):
+    group_id = group.get("GroupId")
+    group_name = group.get("DisplayName", "unknown")
+    try:
+        memberships = future.result()
+    except Exception as error:
+        logger.exception(
+            "aws_identity_store_group_memberships_error",
             group_id=group_id,
             group_name=group_name,
+            error=str(error),
         )
-        try:
-            memberships = list_group_memberships(group_id)
-        except Exception as error:
-            logger.exception(
-                "aws_identity_store_group_memberships_error",
+        return None
+
+    error_occurred = False
+    for membership in memberships:
+        member_id = membership["MemberId"].get("UserId")
+        member_details = users_by_id.get(member_id)
+        if member_details is None:
+            logger.warning(
+                "aws_identity_store_member_error",
                 group_id=group_id,
                 group_name=group_name,
-                error=str(error),
+                member_id=member_id,
+                error="user not found",
             )
+            error_occurred = True
+            if not tolerate_errors:
+                break
             continue
-        for membership in memberships:
-            member_details = {}
-            try:
-                member_details = next(member for member in users if member["UserId"] == membership["MemberId"]["UserId"])
-            except Exception as error:
-                logger.warning(
-                    "aws_identity_store_member_error",
-                    group_id=group_id,
-                    group_name=group_name,
-                    member_id=membership["MemberId"]["UserId"],
-                    error=str(error),
-                )
-                error_occurred = True
-                if not tolerate_errors:
-                    break
-            if member_details:
-                membership["MemberId"].update(member_details)
-        if memberships and (not error_occurred or tolerate_errors):
-            group["GroupMemberships"] = memberships
-            groups_with_memberships.append(group)
-    logger.info(
-        "aws_identity_store_operation_complete",
-        status="complete",
-        count=len(groups_with_memberships),
-    )
-    return groups_with_memberships
+        membership["MemberId"].update(member_details)
+    if memberships and (not error_occurred or tolerate_errors):
+        group["GroupMemberships"] = memberships
+        return group
+    return None
 
 
 def convert_aws_groups_members_to_dataframe(groups):
@@ -1,3 +1,21 @@
+"""AWS Organizations module.
+
+``AccountCatalog`` keeps an in-process, indexed copy of the organization's
+accounts (id, name, status and tags) so account lookups and the account
+pickers in Slack modals do not page through ``list_accounts`` each time.
+Reads are served from the catalog; once it is older than its TTL the stale
+copy is still served while a background thread reloads it
+(stale-while-revalidate). Only the very first load blocks. Tags are loaded
+per account on first use and kept for the same TTL.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
 import structlog
 
 from infrastructure.configuration.integrations.aws import get_aws_settings
@@ -19,16 +37,205 @@ def list_organization_accounts():
     return execute_aws_api_call("organizations", "list_accounts", paginated=True, keys=["Accounts"], **params)
 
 
+@dataclass(frozen=True)
+class _CatalogSnapshot:
+    accounts: tuple[dict[str, Any], ...] = ()
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_name: dict[str, dict[str, Any]] = field(default_factory=dict)
+    loaded_at: float | None = None
+
+
+class AccountCatalog:
+    """Thread-safe, indexed catalog of the organization's accounts.
+
+    Args:
+        loader: Callable returning every account as listed by ``list_accounts``.
+        tags_loader: Callable returning the tags of one account.
+        ttl_seconds: Seconds the catalog is served before it is reloaded in
+            the background.
+        clock: Monotonic clock in seconds (injectable for tests).
+        start_refresh: Starts a background refresh (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], list[dict[str, Any]]],
+        tags_loader: Callable[[str], list[dict[str, str]]],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        start_refresh: Callable[[Callable[[], None]], None] | None = None,
+    ) -> None:
+        self._loader = loader
+        self._tags_loader = tags_loader
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._start_refresh = start_refresh or _start_daemon_thread
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._snapshot = _CatalogSnapshot()
+        self._tags: dict[str, tuple[list[dict[str, str]], float]] = {}
+        self._refreshing = False
+        self._stats = {"hits": 0, "stale_hits": 0, "loads": 0, "load_failures": 0, "tag_hits": 0, "tag_misses": 0}
+
+    def accounts(self) -> list[dict[str, Any]]:
+        """Return every account in the order listed by AWS."""
+        return list(self._current().accounts)
+
+    def get(self, account_id: str) -> dict[str, Any] | None:
+        """Return the account with ``account_id``, or None."""
+        return self._current().by_id.get(account_id)
+
+    def find_by_name(self, name: str) -> dict[str, Any] | None:
+        """Return the account named exactly ``name``, or None."""
+        return self._current().by_name.get(name)
+
+    def tags(self, account_id: str) -> list[dict[str, str]]:
+        """Return the tags of ``account_id``, loading them on first use."""
+        now = self._clock()
+        with self._lock:
+            cached = self._tags.get(account_id)
+            if cached is not None and now - cached[1] < self._ttl_seconds:
+                self._stats["tag_hits"] += 1
+                return list(cached[0])
+            self._stats["tag_misses"] += 1
+        tags = self._tags_loader(account_id)
+        if tags is False or tags is None:
+            # Serve the previous tags, if any, rather than caching a failure.
+            return list(cached[0]) if cached is not None else []
+        with self._lock:
+            self._tags[account_id] = (list(tags), now)
+        return list(tags)
+
+    def refresh(self) -> None:
+        """Reload the accounts now; a failure keeps the current catalog."""
+        with self._load_lock:
+            self._load()
+
+    def invalidate(self) -> None:
+        """Mark the catalog stale so the next read reloads it in the background."""
+        with self._lock:
+            if self._snapshot.loaded_at is not None:
+                self._snapshot = _CatalogSnapshot(
+                    self._snapshot.accounts, self._snapshot.by_id, self._snapshot.by_name, loaded_at=float("-inf")
+                )
+            self._tags.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit, stale-hit, load and tag counters and the catalog age."""
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                **self._stats,
+                "accounts": len(snapshot.accounts),
+                "tags_cached": len(self._tags),
+                "refreshing": self._refreshing,
+                "age_seconds": round(self._clock() - snapshot.loaded_at, 3) if snapshot.loaded_at is not None else None,
+            }
+
+    def _current(self) -> _CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot.loaded_at is None:
+            with self._load_lock:
+                if self._snapshot.loaded_at is None:
+                    self._load(raise_errors=True)
+                snapshot = self._snapshot
+            return snapshot
+
+        with self._lock:
+            if self._clock() - snapshot.loaded_at < self._ttl_seconds:
+                self._stats["hits"] += 1
+                return snapshot
+            self._stats["stale_hits"] += 1
+            start = not self._refreshing
+            self._refreshing = True
+        if start:
+            self._start_refresh(self._background_refresh)
+        return snapshot
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _load(self, raise_errors: bool = False) -> None:
+        try:
+            accounts = self._loader()
+            if accounts is False or accounts is None:
+                raise RuntimeError("aws_organizations_list_accounts_failed")
+        except Exception as e:
+            with self._lock:
+                self._stats["load_failures"] += 1
+            logger.warning("aws_account_catalog_load_failed", error=str(e))
+            if raise_errors:
+                raise
+            return
+        ordered = tuple(accounts)
+        by_name: dict[str, dict[str, Any]] = {}
+        for account in ordered:
+            # The first account listed wins, as with a linear search.
+            by_name.setdefault(account.get("Name", ""), account)
+        snapshot = _CatalogSnapshot(
+            accounts=ordered,
+            by_id={account["Id"]: account for account in ordered},
+            by_name=by_name,
+            loaded_at=self._clock(),
+        )
+        with self._lock:
+            self._snapshot = snapshot
+            self._stats["loads"] += 1
+            # Drop tags of accounts that left the organization.
+            self._tags = {account_id: tags for account_id, tags in self._tags.items() if account_id in snapshot.by_id}
+        logger.info("aws_account_catalog_loaded", count=len(ordered))
+
+
+def _start_daemon_thread(target: Callable[[], None]) -> None:
+    threading.Thread(target=target, name="aws-account-catalog-refresh", daemon=True).start()
+
+
+@lru_cache(maxsize=1)
+def get_account_catalog() -> AccountCatalog:
+    """Singleton provider for the organization account catalog."""
+    return AccountCatalog(
+        lambda: list_organization_accounts(),
+        lambda account_id: get_account_tags(account_id),
+        ttl_seconds=settings.ACCOUNT_CATALOG_TTL_SECONDS,
+    )
+
+
+def refresh_account_catalog() -> None:
+    """Reload the account catalog; run periodically by the scheduler."""
+    get_account_catalog().refresh()
+
+
+def list_accounts() -> list[dict[str, Any]]:
+    """Return every account of the organization from the catalog."""
+    return get_account_catalog().accounts()
+
+
+def get_account(account_id: str) -> dict[str, Any] | None:
+    """Return the catalog entry of ``account_id``, or None."""
+    return get_account_catalog().get(account_id)
+
+
+def get_cached_account_tags(account_id: str) -> list[dict[str, str]]:
+    """Return the tags of ``account_id`` from the catalog."""
+    return get_account_catalog().tags(account_id)
+
+
 def get_active_account_names():
     """Retrieves the names of all active accounts from the AWS Organization
 
     Returns:
         list: A list of account names.
     """
-    response = list_organization_accounts()
-
-    # Return a list of account names with 'Status' == 'ACTIVE'
-    return [account["Name"] for account in response if account.get("Status") == "ACTIVE"] if response else []
+    try:
+        accounts = list_accounts()
+    except Exception as error:
+        logger.error("aws_active_account_names_failed", error=str(error))
+        return []
+    return [account["Name"] for account in accounts if account.get("Status") == "ACTIVE"]
 
 
 def get_account_id_by_name(account_name):
@@ -40,13 +247,12 @@ def get_account_id_by_name(account_name):
     Returns:
         str: The account ID.
     """
-    response = list_organization_accounts()
-
-    # Return the account ID for the account with the given name
-    return next(
-        (account["Id"] for account in response if account.get("Name") == account_name),
-        None,
-    )
+    try:
+        account = get_account_catalog().find_by_name(account_name)
+    except Exception as error:
+        logger.error("aws_account_id_lookup_failed", account_name=account_name, error=str(error))
+        return None
+    return account["Id"] if account else None
 
 
 @handle_aws_api_errors
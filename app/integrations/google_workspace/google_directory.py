@@ -1,5 +1,9 @@
 """Google Directory module to interact with the Google Workspace Directory API."""
 
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
 import pandas as pd
 import structlog
 
@@ -12,6 +16,12 @@ GOOGLE_WORKSPACE_CUSTOMER_ID = google_service.GOOGLE_WORKSPACE_CUSTOMER_ID
 logger = structlog.get_logger()
 handle_google_api_errors = google_service.handle_google_api_errors
 
+GROUP_READONLY_SCOPE = "https://www.googleapis.com/auth/admin.directory.group.readonly"
+# Google recommends at most 50 calls per batch request.
+MEMBERS_BATCH_SIZE = 50
+MEMBERS_MAX_WORKERS = 4
+MEMBER_FIELDS = "members(email, role, type, status)"
+
 
 @handle_google_api_errors
 def get_user(user_key, fields=None, **kwargs):
@@ -129,6 +139,119 @@ def list_group_members(group_key, fields=None, **kwargs):
     )
 
 
+def list_members_for_groups(
+    group_keys: Sequence[str],
+    fields: str | None = None,
+    batch_size: int = MEMBERS_BATCH_SIZE,
+    max_workers: int = MEMBERS_MAX_WORKERS,
+    delegated_user_email: str | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """List the members of many groups with batched ``members.list`` calls.
+
+    Groups are split into chunks of ``batch_size``; each chunk is fetched
+    with one HTTP batch request per page round (groups with more than 200
+    members need further rounds) and up to ``max_workers`` chunks run
+    concurrently, each with its own service object.
+
+    Args:
+        group_keys (Sequence[str]): Group email addresses or unique group IDs.
+        fields (str, optional): Partial response selector, e.g. ``"members(email, role)"``.
+        batch_size (int): Groups per batch request.
+        max_workers (int): Chunks fetched concurrently.
+        delegated_user_email (str, optional): The email address of the user to impersonate.
+
+    Returns:
+        dict: Members by group key. Groups whose listing failed are left out
+        and logged.
+
+    Ref: https://developers.google.com/admin-sdk/directory/v1/guides/batch
+    """
+    members: dict[str, list[dict[str, Any]]] = {}
+    for _, chunk_members in iter_members_for_groups(group_keys, fields, batch_size, max_workers, delegated_user_email):
+        members.update(chunk_members)
+    return members
+
+
+def iter_members_for_groups(
+    group_keys: Sequence[str],
+    fields: str | None = None,
+    batch_size: int = MEMBERS_BATCH_SIZE,
+    max_workers: int = MEMBERS_MAX_WORKERS,
+    delegated_user_email: str | None = None,
+    ordered: bool = False,
+) -> Iterator[tuple[list[str], dict[str, list[dict[str, Any]]]]]:
+    """Yield group members chunk by chunk, as ``list_members_for_groups`` fetches them.
+
+    Args:
+        ordered (bool): Yield chunks in the order of ``group_keys`` instead of
+            as soon as each one completes.
+        (other arguments as for ``list_members_for_groups``)
+
+    Yields:
+        tuple: The chunk's group keys and the members by group key of the
+        groups whose listing succeeded.
+    """
+    keys = list(dict.fromkeys(group_keys))
+    if not keys:
+        return
+    chunks = [keys[index : index + batch_size] for index in range(0, len(keys), batch_size)]
+    listed = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks))), thread_name_prefix="group-members") as pool:
+        futures = {pool.submit(_list_members_batch, chunk, fields, delegated_user_email): chunk for chunk in chunks}
+        for future in futures if ordered else as_completed(futures):
+            chunk_members = future.result()
+            listed += len(chunk_members)
+            yield futures[future], chunk_members
+    logger.info("group_members_batch_listed", groups=len(keys), failed=len(keys) - listed, batches=len(chunks))
+
+
+def _list_members_batch(
+    group_keys: list[str],
+    fields: str | None,
+    delegated_user_email: str | None,
+) -> dict[str, list[dict[str, Any]]]:
+    service = google_service.get_google_service(
+        "admin",
+        "directory_v1",
+        [GROUP_READONLY_SCOPE],
+        delegated_user_email or google_service.SRE_BOT_EMAIL,
+    )
+    members: dict[str, list[dict[str, Any]]] = {key: [] for key in group_keys}
+    request_ids = {key: str(index) for index, key in enumerate(group_keys)}
+    page_tokens: dict[str, str | None] = dict.fromkeys(group_keys)
+    next_tokens: dict[str, str | None] = {}
+
+    def callback(request_id, response, exception):
+        group_key = group_keys[int(request_id)]
+        if exception is not None:
+            logger.warning("error_getting_group_members", group_email=group_key, error=str(exception))
+            members.pop(group_key, None)
+            return
+        members[group_key].extend(response.get("members", []))
+        if response.get("nextPageToken"):
+            next_tokens[group_key] = response["nextPageToken"]
+
+    while page_tokens:
+        batch = service.new_batch_http_request(callback=callback)
+        for group_key, page_token in page_tokens.items():
+            params: dict[str, Any] = {"groupKey": group_key, "maxResults": 200}
+            if fields:
+                params["fields"] = f"nextPageToken,{fields}"
+            if page_token:
+                params["pageToken"] = page_token
+            batch.add(service.members().list(**params), request_id=request_ids[group_key])
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.warning("group_members_batch_failed", groups=len(page_tokens), error=str(e))
+            for group_key in page_tokens:
+                members.pop(group_key, None)
+            break
+        page_tokens = dict(next_tokens)
+        next_tokens.clear()
+    return members
+
+
 @handle_google_api_errors
 def get_group(group_key, fields=None, **kwargs):
     """Get a group by group key in the Google Workspace domain.
@@ -182,87 +305,127 @@ def list_groups_with_members(
         tolerate_errors (bool): Whether to include groups that encountered errors during member detail retrieval.
 
     Returns:
-        list: A list of group objects with members. Any group without members will not be included.
+        list: A list of group objects with members, in the order the groups
+        were listed. Any group without members will not be included.
+    """
+    groups_with_members = list(iter_groups_with_members(groups_filters, query, tolerate_errors, ordered=True))
+    logger.info("groups_with_members_listed", count=len(groups_with_members))
+    return groups_with_members
+
+
+def iter_groups_with_members(
+    groups_filters: list | None = None,
+    query: str | None = None,
+    tolerate_errors: bool = False,
+    ordered: bool = False,
+) -> Iterator[dict]:
+    """Yield groups with their members as each batch of member listings completes.
+
+    Members are fetched with ``iter_members_for_groups``; groups whose batch
+    listing failed are retried one by one with ``retry_request``. Users are
+    listed once and indexed by ``primaryEmail`` for the join.
+
+    Args:
+        groups_filters (list): List of filters to apply to the groups.
+        query (str): The query to search for groups.
+        tolerate_errors (bool): Whether to include groups that encountered errors during member detail retrieval.
+        ordered (bool): Yield groups in listing order instead of as their members arrive.
+
+    Yields:
+        dict: A group object with its ``members``. Groups without members are skipped.
     """
     logger.info("listing_groups_with_members", query=query, groups_filters=groups_filters)
     groups = list_groups(query=query, fields="groups(email, name, directMembersCount, description)")
     logger.info("groups_found", count=len(groups), query=query)
 
     if not groups:
-        return []
+        return
 
     if groups_filters is not None:
         for groups_filter in groups_filters:
             groups = filters.filter_by_condition(groups, groups_filter)
         logger.info("groups_filtered", count=len(groups), groups_filters=groups_filters)
 
-    users = list_users()
+    users_by_email = index_users_by_email(list_users())
     filtered_groups = [
         {k: v for k, v in group.items() if k in ["id", "email", "name", "directMembersCount", "description"]} for group in groups
     ]
-
-    groups_with_members = []
+    groups_by_email: dict[str, list[dict]] = {}
     for group in filtered_groups:
-        group_email = group.get("email", "unknown")
-        logger.info("getting_members_for_group", group_email=group_email)
-        try:
-            members = retry_request(
-                list_group_members,
-                group_email,
-                max_attempts=3,
-                delay=1,
-                fields="members(email, role, type, status)",
-            )
-        except Exception as e:
-            error_message = str(e)
-            logger.warning(
-                "error_getting_group_members",
-                group_email=group_email,
-                error=error_message,
-            )
-            continue
-
-        members = get_members_details(members, users, tolerate_errors)
-        if members:
-            group.update({"members": members})
-            groups_with_members.append(group)
-    logger.info("groups_with_members_listed", count=len(groups_with_members))
-
-    return groups_with_members
-
-
-def get_members_details(members: list[dict], users: list[dict], tolerate_errors=False):
+        groups_by_email.setdefault(group.get("email", "unknown"), []).append(group)
+
+    for chunk, chunk_members in iter_members_for_groups(list(groups_by_email), fields=MEMBER_FIELDS, ordered=ordered):
+        for group_email in chunk:
+            members = chunk_members.get(group_email)
+            if members is None:
+                members = _retry_list_group_members(group_email)
+                if members is None:
+                    continue
+            for group in groups_by_email[group_email]:
+                group_members = get_members_details([dict(member) for member in members], users_by_email, tolerate_errors)
+                if group_members:
+                    group.update({"members": group_members})
+                    yield group
+
+
+def _retry_list_group_members(group_email: str) -> list[dict] | None:
+    logger.info("getting_members_for_group", group_email=group_email)
+    try:
+        return retry_request(
+            list_group_members,
+            group_email,
+            max_attempts=3,
+            delay=1,
+            fields=MEMBER_FIELDS,
+        )
+    except Exception as e:
+        logger.warning(
+            "error_getting_group_members",
+            group_email=group_email,
+            error=str(e),
+        )
+        return None
+
+
+def index_users_by_email(users: Iterable[dict]) -> dict[str, dict]:
+    """Index users by ``primaryEmail``, keeping the first user for each address."""
+    users_by_email: dict[str, dict] = {}
+    for user in users or []:
+        email = user.get("primaryEmail") if isinstance(user, dict) else None
+        if email is not None:
+            users_by_email.setdefault(email, user)
+    return users_by_email
+
+
+def get_members_details(members: list[dict], users: list[dict] | dict[str, dict], tolerate_errors=False):
     """Get user details for a list of members.
 
     Args:
         members (list): A list of member objects.
-        users (list): A list of user objects.
+        users (list | dict): A list of user objects, or users already indexed
+            with ``index_users_by_email``.
         tolerate_errors (bool): Whether to tolerate errors when getting user details.
 
-    Returns:"""
+    Returns:
+        list: The members updated with their user details; empty when a
+        member has no user and errors are not tolerated."""
 
+    users_by_email = users if isinstance(users, dict) else index_users_by_email(users)
     error_occured = False
     for member in members:
         logger.debug("getting_user_details", member=member)
-        user_details = None
-        try:
-            user_details = next(
-                (user for user in users if user["primaryEmail"] == member["email"]),
-                None,
-            )
-            if not user_details:
-                raise ValueError("User details not found.")
-        except Exception as e:
+        user_details = users_by_email.get(member.get("email"))
+        if not user_details:
             logger.warning(
                 "getting_user_details_error",
                 member=member,
-                error=str(e),
+                error="User details not found.",
             )
             error_occured = True
             if not tolerate_errors:
                 break
-        if user_details:
-            member.update(user_details)
+            continue
+        member.update(user_details)
     return members if not error_occured or tolerate_errors else []
 
 
@@ -262,12 +262,13 @@ def find_files_by_name(name, folder_id=None, **kwargs):
 
 
 @handle_google_api_errors
-def list_folders_in_folder(folder, query=None, **kwargs):
+def list_folders_in_folder(folder, query=None, fields="files(id, name)", **kwargs):
     """List all folders in a folder in Google Drive.
 
     Args:
         folder (str): The id of the folder to list.
         query (str, optional): A query to filter the folders.
+        fields (str, optional): The fields to return for each folder.
         **kwargs: Additional keyword arguments to pass to the API call. e.g., `delegated_user_email`.
 
     Returns:
@@ -289,7 +290,7 @@ def list_folders_in_folder(folder, query=None, **kwargs):
         includeItemsFromAllDrives=True,
         corpora="user",
         q=base_query,
-        fields="files(id, name)",
+        fields=fields,
         **kwargs,
     )
 
@@ -10,11 +10,19 @@ Functions:
     handle_google_api_errors(func: Callable) -> Callable:
         Decorator that catches and logs any HttpError or Error exceptions that occur when the decorated function is called.
 
+    execute_google_api_call(service_name, version, resource_path, method, ...) -> Any:
+        Executes a Google API call. Method parameter signatures are cached per
+        (service, version, resource path, method), resolved resource objects
+        are cached per thread and kwargs key conversion is memoized per key
+        set; ``clear_google_api_caches`` drops all three.
+
 """
 
 import json
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from json import JSONDecodeError
 from typing import Any
 
@@ -27,7 +35,7 @@ from infrastructure.configuration.integrations.google import (
     get_google_resources_config,
     get_google_workspace_settings,
 )
-from integrations.utils.api import convert_kwargs_to_camel_case
+from integrations.utils.api import convert_kwargs_to_camel_case, convert_string_to_camel_case
 
 # Define the default arguments - do not delete currently used in sibling modules
 settings = get_google_workspace_settings()
@@ -38,6 +46,19 @@ SRE_BOT_EMAIL = settings.SRE_BOT_EMAIL
 INCIDENT_TEMPLATE = resources.incident_template_id
 logger = structlog.get_logger()
 
+# Resource objects (and their HTTP clients) are not thread-safe, so each
+# thread keeps its own, bounded because delegated users vary per call site.
+RESOURCE_CACHE_SIZE = 32
+_command_parameters: dict[tuple[str, str, str, str], frozenset[str]] = {}
+_thread_resources = threading.local()
+
+
+def clear_google_api_caches() -> None:
+    """Drop cached method parameters, key conversions and this thread's resources."""
+    _command_parameters.clear()
+    _camel_case_keys.cache_clear()
+    vars(_thread_resources).clear()
+
 
 def get_google_service(
     service: str,
@@ -189,24 +210,8 @@ def execute_google_api_call(
     """
     if delegated_user_email is None:
         delegated_user_email = settings.SRE_BOT_EMAIL
-    service = get_google_service(
-        service_name,
-        version,
-        scopes,
-        delegated_user_email,
-    )
-    resource_obj = service
-
-    for resource in resource_path.split("."):
-        try:
-            resource_obj = getattr(resource_obj, resource)()
-        except Exception as e:
-            logger.error(
-                "resource_access_error",
-                resource=resource,
-                error=str(e),
-            )
-            raise AttributeError(f"Error accessing {resource} on resource object. Exception: {e}") from e
+    resource_obj = _get_resource(service_name, version, resource_path, scopes, delegated_user_email)
+    resource = resource_path.split(".")[-1]
 
     try:
         api_method = getattr(resource_obj, method)
@@ -218,8 +223,8 @@ def execute_google_api_call(
         )
         raise AttributeError(f"Error executing API method {method}. Exception: {e}") from e
 
-    supported_params = get_google_api_command_parameters(resource_obj, method)
-    formatted_kwargs = convert_kwargs_to_camel_case(kwargs) if kwargs else {}
+    supported_params = _get_command_parameters((service_name, version, resource_path, method), resource_obj)
+    formatted_kwargs = _format_kwargs(kwargs) if kwargs else {}
     filtered_params = {k: v for k, v in formatted_kwargs.items() if k in supported_params}
     unsupported_params = set(formatted_kwargs.keys()) - set(filtered_params.keys())
     if paginate:
@@ -235,6 +240,67 @@ def execute_google_api_call(
         return api_method(**filtered_params).execute(), unsupported_params
 
 
+def _get_resource(
+    service_name: str,
+    version: str,
+    resource_path: str,
+    scopes: list[str] | None,
+    delegated_user_email: str,
+) -> Any:
+    """Return this thread's resource object for ``resource_path``, building it on first use."""
+    key = (service_name, version, resource_path, tuple(scopes) if scopes else None, delegated_user_email)
+    cache: OrderedDict[tuple, Any] = vars(_thread_resources).setdefault("resources", OrderedDict())
+    resource_obj = cache.get(key)
+    if resource_obj is not None:
+        cache.move_to_end(key)
+        return resource_obj
+
+    resource_obj = get_google_service(
+        service_name,
+        version,
+        scopes,
+        delegated_user_email,
+    )
+    for resource in resource_path.split("."):
+        try:
+            resource_obj = getattr(resource_obj, resource)()
+        except Exception as e:
+            logger.error(
+                "resource_access_error",
+                resource=resource,
+                error=str(e),
+            )
+            raise AttributeError(f"Error accessing {resource} on resource object. Exception: {e}") from e
+
+    cache[key] = resource_obj
+    if len(cache) > RESOURCE_CACHE_SIZE:
+        cache.popitem(last=False)
+    return resource_obj
+
+
+def _get_command_parameters(key: tuple[str, str, str, str], resource_obj: Any) -> frozenset[str]:
+    """Return the parameter names of a method, parsing its docstring only on first use."""
+    parameters = _command_parameters.get(key)
+    if parameters is None:
+        parameters = frozenset(get_google_api_command_parameters(resource_obj, key[3]))
+        _command_parameters[key] = parameters
+    return parameters
+
+
+@lru_cache(maxsize=256)
+def _camel_case_keys(keys: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(convert_string_to_camel_case(key) for key in keys)
+
+
+def _format_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """camelCase the keys of ``kwargs`` and of any nested dicts or lists."""
+    keys = _camel_case_keys(tuple(kwargs))
+    return {
+        key: convert_kwargs_to_camel_case(value) if isinstance(value, (dict, list)) else value
+        for key, value in zip(keys, kwargs.values(), strict=True)
+    }
+
+
 def get_google_api_command_parameters(resource_obj, method):
     """
     Get the parameter names for a Google API command, excluding non-parameter documentation.
@@ -118,6 +118,64 @@ def batch_update_values(
     )
 
 
+@handle_google_api_errors
+def batch_update_value_ranges(
+    spreadsheetId: str,
+    data: list[dict],
+    valueInputOption: str = "USER_ENTERED",
+    **kwargs,
+) -> dict:
+    """Updates several ranges of a Google Sheet in one request.
+
+    Args:
+        spreadsheetId (str): The id of the Google Sheet.
+        data (list): Value ranges, e.g. ``[{"range": "'Sheet 1'!A1", "values": [["a"]]}]``.
+        valueInputOption (str, optional): The value input option.
+        **kwargs: Additional keyword arguments to pass to the API call. e.g., `delegated_user_email`.
+
+    Returns:
+        dict: The response from the Google Sheets API.
+    Reference:
+    https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchUpdate
+    """
+    return execute_google_api_call(
+        "sheets",
+        "v4",
+        "spreadsheets.values",
+        "batchUpdate",
+        scopes=["https://www.googleapis.com/auth/spreadsheets"],
+        spreadsheetId=spreadsheetId,
+        body={"valueInputOption": valueInputOption, "data": data},
+        **kwargs,
+    )
+
+
+@handle_google_api_errors
+def get_spreadsheet(spreadsheetId: str, fields: str | None = None, **kwargs) -> dict:
+    """Gets a spreadsheet's metadata without grid data.
+
+    Args:
+        spreadsheetId (str): The id of the Google Sheet.
+        fields (str, optional): The fields to include in the response, e.g. ``"sheets.properties.title"``.
+        **kwargs: Additional keyword arguments to pass to the API call. e.g., `delegated_user_email`.
+
+    Returns:
+        dict: The response from the Google Sheets API.
+    Reference:
+    https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/get
+    """
+    return execute_google_api_call(
+        "sheets",
+        "v4",
+        "spreadsheets",
+        "get",
+        scopes=["https://www.googleapis.com/auth/spreadsheets"],
+        spreadsheetId=spreadsheetId,
+        fields=fields,
+        **kwargs,
+    )
+
+
 @handle_google_api_errors
 def append_values(
     spreadsheetId: str,
@@ -9,6 +9,7 @@ from .client import (
     get_on_call_users,
     healthcheck,
 )
+from .transport import OpsGenieHTTPClient, get_opsgenie_http_client
 
 __all__ = [
     "OpsGenieAPIError",
@@ -18,4 +19,6 @@ __all__ = [
     "healthcheck",
     "api_get_request",
     "api_post_request",
+    "OpsGenieHTTPClient",
+    "get_opsgenie_http_client",
 ]
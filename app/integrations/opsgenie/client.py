@@ -1,10 +1,10 @@
 import json
 from datetime import UTC, datetime
-from urllib.request import Request, urlopen
 
 import structlog
 
 from infrastructure.configuration.integrations.opsgenie import get_opsgenie_settings
+from integrations.opsgenie.transport import get_opsgenie_http_client
 
 # Use the integrations API Key as the Opsgenie API Key
 OPSGENIE_KEY = get_opsgenie_settings().OPSGENIE_INTEGRATIONS_KEY
@@ -115,18 +115,11 @@ def healthcheck():
     return healthy
 
 
+# Requests share the pooled, keep-alive session from ``transport.py``.
 def api_get_request(url, auth):
-    req = Request(url)  # noqa: S310 -- scheme is hardcoded to https call sites
-    req.add_header("Authorization", f"{auth['name']} {auth['token']}")
-    conn = urlopen(req)  # noqa: S310 -- scheme is hardcoded to https call sites
-    return conn.read().decode("utf-8")
+    return get_opsgenie_http_client().get(url, f"{auth['name']} {auth['token']}")
 
 
 # Post the API request to the Opsgenie API
 def api_post_request(url, auth, data):
-    data = json.dumps(data).encode("utf-8")
-    req = Request(url, data=data)  # noqa: S310 -- scheme is hardcoded to https call sites
-    req.add_header("Content-Type", "application/json")
-    req.add_header("Authorization", f"{auth['name']} {auth['token']}")
-    conn = urlopen(req)  # noqa: S310 -- scheme is hardcoded to https call sites
-    return conn.read().decode("utf-8")
+    return get_opsgenie_http_client().post(url, f"{auth['name']} {auth['token']}", data)
@@ -0,0 +1,216 @@
+"""Pooled HTTP transport for the OpsGenie API.
+
+Every OpsGenie call goes through one shared ``requests.Session`` so TCP and
+TLS connections are kept alive and reused across calls and threads (the
+on-call sync resolves rotations concurrently; incident creation looks up
+several schedules in a row).
+
+The session applies explicit connect/read timeouts and retries connection
+errors, 429 and 5xx responses with exponential backoff, honouring
+``Retry-After`` (capped). ``POST`` requests (alert creation) are only retried
+on 429 and on connection errors, where the request was not processed: a read
+timeout or dropped connection after the request was sent is raised as is,
+since OpsGenie may already have created the alert.
+
+Per-endpoint latency is recorded in memory (``stats()``) and logged at debug
+level. Endpoints are the request path with resource identifiers replaced by
+``{id}`` so the number of series stays bounded.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from types import TracebackType
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+import structlog
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from infrastructure.configuration.integrations.opsgenie import get_opsgenie_settings
+
+logger = structlog.get_logger()
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER_SECONDS = 30.0
+_ID_SEGMENT = re.compile(r"(/(?:schedules|alerts|teams|users|escalations)/)[^/?]+")
+
+
+class _OpsGenieRetry(Retry):
+    """Retry policy that caps ``Retry-After`` and only retries POST on 429 or connect errors."""
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: Any = None,
+        error: Exception | None = None,
+        _pool: Any = None,
+        _stacktrace: TracebackType | None = None,
+    ) -> Retry:
+        if error is not None and method is not None and method.upper() == "POST" and not self._is_connection_error(error):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST" and status_code != 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER_SECONDS)
+
+
+@dataclass
+class EndpointStats:
+    """Latency and outcome counters for one OpsGenie endpoint.
+
+    Attributes:
+        count: Completed calls, including failed ones.
+        errors: Calls that raised or returned an HTTP error status.
+        total_seconds: Sum of call durations (retries included).
+        max_seconds: Slowest call.
+    """
+
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        average = self.total_seconds / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(average * 1000, 2),
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Return the metrics label of a request, e.g. ``GET /v2/schedules/{id}/timeline``."""
+    path = _ID_SEGMENT.sub(r"\1{id}", urlsplit(url).path)
+    return f"{method.upper()} {path}"
+
+
+class OpsGenieHTTPClient:
+    """Thread-safe, keep-alive HTTP client for the OpsGenie REST API.
+
+    Args:
+        connect_timeout: Seconds allowed to establish a connection.
+        read_timeout: Seconds allowed between bytes of the response.
+        max_retries: Retries for connection errors, 429 and 5xx responses.
+        backoff_factor: Base of the exponential backoff between retries.
+        pool_maxsize: Keep-alive connections kept per host.
+        clock: Monotonic clock used for latency metrics (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: int = 10,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._timeout = (connect_timeout, read_timeout)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: dict[str, EndpointStats] = {}
+
+        retry = _OpsGenieRetry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, authorization: str, json_body: Any | None = None) -> str:
+        """Send a request and return the decoded response body.
+
+        Args:
+            method: HTTP method.
+            url: Absolute request URL.
+            authorization: Value of the ``Authorization`` header, e.g. ``GenieKey <key>``.
+            json_body: Optional JSON payload.
+
+        Raises:
+            requests.RequestException: On connection failure, timeout, or an
+                HTTP error status after retries are exhausted.
+        """
+        endpoint = endpoint_name(method, url)
+        headers = {"Authorization": authorization}
+        started = self._clock()
+        status_code: int | None = None
+        failed = True
+        try:
+            response = self._session.request(method, url, headers=headers, json=json_body, timeout=self._timeout)
+            status_code = response.status_code
+            response.raise_for_status()
+            failed = False
+            return response.text
+        finally:
+            duration = self._clock() - started
+            self._record(endpoint, duration, failed)
+            logger.debug(
+                "opsgenie_request_completed",
+                endpoint=endpoint,
+                status_code=status_code,
+                duration_ms=round(duration * 1000, 2),
+                failed=failed,
+            )
+
+    def get(self, url: str, authorization: str) -> str:
+        return self.request("GET", url, authorization)
+
+    def post(self, url: str, authorization: str, json_body: Any) -> str:
+        return self.request("POST", url, authorization, json_body=json_body)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return a snapshot of per-endpoint latency metrics."""
+        with self._lock:
+            return {endpoint: stats.as_dict() for endpoint, stats in self._stats.items()}
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
+    def _record(self, endpoint: str, duration: float, failed: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            stats.count += 1
+            stats.errors += int(failed)
+            stats.total_seconds += duration
+            stats.max_seconds = max(stats.max_seconds, duration)
+
+
+@lru_cache(maxsize=1)
+def get_opsgenie_http_client() -> OpsGenieHTTPClient:
+    """Singleton provider for the shared OpsGenie HTTP client."""
+    settings = get_opsgenie_settings()
+    return OpsGenieHTTPClient(
+        connect_timeout=settings.OPSGENIE_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=settings.OPSGENIE_READ_TIMEOUT_SECONDS,
+        max_retries=settings.OPSGENIE_MAX_RETRIES,
+        pool_maxsize=settings.OPSGENIE_POOL_MAXSIZE,
+    )
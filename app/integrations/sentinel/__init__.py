@@ -1,5 +1,21 @@
 """Sentinel integration module."""
 
-from .client import build_signature, log_to_sentinel, post_data, send_event
+from .client import (
+    build_signature,
+    get_sentinel_shipper,
+    log_to_sentinel,
+    post_data,
+    send_event,
+    stop_sentinel_shipper,
+)
+from .shipper import SentinelShipper
 
-__all__ = ["send_event", "build_signature", "post_data", "log_to_sentinel"]
+__all__ = [
+    "send_event",
+    "build_signature",
+    "post_data",
+    "log_to_sentinel",
+    "SentinelShipper",
+    "get_sentinel_shipper",
+    "stop_sentinel_shipper",
+]
@@ -3,6 +3,7 @@ import hashlib
 import hmac
 import json
 from datetime import UTC, date, datetime, time
+from functools import lru_cache
 from typing import Any
 
 import requests
@@ -10,6 +11,7 @@ import structlog
 
 from infrastructure.audit.models import AuditEvent
 from infrastructure.configuration.integrations.sentinel import get_sentinel_settings
+from integrations.sentinel.shipper import SentinelShipper
 
 logger = structlog.get_logger()
 sentinel_settings = get_sentinel_settings()
@@ -41,6 +43,13 @@ def _payload_size_bytes(payload: Any) -> int | None:
 
 
 def send_event(payload: Any) -> bool:
+    """Ship one event to Sentinel.
+
+    With ``SENTINEL_SHIPPER_ENABLED`` (the default) the event is handed to
+    the background ``SentinelShipper`` and this returns once it is queued;
+    otherwise it is posted inline. Returns False when Sentinel is not
+    configured or the event had to be dropped.
+    """
     customer_id = SENTINEL_CUSTOMER_ID
     log_type = SENTINEL_LOG_TYPE
     shared_key = SENTINEL_SHARED_KEY
@@ -50,10 +59,42 @@ def send_event(payload: Any) -> bool:
         return False
 
     payload_body = _serialize_payload(payload)
+    if sentinel_settings.SENTINEL_SHIPPER_ENABLED:
+        return get_sentinel_shipper().enqueue(payload_body)
     post_data(customer_id, shared_key, payload_body, log_type)
     return True
 
 
+def _send_batch(body: str) -> bool:
+    """Post one JSON array of events; used by the shipper's worker thread."""
+    if SENTINEL_CUSTOMER_ID is None or SENTINEL_SHARED_KEY is None:
+        return False
+    return post_data(SENTINEL_CUSTOMER_ID, SENTINEL_SHARED_KEY, body, SENTINEL_LOG_TYPE)
+
+
+@lru_cache(maxsize=1)
+def get_sentinel_shipper() -> SentinelShipper:
+    """Singleton provider for the background Sentinel shipper."""
+    return SentinelShipper(
+        _send_batch,
+        max_queue_size=sentinel_settings.SENTINEL_MAX_QUEUE_SIZE,
+        flush_interval_seconds=sentinel_settings.SENTINEL_FLUSH_INTERVAL_SECONDS,
+        spill_path=sentinel_settings.SENTINEL_SPILL_PATH,
+    )
+
+
+def stop_sentinel_shipper(timeout: float = 10.0) -> dict[str, int]:
+    """Drain and stop the shipper; returns its final counters."""
+    shipper = get_sentinel_shipper()
+    shipper.stop(timeout)
+    return shipper.stats()
+
+
+@lru_cache(maxsize=4)
+def _decode_shared_key(shared_key: str) -> bytes:
+    return base64.b64decode(shared_key)
+
+
 def build_signature(
     customer_id: str,
     shared_key: str,
@@ -66,7 +107,7 @@ def build_signature(
     x_headers = "x-ms-date:" + date
     string_to_hash = method + "\n" + str(content_length) + "\n" + content_type + "\n" + x_headers + "\n" + resource
     bytes_to_hash = bytes(string_to_hash, encoding="utf-8")
-    decoded_key = base64.b64decode(shared_key)
+    decoded_key = _decode_shared_key(shared_key)
     encoded_hash = base64.b64encode(hmac.new(decoded_key, bytes_to_hash, digestmod=hashlib.sha256).digest()).decode()
     authorization = f"SharedKey {customer_id}:{encoded_hash}"
     return authorization
@@ -128,7 +169,8 @@ def log_to_sentinel(event: Any, message: Any) -> None:
         log.exception("log_to_sentinel_error", error=str(e))
 
     if is_event_sent:
-        log.info("sentinel_event_sent")
+        # With the shipper the event is only queued; it logs the send itself.
+        log.info("sentinel_event_enqueued" if sentinel_settings.SENTINEL_SHIPPER_ENABLED else "sentinel_event_sent")
     else:
         log.error(
             "sentinel_event_error",
@@ -171,7 +213,7 @@ def log_audit_event(audit_event: AuditEvent) -> bool:
 
     if is_event_sent:
         log.info(
-            "audit_event_sent_to_sentinel",
+            "audit_event_enqueued_for_sentinel" if sentinel_settings.SENTINEL_SHIPPER_ENABLED else "audit_event_sent_to_sentinel",
             resource_type=audit_event.resource_type,
             resource_id=audit_event.resource_id,
         )
@@ -0,0 +1,271 @@
+"""Background, batched shipping of events to the Sentinel Data Collector API.
+
+``log_to_sentinel`` and ``log_audit_event`` used to post every event inline,
+so a slow Log Analytics endpoint stalled incident, webhook and provisioning
+handlers. They now hand events to ``SentinelShipper``:
+
+- Events are serialized on the caller's thread and put on a bounded
+  in-memory queue; enqueueing never blocks.
+- A daemon worker sends them as one JSON array per request, flushing when a
+  batch reaches ``max_batch_bytes`` / ``max_batch_events`` or the oldest
+  queued event is ``flush_interval_seconds`` old.
+- Failed batches are retried with exponential backoff. Batches that still
+  fail, and events arriving while the queue is full, are appended to
+  ``spill_path`` (JSON lines) when configured, otherwise dropped. Spilled
+  events are replayed once the queue has room again.
+- ``stop()`` drains the queue before returning (bounded by a timeout).
+
+``stats()`` exposes queue depth and sent/dropped/spilled counters.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger()
+
+# The Data Collector API rejects posts above 30 MB; stay well below it.
+DEFAULT_MAX_BATCH_BYTES = 25 * 1024 * 1024
+DEFAULT_MAX_BATCH_EVENTS = 500
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+IDLE_POLL_SECONDS = 0.5
+
+
+class SentinelShipper:
+    """Bounded queue plus a worker thread that posts batches to Sentinel.
+
+    Args:
+        send_batch: Posts one serialized JSON array; returns True on a 2xx
+            response. Exceptions count as failures.
+        max_queue_size: Events held in memory before spilling or dropping.
+        max_batch_bytes: Upper bound of one request body.
+        max_batch_events: Upper bound of events per request.
+        flush_interval_seconds: Maximum age of a queued event before a flush.
+        max_retries: Retries of a failed batch before it is spilled or dropped.
+        backoff_seconds: Base delay of the exponential retry backoff.
+        spill_path: Optional JSON-lines file for events that cannot be queued
+            or sent.
+        sleep: Sleep function used between retries (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[str], bool],
+        *,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_batch_events: int = DEFAULT_MAX_BATCH_EVENTS,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        spill_path: str | Path | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._send_batch = send_batch
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=max_queue_size)
+        self._max_batch_bytes = max_batch_bytes
+        self._max_batch_events = max_batch_events
+        self._flush_interval = flush_interval_seconds
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._sleep = sleep
+
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._counters = {"enqueued": 0, "sent": 0, "batches": 0, "failed_batches": 0, "dropped": 0, "spilled": 0}
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, body: str) -> bool:
+        """Queue one serialized event; returns False when it had to be dropped.
+
+        Starts the worker on first use. Never blocks: when the queue is full
+        the event is spilled to disk (if configured) or dropped.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(body)
+        except queue.Full:
+            if self._spill([body]):
+                return True
+            self._count("dropped")
+            logger.warning("sentinel_event_dropped", reason="queue_full", queue_depth=self._queue.qsize())
+            return False
+        self._count("enqueued")
+        return True
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the worker thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="sentinel-shipper", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush queued events and stop the worker, waiting up to ``timeout`` seconds."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("sentinel_shipper_stop_timed_out", queue_depth=self._queue.qsize())
+
+    def flush(self) -> None:
+        """Send everything currently queued on the calling thread."""
+        while self._send_next_batch(wait=False):
+            pass
+
+    def stats(self) -> dict[str, int]:
+        """Return queue depth and shipping counters."""
+        with self._lock:
+            counters = dict(self._counters)
+        counters["queue_depth"] = self._queue.qsize()
+        return counters
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._send_next_batch(wait=True)
+            self._replay_spill()
+        # Drain on shutdown.
+        self.flush()
+
+    def _send_next_batch(self, wait: bool) -> bool:
+        """Collect one batch and send it; returns False when nothing was queued."""
+        batch = self._collect_batch(wait)
+        if not batch:
+            return False
+        self._ship(batch)
+        return True
+
+    def _collect_batch(self, wait: bool) -> list[str]:
+        try:
+            # Idle polling stays short so stop() is noticed promptly.
+            first = self._queue.get(timeout=min(self._flush_interval, IDLE_POLL_SECONDS)) if wait else self._queue.get_nowait()
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        size = _encoded_size(first) + 2
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._max_batch_events:
+            remaining = deadline - time.monotonic()
+            try:
+                if wait and remaining > 0 and not self._stop_event.is_set():
+                    body = self._queue.get(timeout=remaining)
+                else:
+                    body = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            body_size = _encoded_size(body)
+            if size + body_size + 1 > self._max_batch_bytes:
+                # Leave the event that does not fit for the next batch.
+                self._requeue(body)
+                break
+            batch.append(body)
+            size += body_size + 1
+        return batch
+
+    def _requeue(self, body: str) -> None:
+        try:
+            self._queue.put_nowait(body)
+        except queue.Full:
+            if not self._spill([body]):
+                self._count("dropped")
+
+    def _ship(self, batch: list[str]) -> None:
+        payload = "[" + ",".join(batch) + "]"
+        for attempt in range(self._max_retries + 1):
+            try:
+                sent = self._send_batch(payload)
+            except Exception as exc:
+                logger.warning("sentinel_batch_send_error", error=str(exc), attempt=attempt + 1)
+                sent = False
+            if sent:
+                with self._lock:
+                    self._counters["sent"] += len(batch)
+                    self._counters["batches"] += 1
+                logger.info("sentinel_batch_sent", event_count=len(batch), content_length=len(payload), attempt=attempt + 1)
+                return
+            if attempt < self._max_retries:
+                self._sleep(self._backoff_seconds * (2**attempt))
+
+        self._count("failed_batches")
+        logger.error("sentinel_batch_failed", event_count=len(batch), content_length=len(payload))
+        if not self._spill(batch):
+            with self._lock:
+                self._counters["dropped"] += len(batch)
+
+    # ------------------------------------------------------------------
+    # Disk spill
+    # ------------------------------------------------------------------
+
+    def _spill(self, bodies: list[str]) -> bool:
+        if self._spill_path is None:
+            return False
+        try:
+            with self._spill_lock, self._spill_path.open("a", encoding="utf-8") as handle:
+                handle.writelines(body + "\n" for body in bodies)
+        except OSError as exc:
+            logger.error("sentinel_spill_failed", error=str(exc), path=str(self._spill_path))
+            return False
+        with self._lock:
+            self._counters["spilled"] += len(bodies)
+        return True
+
+    def _replay_spill(self) -> None:
+        """Move spilled events back onto the queue once it is at most half full."""
+        if self._spill_path is None or self._queue.qsize() > self._queue.maxsize // 2:
+            return
+        replay_path = self._spill_path.with_name(self._spill_path.name + ".replay")
+        with self._spill_lock:
+            if not self._spill_path.exists():
+                return
+            os.replace(self._spill_path, replay_path)
+        with contextlib.suppress(OSError):
+            lines = replay_path.read_text(encoding="utf-8").splitlines()
+            replay_path.unlink()
+            for line in lines:
+                if line:
+                    self._requeue(line)
+            logger.info("sentinel_spill_replayed", event_count=len(lines))
+
+
+def _encoded_size(body: str) -> int:
+    return len(body.encode("utf-8"))
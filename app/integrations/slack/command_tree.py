@@ -0,0 +1,95 @@
+"""Prefix trie over registered Slack commands.
+
+``SlackPlatformProvider`` stores commands in a flat dict keyed by full path
+("sre.groups.list"). ``CommandTree`` compiles that dict into a trie, one
+node per path segment with its children pre-sorted by name, so routing a
+command is one dict lookup per token and listing children does not scan
+the registry. The trie is compiled on first use and recompiled after
+``invalidate()``, which the provider calls whenever a command is registered.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass, field
+
+from integrations.slack.models import CommandDefinition
+
+
+@dataclass
+class _CommandNode:
+    """One path segment; the root node has no definition."""
+
+    definition: CommandDefinition | None = None
+    children: dict[str, _CommandNode] = field(default_factory=dict)
+    ordered: tuple[CommandDefinition, ...] = ()
+
+
+class CommandTree:
+    """Lazily compiled trie view of a command registry.
+
+    Args:
+        commands: Registry of CommandDefinition by full path. The dict is
+            read, never modified; call ``invalidate()`` after changing it.
+    """
+
+    def __init__(self, commands: dict[str, CommandDefinition]) -> None:
+        self._commands = commands
+        self._nodes: dict[str, _CommandNode] | None = None
+
+    def invalidate(self) -> None:
+        """Drop the compiled trie; it is rebuilt on next use."""
+        self._nodes = None
+
+    def children(self, path: str) -> tuple[CommandDefinition, ...]:
+        """Return the direct children of ``path`` sorted by name ("" for top-level)."""
+        node = self._compiled().get(path)
+        return node.ordered if node else ()
+
+    def resolve(self, path: str, tokens: list[str], stop_words: Collection[str] = ()) -> tuple[str, int]:
+        """Follow ``tokens`` down the trie from ``path``.
+
+        Stops at the first token that is not a child of the current node or
+        whose lowercase form is in ``stop_words`` (e.g. help keywords).
+
+        Returns:
+            Tuple of (deepest command path reached, number of tokens consumed).
+        """
+        nodes = self._compiled()
+        node = nodes.get(path)
+        consumed = 0
+        while node is not None and consumed < len(tokens):
+            token = tokens[consumed]
+            if token.lower() in stop_words:
+                break
+            child = node.children.get(token)
+            if child is None or child.definition is None:
+                break
+            node = child
+            path = child.definition.full_path
+            consumed += 1
+        return path, consumed
+
+    def _compiled(self) -> dict[str, _CommandNode]:
+        nodes = self._nodes
+        if nodes is None:
+            nodes = self._compile()
+            self._nodes = nodes
+        return nodes
+
+    def _compile(self) -> dict[str, _CommandNode]:
+        nodes: dict[str, _CommandNode] = {"": _CommandNode()}
+        definitions = list(self._commands.values())
+        for definition in definitions:
+            nodes.setdefault(definition.full_path, _CommandNode()).definition = definition
+        for definition in definitions:
+            parent = nodes.setdefault(definition.parent or "", _CommandNode())
+            parent.children[definition.name] = nodes[definition.full_path]
+        for node in nodes.values():
+            node.ordered = tuple(
+                sorted(
+                    (child.definition for child in node.children.values() if child.definition is not None),
+                    key=lambda definition: definition.name,
+                )
+            )
+        return nodes
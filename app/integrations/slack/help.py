@@ -7,6 +7,7 @@ Argument definitions, with optional i18n support.
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from integrations.slack.command_tree import CommandTree
 from integrations.slack.models import Argument
 
 if TYPE_CHECKING:
@@ -229,6 +230,11 @@ class SlackHelpGenerator:
     - "command": Show single command with signature, args, examples
     - "arguments": Show arguments only
 
+    Help text for registered commands is rendered once per (command path,
+    mode, locale) and served from a cache until ``invalidate()`` is called,
+    which the provider does when a command is registered or the translator
+    changes.
+
     Usage:
         generator = SlackHelpGenerator(
             commands=provider._commands,
@@ -241,15 +247,23 @@ class SlackHelpGenerator:
         self,
         commands: dict,
         translator: Callable[[str | None, str, str], str] | None = None,
+        command_tree: CommandTree | None = None,
     ):
         """Initialize help generator.
 
         Args:
             commands: Dict of registered CommandDefinition objects
             translator: Optional i18n translator function (key, fallback, locale) -> str
+            command_tree: Optional CommandTree over ``commands`` shared with the caller
         """
         self._commands = commands
         self._translator = translator or (lambda key, fallback, locale: fallback)
+        self._tree = command_tree or CommandTree(commands)
+        self._cache: dict[tuple[str, str, str], str] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached help text (e.g. after registering a command)."""
+        self._cache.clear()
 
     def generate(self, command_path: str, mode: str = "command", locale: str = "en-US") -> str:
         """Generate help text in specified mode.
@@ -262,15 +276,25 @@ class SlackHelpGenerator:
         Returns:
             Formatted help text for the specified mode
         """
+        cache_key = (command_path, mode, locale)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if mode == "tree":
-            return self._generate_tree(command_path, locale)
+            help_text = self._generate_tree(command_path, locale)
         elif mode == "command":
-            return self._generate_command(command_path, locale)
+            help_text = self._generate_command(command_path, locale)
         elif mode == "arguments":
-            return self._generate_arguments(command_path, locale)
+            help_text = self._generate_arguments(command_path, locale)
         else:
             return f"Unknown help mode: {mode}"
 
+        # Only registered paths are cached, so arbitrary user input cannot grow the cache.
+        if not command_path or command_path in self._commands:
+            self._cache[cache_key] = help_text
+        return help_text
+
     def _generate_tree(self, root_path: str | None = None, locale: str = "en-US") -> str:
         """Generate help tree for command and children.
 
@@ -304,14 +328,14 @@ class SlackHelpGenerator:
                 self._append_command_tree_entry(lines, cmd_def, indent_level=0, locale=locale)
         else:
             # Show all top-level commands
-            top_level = [cmd for cmd in self._commands.values() if not cmd.parent]
+            top_level = self._tree.children("")
             if not top_level:
                 return self._translator(
                     "commands.errors.no_top_level_commands",
                     "No top-level commands registered.",
                     locale,
                 )
-            for cmd_def in sorted(top_level, key=lambda c: c.name):
+            for cmd_def in top_level:
                 self._append_command_tree_entry(lines, cmd_def, indent_level=0, locale=locale)
 
         return "\n".join(lines)
@@ -446,5 +470,4 @@ class SlackHelpGenerator:
         Returns:
             Sorted list of child CommandDefinition objects
         """
-        children = [cmd for cmd in self._commands.values() if cmd.parent == parent_path]
-        return sorted(children, key=lambda c: c.name)
+        return list(self._tree.children(parent_path))
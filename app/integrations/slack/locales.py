@@ -0,0 +1,178 @@
+"""Shared user locale lookup with a bounded TTL cache.
+
+Both ``SlackPlatformProvider.get_user_locale`` (command dispatch) and the
+legacy ``integrations.slack.users.get_user_locale`` resolve locales through
+``resolve_user_locale``, which answers from ``UserLocaleCache`` before
+calling ``users.info``. This keeps the Tier-4 round trip out of the 3-second
+ack window for every command after a user's first.
+
+Entries expire after ``ttl_seconds`` and the least recently used entry is
+evicted once ``max_entries`` is reached. The provider drops a user's entry on
+``user_change`` events, and ``prime_user_locales`` can fill the cache from a
+paginated ``users.list``. ``stats()`` reports the hit rate and the
+``users.info`` latency saved by hits (hits multiplied by the average
+observed lookup latency).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_LOCALE = "en-US"
+SUPPORTED_LOCALES = frozenset({"en-US", "fr-FR"})
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_ENTRIES = 5000
+USERS_LIST_PAGE_SIZE = 200
+
+
+def normalize_locale(locale: Any) -> str:
+    """Return the locale when supported, otherwise the default locale."""
+    if isinstance(locale, str) and locale in SUPPORTED_LOCALES:
+        return locale
+    return DEFAULT_LOCALE
+
+
+class UserLocaleCache:
+    """Thread-safe LRU cache of Slack user ID to supported locale with a TTL.
+
+    Args:
+        ttl_seconds: Seconds an entry is served before ``users.info`` is called again.
+        max_entries: Maximum number of cached users.
+        clock: Monotonic clock in seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lookups = 0
+        self._lookup_seconds = 0.0
+
+    def get(self, user_id: str) -> str | None:
+        """Return the cached locale, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(user_id)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[user_id]
+            self._misses += 1
+            return None
+
+    def put(self, user_id: str, locale: str) -> None:
+        """Cache a user's locale, evicting the least recently used entry when full."""
+        if self._ttl_seconds <= 0 or self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (self._clock() + self._ttl_seconds, locale)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop one user's entry (e.g. on ``user_change``)."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._lookups = 0
+            self._lookup_seconds = 0.0
+
+    def record_lookup(self, seconds: float) -> None:
+        """Record the latency of one ``users.info`` call made on a miss."""
+        with self._lock:
+            self._lookups += 1
+            self._lookup_seconds += seconds
+
+    def stats(self) -> dict[str, Any]:
+        """Return size, hit rate and the estimated latency saved by hits."""
+        with self._lock:
+            requests = self._hits + self._misses
+            average = self._lookup_seconds / self._lookups if self._lookups else 0.0
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / requests, 4) if requests else 0.0,
+                "avg_lookup_ms": round(average * 1000, 2),
+                "saved_ms": round(self._hits * average * 1000, 2),
+            }
+
+
+@lru_cache(maxsize=1)
+def get_user_locale_cache() -> UserLocaleCache:
+    """Singleton provider for the process-wide user locale cache."""
+    return UserLocaleCache()
+
+
+def resolve_user_locale(client: Any, user_id: str | None, cache: UserLocaleCache | None = None) -> str:
+    """Return a user's supported locale, using the cache before ``users.info``.
+
+    Only successful ``users.info`` responses are cached; failures fall back
+    to the default locale and are retried on the next call.
+
+    Raises:
+        Exception: Whatever the Slack client raises; callers decide how to log it.
+    """
+    if not user_id:
+        return DEFAULT_LOCALE
+    cache = cache or get_user_locale_cache()
+    cached = cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    started = time.perf_counter()
+    response = client.users_info(user=user_id, include_locale=True)
+    cache.record_lookup(time.perf_counter() - started)
+    if not response.get("ok") or not response.get("user"):
+        return DEFAULT_LOCALE
+    locale = normalize_locale(response["user"].get("locale"))
+    cache.put(user_id, locale)
+    return locale
+
+
+def prime_user_locales(client: Any, cache: UserLocaleCache | None = None, max_pages: int | None = None) -> int:
+    """Fill the cache from a paginated ``users.list``; returns the number of users cached."""
+    cache = cache or get_user_locale_cache()
+    cursor: str | None = None
+    primed = 0
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        kwargs: dict[str, Any] = {"include_locale": True, "limit": USERS_LIST_PAGE_SIZE}
+        if cursor:
+            kwargs["cursor"] = cursor
+        response = client.users_list(**kwargs)
+        pages += 1
+        for member in response.get("members", []) or []:
+            if member.get("deleted") or member.get("is_bot") or not member.get("id"):
+                continue
+            cache.put(member["id"], normalize_locale(member.get("locale")))
+            primed += 1
+        cursor = (response.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            break
+    logger.info("slack_user_locale_cache_primed", users=primed, pages=pages)
+    return primed
@@ -8,7 +8,7 @@ Provides integration with Slack using the Bolt SDK for Socket Mode.
 import threading
 from collections.abc import Callable
 from functools import cache
-from typing import Any, cast
+from typing import Any
 
 import structlog
 from slack_bolt import Ack, App, Respond
@@ -18,11 +18,19 @@ from infrastructure.i18n import Locale, TranslationKey, Translator
 from infrastructure.operations import OperationResult
 from infrastructure.slack.settings import get_slack_transport_settings
 from integrations.slack import LegacySlackBootstrap
+from integrations.slack.command_tree import CommandTree
 from integrations.slack.formatter import SlackBlockKitFormatter
 from integrations.slack.help import (
     SLACK_HELP_KEYWORDS,
     SlackHelpGenerator,
 )
+from integrations.slack.locales import (
+    DEFAULT_LOCALE,
+    UserLocaleCache,
+    get_user_locale_cache,
+    prime_user_locales,
+    resolve_user_locale,
+)
 from integrations.slack.models import (
     ArgumentParsingError,
     CommandDefinition,
@@ -80,6 +88,7 @@ class SlackPlatformProvider:
         enabled: bool = True,
         version: str = "1.0.0",
         translation_service: Translator | None = None,
+        locale_cache: UserLocaleCache | None = None,
     ):
         """Initialize Slack platform provider.
 
@@ -89,6 +98,7 @@ class SlackPlatformProvider:
             name: Provider name (default: "slack")
             version: Provider version (default: "1.0.0")
             translation_service: Optional translation service for i18n support
+            locale_cache: Optional user locale cache (defaults to the shared cache)
         """
         self._name = name
         self._version = version
@@ -96,6 +106,15 @@ class SlackPlatformProvider:
         self._logger = logger.bind(provider=name, version=version)
         # Commands stored by full_path (e.g., "sre.dev.aws") as key
         self._commands: dict[str, CommandDefinition] = {}
+        # Trie over _commands for routing and child lookups, recompiled after registration
+        self._command_tree = CommandTree(self._commands)
+        self._tokenizer = CommandArgumentParser([])
+        # Help generator for unified help text generation; caches rendered help
+        self._help_generator = SlackHelpGenerator(
+            commands=self._commands,
+            translator=self._translate_or_fallback,
+            command_tree=self._command_tree,
+        )
         self._translator: Translator | None = None
         if translation_service:
             self.set_translator(translation_service)
@@ -107,12 +126,7 @@ class SlackPlatformProvider:
         # Will be initialized when app is started
         self._app: App | None = None
         self._client: Any | None = None
-
-        # Help generator for unified help text generation
-        self._help_generator = SlackHelpGenerator(
-            commands=self._commands,
-            translator=self._translate_or_fallback,
-        )
+        self._locale_cache = locale_cache or get_user_locale_cache()
 
         self._logger.info(
             "slack_provider_initialized",
@@ -179,6 +193,7 @@ class SlackPlatformProvider:
             # Create Bolt App instance
             self._app = LegacySlackBootstrap().create_app()
             self._client = self._app.client
+            self._app.event("user_change")(self._handle_user_change)
             log.debug("slack_app_created")
 
             # Auto-register root commands with Slack Bolt
@@ -223,6 +238,8 @@ class SlackPlatformProvider:
             translator: Translator instance for message translation
         """
         self._translator = translator
+        # Cached help was rendered with the previous translator.
+        self._help_generator.invalidate()
 
     def _translate_or_fallback(
         self,
@@ -322,6 +339,7 @@ class SlackPlatformProvider:
                 )
 
                 self._commands[partial_path] = auto_cmd
+                self._invalidate_command_index()
 
                 self._logger.debug(
                     "auto_generated_intermediate_command",
@@ -338,13 +356,12 @@ class SlackPlatformProvider:
         Returns:
             List of child CommandDefinition objects
         """
-        children = []
-        for cmd in self._commands.values():
-            # Check if this command's parent matches
-            if cmd.parent == parent_path:
-                children.append(cmd)
+        return list(self._command_tree.children(parent_path))
 
-        return sorted(children, key=lambda c: c.name)
+    def _invalidate_command_index(self) -> None:
+        """Recompile the command trie and drop cached help after a registry change."""
+        self._command_tree.invalidate()
+        self._help_generator.invalidate()
 
     def get_help_keywords(self) -> frozenset[str]:
         """Get Slack-specific help keywords for text commands."""
@@ -373,6 +390,12 @@ class SlackPlatformProvider:
             )
             self._socket_thread.start()
             log.info("socket_mode_started")
+            if getattr(self._settings, "LOCALE_CACHE_PRIME", False) is True:
+                threading.Thread(
+                    target=self.prime_user_locale_cache,
+                    daemon=True,
+                    name="slack-locale-prime",
+                ).start()
             return OperationResult.success(message="Socket Mode started")
         except Exception as e:
             log.error("socket_mode_start_failed", error=str(e))
@@ -387,6 +410,7 @@ class SlackPlatformProvider:
             self._handler.close()
         if self._socket_thread and self._socket_thread.is_alive():
             self._socket_thread.join(timeout=5)
+        self._logger.info("slack_user_locale_cache_stats", **self._locale_cache.stats())
 
     def _auto_register_root_commands(self) -> None:
         """Auto-register root commands with Slack Bolt based on registered command tree.
@@ -462,21 +486,21 @@ class SlackPlatformProvider:
 
     def _tokenize_command_text(self, text: str) -> list[str]:
         """Tokenize Slack command text using quote-aware parsing."""
-        parser = CommandArgumentParser([])
-        return parser._tokenize(text)
+        return self._tokenizer._tokenize(text)
 
     def route_hierarchical_command(self, root_command: str, text: str, payload: CommandPayload) -> CommandResponse:
-        """Route a Slack hierarchical command recursively to leaf command.
+        """Route a Slack hierarchical command to the deepest matching command.
 
-        Handles multi-level command hierarchies by recursively routing through
-        the command tree. Uses quote-aware tokenization to preserve arguments
-        with spaces.
+        Handles multi-level command hierarchies by walking the command trie.
+        The text is tokenized once (quote-aware) and leading tokens that name
+        child commands are consumed.
 
         Flow:
         1. Tokenize text (quote-aware)
-        2. Check if first token is help keyword → generate help
-        3. Check if first token matches child command → recurse
-        4. If no match or no tokens, dispatch to current command
+        2. Follow tokens naming child commands down the trie, stopping at a
+           help keyword or the first token that is not a child
+        3. Help keyword → dispatch it to the command reached (shows help)
+        4. Otherwise dispatch the remaining tokens to the command reached
 
         Args:
             root_command: Current command path (e.g., "sre" or "sre.groups")
@@ -490,8 +514,8 @@ class SlackPlatformProvider:
             User: /sre groups add email@example.com
             Call: route_hierarchical_command("sre", "groups add email@example.com")
             Internal routing:
-              - "sre" + "groups" → "sre.groups" (child found, recurse)
-              - "sre.groups" + "add" → "sre.groups.add" (child found, recurse)
+              - "sre" + "groups" → "sre.groups" (child found)
+              - "sre.groups" + "add" → "sre.groups.add" (child found)
               - "sre.groups.add" + "email@..." → no child (dispatch)
             Handler receives: text="email@example.com" (arguments only)
         """
@@ -502,24 +526,18 @@ class SlackPlatformProvider:
         if not tokens:
             return self.dispatch_command(root_command, payload)
 
-        first_word = tokens[0]
-        remaining_text = " ".join(tokens[1:]) if len(tokens) > 1 else ""
+        command_path, consumed = self._command_tree.resolve(root_command, tokens, self.SLACK_HELP_KEYWORDS)
+        remaining = tokens[consumed:]
 
-        # Check for help keyword (early exit, don't recurse deeper)
-        if first_word.lower() in self.SLACK_HELP_KEYWORDS:
-            payload.text = first_word
-            return self.dispatch_command(root_command, payload)
-
-        # Try to recurse to child command
-        child_path = f"{root_command}.{first_word}"
-        if child_path in self._commands:
-            payload.text = remaining_text
-            # Recursively route the child to handle arbitrary depth
-            return self.route_hierarchical_command(child_path, remaining_text, payload)
-
-        # No child found, dispatch to current command with full text
-        payload.text = text
-        return self.dispatch_command(root_command, payload)
+        # Help keyword (don't route deeper)
+        if remaining and remaining[0].lower() in self.SLACK_HELP_KEYWORDS:
+            payload.text = remaining[0]
+        elif consumed:
+            payload.text = " ".join(remaining)
+        else:
+            # No child found, dispatch to current command with full text
+            payload.text = text
+        return self.dispatch_command(command_path, payload)
 
     def _send_command_response(self, response: CommandResponse, respond: Respond) -> None:
         """Send CommandResponse to Slack using respond function.
@@ -592,7 +610,9 @@ class SlackPlatformProvider:
         """Get user's locale from Slack API.
 
         Extracts the user's locale preference from their Slack profile.
-        Falls back to "en-US" if locale cannot be determined.
+        Falls back to "en-US" if locale cannot be determined. Answers come
+        from the shared ``UserLocaleCache`` when possible, so only a user's
+        first command (per cache TTL) pays the ``users.info`` round trip.
 
         Args:
             user_id: Slack user ID (e.g., "U02KULRUCA2")
@@ -600,43 +620,18 @@ class SlackPlatformProvider:
         Returns:
             Locale string (e.g., "en-US", "fr-FR")
         """
-        default_locale = "en-US"
-        supported_locales = ["en-US", "fr-FR"]
-
         if not user_id:
-            return default_locale
+            return DEFAULT_LOCALE
 
         if not self._client:
             self._logger.warning(
                 "slack_client_not_available_for_locale_extraction",
                 user_id=user_id,
             )
-            return default_locale
+            return DEFAULT_LOCALE
 
         try:
-            user_info = self._client.users_info(user=user_id, include_locale=True)
-            if user_info.get("ok") and user_info.get("user"):
-                user_locale = user_info["user"].get("locale")
-                if user_locale and isinstance(user_locale, str) and user_locale in supported_locales:
-                    self._logger.debug(
-                        "user_locale_extracted_from_slack",
-                        user_id=user_id,
-                        locale=user_locale,
-                    )
-                    return cast(str, user_locale)
-                else:
-                    self._logger.debug(
-                        "user_locale_not_supported_or_missing",
-                        user_id=user_id,
-                        locale=user_locale,
-                        supported=supported_locales,
-                    )
-            else:
-                self._logger.warning(
-                    "slack_users_info_failed",
-                    user_id=user_id,
-                    ok=user_info.get("ok"),
-                )
+            return resolve_user_locale(self._client, user_id, self._locale_cache)
         except Exception as e:
             self._logger.warning(
                 "failed_to_get_user_locale_from_slack",
@@ -644,7 +639,27 @@ class SlackPlatformProvider:
                 error=str(e),
             )
 
-        return default_locale
+        return DEFAULT_LOCALE
+
+    def prime_user_locale_cache(self, max_pages: int | None = None) -> int:
+        """Fill the locale cache from ``users.list`` so first commands skip ``users.info``.
+
+        Returns:
+            Number of users cached (0 when the client is unavailable or the call fails).
+        """
+        if not self._client:
+            return 0
+        try:
+            return prime_user_locales(self._client, self._locale_cache, max_pages=max_pages)
+        except Exception as e:
+            self._logger.warning("slack_user_locale_cache_prime_failed", error=str(e))
+            return 0
+
+    def _handle_user_change(self, event: dict[str, Any]) -> None:
+        """Drop the cached locale of a user whose profile changed."""
+        user_id = (event.get("user") or {}).get("id")
+        if user_id:
+            self._locale_cache.invalidate(user_id)
 
     def register_command(
         self,
@@ -729,6 +744,7 @@ class SlackPlatformProvider:
 
         # Store by full_path
         self._commands[cmd_def.full_path] = cmd_def
+        self._invalidate_command_index()
 
         self._logger.debug(
             "slack_command_registered",
@@ -44,6 +44,7 @@ class SlackSettings(BaseSettings):
 
     REQUEST_TIMEOUT_SECONDS: int = Field(default=10, alias="SLACK_REQUEST_TIMEOUT_SECONDS")
     RETRY_MAX_ATTEMPTS: int = Field(default=2, alias="SLACK_RETRY_MAX_ATTEMPTS")
+    LOCALE_CACHE_PRIME: bool = Field(default=False, alias="SLACK_LOCALE_CACHE_PRIME")
 
     @model_validator(mode="after")
     def _validate_transport_credentials(self) -> SlackSettings:
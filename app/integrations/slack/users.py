@@ -9,6 +9,7 @@ import structlog
 from slack_sdk import WebClient
 
 from integrations.slack.client import SlackClientManager
+from integrations.slack.locales import resolve_user_locale
 
 SLACK_USER_ID_REGEX = r"^[A-Z0-9]+$"
 
@@ -161,16 +162,10 @@ def get_user_email_from_id(client: WebClient, user_id: str) -> str | None:
 
 def get_user_locale(client: WebClient, user_id=None):
     """
-    Returns the user locale from a command's user_id if valid, "en-US" as default otherwise
+    Returns the user locale from a command's user_id if valid, "en-US" as default otherwise.
+    Served from the shared user locale cache when possible.
     """
-    default_locale = "en-US"
-    supported_locales = ["en-US", "fr-FR"]
-    if user_id is None:
-        return default_locale
-    user_locale = client.users_info(user=user_id, include_locale=True)
-    if user_locale["ok"] and (user_locale["user"]["locale"] in supported_locales):
-        return user_locale["user"]["locale"]
-    return default_locale
+    return resolve_user_locale(client, user_id)
 
 
 def replace_user_id_with_handle(client, message):
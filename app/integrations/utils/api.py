@@ -3,7 +3,9 @@
 import random
 import re
 import string
+import threading
 import time
+from collections.abc import Callable
 
 import structlog
 
@@ -121,3 +123,51 @@ def retry_request(
                 log.warning("retry_request_attempt", error=str(e), attempt=i + 1)
             time.sleep(delay)
             continue
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace calls under a per-minute API quota.
+
+    Tokens refill continuously at ``rate_per_second`` up to ``capacity``;
+    ``acquire`` blocks until enough tokens are available.
+
+    Args:
+        rate_per_second (float): Refill rate, e.g. ``60 / 60`` for 60 calls per minute.
+        capacity (float): Maximum burst size.
+        clock (Callable): Monotonic clock in seconds (injectable for tests).
+        sleep (Callable): Sleep function (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rate = rate_per_second
+        self._capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take ``tokens`` from the bucket, waiting for a refill if needed.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self._rate
+            self._sleep(delay)
+            waited += delay
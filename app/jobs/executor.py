@@ -0,0 +1,301 @@
+"""Worker pool that runs scheduled jobs off the schedule loop.
+
+``schedule`` calls each job inline from the loop thread, so one long job
+delays every other job due in the meantime. ``ScheduledJobExecutor.job``
+wraps a job so that, when ``schedule`` calls it, the run is handed to a
+bounded thread pool and the loop moves on at once.
+
+Each job runs at most ``max_instances`` times at once. A run that comes due
+while that limit is reached, or that cannot start within its misfire grace
+time, is handled by the job's misfire policy: ``SKIP`` drops it and
+``COALESCE`` keeps a single pending run that starts as soon as the current
+one finishes. ``run_pending`` replaces ``schedule.run_pending`` so each run
+knows when it was due: lateness (due to start) and duration are recorded
+per job, and runs missed entirely because the loop was late are counted
+and logged instead of silently dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any
+
+import schedule
+from structlog import get_logger
+
+from jobs.settings import get_scheduler_settings
+
+SKIP = "skip"
+COALESCE = "coalesce"
+
+logger = get_logger()
+
+
+@dataclass
+class _JobStats:
+    running: int = 0
+    runs: int = 0
+    failures: int = 0
+    overlaps: int = 0
+    coalesced: int = 0
+    misfires: int = 0
+    missed_runs: int = 0
+    last_lateness_seconds: float | None = None
+    max_lateness_seconds: float = 0.0
+    last_duration_seconds: float | None = None
+    max_duration_seconds: float = 0.0
+    total_duration_seconds: float = 0.0
+
+
+class ScheduledJob:
+    """A job dispatched to the executor when ``schedule`` calls it.
+
+    Attributes:
+        name: Job name used in logs and stats.
+        func: Callable doing the work; receives the arguments given to ``do()``.
+        max_instances: Maximum runs of this job at the same time.
+        misfire_policy: ``SKIP`` or ``COALESCE``.
+        misfire_grace_seconds: Maximum lateness before a run counts as a
+            misfire; None never misfires on lateness alone.
+    """
+
+    def __init__(
+        self,
+        executor: ScheduledJobExecutor,
+        name: str,
+        func: Callable[..., Any],
+        max_instances: int,
+        misfire_policy: str,
+        misfire_grace_seconds: float | None,
+    ) -> None:
+        self.name = name
+        self.func = func
+        self.max_instances = max_instances
+        self.misfire_policy = misfire_policy
+        self.misfire_grace_seconds = misfire_grace_seconds
+        self._executor = executor
+        # Read by schedule when it logs and reprs the job.
+        self.__name__ = name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        self._executor.dispatch(self, args, kwargs)
+
+
+class ScheduledJobExecutor:
+    """Run scheduled jobs on a bounded thread pool.
+
+    Args:
+        max_workers: Maximum number of jobs running at the same time.
+        misfire_grace_seconds: Default misfire grace time of each job.
+        clock: Monotonic clock used for lateness and durations.
+        submit: Runs a callable on a worker (injectable for tests; defaults
+            to the executor's thread pool).
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        misfire_grace_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        submit: Callable[[Callable[[], None]], Any] | None = None,
+    ) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduled-job")
+        self._submit = submit or self._pool.submit
+        self._misfire_grace_seconds = misfire_grace_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: dict[str, _JobStats] = {}
+        # Due run waiting for the current one to finish, per COALESCE job.
+        self._pending: dict[str, tuple[tuple[Any, ...], dict[str, Any], float]] = {}
+        self._dispatching = threading.local()
+
+    def job(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        max_instances: int = 1,
+        misfire_policy: str = SKIP,
+        misfire_grace_seconds: float | None = None,
+    ) -> ScheduledJob:
+        """Wrap ``func`` so each scheduled call runs on the worker pool.
+
+        Args:
+            name: Job name used in logs and stats.
+            func: Job to run.
+            max_instances: Maximum runs of this job at the same time.
+            misfire_policy: ``SKIP`` drops a run that cannot start on time;
+                ``COALESCE`` runs it once the current run finishes, merging
+                any further due runs into it.
+            misfire_grace_seconds: Overrides the executor's default grace time.
+
+        Returns:
+            ScheduledJob: Callable to pass to ``schedule``'s ``do()``.
+
+        Raises:
+            ValueError: If the policy is unknown or ``max_instances`` is below 1.
+        """
+        if misfire_policy not in (SKIP, COALESCE):
+            raise ValueError(f"Unknown misfire policy: {misfire_policy}")
+        if max_instances < 1:
+            raise ValueError("max_instances must be at least 1")
+        with self._lock:
+            self._stats.setdefault(name, _JobStats())
+        grace = misfire_grace_seconds if misfire_grace_seconds is not None else self._misfire_grace_seconds
+        return ScheduledJob(self, name, func, max_instances, misfire_policy, grace)
+
+    def run_pending(self, scheduler: schedule.Scheduler | None = None) -> None:
+        """Dispatch every due job of ``scheduler`` (the default scheduler if None)."""
+        scheduler = scheduler or schedule.default_scheduler
+        for job in sorted(job for job in scheduler.jobs if job.should_run):
+            lateness = max((datetime.now() - job.next_run).total_seconds(), 0.0)
+            scheduled = getattr(job.job_func, "func", None)
+            period = _period_seconds(job)
+            if isinstance(scheduled, ScheduledJob) and period and lateness >= period:
+                # schedule runs an overdue job once, whatever the number of periods missed.
+                missed = int(lateness // period)
+                with self._lock:
+                    self._stats[scheduled.name].missed_runs += missed
+                logger.warning("scheduled_job_runs_missed", job_name=scheduled.name, missed=missed)
+            self._dispatching.due_at = self._clock() - lateness
+            try:
+                if job.run() is schedule.CancelJob:
+                    scheduler.cancel_job(job)
+            finally:
+                self._dispatching.due_at = None
+
+    def dispatch(self, job: ScheduledJob, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        """Start a run of ``job`` on the pool, applying its overlap limit."""
+        due_at = getattr(self._dispatching, "due_at", None)
+        if due_at is None:
+            due_at = self._clock()
+        with self._lock:
+            stats = self._stats[job.name]
+            if stats.running >= job.max_instances:
+                if job.misfire_policy == COALESCE:
+                    stats.coalesced += 1
+                    # Keep the earliest due time so lateness covers the whole wait.
+                    previous = self._pending.get(job.name)
+                    self._pending[job.name] = (args, kwargs, previous[2] if previous else due_at)
+                else:
+                    stats.overlaps += 1
+                overlap = True
+            else:
+                stats.running += 1
+                overlap = False
+        if overlap:
+            logger.warning("scheduled_job_overlap", job_name=job.name, misfire_policy=job.misfire_policy)
+            return
+        self._start(job, args, kwargs, due_at)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return run counts, lateness and duration per job."""
+        with self._lock:
+            return {
+                name: {
+                    "running": stats.running,
+                    "pending": name in self._pending,
+                    "runs": stats.runs,
+                    "failures": stats.failures,
+                    "overlaps": stats.overlaps,
+                    "coalesced": stats.coalesced,
+                    "misfires": stats.misfires,
+                    "missed_runs": stats.missed_runs,
+                    "last_lateness_seconds": stats.last_lateness_seconds,
+                    "max_lateness_seconds": round(stats.max_lateness_seconds, 4),
+                    "last_duration_seconds": stats.last_duration_seconds,
+                    "max_duration_seconds": round(stats.max_duration_seconds, 4),
+                    "avg_duration_seconds": round(stats.total_duration_seconds / stats.runs, 4) if stats.runs else None,
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool; runs not yet started are cancelled."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _start(self, job: ScheduledJob, args: tuple[Any, ...], kwargs: dict[str, Any], due_at: float) -> None:
+        try:
+            self._submit(lambda: self._execute(job, args, kwargs, due_at))
+        except RuntimeError:
+            # The pool is shut down: the loop is stopping, or the job was
+            # registered with an executor that has since been replaced.
+            with self._lock:
+                self._stats[job.name].running -= 1
+                self._pending.pop(job.name, None)
+            logger.warning("scheduled_job_dropped_executor_shut_down", job_name=job.name)
+
+    def _execute(self, job: ScheduledJob, args: tuple[Any, ...], kwargs: dict[str, Any], due_at: float) -> None:
+        started = self._clock()
+        lateness = max(started - due_at, 0.0)
+        misfired = job.misfire_policy == SKIP and job.misfire_grace_seconds is not None and lateness > job.misfire_grace_seconds
+        failed = False
+        try:
+            if misfired:
+                logger.warning("scheduled_job_misfired", job_name=job.name, lateness_seconds=round(lateness, 4))
+            else:
+                job.func(*args, **kwargs)
+        except Exception as e:
+            failed = True
+            logger.error("scheduled_job_failed", job_name=job.name, error=str(e))
+        finally:
+            duration = self._clock() - started
+            with self._lock:
+                stats = self._stats[job.name]
+                if misfired:
+                    stats.misfires += 1
+                else:
+                    stats.runs += 1
+                    stats.failures += int(failed)
+                    stats.last_lateness_seconds = round(lateness, 4)
+                    stats.max_lateness_seconds = max(stats.max_lateness_seconds, lateness)
+                    stats.last_duration_seconds = round(duration, 4)
+                    stats.max_duration_seconds = max(stats.max_duration_seconds, duration)
+                    stats.total_duration_seconds += duration
+                pending = self._pending.pop(job.name, None)
+                if pending is None:
+                    stats.running -= 1
+            if not misfired:
+                logger.info(
+                    "scheduled_job_finished",
+                    job_name=job.name,
+                    lateness_seconds=round(lateness, 4),
+                    duration_seconds=round(duration, 4),
+                )
+        if pending is not None:
+            # The slot is handed straight to the coalesced run.
+            self._start(job, *pending)
+
+
+def _period_seconds(job: schedule.Job) -> float | None:
+    try:
+        return timedelta(**{job.unit: job.interval}).total_seconds()
+    except TypeError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_job_executor() -> ScheduledJobExecutor:
+    """Singleton provider for the scheduled job executor."""
+    settings = get_scheduler_settings()
+    return ScheduledJobExecutor(
+        max_workers=settings.SCHEDULER_MAX_WORKERS,
+        misfire_grace_seconds=settings.SCHEDULER_MISFIRE_GRACE_SECONDS,
+    )
+
+
+def shutdown_job_executor() -> None:
+    """Shut down the executor's worker pool, if it was created, and forget it.
+
+    The next ``get_job_executor`` call builds a fresh executor, so jobs
+    registered after a restart never land on the stopped pool.
+    """
+    if get_job_executor.cache_info().currsize:
+        get_job_executor().shutdown()
+    get_job_executor.cache_clear()
@@ -0,0 +1,149 @@
+"""Concurrent integration healthchecks.
+
+``HealthcheckRunner`` runs every integration's healthcheck on a bounded
+thread pool, waits for each one up to its own timeout and records the
+outcome in ``HealthStatusRegistry``. A check still running at its deadline
+is reported as timed out and left to finish in the background; it is not
+started again until it returns, so a hung dependency holds at most one
+worker. Timeouts count from submission, which bounds the whole run by the
+longest timeout. Outcomes go to ``infrastructure.health``'s status
+registry, which the API reads without live calls.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+
+from infrastructure.health import (
+    FAILED,
+    HEALTHY,
+    TIMED_OUT,
+    UNHEALTHY,
+    HealthStatusRegistry,
+    get_health_status_registry,
+)
+from jobs.settings import get_scheduler_settings
+
+
+@dataclass(frozen=True)
+class IntegrationHealthcheck:
+    """One integration healthcheck.
+
+    Attributes:
+        name: Integration name used in logs and the status registry.
+        check: Callable returning True when the integration is healthy.
+        timeout_seconds: Maximum run time before the check counts as timed
+            out (defaults to HEALTHCHECK_TIMEOUT_SECONDS).
+    """
+
+    name: str
+    check: Callable[[], bool]
+    timeout_seconds: float | None = None
+
+
+class HealthcheckRunner:
+    """Run healthchecks concurrently with per-check timeouts.
+
+    Args:
+        registry: Registry receiving each outcome.
+        timeout_seconds: Default per-check timeout.
+        max_workers: Maximum number of checks running at the same time.
+        clock: Monotonic clock used for durations and deadlines.
+    """
+
+    def __init__(
+        self,
+        registry: HealthStatusRegistry,
+        timeout_seconds: float,
+        max_workers: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._registry = registry
+        self._timeout_seconds = timeout_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="healthcheck")
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Checks abandoned at their deadline; not resubmitted until they return.
+        self._in_flight: dict[str, Future[tuple[bool, float]]] = {}
+
+    def run(self, checks: list[IntegrationHealthcheck]) -> dict[str, str]:
+        """Run every check and return the status recorded for each integration.
+
+        Returns once every check has finished or reached its timeout, counted
+        from submission so the run stays bounded even when every worker is
+        held by a hung check.
+        """
+        results: dict[str, str] = {}
+        running: dict[Future[tuple[bool, float]], IntegrationHealthcheck] = {}
+        deadlines: dict[str, float] = {}
+
+        for check in checks:
+            with self._lock:
+                previous = self._in_flight.get(check.name)
+                if previous is not None and not previous.done():
+                    results[check.name] = self._record(check.name, TIMED_OUT, error="previous check still running")
+                    continue
+                self._in_flight.pop(check.name, None)
+            deadlines[check.name] = self._clock() + self._timeout(check)
+            running[self._executor.submit(self._execute, check)] = check
+
+        while running:
+            timeout = max(min(deadlines[check.name] for check in running.values()) - self._clock(), 0.0)
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                check = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    results[check.name] = self._record(check.name, FAILED, error=str(error))
+                else:
+                    healthy, duration = future.result()
+                    results[check.name] = self._record(check.name, HEALTHY if healthy else UNHEALTHY, duration)
+
+            now = self._clock()
+            for future, check in list(running.items()):
+                if now >= deadlines[check.name]:
+                    del running[future]
+                    with self._lock:
+                        self._in_flight[check.name] = future
+                    results[check.name] = self._record(check.name, TIMED_OUT, self._timeout(check), "healthcheck timed out")
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker pool without waiting for checks still running."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(self, check: IntegrationHealthcheck) -> tuple[bool, float]:
+        started = self._clock()
+        healthy = bool(check.check())
+        return healthy, self._clock() - started
+
+    def _timeout(self, check: IntegrationHealthcheck) -> float:
+        return check.timeout_seconds if check.timeout_seconds is not None else self._timeout_seconds
+
+    def _record(self, name: str, status: str, duration: float | None = None, error: str | None = None) -> str:
+        self._registry.record(name, status, duration_seconds=duration, error=error)
+        return status
+
+
+@lru_cache(maxsize=1)
+def get_healthcheck_runner() -> HealthcheckRunner:
+    """Singleton provider for the integration healthcheck runner."""
+    settings = get_scheduler_settings()
+    return HealthcheckRunner(
+        registry=get_health_status_registry(),
+        timeout_seconds=settings.HEALTHCHECK_TIMEOUT_SECONDS,
+        max_workers=settings.HEALTHCHECK_MAX_WORKERS,
+    )
+
+
+def shutdown_healthcheck_runner() -> None:
+    """Shut down the runner's worker pool, if it was created, and forget it."""
+    if get_healthcheck_runner.cache_info().currsize:
+        get_healthcheck_runner().shutdown()
+    get_healthcheck_runner.cache_clear()
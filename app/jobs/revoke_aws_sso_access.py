@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from structlog import get_logger
 
 from integrations.aws import identity_store, sso_admin
@@ -6,9 +8,26 @@ from modules.ops.notifications import log_ops_message
 
 logger = get_logger()
 
+# Bounded so a large backlog of expired requests does not trip the Identity
+# Center API rate limits.
+MAX_CONCURRENT_REVOCATIONS = 8
+
 
 def revoke_aws_sso_access(client):
-    for request in aws_access_requests.get_expired_requests():
+    expired_requests = aws_access_requests.get_expired_requests()
+    if not expired_requests:
+        return
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REVOCATIONS) as executor:
+        outcomes = list(executor.map(_remove_account_assignment, expired_requests))
+    revoked = [request for request, removed in zip(expired_requests, outcomes, strict=True) if removed]
+    if not revoked:
+        return
+
+    unprocessed = aws_access_requests.expire_requests(revoked)
+    unprocessed_keys = {(item["account_id"]["S"], item["created_at"]["N"]) for item in unprocessed}
+
+    for request in revoked:
         account_id = request["account_id"]["S"]
         account_name = request["account_name"]["S"]
         user_id = request["user_id"]["S"]
@@ -16,20 +35,19 @@ def revoke_aws_sso_access(client):
         access_type = request["access_type"]["S"]
         created_at = request["created_at"]["N"]
 
-        logger.info(
-            "revoking_aws_sso_access",
-            account_name=account_name,
-            account_id=account_id,
-            user_id=user_id,
-            email=email,
-            access_type=access_type,
-            created_at=created_at,
-        )
+        if (account_id, created_at) in unprocessed_keys:
+            logger.error(
+                "failed_to_expire_aws_access_request",
+                account_name=account_name,
+                account_id=account_id,
+                user_id=user_id,
+                email=email,
+                access_type=access_type,
+                created_at=created_at,
+            )
+            continue
 
         try:
-            aws_user_id = identity_store.get_user_id(email)
-            sso_admin.delete_account_assignment(aws_user_id, account_id, access_type)
-            aws_access_requests.expire_request(account_id=account_id, created_at=created_at)
             msg = f"Revoked access to {account_name} ({account_id}) for <@{user_id}> ({email}) with access type: {access_type}"
             client.chat_postEphemeral(
                 channel=user_id,
@@ -37,10 +55,9 @@ def revoke_aws_sso_access(client):
                 text=msg,
             )
             log_ops_message(msg)
-
         except Exception as e:
             logger.error(
-                "failed_to_revoke_aws_sso_access",
+                "failed_to_notify_aws_sso_access_revoked",
                 account_name=account_name,
                 account_id=account_id,
                 user_id=user_id,
@@ -48,3 +65,44 @@ def revoke_aws_sso_access(client):
                 access_type=access_type,
                 error=str(e),
             )
+
+
+def _remove_account_assignment(request) -> bool:
+    """Delete the account assignment behind one expired request.
+
+    Returns:
+        bool: True when the assignment was removed and the request can be
+            marked expired; failures are logged and left for the next run.
+    """
+    account_id = request["account_id"]["S"]
+    account_name = request["account_name"]["S"]
+    user_id = request["user_id"]["S"]
+    email = request["email"]["S"]
+    access_type = request["access_type"]["S"]
+    created_at = request["created_at"]["N"]
+
+    logger.info(
+        "revoking_aws_sso_access",
+        account_name=account_name,
+        account_id=account_id,
+        user_id=user_id,
+        email=email,
+        access_type=access_type,
+        created_at=created_at,
+    )
+
+    try:
+        aws_user_id = identity_store.get_user_id(email)
+        sso_admin.delete_account_assignment(aws_user_id, account_id, access_type)
+        return True
+    except Exception as e:
+        logger.error(
+            "failed_to_revoke_aws_sso_access",
+            account_name=account_name,
+            account_id=account_id,
+            user_id=user_id,
+            email=email,
+            access_type=access_type,
+            error=str(e),
+        )
+        return False
@@ -7,14 +7,18 @@ from typing import Any
 import schedule
 from structlog import get_logger
 
+from infrastructure.health import HEALTHY, get_health_status_registry
 from infrastructure.idempotency import get_lease_store, run_if_leased
 from infrastructure.plugins.manager import get_plugin_manager
 from integrations import maxmind, opsgenie
-from integrations.aws import identity_store
+from integrations.aws import identity_store, organizations
 from integrations.google_workspace import google_drive
+from jobs.executor import COALESCE, ScheduledJob, get_job_executor, shutdown_job_executor
+from jobs.healthchecks import IntegrationHealthcheck, get_healthcheck_runner
 from jobs.models import BackgroundJobRegistry
 from jobs.settings import get_scheduler_settings
 from modules.aws import identity_center, spending
+from modules.incident.incident_folder import refresh_incident_folder_index
 from modules.incident.notify_stale_incident_channels import (
     notify_stale_incident_channels,
 )
@@ -37,7 +41,7 @@ class _ScheduleBackgroundJobRegistry(BackgroundJobRegistry):
         schedule: str,
         job: Callable[[], None],
     ) -> None:
-        schedule_lib.every().day.at(schedule).do(safe_run(job))
+        schedule_lib.every().day.at(schedule).do(_scheduled(job_name, job, misfire_policy=COALESCE))
         logger.info(
             "feature_background_job_scheduled",
             job_name=job_name,
@@ -53,7 +57,7 @@ class _ScheduleBackgroundJobRegistry(BackgroundJobRegistry):
         job: Callable[[], None],
     ) -> None:
         seconds = int(every.total_seconds())
-        schedule_lib.every(seconds).seconds.do(safe_run(job))
+        schedule_lib.every(seconds).seconds.do(_scheduled(job_name, job))
         logger.info(
             "feature_background_job_scheduled",
             job_name=job_name,
@@ -79,6 +83,11 @@ def safe_run(job: Callable[..., Any]) -> Callable[..., None]:
     return wrapper
 
 
+def _scheduled(name: str, job: Callable[..., Any], **options: Any) -> ScheduledJob:
+    """Run a job on the scheduled job executor instead of the schedule loop."""
+    return get_job_executor().job(name, safe_run(job), **options)
+
+
 def _tier2(name: str, job: Callable[..., None]) -> Callable[..., None]:
     """Wrap a singleton Tier-2 job with lease acquisition/release."""
     ttl_seconds = get_scheduler_settings().DEFAULT_TIER2_LEASE_TTL_SECONDS
@@ -94,19 +103,39 @@ def init(bot):
     """Initialize the scheduled tasks."""
     logger.info("initializing_scheduled_tasks", module="scheduled_tasks", function="init")
 
-    schedule.every(5).minutes.do(safe_run(scheduler_heartbeat))
-    schedule.every(5).minutes.do(safe_run(integration_healthchecks))
+    # Runs inline on the loop thread, so a heartbeat proves the loop itself is alive.
+    schedule.every(5).minutes.do(scheduler_heartbeat)
+    # Interval jobs skip a run that cannot start on time; the next one is never far off.
+    schedule.every(5).minutes.do(_scheduled("integration_healthchecks", integration_healthchecks))
+    # Per-replica in-memory index; every replica refreshes its own copy.
+    schedule.every(5).minutes.do(_scheduled("refresh_incident_folder_index", refresh_incident_folder_index))
+    # Keeps the account catalog warm so Slack modals never wait on a cold load.
+    schedule.every(10).minutes.do(_scheduled("refresh_account_catalog", organizations.refresh_account_catalog))
 
     # Tier-2 job body is idempotent; lease only avoids duplicate cross-replica runs.
-    schedule.every(2).hours.do(safe_run(_tier2("scheduler:provision_aws_identity_center", provision_aws_identity_center)))
+    schedule.every(2).hours.do(
+        _scheduled(
+            "provision_aws_identity_center",
+            _tier2("scheduler:provision_aws_identity_center", provision_aws_identity_center),
+        )
+    )
+    # Daily jobs coalesce instead: a skipped run would not come back for a day.
     # Tier-2 job body is idempotent; lease only avoids duplicate cross-replica runs.
     schedule.every().day.at("16:00").do(
-        safe_run(_tier2("scheduler:notify_stale_incident_channels", notify_stale_incident_channels)),
+        _scheduled(
+            "notify_stale_incident_channels",
+            _tier2("scheduler:notify_stale_incident_channels", notify_stale_incident_channels),
+            misfire_policy=COALESCE,
+        ),
         client=bot.client,
     )
     # Tier-2 job body is idempotent; lease only avoids duplicate cross-replica runs.
     schedule.every().day.at("00:00").do(
-        safe_run(_tier2("scheduler:spending_generate_spending_data", spending.generate_spending_data)),
+        _scheduled(
+            "spending_generate_spending_data",
+            _tier2("scheduler:spending_generate_spending_data", spending.generate_spending_data),
+            misfire_policy=COALESCE,
+        ),
         logger=logger,
     )
 
@@ -119,28 +148,35 @@ def scheduler_heartbeat():
 
 
 def integration_healthchecks():
-    """Run integration healthchecks."""
+    """Run integration healthchecks concurrently and record their status."""
     logger.info("running_integration_healthchecks", module="scheduled_tasks", time=time.ctime())
-    healthchecks: dict[str, Callable[[], bool]] = {
-        "google_drive": google_drive.healthcheck,
-        "maxmind": maxmind.healthcheck,
-        "opsgenie": opsgenie.healthcheck,
-        "aws": identity_store.healthcheck,
-    }
-    for key, healthcheck in healthchecks.items():
-        if not healthcheck():
+    healthchecks = [
+        IntegrationHealthcheck("google_drive", google_drive.healthcheck),
+        IntegrationHealthcheck("maxmind", maxmind.healthcheck),
+        IntegrationHealthcheck("opsgenie", opsgenie.healthcheck),
+        IntegrationHealthcheck("aws", identity_store.healthcheck),
+    ]
+    results = get_healthcheck_runner().run(healthchecks)
+    registry = get_health_status_registry()
+    for key, status in results.items():
+        entry = registry.get(key) or {}
+        if status != HEALTHY:
             logger.error(
                 "integration_healthcheck_result",
                 module="scheduled_tasks",
                 integration=key,
-                result="unhealthy",
+                result=status,
+                duration_seconds=entry.get("duration_seconds"),
+                consecutive_failures=entry.get("consecutive_failures"),
+                reason=entry.get("error"),
             )
         else:
             logger.info(
                 "integration_healthcheck_result",
                 module="scheduled_tasks",
                 integration=key,
-                result="healthy",
+                result=status,
+                duration_seconds=entry.get("duration_seconds"),
             )
 
 
@@ -163,22 +199,36 @@ def run_continuously(interval=1):
     missed jobs*. For example, if you've registered a job that
     should run every minute and you set a continuous run
     interval of one hour then your job won't be run 60 times
-    at each interval but only once.
+    at each interval but only once. Such missed runs are counted
+    and logged by the job executor, which runs each due job on its
+    worker pool so a long job never holds up the loop.
     """
+    executor = get_job_executor()
     cease_continuous_run = threading.Event()
 
     class ScheduleThread(threading.Thread):
         @classmethod
         def run(cls):
             while not cease_continuous_run.is_set():
-                schedule.run_pending()
+                executor.run_pending(schedule.default_scheduler)
                 time.sleep(interval)
+            executor.shutdown()
 
     continuous_thread = ScheduleThread()
     continuous_thread.start()
     return cease_continuous_run
 
 
+def shutdown() -> None:
+    """Forget the registered jobs and stop the job executor.
+
+    Called once the loop is told to stop, so a later ``init`` and
+    ``run_continuously`` start from an empty schedule and a fresh executor.
+    """
+    schedule.clear()
+    shutdown_job_executor()
+
+
 def reconcile_access_sync() -> None:
     """Run full-platform Access Sync batch sync for all registered platforms."""
     logger.info("reconcile_access_sync_started", module="scheduled_tasks")
@@ -8,12 +8,41 @@ from infrastructure.configuration.base import InfrastructureSettings
 
 
 class SchedulerSettings(InfrastructureSettings):
-    """Shared scheduler defaults for Tier-2 singleton jobs."""
+    """Shared scheduler defaults for Tier-2 singleton jobs, healthchecks and the job pool.
+
+    Environment Variables:
+        DEFAULT_TIER2_LEASE_TTL_SECONDS: Lease TTL for Tier-2 singleton jobs (default: 1800)
+        HEALTHCHECK_TIMEOUT_SECONDS: Per-integration healthcheck timeout (default: 10)
+        HEALTHCHECK_MAX_WORKERS: Integration healthchecks run at the same time (default: 4)
+        SCHEDULER_MAX_WORKERS: Scheduled jobs run at the same time (default: 4)
+        SCHEDULER_MISFIRE_GRACE_SECONDS: Lateness after which a run of a skip-policy
+            job is dropped (default: 300)
+    """
 
     DEFAULT_TIER2_LEASE_TTL_SECONDS: int = Field(
         default=1800,
         alias="DEFAULT_TIER2_LEASE_TTL_SECONDS",
     )
+    HEALTHCHECK_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        alias="HEALTHCHECK_TIMEOUT_SECONDS",
+        gt=0,
+    )
+    HEALTHCHECK_MAX_WORKERS: int = Field(
+        default=4,
+        alias="HEALTHCHECK_MAX_WORKERS",
+        ge=1,
+    )
+    SCHEDULER_MAX_WORKERS: int = Field(
+        default=4,
+        alias="SCHEDULER_MAX_WORKERS",
+        ge=1,
+    )
+    SCHEDULER_MISFIRE_GRACE_SECONDS: float = Field(
+        default=300.0,
+        alias="SCHEDULER_MISFIRE_GRACE_SECONDS",
+        gt=0,
+    )
 
 
 @lru_cache(maxsize=1)
@@ -3,9 +3,11 @@ import uuid
 
 import boto3  # type: ignore
 import structlog
+from boto3.dynamodb.types import TypeDeserializer
 from slack_sdk import WebClient
 
 from infrastructure.configuration.app import get_app_settings
+from infrastructure.storage import get_storage_service
 from integrations.aws import identity_store, organizations, sso_admin
 from modules.ops.notifications import log_ops_message
 
@@ -25,6 +27,17 @@ dynamodb_client = _get_dynamodb_client()
 
 table = "aws_access_requests"
 
+# Sparse GSI over unexpired requests: only items that still grant access carry
+# expiry_bucket, and end_date_time is stored as a number so the revoke job can
+# range-query "ended before now" instead of scanning the whole table.
+EXPIRY_INDEX = "expiry_bucket-end_date_time-index"
+ACTIVE_EXPIRY_BUCKET = "active"
+ACCESS_DURATION = datetime.timedelta(hours=4)
+
+BATCH_WRITE_SIZE = 25
+
+_deserializer = TypeDeserializer()
+
 
 def already_has_access(account_id, user_id, access_type):
     response = dynamodb_client.query(
@@ -32,7 +45,7 @@ def already_has_access(account_id, user_id, access_type):
         KeyConditionExpression=("account_id = :account_id and created_at > :created_at"),
         ExpressionAttributeValues={
             ":account_id": {"S": account_id},
-            ":created_at": {"N": str(datetime.datetime.now().timestamp() - (4 * 60 * 60))},
+            ":created_at": {"N": str(datetime.datetime.now().timestamp() - ACCESS_DURATION.total_seconds())},
         },
     )
 
@@ -41,7 +54,9 @@ def already_has_access(account_id, user_id, access_type):
 
     for item in response["Items"]:
         if item["user_id"]["S"] == user_id and item["access_type"]["S"] == access_type and item["expired"]["BOOL"] is False:
-            return round((float(item["created_at"]["N"]) + (4 * 60 * 60) - datetime.datetime.now().timestamp()) / 60)
+            return round(
+                (float(item["created_at"]["N"]) + ACCESS_DURATION.total_seconds() - datetime.datetime.now().timestamp()) / 60
+            )
 
     return False
 
@@ -59,7 +74,7 @@ def create_aws_access_request(
     if start_date_time is None:
         start_date_time = datetime.datetime.now()
     if end_date_time is None:
-        end_date_time = datetime.datetime.now() + datetime.timedelta(hours=1)
+        end_date_time = datetime.datetime.now() + ACCESS_DURATION
     id = str(uuid.uuid4())
     response = dynamodb_client.put_item(
         TableName=table,
@@ -71,10 +86,11 @@ def create_aws_access_request(
             "email": {"S": email},
             "access_type": {"S": access_type},
             "rationale": {"S": rationale},
-            "start_date_time": {"S": str(start_date_time.timestamp())},
-            "end_date_time": {"S": str(end_date_time.timestamp())},
+            "start_date_time": {"N": str(start_date_time.timestamp())},
+            "end_date_time": {"N": str(end_date_time.timestamp())},
             "created_at": {"N": str(datetime.datetime.now().timestamp())},
             "expired": {"BOOL": False},
+            "expiry_bucket": {"S": ACTIVE_EXPIRY_BUCKET},
         },
     )
     return response["ResponseMetadata"]["HTTPStatusCode"] == 200
@@ -87,44 +103,117 @@ def expire_request(account_id, created_at):
             "account_id": {"S": account_id},
             "created_at": {"N": created_at},
         },
-        UpdateExpression="set expired = :expired",
+        UpdateExpression="set expired = :expired remove expiry_bucket",
         ExpressionAttributeValues={":expired": {"BOOL": True}},
     )
     return response["ResponseMetadata"]["HTTPStatusCode"] == 200
 
 
-def get_expired_requests():
-    response = dynamodb_client.scan(
+def expire_requests(requests):
+    """Mark several requests as expired with batched writes.
+
+    Each request item (as returned by ``get_expired_requests``) is rewritten
+    with ``expired`` set and ``expiry_bucket`` removed, so it drops out of the
+    sparse expiry index. Writes are sent in chunks of 25 through
+    ``StorageService.batch_put``, which retries unprocessed items with backoff.
+
+    Args:
+        requests (list): Full request items in DynamoDB attribute-value form.
+
+    Returns:
+        list: The items that could not be written after all retries.
+    """
+    items = []
+    for request in requests:
+        item = {key: value for key, value in request.items() if key != "expiry_bucket"}
+        item["expired"] = {"BOOL": True}
+        items.append(item)
+
+    failed = _batch_put_items(items)
+    if failed:
+        logger.warning("aws_access_requests_expire_unprocessed", unprocessed_count=len(failed))
+    return failed
+
+
+def _batch_put_items(items):
+    """Write items in chunks of 25, collecting every chunk whose write failed.
+
+    A failing chunk (SDK error or items left unprocessed after the storage
+    service's retries) is logged and returned whole; the other chunks are
+    still written.
+
+    Returns:
+        list: The items of every chunk that could not be written.
+    """
+    storage = get_storage_service()
+    failed = []
+    for start in range(0, len(items), BATCH_WRITE_SIZE):
+        chunk = items[start : start + BATCH_WRITE_SIZE]
+        result = storage.batch_put(table, [_to_plain_item(item) for item in chunk])
+        if not result.is_success:
+            logger.error(
+                "aws_access_requests_batch_write_failed",
+                items=len(chunk),
+                error=result.message,
+                error_code=result.error_code,
+            )
+            failed.extend(chunk)
+    return failed
+
+
+def _to_plain_item(item):
+    """Convert an item in DynamoDB attribute-value form to plain Python values."""
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
+
+
+def _query_expiry_index(key_condition, values):
+    """Yield every item of the sparse expiry index matching the key condition."""
+    paginator = dynamodb_client.get_paginator("query")
+    for page in paginator.paginate(
         TableName=table,
-        FilterExpression="expired = :expired and created_at < :created_at",
-        ExpressionAttributeValues={
-            ":expired": {"BOOL": False},
-            ":created_at": {"N": str(datetime.datetime.now().timestamp() - (4 * 60 * 60))},
-        },
+        IndexName=EXPIRY_INDEX,
+        KeyConditionExpression=key_condition,
+        ExpressionAttributeValues={":bucket": {"S": ACTIVE_EXPIRY_BUCKET}, **values},
+    ):
+        yield from page.get("Items", [])
+
+
+def get_expired_requests():
+    """
+    Retrieves requests whose access window has ended but which are not yet expired.
+
+    Only unexpired requests carry ``expiry_bucket``, so this is a paginated
+    query over the sparse expiry index ordered by ``end_date_time``.
+
+    Returns:
+        list: Request items due for revocation, oldest end time first.
+    """
+    current_timestamp = datetime.datetime.now().timestamp()
+    return list(
+        _query_expiry_index(
+            "expiry_bucket = :bucket and end_date_time <= :current_time",
+            {":current_time": {"N": str(current_timestamp)}},
+        )
     )
-    return response.get("Items", [])
 
 
 def get_active_requests():
     """
     Retrieves active requests from the DynamoDB table.
 
-    This function fetches records where the current time is less than the
-    'end_date_time' attribute, indicating active requests.
+    This function fetches unexpired records where the current time is less
+    than the 'end_date_time' attribute, via the sparse expiry index.
 
     Returns:
         list: A list of active items from the DynamoDB table, or an empty list if none are found.
     """
-    # Get the current timestamp
     current_timestamp = datetime.datetime.now().timestamp()
-
-    # Query to get records where current date time is less than end_date_time
-    response = dynamodb_client.scan(
-        TableName=table,
-        FilterExpression="end_date_time > :current_time",
-        ExpressionAttributeValues={":current_time": {"S": str(current_timestamp)}},
+    return list(
+        _query_expiry_index(
+            "expiry_bucket = :bucket and end_date_time > :current_time",
+            {":current_time": {"N": str(current_timestamp)}},
+        )
     )
-    return response.get("Items", [])
 
 
 def get_past_requests():
@@ -132,21 +221,79 @@ def get_past_requests():
     Retrieves past requests from the DynamoDB table.
 
     This function fetches records where the current time is greater than the
-    'end_date_time' attribute, indicating past requests.
+    'end_date_time' attribute, indicating past requests. Expired requests are
+    not in the sparse expiry index, so this walks every scan page.
 
     Returns:
         list: A list of past items from the DynamoDB table, or an empty list if none are found.
     """
-    # Get the current timestamp
     current_timestamp = datetime.datetime.now().timestamp()
 
-    # Query to get records where current date time is greater than end_date_time
-    response = dynamodb_client.scan(
+    paginator = dynamodb_client.get_paginator("scan")
+    items = []
+    for page in paginator.paginate(
         TableName=table,
         FilterExpression="end_date_time < :current_time",
-        ExpressionAttributeValues={":current_time": {"S": str(current_timestamp)}},
-    )
-    return response.get("Items", [])
+        ExpressionAttributeValues={":current_time": {"N": str(current_timestamp)}},
+    ):
+        items.extend(page.get("Items", []))
+    return items
+
+
+def migrate_to_expiry_index(dry_run=False):
+    """
+    Rewrite legacy request items for the expiry index layout.
+
+    Legacy items store ``start_date_time``/``end_date_time`` as strings and
+    have no ``expiry_bucket``. Their access was revoked 4 hours after
+    ``created_at`` regardless of ``end_date_time``, so unexpired legacy items
+    keep that deadline: ``end_date_time`` becomes the later of the stored
+    value and ``created_at`` plus 4 hours. Items already in the new layout
+    are left untouched, so the migration can be re-run safely.
+
+    Args:
+        dry_run (bool): Count the items that would change without writing.
+
+    Returns:
+        dict: ``scanned``, ``migrated`` and ``failed`` item counts.
+    """
+    paginator = dynamodb_client.get_paginator("scan")
+    migrated_items = []
+    scanned = 0
+    for page in paginator.paginate(TableName=table):
+        for item in page.get("Items", []):
+            scanned += 1
+            migrated = _migrate_item(item)
+            if migrated is not None:
+                migrated_items.append(migrated)
+
+    failed = [] if dry_run else _batch_put_items(migrated_items)
+
+    result = {"scanned": scanned, "migrated": len(migrated_items) - len(failed), "failed": len(failed)}
+    logger.info("aws_access_requests_expiry_index_migration", dry_run=dry_run, **result)
+    return result
+
+
+def _migrate_item(item):
+    """Return the item rewritten for the expiry index layout, or None if already migrated."""
+    expired = item.get("expired", {}).get("BOOL", False)
+    legacy = "end_date_time" not in item or any("S" in item.get(key, {}) for key in ("start_date_time", "end_date_time"))
+    if not legacy and (expired or "expiry_bucket" in item):
+        return None
+
+    migrated = dict(item)
+    for key in ("start_date_time", "end_date_time"):
+        if "S" in item.get(key, {}):
+            migrated[key] = {"N": str(float(item[key]["S"]))}
+
+    if not expired:
+        end_date_time = float(migrated["end_date_time"]["N"]) if "end_date_time" in migrated else 0.0
+        if legacy:
+            legacy_deadline = float(item["created_at"]["N"]) + ACCESS_DURATION.total_seconds()
+            end_date_time = max(end_date_time, legacy_deadline)
+        migrated["end_date_time"] = {"N": str(end_date_time)}
+        migrated["expiry_bucket"] = {"S": ACTIVE_EXPIRY_BUCKET}
+    return migrated
 
 
 def access_view_handler(ack, body, request_logger, client: WebClient):
@@ -238,7 +385,7 @@ def access_view_handler(ack, body, request_logger, client: WebClient):
 
 
 def request_access_modal(client: WebClient, body):
-    accounts = {account["Id"]: account["Name"] for account in organizations.list_organization_accounts()}
+    accounts = {account["Id"]: account["Name"] for account in organizations.list_accounts()}
     accounts = dict(sorted(accounts.items(), key=lambda i: i[1]))
 
     options = [
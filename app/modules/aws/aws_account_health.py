@@ -208,7 +208,7 @@ def health_view_handler(ack: Ack, body, client: WebClient):
 
 
 def request_health_modal(client: WebClient, body):
-    accounts = organizations.list_organization_accounts()
+    accounts = organizations.list_accounts()
     options = [
         {
             "text": {
@@ -44,7 +44,7 @@ def generate_spending_data():
     year, month = datetime.now().strftime("%Y"), datetime.now().strftime("%m")
     log = logger.bind(year=year, month=month)
     log.info("generating_aws_spending_data")
-    account_ids = [account["Id"] for account in organizations.list_organization_accounts()]
+    account_ids = [account["Id"] for account in organizations.list_accounts()]
     log.info("aws_accounts_listed", count=len(account_ids))
     accounts = get_accounts_details(account_ids)
     accounts_df = pd.DataFrame(accounts)
@@ -65,9 +65,11 @@ def get_accounts_details(ids):
     accounts = []
     for id in ids:
         log.info("aws_account_details_request", account_id=id)
-        details = organizations.get_account_details(id)
-        account_tags = organizations.get_account_tags(id)
-        details["Tags"] = account_tags
+        # Served from the account catalog; only accounts created since its
+        # last refresh need a describe_account call.
+        cached = organizations.get_account(id)
+        details = dict(cached) if cached else organizations.get_account_details(id)
+        details["Tags"] = organizations.get_cached_account_tags(id)
         account = format_account_details(details)
         accounts.append(account)
     return accounts
@@ -0,0 +1,262 @@
+"""Incident bootstrap step graph executed on a thread pool.
+
+Creating an incident touches Slack, Google Meet, Drive/Docs, Sheets and
+DynamoDB. ``run_bootstrap_steps`` starts every ``BootstrapStep`` as soon as
+the steps it needs have finished, so independent calls overlap instead of
+running back to back inside the Slack handler.
+
+A step that raises, or runs past its timeout, is reported in
+``results["errors"]`` (its name in ``results["failed"]``) and the steps
+depending on it are reported in ``results["skipped"]``; every other step
+still runs. A step that times out is left to finish in the background; when
+the run has a ``key``, ``running_abandoned_steps(key)`` lists such steps
+until they return, so callers can hold off redoing their work. ``after``
+orders steps without making one depend on the other's success, which keeps
+channel messages in a readable order. Steps run in a copy of the caller's
+context, so contextvars such as bound log fields reach the workers.
+Per-step durations are returned in ``results["timings"]``.
+"""
+
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from structlog import get_logger
+
+DEFAULT_STEP_TIMEOUT_SECONDS = 30.0
+DEFAULT_MAX_WORKERS = 6
+DEFAULT_POLL_SECONDS = 1.0
+
+logger = get_logger()
+
+# Steps abandoned at their timeout, by run key, until they return.
+_abandoned_lock = threading.Lock()
+_abandoned: dict[str, dict[str, Future[Any]]] = {}
+
+
+class StepSkipped(Exception):
+    """Raised by a step that has nothing to do; the message is reported as skipped."""
+
+
+@dataclass(frozen=True)
+class BootstrapStep:
+    """One unit of incident bootstrap work.
+
+    Attributes:
+        name: Unique step name used in logs and timings.
+        description: Human readable label used in the results lists.
+        run: Callable receiving the outputs of finished steps by name and
+            returning this step's output.
+        depends_on: Steps that must succeed before this one starts.
+        after: Steps that must finish, successfully or not, before this one starts.
+        timeout_seconds: Maximum run time once started (defaults to the
+            runner's timeout).
+        marks_ready: Whether the channel counts as usable only once this step succeeded.
+    """
+
+    name: str
+    description: str
+    run: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+    timeout_seconds: float | None = None
+    marks_ready: bool = False
+
+
+def _validate(steps: list[BootstrapStep]) -> None:
+    by_name: dict[str, BootstrapStep] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate bootstrap step: {step.name}")
+        by_name[step.name] = step
+
+    for step in steps:
+        for dependency in (*step.depends_on, *step.after):
+            if dependency not in by_name:
+                raise ValueError(f"Bootstrap step {step.name} depends on unknown step {dependency}")
+
+    visiting: set[str] = set()
+    done: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Bootstrap step dependency cycle through {name}")
+        visiting.add(name)
+        for dependency in (*by_name[name].depends_on, *by_name[name].after):
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+
+    for step in steps:
+        visit(step.name)
+
+
+def running_abandoned_steps(key: str) -> list[str]:
+    """Return the names of steps of run ``key`` that timed out and are still running."""
+    with _abandoned_lock:
+        return sorted(name for name, future in _abandoned.get(key, {}).items() if not future.done())
+
+
+def _track_abandoned(key: str, name: str, future: Future[Any]) -> None:
+    with _abandoned_lock:
+        _abandoned.setdefault(key, {})[name] = future
+
+    def forget(_: Future[Any]) -> None:
+        with _abandoned_lock:
+            abandoned = _abandoned.get(key, {})
+            if abandoned.get(name) is future:
+                del abandoned[name]
+                if not abandoned:
+                    _abandoned.pop(key, None)
+
+    future.add_done_callback(forget)
+
+
+def run_bootstrap_steps(
+    steps: list[BootstrapStep],
+    timeout_seconds: float = DEFAULT_STEP_TIMEOUT_SECONDS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    clock: Callable[[], float] = time.monotonic,
+    key: str | None = None,
+) -> dict[str, Any]:
+    """Run bootstrap steps in dependency order, overlapping independent ones.
+
+    Args:
+        steps: Steps to run.
+        timeout_seconds: Default per-step timeout, counted from the step's start.
+        max_workers: Maximum number of steps running at the same time.
+        clock: Monotonic clock used for durations and timeouts.
+        key: Identifies the run (e.g. the incident channel) for
+            ``running_abandoned_steps``.
+
+    Returns:
+        dict: ``success``, ``skipped`` and ``errors`` lists of messages,
+        ``failed`` and ``timed_out`` lists of step names, ``outputs`` by step name, ``timings`` (seconds per finished step),
+        ``total_seconds`` and ``ready_seconds`` (time until every
+        ``marks_ready`` step succeeded, None if one did not).
+
+    Raises:
+        ValueError: If the graph has unknown dependencies, duplicates or a cycle.
+    """
+    _validate(steps)
+    results: dict[str, Any] = {
+        "success": [],
+        "errors": [],
+        "skipped": [],
+        "failed": [],
+        "timed_out": [],
+        "outputs": {},
+        "timings": {},
+        "total_seconds": 0.0,
+        "ready_seconds": None,
+    }
+    outputs: dict[str, Any] = results["outputs"]
+    timings: dict[str, float] = results["timings"]
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="incident-bootstrap")
+    lock = threading.Lock()
+    started = clock()
+    # Written by the worker when a step actually starts, so time spent queued
+    # behind other steps does not count against its timeout.
+    started_at: dict[str, float] = {}
+    running: dict[Future[Any], BootstrapStep] = {}
+    submitted: set[str] = set()
+    succeeded: set[str] = set()
+    finished: set[str] = set()
+    finished_at: dict[str, float] = {}
+
+    def execute(step: BootstrapStep, inputs: dict[str, Any]) -> Any:
+        with lock:
+            started_at[step.name] = clock()
+        return step.run(inputs)
+
+    def step_timeout(step: BootstrapStep) -> float:
+        return step.timeout_seconds if step.timeout_seconds is not None else timeout_seconds
+
+    def finish(step: BootstrapStep, outcome: str, message: str, duration: float | None = None) -> None:
+        finished.add(step.name)
+        finished_at[step.name] = clock() - started
+        results[outcome].append(message)
+        if outcome == "errors":
+            results["failed"].append(step.name)
+        if duration is not None:
+            timings[step.name] = round(duration, 4)
+        log = logger.error if outcome == "errors" else logger.info
+        log(
+            "incident_bootstrap_step_finished",
+            step=step.name,
+            outcome=outcome,
+            duration_seconds=timings.get(step.name),
+        )
+
+    def record(future: Future[Any], step: BootstrapStep) -> None:
+        with lock:
+            duration = clock() - started_at.get(step.name, clock())
+        error = future.exception()
+        if error is None:
+            outputs[step.name] = future.result()
+            succeeded.add(step.name)
+            finish(step, "success", step.description, duration)
+        elif isinstance(error, StepSkipped):
+            finish(step, "skipped", str(error) or step.description, duration)
+        else:
+            finish(step, "errors", f"{step.description} failed: {error}", duration)
+
+    def schedule() -> None:
+        progressed = True
+        while progressed:
+            progressed = False
+            for step in steps:
+                if step.name in finished or step.name in submitted:
+                    continue
+                blocked = [dependency for dependency in step.depends_on if dependency in finished and dependency not in succeeded]
+                if blocked:
+                    finish(step, "skipped", f"{step.description}: skipped, {', '.join(blocked)} did not complete")
+                    progressed = True
+                elif all(dependency in succeeded for dependency in step.depends_on) and all(
+                    dependency in finished for dependency in step.after
+                ):
+                    inputs = {name: outputs[name] for name in (*step.depends_on, *step.after) if name in outputs}
+                    submitted.add(step.name)
+                    # One context copy per step: a context cannot be entered by two threads at once.
+                    running[executor.submit(contextvars.copy_context().run, execute, step, inputs)] = step
+
+    try:
+        schedule()
+        while running:
+            now = clock()
+            with lock:
+                deadlines = [started_at[step.name] + step_timeout(step) for step in running.values() if step.name in started_at]
+            # Steps still queued have no deadline yet; poll until they start.
+            timeout = max(min(deadlines) - now, 0.0) if deadlines else DEFAULT_POLL_SECONDS
+            done, _ = wait(list(running), timeout=min(timeout, DEFAULT_POLL_SECONDS), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                record(future, running.pop(future))
+
+            now = clock()
+            for future, step in list(running.items()):
+                with lock:
+                    step_started = started_at.get(step.name)
+                if step_started is not None and now - step_started >= step_timeout(step):
+                    del running[future]
+                    if key is not None:
+                        _track_abandoned(key, step.name, future)
+                    results["timed_out"].append(step.name)
+                    finish(step, "errors", f"{step.description} timed out after {step_timeout(step)}s", now - step_started)
+            schedule()
+    finally:
+        # Never block on steps abandoned at their timeout.
+        executor.shutdown(wait=False)
+
+    results["total_seconds"] = round(clock() - started, 4)
+    ready_steps = [step.name for step in steps if step.marks_ready]
+    if ready_steps and all(name in succeeded for name in ready_steps):
+        results["ready_seconds"] = round(max(finished_at[name] for name in ready_steps), 4)
+    return results
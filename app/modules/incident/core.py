@@ -14,6 +14,7 @@ from modules.incident import (
     incident_folder,
     on_call,
 )
+from modules.incident.bootstrap import BootstrapStep, StepSkipped, run_bootstrap_steps, running_abandoned_steps
 
 app_settings = get_app_settings()
 incident_settings = get_incident_settings()
@@ -23,6 +24,22 @@ SLACK_NOTIFY_MGMT_USER_GROUP_ID = incident_settings.SLACK_NOTIFY_MGMT_USER_GROUP
 
 logger = get_logger()
 
+NEXT_STEPS_TEXT = """🚨 *Incident Resources Created Successfully!*
+*Next Steps - Available Commands:*
+• `/sre incident roles manage` - Assign roles to the incident
+• `/sre incident schedule retro` - Schedule a retrospective meeting
+• `/sre incident close` - Close and archive this incident
+• `/sre incident status update <status>` - Update incident status
+• `/sre incident updates add` - Add incident updates
+• `/sre incident show` - View incident details
+
+*Quick Actions:*
+📋 Use the bookmarked incident report above to document findings
+👥 Assign roles to team members for clear responsibilities
+📅 Schedule a retro meeting when ready
+
+_Type_ `/sre incident help` _for complete command list_"""
+
 
 def _get_channel_info_and_topic(client: WebClient, channel_id: str) -> tuple:
     """Extract channel information and parse incident details from topic.
@@ -90,10 +107,9 @@ def _find_product_folder(product: str) -> str:
         return None
 
     try:
-        folders = incident_folder.list_incident_folders()
-        for folder in folders:
-            if folder["name"].lower() == product.lower():
-                return folder["id"]
+        folder = incident_folder.find_incident_folder(product)
+        if folder is not None:
+            return folder["id"]
     except Exception as e:
         logger.warning(
             "recreate_missing_resources_folder_lookup_failed",
@@ -318,6 +334,25 @@ def _create_database_record(
         results["errors"].append(f"Failed to create database record: {str(e)}")
 
 
+def _fill_missing_meet_url(incident_record: dict, meet_url: str, user_id: str, results: dict) -> None:
+    """Store the Meet link on a record created with an empty ``meet_url`` while Meet was unavailable."""
+    stored = incident_record.get("meet_url")
+    if not meet_url or stored is None or stored.get("S"):
+        return
+
+    incident_id = incident_record["id"]["S"]
+    try:
+        db_operations.update_incident_field(incident_id, "meet_url", meet_url, user_id)
+        results["success"].append("Added Meet link to database record")
+    except Exception as e:
+        logger.error(
+            "recreate_missing_resources_meet_url_update_failed",
+            incident_id=incident_id,
+            error=str(e),
+        )
+        results["errors"].append(f"Failed to add Meet link to database record: {str(e)}")
+
+
 def recreate_missing_resources(
     client: WebClient,
     channel_id: str,
@@ -345,6 +380,16 @@ def recreate_missing_resources(
         "skipped": [],
     }
 
+    # Bootstrap steps that timed out may still create their resource; recreating
+    # it now would duplicate it.
+    still_running = running_abandoned_steps(channel_id)
+    if still_running:
+        logger.warning("recreate_missing_resources_bootstrap_running", channel_id=channel_id, steps=still_running)
+        results["errors"].append(
+            f"Incident setup is still running ({', '.join(still_running)}); try again once it has finished"
+        )
+        return results
+
     # Get basic channel info
     channel_info, incident_name, product = _get_channel_info_and_topic(client, channel_id)
     if not channel_info:
@@ -400,6 +445,7 @@ def recreate_missing_resources(
         )
     else:
         results["skipped"].append("Database record already exists")
+        _fill_missing_meet_url(incident_record, meet_url, user_id, results)
 
     return results
 
@@ -407,193 +453,252 @@ def recreate_missing_resources(
 def initiate_resources_creation(
     client: WebClient,
     incident_payload: IncidentPayload,
-):
-    """Create an incident and its related resources. If incident Slack channel provided, skips that resource creation"""
-
-    # Create channel
-    environment = "dev" if app_settings.ENVIRONMENT == "dev" else "prod"
+) -> dict:
+    """Create the resources of a new incident whose Slack channel already exists.
 
-    oncall = on_call.get_on_call_users_from_folder(client, incident_payload.folder)
+    The work runs as a step graph (see ``modules.incident.bootstrap``): Slack
+    channel setup, the Meet space, the incident document and the product
+    lookup start together, and steps needing their output (bookmarks, sheet
+    row, database record, boilerplate) start as soon as it is available.
 
-    channel_url = f"https://gcdigital.slack.com/archives/{incident_payload.channel_id}"
-
-    # Set topic
-    client.conversations_setTopic(
-        channel=incident_payload.channel_id,
-        topic=f"Incident: {incident_payload.name} / {incident_payload.product}",
-    )
-
-    # Set the description
-    client.conversations_setPurpose(channel=incident_payload.channel_id, purpose=f"{incident_payload.name}")
+    Returns:
+        dict: ``success``, ``skipped`` and ``errors`` lists plus per-step
+        ``timings`` and ``ready_seconds``, the time until the channel is usable.
+    """
+    environment = "dev" if app_settings.ENVIRONMENT == "dev" else "prod"
+    channel_id = incident_payload.channel_id
+    channel_url = f"https://gcdigital.slack.com/archives/{channel_id}"
+    severity = incident_payload.severity
+    source_alert = incident_payload.source_alert_permalink
+
+    def document_link(document_id: str) -> str:
+        return f"https://docs.google.com/document/d/{document_id}/edit"
+
+    def set_topic(_: dict) -> None:
+        client.conversations_setTopic(
+            channel=channel_id,
+            topic=f"Incident: {incident_payload.name} / {incident_payload.product}",
+        )
 
-    # Announce incident
-    text = (
-        f"<@{incident_payload.user_id}> has kicked off a new incident: {incident_payload.name} for {incident_payload.product}"
-        f" in <#{incident_payload.channel_id}>\n"
-        f"<@{incident_payload.user_id}> a initié un nouvel incident: {incident_payload.name} pour {incident_payload.product}"
-        f" dans <#{incident_payload.channel_id}>"
-    )
-    if INCIDENT_CHANNEL:
+    def set_purpose(_: dict) -> None:
+        client.conversations_setPurpose(channel=channel_id, purpose=f"{incident_payload.name}")
+
+    def announce(_: dict) -> None:
+        if not INCIDENT_CHANNEL:
+            raise StepSkipped("Incident announcement: no incident channel configured")
+        text = (
+            f"<@{incident_payload.user_id}> has kicked off a new incident: {incident_payload.name} for {incident_payload.product}"
+            f" in <#{channel_id}>\n"
+            f"<@{incident_payload.user_id}> a initié un nouvel incident: {incident_payload.name} pour {incident_payload.product}"
+            f" dans <#{channel_id}>"
+        )
         client.chat_postMessage(text=text, channel=INCIDENT_CHANNEL)
 
-    # Add incident creator to channel
-    client.conversations_invite(channel=incident_payload.channel_id, users=incident_payload.user_id)
+    def invite_creator(_: dict) -> None:
+        client.conversations_invite(channel=channel_id, users=incident_payload.user_id)
 
-    # Add meeting link
-    meet_link = meet.create_space()
-    client.bookmarks_add(
-        channel_id=incident_payload.channel_id,
-        title="Meet link",
-        type="link",
-        link=meet_link["meetingUri"],
-    )
+    def create_meet(_: dict) -> dict:
+        return meet.create_space()
 
-    # Create a canvas for the channel
-    client.conversations_canvases_create(
-        channel_id=incident_payload.channel_id,
-        document_content={
-            "type": "markdown",
-            "markdown": "# Incident Canvas 📋\n\nUse this area to write/store anything you want. All you need to do is to start typing below!️",
-        },
-    )
+    def bookmark_meet(inputs: dict) -> None:
+        client.bookmarks_add(
+            channel_id=channel_id,
+            title="Meet link",
+            type="link",
+            link=inputs["meet"]["meetingUri"],
+        )
 
-    if isinstance(incident_payload.severity, str) and incident_payload.severity.lower() in ["sev-1", "sev-2", "sev-3", "sev-4"]:
-        warning_string = f"\n:rotating_light: *SEVERITY WARNING: {incident_payload.severity.upper()}*  :rotating_light: \n\n\n_The incident was initially called with a {incident_payload.severity.upper()} severity level._"
+    def create_canvas(_: dict) -> None:
+        client.conversations_canvases_create(
+            channel_id=channel_id,
+            document_content={
+                "type": "markdown",
+                "markdown": "# Incident Canvas 📋\n\nUse this area to write/store anything you want. All you need to do is to start typing below!️",
+            },
+        )
+
+    def post_severity_warning(_: dict) -> None:
+        if not (isinstance(severity, str) and severity.lower() in ["sev-1", "sev-2", "sev-3", "sev-4"]):
+            raise StepSkipped("Severity warning: no severity level given")
+        warning_string = f"\n:rotating_light: *SEVERITY WARNING: {severity.upper()}*  :rotating_light: \n\n\n_The incident was initially called with a {severity.upper()} severity level._"
         message_blocks: list[blocks.SectionBlock | blocks.DividerBlock] = [
             blocks.DividerBlock(),
             blocks.SectionBlock(text=blocks.MarkdownTextObject(text=warning_string)),
             blocks.DividerBlock(),
         ]
-        client.chat_postMessage(
-            blocks=message_blocks,
-            channel=incident_payload.channel_id,
+        client.chat_postMessage(blocks=message_blocks, channel=channel_id)
+
+    def post_meet_link(inputs: dict) -> None:
+        client.chat_postMessage(text=f"A hangout has been created at: {inputs['meet']['meetingUri']}", channel=channel_id)
+
+    def create_document(_: dict) -> str:
+        document_id = incident_document.create_incident_document(incident_payload.slug, incident_payload.folder)
+        logger.info("incident_document_created", document_id=document_id)
+        return document_id
+
+    def find_team_name(_: dict) -> str:
+        folder = incident_folder.get_incident_folder(incident_payload.folder)
+        return folder["name"] if folder is not None else "Unknown"
+
+    def add_to_sheet(inputs: dict) -> None:
+        incident_folder.add_new_incident_to_list(
+            document_link(inputs["document"]),
+            incident_payload.name,
+            incident_payload.slug,
+            incident_payload.product,
+            channel_url,
         )
 
-    text = f"A hangout has been created at: {meet_link['meetingUri']}"
-    client.chat_postMessage(text=text, channel=incident_payload.channel_id)
-
-    # Create incident document
-    document_id = incident_document.create_incident_document(incident_payload.slug, incident_payload.folder)
-    logger.info("incident_document_created", document_id=document_id)
-
-    document_link = f"https://docs.google.com/document/d/{document_id}/edit"
-
-    # Update incident list
-    incident_folder.add_new_incident_to_list(
-        document_link,
-        incident_payload.name,
-        incident_payload.slug,
-        incident_payload.product,
-        channel_url,
-    )
-
-    folders = incident_folder.list_incident_folders()
-    team_name = "Unknown"
-    for f in folders:
-        if f["id"] == incident_payload.folder:
-            team_name = f["name"]
-            break
-
-    incident_data = {
-        "channel_id": incident_payload.channel_id,
-        "channel_name": incident_payload.channel_name,
-        "name": incident_payload.name,
-        "user_id": incident_payload.user_id,
-        "teams": [team_name],
-        "report_url": document_link,
-        "meet_url": meet_link["meetingUri"],
-        "environment": environment,
-        "severity": incident_payload.severity,
-    }
-    incident_id = db_operations.create_incident(incident_data)
-    logger.info("incident_record_created", incident_id=incident_id)
-
-    # Bookmark incident document
-    client.bookmarks_add(
-        channel_id=incident_payload.channel_id,
-        title="Incident report",
-        type="link",
-        link=document_link,
-    )
-
-    text = f":lapage: An incident report has been created at: {document_link}"
-    client.chat_postMessage(text=text, channel=incident_payload.channel_id)
+    def create_record(inputs: dict) -> str:
+        incident_data = {
+            "channel_id": channel_id,
+            "channel_name": incident_payload.channel_name,
+            "name": incident_payload.name,
+            "user_id": incident_payload.user_id,
+            "teams": [inputs["team_name"]],
+            "report_url": document_link(inputs["document"]),
+            # Left empty when Meet creation failed; recreate_missing_resources fills it in.
+            "meet_url": inputs.get("meet", {}).get("meetingUri", ""),
+            "environment": environment,
+            "severity": severity,
+        }
+        incident_id = db_operations.create_incident(incident_data)
+        logger.info("incident_record_created", incident_id=incident_id)
+        return incident_id
 
-    if incident_payload.source_alert_permalink:
+    def bookmark_document(inputs: dict) -> None:
         client.bookmarks_add(
-            channel_id=incident_payload.channel_id,
-            title="Source alert",
+            channel_id=channel_id,
+            title="Incident report",
             type="link",
-            link=incident_payload.source_alert_permalink,
-        )
-        client.chat_postMessage(
-            text=f"Source alert: <{incident_payload.source_alert_permalink}|View original alert>",
-            channel=incident_payload.channel_id,
+            link=document_link(inputs["document"]),
         )
 
-    # Gather all user IDs in a list to ensure uniqueness
-    users_to_invite = []
-
-    # Add oncall users, excluding the user_id
-    for user in oncall:
-        if user["id"] != incident_payload.user_id:
-            users_to_invite.append(user["id"])
-
-    # Get users from the @security group
-    if incident_payload.security_incident == "yes":
-        # If this is a security incident, get users from the security user group
-        # and add them to the list of users to invite
-        response = client.usergroups_users_list(usergroup=SLACK_SECURITY_USER_GROUP_ID)
-
-        # Avoid inviting security group users outside production to prevent spam.
-        if response.get("ok") and app_settings.ENVIRONMENT == "production":
-            for security_user in response["users"]:
-                if security_user != incident_payload.user_id:
-                    users_to_invite.append(security_user)
-
-    # Get users from the @notify-management group
-    if incident_payload.product == "Notify" and SLACK_NOTIFY_MGMT_USER_GROUP_ID:
-        # If this is a Notify product incident, get users from the Notify management user group
-        # and add them to the list of users to invite
-        response = client.usergroups_users_list(usergroup=SLACK_NOTIFY_MGMT_USER_GROUP_ID)
-        if response.get("ok"):
-            for notify_user in response["users"]:
-                if notify_user != incident_payload.user_id:
-                    users_to_invite.append(notify_user)
-        else:
-            logger.warning(
-                "notify_mgmt_group_fetch_failed",
-                error=response.get("error"),
-                usergroup=SLACK_NOTIFY_MGMT_USER_GROUP_ID,
-            )
-
-    # Invite all collected users to the channel in a single API call
-    if users_to_invite:
-        client.conversations_invite(channel=incident_payload.channel_id, users=users_to_invite)
-    text = """🚨 *Incident Resources Created Successfully!*
-*Next Steps - Available Commands:*
-• `/sre incident roles manage` - Assign roles to the incident
-• `/sre incident schedule retro` - Schedule a retrospective meeting
-• `/sre incident close` - Close and archive this incident
-• `/sre incident status update <status>` - Update incident status
-• `/sre incident updates add` - Add incident updates
-• `/sre incident show` - View incident details
-
-*Quick Actions:*
-📋 Use the bookmarked incident report above to document findings
-👥 Assign roles to team members for clear responsibilities
-📅 Schedule a retro meeting when ready
+    def post_document_link(inputs: dict) -> None:
+        text = f":lapage: An incident report has been created at: {document_link(inputs['document'])}"
+        client.chat_postMessage(text=text, channel=channel_id)
+
+    def bookmark_source_alert(_: dict) -> None:
+        if not source_alert:
+            raise StepSkipped("Source alert bookmark: no source alert")
+        client.bookmarks_add(channel_id=channel_id, title="Source alert", type="link", link=source_alert)
+
+    def post_source_alert(_: dict) -> None:
+        if not source_alert:
+            raise StepSkipped("Source alert message: no source alert")
+        client.chat_postMessage(text=f"Source alert: <{source_alert}|View original alert>", channel=channel_id)
+
+    def invite_responders(inputs: dict) -> None:
+        # Gather all user IDs in a list to ensure uniqueness
+        users_to_invite = [user["id"] for user in inputs["oncall"] if user["id"] != incident_payload.user_id]
+
+        # Get users from the @security group
+        if incident_payload.security_incident == "yes":
+            response = client.usergroups_users_list(usergroup=SLACK_SECURITY_USER_GROUP_ID)
+
+            # Avoid inviting security group users outside production to prevent spam.
+            if response.get("ok") and app_settings.ENVIRONMENT == "production":
+                users_to_invite.extend(user for user in response["users"] if user != incident_payload.user_id)
+
+        # Get users from the @notify-management group
+        if incident_payload.product == "Notify" and SLACK_NOTIFY_MGMT_USER_GROUP_ID:
+            response = client.usergroups_users_list(usergroup=SLACK_NOTIFY_MGMT_USER_GROUP_ID)
+            if response.get("ok"):
+                users_to_invite.extend(user for user in response["users"] if user != incident_payload.user_id)
+            else:
+                logger.warning(
+                    "notify_mgmt_group_fetch_failed",
+                    error=response.get("error"),
+                    usergroup=SLACK_NOTIFY_MGMT_USER_GROUP_ID,
+                )
+
+        if not users_to_invite:
+            raise StepSkipped("Responder invites: no responders to invite")
+        # Invite all collected users to the channel in a single API call
+        client.conversations_invite(channel=channel_id, users=users_to_invite)
+
+    def post_next_steps(_: dict) -> None:
+        client.chat_postMessage(text=NEXT_STEPS_TEXT, channel=channel_id)
+
+    def update_boilerplate(inputs: dict) -> None:
+        incident_document.update_boilerplate_text(
+            inputs["document"],
+            incident_payload.name,
+            incident_payload.product,
+            channel_url,
+            ", ".join([x["profile"]["display_name_normalized"] for x in inputs["oncall"]]),
+        )
 
-_Type_ `/sre incident help` _for complete command list_"""
-    client.chat_postMessage(text=text, channel=incident_payload.channel_id)
-    incident_document.update_boilerplate_text(
-        document_id,
-        incident_payload.name,
-        incident_payload.product,
-        channel_url,
-        ", ".join([x["profile"]["display_name_normalized"] for x in oncall]),
+    steps = [
+        BootstrapStep("set_topic", "Set channel topic", set_topic, marks_ready=True),
+        BootstrapStep("set_purpose", "Set channel purpose", set_purpose),
+        BootstrapStep("invite_creator", "Invited incident creator", invite_creator, marks_ready=True),
+        BootstrapStep("announce", "Announced incident", announce),
+        BootstrapStep("canvas", "Created channel canvas", create_canvas),
+        BootstrapStep(
+            "oncall", "Fetched on-call users", lambda _: on_call.get_on_call_users_from_folder(client, incident_payload.folder)
+        ),
+        BootstrapStep("meet", "Created Meet space", create_meet),
+        BootstrapStep("document", "Created incident document", create_document),
+        BootstrapStep("team_name", "Resolved product team", find_team_name),
+        BootstrapStep("meet_bookmark", "Added Meet link bookmark", bookmark_meet, depends_on=("meet",), marks_ready=True),
+        BootstrapStep("severity_warning", "Posted severity warning", post_severity_warning),
+        BootstrapStep("meet_message", "Posted Meet link", post_meet_link, depends_on=("meet",), after=("severity_warning",)),
+        BootstrapStep("sheet", "Added incident to Google Sheets list", add_to_sheet, depends_on=("document",)),
+        BootstrapStep(
+            "record",
+            "Created database record",
+            create_record,
+            depends_on=("document", "team_name"),
+            after=("meet",),
+        ),
+        BootstrapStep(
+            "document_bookmark",
+            "Added Incident report bookmark",
+            bookmark_document,
+            depends_on=("document",),
+            after=("meet_bookmark",),
+        ),
+        BootstrapStep(
+            "document_message",
+            "Posted incident report link",
+            post_document_link,
+            depends_on=("document",),
+            after=("meet_message",),
+        ),
+        BootstrapStep(
+            "source_alert_bookmark",
+            "Added source alert bookmark",
+            bookmark_source_alert,
+            after=("document_bookmark",),
+        ),
+        BootstrapStep("source_alert_message", "Posted source alert", post_source_alert, after=("document_message",)),
+        BootstrapStep("invite_responders", "Invited responders", invite_responders, depends_on=("oncall",)),
+        BootstrapStep(
+            "next_steps",
+            "Posted next steps",
+            post_next_steps,
+            after=("source_alert_message", "invite_responders"),
+        ),
+        BootstrapStep(
+            "boilerplate", "Updated incident document boilerplate", update_boilerplate, depends_on=("document", "oncall")
+        ),
+    ]
+    results = run_bootstrap_steps(
+        steps,
+        timeout_seconds=incident_settings.INCIDENT_BOOTSTRAP_STEP_TIMEOUT_SECONDS,
+        max_workers=incident_settings.INCIDENT_BOOTSTRAP_MAX_WORKERS,
+        key=channel_id,
     )
     logger.info(
-        "incident_successfully_created",
-        incident_id=incident_id,
+        "incident_bootstrap_completed",
+        channel_id=channel_id,
+        incident_id=results["outputs"].get("record"),
+        success_count=len(results["success"]),
+        skipped_count=len(results["skipped"]),
+        error_count=len(results["errors"]),
+        total_seconds=results["total_seconds"],
+        ready_seconds=results["ready_seconds"],
+        timings=results["timings"],
     )
+    return results
@@ -211,7 +211,7 @@ def submit(ack: Ack, view, say, body, client: WebClient):  # noqa: C901
         source_alert_permalink=source_alert_permalink,
     )
     try:
-        core.initiate_resources_creation(
+        results = core.initiate_resources_creation(
             client=client,
             incident_payload=incident_payload,
         )
@@ -228,6 +228,26 @@ def submit(ack: Ack, view, say, body, client: WebClient):  # noqa: C901
         )
         return
 
+    if results["errors"]:
+        logger.error(
+            "incident_resources_creation_incomplete",
+            errors=results["errors"],
+            skipped=results["skipped"],
+            incident_name=name,
+            channel_id=channel_id,
+        )
+        # Error details stay in the log; the channel only learns which steps failed.
+        timed_out = set(results.get("timed_out", []))
+        say(
+            text=":warning: Some incident resources could not be created:\n"
+            + "\n".join(
+                f"• `{step}` (timed out, may still finish)" if step in timed_out else f"• `{step}`"
+                for step in results["failed"]
+            )
+            + "\nPlease contact the SRE team.",
+            channel=channel_id,
+        )
+
 
 def generate_incident_modal_view(command, options=None, private_metadata=None, locale="en-US"):
     """Generate the incident creation modal view."""
@@ -1,11 +1,20 @@
 """Module for managing SRE incident folders in Google Drive.
 
 Includes functions to manage the folders, the metadata, and the list of incidents in a Google Sheets spreadsheet.
+
+Product folders are served from ``IncidentFolderIndex``, an in-memory index
+of folder id, name and appProperties loaded with a single ``files.list``
+call. The scheduler refreshes it periodically and the metadata save/delete
+handlers invalidate it, so incident creation resolves a product's folder and
+Opsgenie schedule without a Drive round trip.
 """
 
 import datetime
 import re
+import threading
 import time
+from collections.abc import Callable
+from functools import lru_cache
 
 import pytz
 from slack_bolt import Ack
@@ -13,6 +22,7 @@ from slack_sdk.errors import SlackApiError
 from slack_sdk.web import WebClient
 from structlog import get_logger
 
+from infrastructure.configuration.features.incident import get_incident_settings
 from infrastructure.configuration.integrations.google import get_google_resources_config
 from integrations.aws import dynamodb
 from integrations.google_workspace import google_drive, sheets
@@ -25,12 +35,132 @@ INCIDENT_LIST = google_resources.incident_list_id
 logger = get_logger()
 
 
-def list_incident_folders():
-    folders = google_drive.list_folders_in_folder(SRE_INCIDENT_FOLDER, "not name contains 'Templates'")
-    folders.sort(key=lambda x: x["name"])
+class IncidentFolderIndex:
+    """Thread-safe index of the product folders under the SRE incident folder.
+
+    Args:
+        loader: Callable returning the folders with their id, name and appProperties.
+        ttl_seconds: Seconds the index is served before it is reloaded.
+        clock: Monotonic clock in seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], list[dict]],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._loader = loader
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._folders: list[dict] = []
+        self._by_id: dict[str, dict] = {}
+        self._by_name: dict[str, dict] = {}
+        self._expires_at: float | None = None
+
+    def folders(self) -> list[dict]:
+        """Return every folder sorted by name."""
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._folders)
+
+    def get(self, folder_id: str) -> dict | None:
+        """Return the folder with ``folder_id``, or None."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_id.get(folder_id)
+
+    def find_by_name(self, name: str) -> dict | None:
+        """Return the folder named ``name`` (case-insensitive), or None."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_name.get(name.lower())
+
+    def refresh(self) -> None:
+        """Reload the folders now."""
+        with self._lock:
+            self._load()
+
+    def invalidate(self) -> None:
+        """Reload the folders on next use (e.g. after a metadata change)."""
+        with self._lock:
+            self._expires_at = None
+
+    def _ensure_loaded(self) -> None:
+        if self._expires_at is None or self._clock() >= self._expires_at:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            folders = sorted(self._loader(), key=lambda folder: folder["name"])
+        except Exception as e:
+            if self._expires_at is None and not self._folders:
+                raise
+            # Keep serving the previous folders until the next refresh.
+            logger.warning("incident_folder_index_refresh_failed", error=str(e))
+            self._expires_at = self._clock() + self._ttl_seconds
+            return
+        self._folders = folders
+        self._by_id = {folder["id"]: folder for folder in folders}
+        self._by_name = {folder["name"].lower(): folder for folder in folders}
+        self._expires_at = self._clock() + self._ttl_seconds
+        logger.info("incident_folder_index_loaded", count=len(folders))
+
+
+def _load_incident_folders() -> list[dict]:
+    folders = google_drive.list_folders_in_folder(
+        SRE_INCIDENT_FOLDER,
+        "not name contains 'Templates'",
+        fields="files(id, name, appProperties)",
+    )
+    if folders is None:
+        raise RuntimeError("incident_folders_list_failed")
     return folders
 
 
+@lru_cache(maxsize=1)
+def get_incident_folder_index() -> IncidentFolderIndex:
+    """Singleton provider for the product folder index."""
+    return IncidentFolderIndex(
+        _load_incident_folders,
+        ttl_seconds=get_incident_settings().INCIDENT_FOLDER_INDEX_TTL_SECONDS,
+    )
+
+
+def refresh_incident_folder_index() -> None:
+    """Reload the product folder index; run periodically by the scheduler."""
+    get_incident_folder_index().refresh()
+
+
+def list_incident_folders():
+    return get_incident_folder_index().folders()
+
+
+def find_incident_folder(name: str) -> dict | None:
+    """Return the product folder named ``name`` (case-insensitive), or None."""
+    return get_incident_folder_index().find_by_name(name)
+
+
+def get_incident_folder(folder_id: str) -> dict | None:
+    """Return the product folder with ``folder_id``, or None."""
+    return get_incident_folder_index().get(folder_id)
+
+
+def get_folder_app_properties(folder_id: str) -> dict:
+    """Return a folder's appProperties, from the index when the folder is in it."""
+    folder = get_incident_folder_index().get(folder_id)
+    if folder is not None:
+        return folder.get("appProperties", {})
+
+    folder_metadata = get_folder_metadata(folder_id)
+    if isinstance(folder_metadata, dict):
+        return folder_metadata.get("appProperties", {})
+    if isinstance(folder_metadata, tuple) and len(folder_metadata) > 0:
+        return folder_metadata[0].get("appProperties", {})
+    return {}
+
+
 def list_folders_view(client: WebClient, body, ack: Ack):
     ack()
     folders = google_drive.list_folders_in_folder(SRE_INCIDENT_FOLDER, "not name contains 'Templates'")
@@ -50,6 +180,7 @@ def delete_folder_metadata(client: WebClient, body, ack):
     folder_id = body["view"]["private_metadata"]
     key = body["actions"][0]["value"]
     response = google_drive.delete_metadata(folder_id, key)
+    get_incident_folder_index().invalidate()
     if not response:
         logger.warning(
             "metadata_delete_failed",
@@ -72,6 +203,7 @@ def save_metadata(client: WebClient, body, ack, view):
     key = view["state"]["values"]["key"]["key"]["value"]
     value = view["state"]["values"]["value"]["value"]["value"]
     google_drive.add_metadata(folder_id, key, value)
+    get_incident_folder_index().invalidate()
     body["actions"] = [{"value": folder_id}]
     del body["view"]
     view_folder_metadata(client, body, ack)
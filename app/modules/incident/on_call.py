@@ -1,14 +1,68 @@
-"""Manage on call users"""
+"""Manage on call users
+
+The Slack users on call for an Opsgenie schedule are cached for
+``INCIDENT_ONCALL_CACHE_TTL_SECONDS``, so creating several incidents for the
+same product within a short time resolves the Opsgenie schedule and each
+responder's Slack account once.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache
 
 from slack_sdk import WebClient
 from structlog import get_logger
 
+from infrastructure.configuration.features.incident import get_incident_settings
 from integrations.opsgenie import get_on_call_users
-from modules.incident.incident_folder import get_folder_metadata
+from modules.incident.incident_folder import get_folder_app_properties
 
 logger = get_logger()
 
 
+class OnCallUsersCache:
+    """Thread-safe TTL cache of Opsgenie schedule ID to on-call Slack users.
+
+    Args:
+        ttl_seconds: Seconds an entry is served; 0 disables the cache.
+        clock: Monotonic clock in seconds (injectable for tests).
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, list]] = {}
+
+    def get(self, schedule: str) -> list | None:
+        """Return the cached users, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(schedule)
+            if entry is not None and entry[0] > self._clock():
+                return list(entry[1])
+            self._entries.pop(schedule, None)
+            return None
+
+    def put(self, schedule: str, users: list) -> None:
+        """Cache the users on call for a schedule."""
+        if self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[schedule] = (self._clock() + self._ttl_seconds, list(users))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_on_call_users_cache() -> OnCallUsersCache:
+    """Singleton provider for the on-call users cache."""
+    return OnCallUsersCache(get_incident_settings().INCIDENT_ONCALL_CACHE_TTL_SECONDS)
+
+
 def get_on_call_users_from_folder(client: WebClient, folder: str) -> list:
     """Get the on call users for a given folder
 
@@ -19,23 +73,33 @@ def get_on_call_users_from_folder(client: WebClient, folder: str) -> list:
         list: List of on call users. If users are found, they will be Slack user objects.
     """
     log = logger.bind(operation="get_on_call_users_from_folder", folder_id=folder)
-    oncall = []
-    folder_metadata = get_folder_metadata(folder)
-    if isinstance(folder_metadata, dict):
-        folder_metadata = folder_metadata.get("appProperties", {})
-    elif isinstance(folder_metadata, tuple) and len(folder_metadata) > 0:
-        folder_metadata = folder_metadata[0].get("appProperties", {})
-    else:
-        folder_metadata = {}
+    folder_metadata = get_folder_app_properties(folder)
 
     # Get OpsGenie data
+    oncall = []
     if "genie_schedule" in folder_metadata:
-        for email in get_on_call_users(folder_metadata["genie_schedule"]):
-            try:
-                r = client.users_lookupByEmail(email=email)
-                if r.get("ok"):
-                    oncall.append(r["user"])
-            except Exception as e:
-                log.error("error_lookup_user_by_email", email=email, error=str(e))
+        oncall = _get_schedule_slack_users(client, folder_metadata["genie_schedule"], log)
     log.info("oncall_users_resolved", count=len(oncall))
     return oncall
+
+
+def _get_schedule_slack_users(client: WebClient, schedule: str, log) -> list:
+    cache = get_on_call_users_cache()
+    cached = cache.get(schedule)
+    if cached is not None:
+        return cached
+
+    oncall = []
+    complete = True
+    for email in get_on_call_users(schedule):
+        try:
+            r = client.users_lookupByEmail(email=email)
+            if r.get("ok"):
+                oncall.append(r["user"])
+        except Exception as e:
+            complete = False
+            log.error("error_lookup_user_by_email", email=email, error=str(e))
+    # Empty results may be an Opsgenie error; only cache complete, non-empty lookups.
+    if oncall and complete:
+        cache.put(schedule, oncall)
+    return oncall
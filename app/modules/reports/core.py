@@ -39,7 +39,7 @@ def reports_command(args, ack: Ack, command, respond: Respond, client: WebClient
         case "google-groups":
             google_groups.generate_report(args, respond)
         case "google-groups-members":
-            google_groups.generate_group_members_report(args, respond)
+            google_groups.start_group_members_report(args, respond)
         case _:
             respond(
                 "Unknown command. Type `/sre reports help` for a list of commands.\nCommande inconnue. Tapez `/sre reports aide` pour voir une liste de commandes."
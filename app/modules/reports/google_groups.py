@@ -1,6 +1,19 @@
+"""Google Groups reports.
+
+The members report runs as a background job started from the Slack command:
+group members are fetched with batched, concurrent ``members.list`` calls,
+then every missing sheet is added with one ``spreadsheets.batchUpdate`` and
+all rows are written with ``spreadsheets.values.batchUpdate``. Sheets writes
+are paced by a token bucket sized to the per-user write quota, and progress
+is posted back through ``respond``.
+"""
+
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 
+from googleapiclient.errors import HttpError  # type: ignore
 from structlog import get_logger
 
 from infrastructure.configuration.integrations.google import get_google_resources_config
@@ -9,16 +22,57 @@ from integrations.google_workspace import (
     google_drive,
     sheets,
 )
+from integrations.utils.api import TokenBucket
 
 FOLDER_REPORTS_GOOGLE_GROUPS = get_google_resources_config().google_groups_reports_folder_id
 
+EXCLUDED_GROUPS = ["AWS-"]
+SHEET_TITLE_MAX_LENGTH = 50
+# Sheets allows 60 write requests per minute per user.
+SHEETS_WRITES_PER_MINUTE = 60
+SHEETS_WRITE_BURST = 10
+SHEETS_WRITE_ATTEMPTS = 3
+SHEETS_QUOTA_BACKOFF_SECONDS = 20
+# Keeps each values.batchUpdate body well below the request size limit.
+SHEETS_RANGES_PER_REQUEST = 100
+SHEETS_REQUESTS_PER_BATCH = 100
+
 logger = get_logger()
 
 
+@lru_cache(maxsize=1)
+def get_sheets_write_bucket() -> TokenBucket:
+    """Singleton token bucket pacing this process's Sheets writes."""
+    return TokenBucket(SHEETS_WRITES_PER_MINUTE / 60, SHEETS_WRITE_BURST)
+
+
 def generate_report(args, respond):
     respond("Generating Google Groups report is not implemented yet.")
 
 
+def start_group_members_report(args, respond):
+    """Start the Google Groups members report in a background thread."""
+    if not FOLDER_REPORTS_GOOGLE_GROUPS:
+        respond("Google Drive folder for reports not set.")
+        return
+    respond("Generating the Google Groups Members report in the background. Progress will be posted here.")
+    thread = threading.Thread(
+        target=_run_group_members_report,
+        args=(args, respond),
+        daemon=True,
+        name="google-groups-members-report",
+    )
+    thread.start()
+
+
+def _run_group_members_report(args, respond):
+    try:
+        generate_group_members_report(args, respond)
+    except Exception as e:
+        logger.exception("group_members_report_failed", error=str(e))
+        respond("Google Groups Members report failed. Check the logs for details.")
+
+
 def generate_group_members_report(args, respond):
     """Generate a report of Google Groups members."""
     log = logger.bind(
@@ -27,7 +81,6 @@ def generate_group_members_report(args, respond):
     if not FOLDER_REPORTS_GOOGLE_GROUPS:
         respond("Google Drive folder for reports not set.")
         return
-    exclude_groups = ["AWS-"]
     log.info(
         "group_members_report_started",
         group="Google Groups",
@@ -45,66 +98,94 @@ def generate_group_members_report(args, respond):
 
     log.info("getting_google_groups")
     groups = google_directory.list_groups()
-    groups = [group for group in groups if not any(exclude in group["name"] for exclude in exclude_groups)]
+    groups = [group for group in groups if not any(exclude in group["name"] for exclude in EXCLUDED_GROUPS)]
 
     if not groups:
         respond("No groups found.")
         return
 
     log.info("groups_found", count=len(groups))
+    respond(f"Fetching the members of {len(groups)} Google Groups...")
+    members = google_directory.list_members_for_groups(
+        [group["email"] for group in groups],
+        fields="members(email, role)",
+    )
     groups_with_members = []
-    for _index, group in enumerate(groups):
-        log.info(
-            "processing_group",
-            group_email=group["email"],
-        )
-        members = google_directory.list_group_members(group["email"])
-        group["members"] = members
-        groups_with_members.append(group)
-
-    for group in groups_with_members:
-        group_sheet_name = f"{group['name']}"
-        log.info("processing_group_sheet", group=group_sheet_name)
-        if len(group_sheet_name) > 50:
-            group_sheet_name = group_sheet_name[:50]
+    for group in groups:
+        if group["email"] in members:
+            log.info("processing_group", group_email=group["email"], members=len(members[group["email"]]))
+            groups_with_members.append({**group, "members": members[group["email"]]})
+    failed = len(groups) - len(groups_with_members)
+    if failed:
+        log.warning("group_members_unavailable", count=failed)
+    respond(f"Fetched the members of {len(groups_with_members)} groups ({failed} failed). Writing the report...")
+
+    write_group_members_sheets(file["id"], groups_with_members)
+    log.info("group_members_report_completed", groups=len(groups_with_members), failed=failed)
+    respond("Google Groups Members report generated.")
 
-        try:
-            sheet = sheets.get_sheet(file["id"], group_sheet_name)
-        except Exception:
-            sheet = None
-        if sheet:
-            log.info("sheet_found", sheet=sheet)
-        else:
-            try:
-                request = {
-                    "requests": [
-                        {
-                            "addSheet": {
-                                "properties": {
-                                    "title": group_sheet_name,
-                                }
-                            }
-                        }
-                    ]
-                }
-                sheet = sheets.batch_update(file["id"], request)
-                if sheet:
-                    log.info("sheet_created", sheet=group_sheet_name)
-            except Exception as e:
-                log.error("sheet_creation_failed", error=str(e))
-
-        values = [["Group Name", group_sheet_name], ["Email", "Role"]]
-        group_sheet_name = f"{group_sheet_name}!A1"
-        for member in group["members"]:
-            values.append([member["email"], member["role"]])
-        updated_sheet = sheets.batch_update_values(
-            file["id"],
-            group_sheet_name,
-            values,
-        )
-        if updated_sheet:
-            log.info("sheet_updated", sheet=group_sheet_name)
-
-        time.sleep(1.1)
 
-    respond("Google Groups Members report generated.")
+def write_group_members_sheets(spreadsheet_id: str, groups: list[dict]) -> None:
+    """Write one sheet per group, adding missing sheets first.
+
+    Sheet titles are the group names truncated to 50 characters; when
+    truncated names collide, later groups get a numeric suffix.
+    """
+    values_by_title: dict[str, list[list[str]]] = {}
+    for group in groups:
+        title = _unique_sheet_title(group["name"], values_by_title)
+        logger.info("processing_group_sheet", group=group["name"], sheet=title)
+        values = [["Group Name", title], ["Email", "Role"]]
+        values.extend([member["email"], member["role"]] for member in group["members"])
+        values_by_title[title] = values
+
+    spreadsheet = sheets.get_spreadsheet(spreadsheet_id, fields="sheets.properties.title")
+    existing = {sheet["properties"]["title"] for sheet in (spreadsheet or {}).get("sheets", [])}
+    add_titles = [title for title in values_by_title if title not in existing]
+    for index in range(0, len(add_titles), SHEETS_REQUESTS_PER_BATCH):
+        chunk = add_titles[index : index + SHEETS_REQUESTS_PER_BATCH]
+        requests = [{"addSheet": {"properties": {"title": title}}} for title in chunk]
+        _write_with_quota(sheets.batch_update, spreadsheet_id, {"requests": requests})
+        for title in chunk:
+            logger.info("sheet_created", sheet=title)
+    logger.info("group_sheets_added", count=len(add_titles))
+
+    data = [{"range": f"{_quote_sheet_title(title)}!A1", "values": values} for title, values in values_by_title.items()]
+    for index in range(0, len(data), SHEETS_RANGES_PER_REQUEST):
+        chunk = data[index : index + SHEETS_RANGES_PER_REQUEST]
+        _write_with_quota(sheets.batch_update_value_ranges, spreadsheet_id, chunk)
+        for value_range in chunk:
+            logger.info("sheet_updated", sheet=value_range["range"])
+    logger.info("group_sheets_updated", count=len(data))
+
+
+def _unique_sheet_title(name: str, taken: dict[str, list[list[str]]]) -> str:
+    """Truncate ``name`` to a sheet title, suffixing `` (n)`` while it is in ``taken``."""
+    title = name[:SHEET_TITLE_MAX_LENGTH]
+    number = 2
+    while title in taken:
+        suffix = f" ({number})"
+        title = name[: SHEET_TITLE_MAX_LENGTH - len(suffix)] + suffix
+        number += 1
+    return title
+
+
+def _quote_sheet_title(title: str) -> str:
+    escaped = title.replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _write_with_quota(func, *args, **kwargs):
+    """Call a Sheets API function under the write token bucket, backing off on 429."""
+    bucket = get_sheets_write_bucket()
+    for attempt in range(1, SHEETS_WRITE_ATTEMPTS):
+        bucket.acquire()
+        try:
+            return func(*args, **kwargs)
+        except HttpError as e:
+            if e.resp.status != 429:
+                raise
+            logger.warning("sheets_write_quota_exceeded", function=func.__name__, attempt=attempt)
+            time.sleep(SHEETS_QUOTA_BACKOFF_SECONDS * attempt)
+    bucket.acquire()
+    return func(*args, **kwargs)
@@ -59,6 +59,11 @@ class AccessSyncSettings(BaseModel):
         ACCESS_SYNC_RECONCILIATION_SCHEDULE  — daily sync run time HH:MM (UTC)
         ACCESS_SYNC_JOB_TTL_SECONDS          — retention for completed/failed job records
         ACCESS_SYNC_LOCK_STALE_SECONDS       — running lock older than this is considered stale
+        ACCESS_SYNC_GROUP_CACHE_TTL_SECONDS  — reuse resolved IDP group metadata this long (0 disables)
+        ACCESS_SYNC_DESIRED_STATE_MAX_AGE_SECONDS — skip planning for an unchanged desired state until
+                                               the last converged reconcile is this old (0 disables;
+                                               default 23h, below the daily reconcile interval so
+                                               every scheduled run plans and corrects drift)
     """
 
     enabled: bool = False
@@ -66,6 +71,8 @@ class AccessSyncSettings(BaseModel):
     reconciliation_schedule: str = "03:00"
     job_ttl_seconds: int = 86400
     lock_stale_seconds: int = 14400
+    group_cache_ttl_seconds: int = Field(default=300, ge=0)
+    desired_state_max_age_seconds: int = Field(default=82800, ge=0)
 
 
 class AccessRequestsSettings(BaseModel):
@@ -77,6 +84,7 @@ class AccessRequestsSettings(BaseModel):
         ACCESS_REQUESTS_FALLBACK_APPROVER_SLUG  — org-level approver fallback group slug
         ACCESS_REQUESTS_MIN_APPROVER_COUNT      — minimum affirmative decisions to approve
         ACCESS_REQUESTS_REQUEST_TTL_HOURS       — hours before a pending request expires
+        ACCESS_REQUESTS_APPROVER_CACHE_TTL_SECONDS — seconds resolved approvers are reused (0 disables)
     """
 
     enabled: bool = False
@@ -84,6 +92,7 @@ class AccessRequestsSettings(BaseModel):
     fallback_approver_slug: str = "sg-org-admins"
     min_approver_count: int = 1
     request_ttl_hours: int = 72
+    approver_cache_ttl_seconds: int = Field(default=60, ge=0)
 
 
 class AccessCatalogSettings(BaseModel):
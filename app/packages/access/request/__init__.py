@@ -27,8 +27,10 @@ def register_routes(app) -> None:
 
 
 def on_sync_completed(event) -> None:
-    """Advance the originating access request to 'completed' after a successful sync."""
-    get_access_request_service().advance_from_sync_result(event)
+    """Drop cached approvers and advance the originating request to 'completed'."""
+    service = get_access_request_service()
+    service.on_membership_changed(event)
+    service.advance_from_sync_result(event)
 
 
 def on_sync_failed(event) -> None:
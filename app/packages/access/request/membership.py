@@ -0,0 +1,109 @@
+"""Group membership views used by access request intake.
+
+``GroupMemberSnapshot`` is a request-scoped copy of one target group's
+member list. Intake answers eligibility, delegated-actor authorization and
+approver resolution from a single ``get_group_members`` call instead of
+fetching the same list once per check.
+
+``ApproverCache`` keeps resolved approver lists per group for a short TTL so
+a burst of requests against a popular group does not re-read the directory.
+Entries are dropped when membership changes are observed (sync results and
+intake's own IDP writes).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from infrastructure.directory.models import DirectoryMember
+
+APPROVER_ROLES = frozenset({"OWNER", "MANAGER"})
+
+
+@dataclass(frozen=True)
+class GroupMemberSnapshot:
+    """Direct members of one group, fetched once per request.
+
+    Attributes:
+        group_email: Canonical email of the group the members belong to.
+        members: Every direct member returned by the directory (all types).
+    """
+
+    group_email: str
+    members: tuple[DirectoryMember, ...]
+
+    @property
+    def user_members(self) -> list[DirectoryMember]:
+        """Direct members that are users (members with no type count as users)."""
+        return [m for m in self.members if m.member_type is None or m.member_type.upper() == "USER"]
+
+    def is_member(self, user_email: str) -> bool | None:
+        """Return whether the user is a member, or None when only the IDP can tell.
+
+        A direct user member is a definite yes. Absence is only a definite no
+        when every member is a typed user, because ``check_membership`` also
+        counts members of nested groups (and domain-wide members).
+        """
+        email = user_email.lower()
+        if any(m.email.lower() == email for m in self.user_members):
+            return True
+        if all(m.member_type is not None and m.member_type.upper() == "USER" for m in self.members):
+            return False
+        return None
+
+    def is_owner_or_manager(self, user_email: str) -> bool:
+        """Return whether the user is a direct OWNER or MANAGER of the group."""
+        email = user_email.lower()
+        return any(
+            m.email.lower() == email and m.role is not None and m.role.upper() in APPROVER_ROLES for m in self.user_members
+        )
+
+
+class ApproverCache:
+    """Thread-safe TTL cache of resolved approver lists keyed by group email.
+
+    Args:
+        ttl_seconds: Seconds an approver list is reused; 0 disables caching.
+        clock: Monotonic clock returning seconds (injectable for tests).
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, list[str]]] = {}
+
+    def get(self, group_email: str) -> list[str] | None:
+        """Return a copy of the cached approvers, or None when absent or expired."""
+        key = group_email.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, approvers = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            return list(approvers)
+
+    def put(self, group_email: str, approvers: list[str]) -> None:
+        """Cache a non-empty approver list for the TTL."""
+        if self._ttl_seconds <= 0 or not approvers:
+            return
+        with self._lock:
+            self._entries[group_email.lower()] = (self._clock() + self._ttl_seconds, list(approvers))
+
+    def invalidate(self, group_email: str) -> None:
+        """Drop the cached approvers of one group."""
+        with self._lock:
+            self._entries.pop(group_email.lower(), None)
+
+    def clear(self) -> None:
+        """Drop every cached approver list."""
+        with self._lock:
+            self._entries.clear()
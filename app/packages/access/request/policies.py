@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING
 from packages.access.common.config import EntitlementMode
 
 if TYPE_CHECKING:
-    from infrastructure.directory.models import DirectoryGroup
+    from infrastructure.directory.models import DirectoryGroup, DirectoryMember
     from infrastructure.directory.provider import DirectoryProvider
     from packages.access.common.config import AccessRuntimeConfig
     from packages.access.request.domain import AccessRequest, ApprovalDecision
@@ -71,6 +71,7 @@ def resolve_approver_candidates(
     directory_group: DirectoryGroup,
     fallback_slug: str,
     directory: DirectoryProvider,
+    group_members: list[DirectoryMember] | None = None,
 ) -> list[str]:
     """Resolve an ordered list of eligible approver emails for a target group.
 
@@ -86,18 +87,21 @@ def resolve_approver_candidates(
         directory_group: Resolved canonical group from the IDP.
         fallback_slug: Org-level fallback group slug (e.g. ``"sg-org-admins"``).
         directory: IDP directory provider; read-only calls only.
+        group_members: User members of ``directory_group`` already fetched by
+            the caller; when given, the target group is not fetched again.
 
     Returns:
         Ordered list of approver email strings; may be empty.
     """
-    members_result = directory.get_group_members(
-        group_key=directory_group.group_email,
-        include_member_types={"USER"},
-    )
-    if members_result.is_success and members_result.data:
-        owners = [m.email for m in members_result.data if m.role is not None and m.role.upper() in ("OWNER", "MANAGER")]
-        if owners:
-            return owners
+    if group_members is None:
+        members_result = directory.get_group_members(
+            group_key=directory_group.group_email,
+            include_member_types={"USER"},
+        )
+        group_members = (members_result.data or []) if members_result.is_success else []
+    owners = [m.email for m in group_members if m.role is not None and m.role.upper() in ("OWNER", "MANAGER")]
+    if owners:
+        return owners
 
     fallback_result = directory.get_group_members(
         group_key=fallback_slug,
@@ -16,6 +16,7 @@ from infrastructure.events import (
 from infrastructure.storage import get_storage_service
 from packages.access.common.providers import get_access_runtime_config
 from packages.access.common.settings import AccessRequestsSettings, get_access_settings
+from packages.access.request.membership import ApproverCache
 from packages.access.request.service import AccessRequestService
 from packages.access.request.store import AccessRequestRepository
 
@@ -46,4 +47,5 @@ def get_access_request_service() -> AccessRequestService:
         dispatcher=get_event_dispatcher(),
         fallback_approver_slug=settings.fallback_approver_slug,
         min_approver_count=settings.min_approver_count,
+        approver_cache=ApproverCache(ttl_seconds=settings.approver_cache_ttl_seconds),
     )
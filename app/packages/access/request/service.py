@@ -9,6 +9,7 @@ Public methods:
     cancel_request()         — requester cancels a pending request.
     get_request_status()     — read request + decision history.
     advance_from_sync_result() — handle sync_completed / sync_failed events.
+    on_membership_changed()  — drop cached approvers after applied syncs.
 
 The service owns no persistence directly — it delegates to
 ``AccessRequestRepository``.  It enforces all policy rules by calling pure
@@ -37,6 +38,7 @@ from packages.access.request.domain import (
     ApprovalDecision,
     RequestAuditEvent,
 )
+from packages.access.request.membership import ApproverCache, GroupMemberSnapshot
 from packages.access.request.policies import (
     check_entitlement_mode,
     is_auto_approvable,
@@ -105,6 +107,8 @@ class AccessRequestServicePort(Protocol):
 
     def advance_from_sync_result(self, event: Event) -> None: ...
 
+    def on_membership_changed(self, event: Event) -> None: ...
+
 
 class AccessRequestService:
     """Orchestrates the full access request lifecycle.
@@ -120,6 +124,8 @@ class AccessRequestService:
         dispatcher: Event dispatcher for publishing domain events.
         fallback_approver_slug: Org-level fallback approver group slug.
         min_approver_count: Minimum number of approvals required.
+        approver_cache: Short-TTL cache of resolved approvers per group;
+            defaults to a 60-second cache.
     """
 
     def __init__(
@@ -130,6 +136,7 @@ class AccessRequestService:
         dispatcher: EventDispatcher,
         fallback_approver_slug: str = "sg-org-admins",
         min_approver_count: int = 1,
+        approver_cache: ApproverCache | None = None,
     ) -> None:
         self._repo = repository
         self._directory = directory
@@ -137,6 +144,7 @@ class AccessRequestService:
         self._dispatcher = dispatcher
         self._fallback_approver_slug = fallback_approver_slug
         self._min_approver_count = min_approver_count
+        self._approver_cache = approver_cache if approver_cache is not None else ApproverCache()
         self.logger = logger
 
     # ------------------------------------------------------------------
@@ -168,6 +176,10 @@ class AccessRequestService:
             7. Persist AccessRequest + audit event.
             8. Publish domain events (APPROVAL_REQUIRED or REQUEST_APPROVED).
 
+        Steps 3-5 share one member snapshot of the target group, fetched only
+        when a delegated actor must be checked or the group's approvers are
+        not cached; otherwise eligibility is a single ``check_membership``.
+
         Returns:
             OperationResult[AccessRequest] on success or permanent/transient
             error on failure.
@@ -239,10 +251,20 @@ class AccessRequestService:
                 error_code="ENTITLEMENT_MODE_EPHEMERAL",
             )
 
+        # One member fetch answers eligibility, delegated authorization and
+        # approver resolution; skip it when none of them needs the full list.
+        cached_approvers = self._approver_cache.get(directory_group.group_email)
+        snapshot = None
+        if actor_type == "delegated" or cached_approvers is None:
+            snapshot = self._get_member_snapshot(directory_group.group_email)
+
         # Step 3: eligibility — direction-aware membership check
-        membership_result = self._directory.check_membership(directory_group.group_email, user_email)
-        if membership_result.is_success and membership_result.data is not None:
-            is_member = membership_result.data.is_member
+        is_member = snapshot.is_member(user_email) if snapshot is not None else None
+        if is_member is None:
+            membership_result = self._directory.check_membership(directory_group.group_email, user_email)
+            if membership_result.is_success and membership_result.data is not None:
+                is_member = membership_result.data.is_member
+        if is_member is not None:
             if request_type == "grant" and is_member:
                 log.info(
                     "access_request_intake_rejected",
@@ -267,11 +289,7 @@ class AccessRequestService:
         # Step 4: delegated actor authorization — actor must be OWNER or MANAGER
         # of the specific target group, not a member of a global manager group.
         if actor_type == "delegated":
-            members_result = self._directory.get_group_members(
-                group_key=directory_group.group_email,
-                include_member_types={"USER"},
-            )
-            if not members_result.is_success:
+            if snapshot is None:
                 log.warning(
                     "access_request_intake_rejected",
                     reason="delegated_actor_membership_check_failed",
@@ -281,12 +299,7 @@ class AccessRequestService:
                     message="Could not verify delegated actor authorization.",
                     error_code="ACTOR_AUTHORIZATION_CHECK_FAILED",
                 )
-            members = members_result.data or []
-            actor_is_owner_or_manager = any(
-                m.email.lower() == actor_email.lower() and m.role is not None and m.role.upper() in ("OWNER", "MANAGER")
-                for m in members
-            )
-            if not actor_is_owner_or_manager:
+            if not snapshot.is_owner_or_manager(actor_email):
                 log.warning(
                     "access_request_intake_rejected",
                     reason="delegated_actor_not_authorized",
@@ -298,11 +311,15 @@ class AccessRequestService:
                 )
 
         # Step 5: resolve approvers
-        approvers = resolve_approver_candidates(
-            directory_group=directory_group,
-            fallback_slug=self._fallback_approver_slug,
-            directory=self._directory,
-        )
+        approvers = cached_approvers
+        if approvers is None:
+            approvers = resolve_approver_candidates(
+                directory_group=directory_group,
+                fallback_slug=self._fallback_approver_slug,
+                directory=self._directory,
+                group_members=snapshot.user_members if snapshot is not None else None,
+            )
+            self._approver_cache.put(directory_group.group_email, approvers)
         if not approvers:
             log.error(
                 "no_approvers_found",
@@ -400,6 +417,7 @@ class AccessRequestService:
                     message="Failed to update IDP membership. The request has been marked as failed.",
                     error_code="IDP_WRITE_FAILED",
                 )
+            self._invalidate_approvers(directory_group.group_email, directory_group.group_slug)
 
         # Step 9: publish domain events
         if auto_approved:
@@ -570,6 +588,7 @@ class AccessRequestService:
                     message="Failed to update IDP membership. The request has been marked as failed.",
                     error_code="IDP_WRITE_FAILED",
                 )
+            self._invalidate_approvers(request.group_email, request.group_slug)
 
             updated = replace(request, status="approved", updated_at=now)
             self._repo.save_request(updated)
@@ -832,6 +851,7 @@ class AccessRequestService:
                 message="IDP membership write failed again. Request remains in 'failed' state.",
                 error_code="IDP_WRITE_FAILED",
             )
+        self._invalidate_approvers(request.group_email, request.group_slug)
 
         updated = replace(request, status="approved", updated_at=now)
         self._repo.save_request(updated)
@@ -955,3 +975,41 @@ class AccessRequestService:
                 metadata={"request_id": request_id, "platform": request.platform},
             )
         )
+
+    def on_membership_changed(self, event: Event) -> None:
+        """Drop cached approvers after Access Sync applied membership changes.
+
+        Sync results do not name the groups they touched, so any applied,
+        non-dry-run sync clears the whole approver cache.
+
+        Args:
+            event: SYNC_COMPLETED domain event from Access Sync.
+        """
+        metadata = event.metadata if isinstance(event.metadata, dict) else {}
+        if metadata.get("dry_run") or not metadata.get("applied"):
+            return
+        self._approver_cache.clear()
+        self.logger.debug("approver_cache_cleared", reason="sync_completed", applied=metadata.get("applied"))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _get_member_snapshot(self, group_email: str) -> GroupMemberSnapshot | None:
+        """Fetch every direct member of a group once for the current request.
+
+        Returns:
+            The snapshot, or None when the directory call failed.
+        """
+        members_result = self._directory.get_group_members(group_key=group_email)
+        if not members_result.is_success:
+            return None
+        return GroupMemberSnapshot(group_email=group_email, members=tuple(members_result.data or []))
+
+    def _invalidate_approvers(self, group_email: str, group_slug: str) -> None:
+        """Drop cached approvers affected by a membership write to a group."""
+        if group_slug == self._fallback_approver_slug:
+            # Fallback members approve for every group without owners.
+            self._approver_cache.clear()
+        else:
+            self._approver_cache.invalidate(group_email)
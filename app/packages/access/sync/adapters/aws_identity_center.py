@@ -1189,6 +1189,7 @@ class AwsIdentityCenterAdapter:
                         for entitlement_id, members in sorted(plan.entitlement_removes_by_id.items())
                     },
                 },
+                failed_entitlements=failed_group_slugs,
             )
         )
 
@@ -7,10 +7,17 @@ Responsibilities:
   4. Persist audit record and emit domain events.
 
 All platform state assessment, planning, and execution is owned by adapters.
+
+A platform reconcile skips the adapter when the desired state hash matches
+the last fully converged reconcile, until that snapshot is older than
+``desired_state_max_age_seconds``; the periodic full run corrects drift made
+directly on the platform.  Runs that left manual actions or unresolved
+entitlements do not record a snapshot, so the next run plans again.
 """
 
 import uuid
 from collections.abc import Mapping
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Protocol
 
 import structlog
@@ -20,8 +27,8 @@ from infrastructure.operations import OperationResult, OperationStatus
 from packages.access.common.config import AccessRuntimeConfig
 from packages.access.sync import events as sync_events
 from packages.access.sync.adapters import AccessSyncAdapter
-from packages.access.sync.desired_state import DirectoryMembershipBuilder
-from packages.access.sync.domain import SyncOutcome, SyncRunRecord
+from packages.access.sync.desired_state import DirectoryMembershipBuilder, desired_state_hash
+from packages.access.sync.domain import DesiredStateSnapshot, ReconciliationOutcome, SyncOutcome, SyncRunRecord
 from packages.access.sync.policies import (
     EffectivePlatformPolicy,
     PlanningContext,
@@ -29,7 +36,7 @@ from packages.access.sync.policies import (
 )
 
 if TYPE_CHECKING:
-    from packages.access.sync.store import SyncRunRepository
+    from packages.access.sync.store import DesiredStateRepository, SyncRunRepository
 
 logger = structlog.get_logger()
 
@@ -73,12 +80,16 @@ class AccessSyncApplicationService:
         membership_builder: DirectoryMembershipBuilder,
         repository: SyncRunRepository | None = None,
         dispatcher: EventDispatcher | None = None,
+        desired_state_repository: DesiredStateRepository | None = None,
+        desired_state_max_age_seconds: int = 0,
     ) -> None:
         self._adapters = adapters
         self._config = config
         self._membership_builder = membership_builder
         self._repository = repository
         self._dispatcher = dispatcher
+        self._desired_state_repository = desired_state_repository
+        self._desired_state_max_age_seconds = desired_state_max_age_seconds
 
     def _resolve(
         self, platform: str
@@ -137,6 +148,16 @@ class AccessSyncApplicationService:
             )
         )
 
+    def _fresh_snapshot(self, platform: str, state_hash: str) -> DesiredStateSnapshot | None:
+        """Return the snapshot when it matches ``state_hash`` and is younger than the max age."""
+        if self._desired_state_repository is None or self._desired_state_max_age_seconds <= 0:
+            return None
+        snapshot = self._desired_state_repository.get(platform)
+        if snapshot is None or snapshot.state_hash != state_hash:
+            return None
+        age = (datetime.now(UTC) - snapshot.reconciled_at).total_seconds()
+        return snapshot if age < self._desired_state_max_age_seconds else None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -240,14 +261,42 @@ class AccessSyncApplicationService:
         if not desired_result.is_success or desired_result.data is None:
             return desired_result
 
+        desired_state = desired_result.data
+        context = PlanningContext.from_effective(effective)
+        state_hash = desired_state_hash(desired_state, context)
+        snapshot = None if dry_run else self._fresh_snapshot(platform, state_hash)
+        if snapshot is not None:
+            log.info("sync_platform_skipped_unchanged", state_hash=state_hash)
+            return OperationResult.success(
+                data=ReconciliationOutcome(
+                    platform=platform,
+                    users_synced=snapshot.users_synced,
+                    users_converged=0,
+                    orphans_found=snapshot.orphans_found,
+                    requires_manual_action_count=0,
+                    unchanged_user_count=snapshot.users_synced,
+                    planning_skipped=True,
+                )
+            )
+
         result = adapter.reconcile_platform(
-            desired_state=desired_result.data,
-            context=PlanningContext.from_effective(effective),
+            desired_state=desired_state,
+            context=context,
             dry_run=dry_run,
         )
 
         if result.is_success and result.data is not None:
             outcome = result.data
+            if not dry_run and outcome.converged and self._desired_state_repository is not None:
+                self._desired_state_repository.save(
+                    DesiredStateSnapshot(
+                        platform=platform,
+                        state_hash=state_hash,
+                        state=desired_state,
+                        users_synced=outcome.users_synced,
+                        orphans_found=outcome.orphans_found,
+                    )
+                )
             log.info(
                 "sync_platform_completed",
                 users_synced=outcome.users_synced,
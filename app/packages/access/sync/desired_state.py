@@ -10,15 +10,27 @@ The coordinator resolves effective policy once per run via
 ``build_platform_state_from_effective`` (batch reconciliation).  Discovery
 of IDP groups is handled by ``discover_group_slugs`` which queries the
 directory with the platform prefix and returns matching slugs.
+
+Group metadata (slug → canonical email) is effectively static, so the
+builder resolves every group a run needs with one ``get_groups_batch`` call
+and keeps the result for ``group_cache_ttl_seconds``. ``desired_state_hash``
+fingerprints a built platform state together with its planning context so
+the coordinator can tell whether anything changed since the last run.
 """
 
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import structlog
 
+from infrastructure.directory.models import DirectoryGroup
 from infrastructure.operations import OperationResult, OperationStatus
 from packages.access.sync.domain import DesiredPlatformState, DesiredUserState
-from packages.access.sync.policies import EffectivePlatformPolicy, EntitlementRule
+from packages.access.sync.policies import EffectivePlatformPolicy, EntitlementRule, PlanningContext
 
 if TYPE_CHECKING:
     from infrastructure.directory.provider import DirectoryProvider
@@ -26,6 +38,29 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+DEFAULT_GROUP_CACHE_TTL_SECONDS = 300.0
+
+
+def desired_state_hash(state: DesiredPlatformState, context: PlanningContext) -> str:
+    """Return a SHA-256 content hash of a desired platform state and its policy.
+
+    The hash covers the desired users, per-entitlement members, entitlement
+    slugs and the planning context (removal mode and rules), canonicalised
+    so set and dict ordering never changes it.
+    """
+    canonical = {
+        "platform": context.platform,
+        "authn_removal_mode": context.authn_removal_mode,
+        "rules": sorted(
+            [rule.entitlement_id, rule.group_slug, rule.entitlement_type, rule.mode] for rule in context.entitlement_rules
+        ),
+        "desired_users": sorted(state.desired_users),
+        "members": {entitlement_id: sorted(members) for entitlement_id, members in state.desired_members_by_entitlement.items()},
+        "slugs": state.entitlement_slug_by_id,
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
 
 class DirectoryMembershipBuilder:
     """Build desired access state from IDP directory group membership.
@@ -36,10 +71,25 @@ class DirectoryMembershipBuilder:
 
     All public methods return ``OperationResult`` so callers can handle IDP
     failures through the standard result contract without catching exceptions.
+
+    Args:
+        directory: IDP directory provider.
+        group_cache_ttl_seconds: How long resolved group metadata is reused;
+            0 disables the cache.
+        clock: Monotonic clock used for cache expiry.
     """
 
-    def __init__(self, directory: DirectoryProvider) -> None:
+    def __init__(
+        self,
+        directory: DirectoryProvider,
+        group_cache_ttl_seconds: float = DEFAULT_GROUP_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._directory = directory
+        self._group_cache_ttl_seconds = group_cache_ttl_seconds
+        self._clock = clock
+        self._group_cache: dict[str, tuple[DirectoryGroup, float]] = {}
+        self._group_cache_lock = threading.Lock()
 
     def build_user_state_from_effective(
         self,
@@ -116,18 +166,32 @@ class DirectoryMembershipBuilder:
         self,
         effective: EffectivePlatformPolicy,
     ) -> OperationResult[DesiredPlatformState]:
-        """Batch-read authn and entitlement groups into platform-shaped state."""
+        """Batch-read authn and entitlement groups into platform-shaped state.
+
+        Group metadata for the authn group and every sync-managed rule is
+        resolved with a single batched fetch before the member batch.
+        """
         log = logger.bind(platform=effective.platform)
+        rules = effective.sync_managed_rules()
 
-        authn_group_result = self._directory.get_group(effective.authn_group_slug)
-        if not authn_group_result.is_success or not authn_group_result.data:
+        groups_result = self._resolve_groups([effective.authn_group_slug, *(rule.group_slug for rule in rules)])
+        if not groups_result.is_success:
+            return OperationResult.error(
+                groups_result.status,
+                message=groups_result.message,
+                error_code=groups_result.error_code,
+            )
+        groups = groups_result.data or {}
+
+        authn_group = groups.get(effective.authn_group_slug)
+        if authn_group is None:
             return OperationResult.error(
                 OperationStatus.NOT_FOUND,
                 message=f"Authn group not found: {effective.authn_group_slug}",
                 error_code="GROUP_NOT_FOUND",
             )
 
-        authn_email = authn_group_result.data.group_email
+        authn_email = authn_group.group_email
         authn_members_result = self._directory.get_group_members(
             authn_email,
             include_member_types={"USER"},
@@ -143,18 +207,18 @@ class DirectoryMembershipBuilder:
         log.info("build_desired_state_authn_members", count=len(desired_users))
 
         email_to_rule: dict[str, EntitlementRule] = {}
-        for rule in effective.sync_managed_rules():
-            group_result = self._directory.get_group(rule.group_slug)
-            if not group_result.is_success or not group_result.data:
+        for rule in rules:
+            group = groups.get(rule.group_slug)
+            if group is None:
                 log.warning(
                     "build_desired_state_group_not_found",
                     group_slug=rule.group_slug,
                 )
                 continue
-            email_to_rule[group_result.data.group_email] = rule
+            email_to_rule[group.group_email] = rule
 
         desired_members_by_entitlement: dict[str, set[str]] = {}
-        entitlement_slug_by_id: dict[str, str] = {rule.entitlement_id: rule.group_slug for rule in effective.sync_managed_rules()}
+        entitlement_slug_by_id: dict[str, str] = {rule.entitlement_id: rule.group_slug for rule in rules}
 
         if email_to_rule:
             batch_result = self._directory.get_group_members_batch(
@@ -225,7 +289,7 @@ class DirectoryMembershipBuilder:
         user_email: str,
     ) -> OperationResult[bool]:
         """Resolve group slug to email and check user membership."""
-        group_result = self._directory.get_group(group_slug)
+        group_result = self._resolve_groups([group_slug])
         if not group_result.is_success:
             return OperationResult.error(
                 group_result.status,
@@ -233,7 +297,7 @@ class DirectoryMembershipBuilder:
                 error_code=group_result.error_code,
             )
 
-        group = group_result.data
+        group = (group_result.data or {}).get(group_slug)
         if not group or not group.group_email:
             return OperationResult.error(
                 OperationStatus.NOT_FOUND,
@@ -254,3 +318,38 @@ class DirectoryMembershipBuilder:
 
         member = membership_result.data
         return OperationResult.success(data=member.is_member if member else False)
+
+    def _resolve_groups(self, group_slugs: list[str]) -> OperationResult[dict[str, DirectoryGroup]]:
+        """Resolve group slugs to canonical groups, batch-fetching cache misses.
+
+        Slugs that do not resolve are omitted from the result and are not
+        cached, so a newly created group is picked up on the next run.
+        """
+        now = self._clock()
+        resolved: dict[str, DirectoryGroup] = {}
+        missing: list[str] = []
+        with self._group_cache_lock:
+            for slug in dict.fromkeys(group_slugs):
+                cached = self._group_cache.get(slug)
+                if cached is not None and cached[1] > now:
+                    resolved[slug] = cached[0]
+                else:
+                    missing.append(slug)
+        if not missing:
+            return OperationResult.success(data=resolved)
+
+        batch_result = self._directory.get_groups_batch(missing)
+        if not batch_result.is_success:
+            return OperationResult.error(
+                batch_result.status,
+                message=batch_result.message,
+                error_code=batch_result.error_code,
+            )
+        fetched = {slug: group for slug, group in (batch_result.data or {}).items() if group and group.group_email}
+        if self._group_cache_ttl_seconds > 0:
+            expires_at = now + self._group_cache_ttl_seconds
+            with self._group_cache_lock:
+                self._group_cache.update((slug, (group, expires_at)) for slug, group in fetched.items())
+        logger.debug("resolve_groups_completed", cached=len(resolved), fetched=len(fetched), missing=len(missing))
+        resolved.update(fetched)
+        return OperationResult.success(data=resolved)
@@ -6,7 +6,8 @@ inside ``OperationResult.data`` for success cases.  Technical failures
 and never produce a ``SyncOutcome``.
 
 ``SyncRunRecord`` is the persistent audit record written to DynamoDB via
-``SyncRunRepository`` in store.py.
+``SyncRunRepository`` in store.py.  ``DesiredStateSnapshot`` is the last
+reconciled desired state per platform, written via ``DesiredStateRepository``.
 """
 
 from dataclasses import dataclass, field
@@ -102,6 +103,27 @@ class SyncRunRecord:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
+@dataclass(frozen=True)
+class DesiredStateSnapshot:
+    """Desired platform state and content hash of the last full reconcile.
+
+    Attributes:
+        platform: Platform key.
+        state_hash: ``desired_state_hash`` of the reconciled state.
+        state: The reconciled desired state.
+        reconciled_at: When the reconcile that applied it completed.
+        users_synced: ``users_synced`` reported by that reconcile.
+        orphans_found: ``orphans_found`` reported by that reconcile.
+    """
+
+    platform: str
+    state_hash: str
+    state: DesiredPlatformState
+    reconciled_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    users_synced: int = 0
+    orphans_found: int = 0
+
+
 @dataclass(frozen=True)
 class ReconciliationOutcome:
     """Outcome of a full platform reconciliation run.
@@ -114,6 +136,11 @@ class ReconciliationOutcome:
         requires_manual_action_count: Users whose sync flagged manual action.
         dry_run: True if no changes were actually executed.
         per_user: Optional mapping of email → SyncOutcome for detailed audit.
+        failed_entitlements: Slugs of entitlements the adapter could not
+            resolve on the platform; their members were not reconciled.
+        planning_skipped: True when the desired state matched the last full
+            reconcile and the adapter was not called. ``users_synced`` and
+            ``orphans_found`` are then carried over from that reconcile.
     """
 
     platform: str
@@ -128,3 +155,10 @@ class ReconciliationOutcome:
     action_counts: dict[str, int] = field(default_factory=dict)
     lifecycle_actions: dict[str, list[str]] = field(default_factory=dict)
     entitlements_by_action: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+    failed_entitlements: list[str] = field(default_factory=list)
+    planning_skipped: bool = False
+
+    @property
+    def converged(self) -> bool:
+        """True when nothing was left for manual action or failed to resolve."""
+        return self.requires_manual_action_count == 0 and not self.failed_entitlements
@@ -121,6 +121,7 @@ class CompletedPlatformRecord:
     action_counts: dict[str, int] = dataclasses.field(default_factory=dict)
     lifecycle_actions: dict[str, list[str]] = dataclasses.field(default_factory=dict)
     entitlements_by_action: dict[str, dict[str, list[str]]] = dataclasses.field(default_factory=dict)
+    planning_skipped: bool = False
     sync_type: str = "platform"
     status: str = JobStatus.COMPLETED
 
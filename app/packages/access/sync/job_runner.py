@@ -195,6 +195,7 @@ def run_platform_sync_job(
                     action: {slug: list(users) for slug, users in by_slug.items()}
                     for action, by_slug in recon.entitlements_by_action.items()
                 },
+                planning_skipped=recon.planning_skipped,
             )
             log.info(
                 "platform_sync_job_completed",
@@ -12,7 +12,7 @@ from packages.access.sync.adapters.fake_platform import FakePlatformAdapter
 from packages.access.sync.application import AccessSyncApplicationService
 from packages.access.sync.desired_state import DirectoryMembershipBuilder
 from packages.access.sync.job_status_store import JobStatusStore
-from packages.access.sync.store import SyncRunRepository
+from packages.access.sync.store import DesiredStateRepository, SyncRunRepository
 
 
 def get_access_sync_settings() -> AccessSyncSettings:
@@ -49,6 +49,12 @@ def get_sync_run_repository() -> SyncRunRepository:
     return SyncRunRepository(storage=get_storage_service())
 
 
+@functools.lru_cache(maxsize=1)
+def get_desired_state_repository() -> DesiredStateRepository:
+    """Return the singleton DesiredStateRepository instance."""
+    return DesiredStateRepository(storage=get_storage_service())
+
+
 @functools.lru_cache(maxsize=1)
 def get_access_sync_job_status_store() -> JobStatusStore:
     """Return the singleton JobStatusStore instance."""
@@ -58,10 +64,16 @@ def get_access_sync_job_status_store() -> JobStatusStore:
 @functools.lru_cache(maxsize=1)
 def get_access_sync_coordinator() -> AccessSyncApplicationService:
     """Return the singleton AccessSyncApplicationService instance."""
+    settings = get_access_sync_settings()
     return AccessSyncApplicationService(
         adapters=get_access_sync_adapters(),
         config=get_access_runtime_config(),
-        membership_builder=DirectoryMembershipBuilder(directory=get_directory_provider()),
+        membership_builder=DirectoryMembershipBuilder(
+            directory=get_directory_provider(),
+            group_cache_ttl_seconds=settings.group_cache_ttl_seconds,
+        ),
         repository=get_sync_run_repository(),
         dispatcher=get_event_dispatcher(),
+        desired_state_repository=get_desired_state_repository(),
+        desired_state_max_age_seconds=settings.desired_state_max_age_seconds,
     )
@@ -100,6 +100,7 @@ class SyncJobStatusResponse(BaseModel):
     action_counts: dict[str, int] | None = None
     lifecycle_actions: dict[str, list[str]] | None = None
     entitlements_by_action: dict[str, dict[str, list[str]]] | None = None
+    planning_skipped: bool | None = None
     # User sync outcome fields
     user_email: str | None = None
     actions_planned: list[str] | None = None
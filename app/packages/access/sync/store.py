@@ -10,14 +10,24 @@ Key scheme in ``sre_bot_access``:
 
 This allows efficient per-user, per-platform pagination (newest first via
 ``ScanIndexForward=False``).
+
+``DesiredStateRepository`` keeps one ``DesiredStateSnapshot`` per platform in
+the same table:
+    PK = ``DESIRED_STATE#{platform}``
+    SK = ``LATEST``
+
+The state is stored as gzip-compressed JSON so large user sets stay well
+under the DynamoDB item size limit.
 """
 
+import gzip
+import json
 from datetime import UTC, datetime
 
 import structlog
 
 from infrastructure.storage.protocol import StorageService
-from packages.access.sync.domain import SyncRunRecord
+from packages.access.sync.domain import DesiredPlatformState, DesiredStateSnapshot, SyncRunRecord
 
 logger = structlog.get_logger()
 
@@ -101,3 +111,71 @@ class SyncRunRepository:
             error_message=item.get("error_message"),
             created_at=created_at,
         )
+
+
+class DesiredStateRepository:
+    """DynamoDB-backed repository for the last reconciled desired state per platform.
+
+    Args:
+        storage: Configured ``StorageService`` instance injected by provider.
+    """
+
+    TABLE = "sre_bot_access"
+
+    def __init__(self, storage: StorageService) -> None:
+        self._storage = storage
+
+    def save(self, snapshot: DesiredStateSnapshot) -> None:
+        """Replace the platform's snapshot.  Failure is logged but not propagated."""
+        state = snapshot.state
+        payload = {
+            "desired_users": sorted(state.desired_users),
+            "desired_members_by_entitlement": {
+                entitlement_id: sorted(members) for entitlement_id, members in state.desired_members_by_entitlement.items()
+            },
+            "entitlement_slug_by_id": state.entitlement_slug_by_id,
+        }
+        item = {
+            "PK": f"DESIRED_STATE#{snapshot.platform}",
+            "SK": "LATEST",
+            "platform": snapshot.platform,
+            "state_hash": snapshot.state_hash,
+            "state_gz": gzip.compress(json.dumps(payload, separators=(",", ":")).encode()),
+            "reconciled_at": snapshot.reconciled_at.isoformat(),
+            "users_synced": snapshot.users_synced,
+            "orphans_found": snapshot.orphans_found,
+        }
+        result = self._storage.put(self.TABLE, item)
+        if not result.is_success:
+            logger.error(
+                "desired_state_save_failed",
+                platform=snapshot.platform,
+                error=result.message,
+            )
+
+    def get(self, platform: str) -> DesiredStateSnapshot | None:
+        """Return the platform's snapshot, or None when missing or unreadable."""
+        result = self._storage.get(self.TABLE, {"PK": f"DESIRED_STATE#{platform}", "SK": "LATEST"})
+        if not result.is_success or not isinstance(result.data, dict):
+            return None
+        item = result.data
+        try:
+            payload = json.loads(gzip.decompress(bytes(item["state_gz"])))
+            return DesiredStateSnapshot(
+                platform=platform,
+                state_hash=item["state_hash"],
+                state=DesiredPlatformState(
+                    desired_users=set(payload["desired_users"]),
+                    desired_members_by_entitlement={
+                        entitlement_id: set(members)
+                        for entitlement_id, members in payload["desired_members_by_entitlement"].items()
+                    },
+                    entitlement_slug_by_id=dict(payload["entitlement_slug_by_id"]),
+                ),
+                reconciled_at=datetime.fromisoformat(item["reconciled_at"]),
+                users_synced=int(item.get("users_synced", 0)),
+                orphans_found=int(item.get("orphans_found", 0)),
+            )
+        except (KeyError, TypeError, ValueError, OSError) as exc:
+            logger.warning("desired_state_unreadable", platform=platform, error=str(exc))
+            return None
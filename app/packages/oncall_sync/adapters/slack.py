@@ -4,11 +4,19 @@ Resolves on-call user emails to Slack user IDs, finds (or creates) the
 matching user group, re-enables it if it was deleted, then sets its membership
 to exactly the provided users. Used for both single-user rotation groups and
 multi-user schedule aggregate groups.
+
+User groups are listed once per run (``begin_run``) together with their
+current members and indexed by handle; membership is only written when it
+differs from the snapshot. Email to user ID lookups are cached for
+``user_id_ttl_seconds`` across runs. The adapter is driven from a single
+thread by ``OnCallSyncService`` and is not thread-safe.
 """
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
 
 import structlog
 from slack_sdk import WebClient
@@ -18,12 +26,28 @@ from packages.oncall_sync.ports import OnCallSyncError
 
 logger = structlog.get_logger()
 
+DEFAULT_USER_ID_TTL_SECONDS = 3600.0
+
 
 class SlackUserGroupTarget:
     """Mirror on-call membership into Slack user groups."""
 
-    def __init__(self, client: WebClient) -> None:
+    def __init__(
+        self,
+        client: WebClient,
+        *,
+        user_id_ttl_seconds: float = DEFAULT_USER_ID_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._client = client
+        self._user_id_ttl_seconds = user_id_ttl_seconds
+        self._clock = clock
+        self._user_ids: dict[str, tuple[float, str]] = {}
+        self._usergroups: dict[str, dict[str, Any]] | None = None
+
+    def begin_run(self) -> None:
+        """Drop the user-group snapshot so the next sync lists groups again."""
+        self._usergroups = None
 
     def sync_user_group(
         self,
@@ -42,14 +66,23 @@ class SlackUserGroupTarget:
             return
 
         try:
-            usergroup_id = self._find_or_create_usergroup(handle, name, description, log)
-            self._client.usergroups_users_update(usergroup=usergroup_id, users=",".join(user_ids))
+            usergroup = self._find_or_create_usergroup(handle, name, description, log)
+            if set(usergroup["users"]) == set(user_ids):
+                log.info("oncall_sync_usergroup_unchanged", usergroup_id=usergroup["id"])
+                return
+            self._client.usergroups_users_update(usergroup=usergroup["id"], users=",".join(user_ids))
         except SlackApiError as exc:
             raise OnCallSyncError(f"Slack API call failed: {exc.response.get('error')}") from exc
 
-        log.info("oncall_sync_usergroup_updated", usergroup_id=usergroup_id)
+        usergroup["users"] = list(user_ids)
+        log.info("oncall_sync_usergroup_updated", usergroup_id=usergroup["id"])
 
     def _resolve_user_id(self, email: str, log) -> str | None:
+        key = email.lower()
+        cached = self._user_ids.get(key)
+        if cached is not None and cached[0] > self._clock():
+            return cached[1]
+
         try:
             resp = self._client.users_lookupByEmail(email=email)
         except SlackApiError as exc:
@@ -61,16 +94,22 @@ class SlackUserGroupTarget:
             return None
         if resp.get("ok"):
             user_id: str = resp["user"]["id"]
+            # Only hits are cached: a user missing today may be provisioned
+            # before the next run.
+            self._user_ids[key] = (self._clock() + self._user_id_ttl_seconds, user_id)
             return user_id
         return None
 
-    def _find_or_create_usergroup(self, handle: str, name: str, description: str, log) -> str:
-        existing = self._lookup_usergroup(handle)
+    def _find_or_create_usergroup(self, handle: str, name: str, description: str, log) -> dict[str, Any]:
+        usergroups = self._load_usergroups()
+        existing = usergroups.get(handle)
         if existing is not None:
-            group_id, is_disabled = existing
-            if is_disabled:
-                self._client.usergroups_enable(usergroup=group_id)
-            return group_id
+            if existing["disabled"]:
+                self._client.usergroups_enable(usergroup=existing["id"])
+                existing["disabled"] = False
+                # Members of a disabled group are not reliable; force a write.
+                existing["users"] = []
+            return existing
 
         created = self._client.usergroups_create(
             name=name,
@@ -79,12 +118,21 @@ class SlackUserGroupTarget:
         )
         usergroup_id: str = created["usergroup"]["id"]
         log.info("oncall_sync_usergroup_created", usergroup_id=usergroup_id)
-        return usergroup_id
-
-    def _lookup_usergroup(self, handle: str) -> tuple[str, bool] | None:
-        response = self._client.usergroups_list(include_disabled=True)
-        usergroups: list[dict] = response.get("usergroups", []) or []
-        for group in usergroups:
-            if group.get("handle") == handle:
-                return group["id"], bool(group.get("date_delete", 0))
-        return None
+        usergroups[handle] = {"id": usergroup_id, "disabled": False, "users": []}
+        return usergroups[handle]
+
+    def _load_usergroups(self) -> dict[str, dict[str, Any]]:
+        """Return the run's user groups indexed by handle, listing them on first use."""
+        if self._usergroups is None:
+            response = self._client.usergroups_list(include_disabled=True, include_users=True)
+            groups: list[dict] = response.get("usergroups", []) or []
+            self._usergroups = {
+                group["handle"]: {
+                    "id": group["id"],
+                    "disabled": bool(group.get("date_delete", 0)),
+                    "users": list(group.get("users") or []),
+                }
+                for group in groups
+                if group.get("handle")
+            }
+        return self._usergroups
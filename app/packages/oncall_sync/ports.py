@@ -31,6 +31,15 @@ class OnCallScheduleProvider(Protocol):
 class UserGroupSyncTarget(Protocol):
     """Messaging-platform user group that should mirror on-call membership."""
 
+    def begin_run(self) -> None:
+        """Start a sync run.
+
+        Called once before the first ``sync_user_group`` of every run.
+        Implementations may drop per-run snapshots (e.g. the listing of
+        existing user groups) here so each run sees fresh platform state.
+        """
+        ...
+
     def sync_user_group(
         self,
         handle: str,
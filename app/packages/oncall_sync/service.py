@@ -4,11 +4,18 @@ Iterates the configured schedules. For each schedule, syncs each rotation's
 user group to its single on-call user, then syncs the schedule's aggregate
 user group to the union of all on-call users. If any rotation fails, the
 schedule group update is skipped and an error is logged.
+
+A run has two phases. On-call lookups (one network round trip per rotation)
+are fetched concurrently, one worker per schedule; a failing lookup only
+affects its own schedule. User-group writes then run serially in config
+order, so the target sees one caller and can reuse a per-run snapshot.
 """
 
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import structlog
 
@@ -25,6 +32,17 @@ from packages.oncall_sync.settings import (
 
 logger = structlog.get_logger()
 
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class _RotationLookup:
+    """Outcome of one on-call lookup; ``failed`` is set when the provider raised."""
+
+    rotation: OnCallRotation
+    email: str | None = None
+    failed: bool = False
+
 
 class OnCallSyncService:
     """Coordinates on-call -> user-group sync across all configured schedules."""
@@ -35,25 +53,49 @@ class OnCallSyncService:
         on_call: OnCallScheduleProvider,
         target: UserGroupSyncTarget,
         schedules: Iterable[OnCallScheduleConfig],
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         self._on_call = on_call
         self._target = target
         self._schedules = list(schedules)
+        self._max_workers = max(1, max_workers)
 
     def sync_all(self) -> None:
         """Sync every configured schedule; isolate per-schedule failures."""
-        for schedule in self._schedules:
-            self._sync_schedule(schedule)
+        if not self._schedules:
+            return
+
+        self._target.begin_run()
+        workers = min(self._max_workers, len(self._schedules))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="oncall-sync") as pool:
+            lookups = list(pool.map(self._lookup_schedule, self._schedules))
+
+        for schedule, schedule_lookups in zip(self._schedules, lookups, strict=True):
+            self._sync_schedule(schedule, schedule_lookups)
 
-    def _sync_schedule(self, schedule: OnCallScheduleConfig) -> None:
+    def _lookup_schedule(self, schedule: OnCallScheduleConfig) -> list[_RotationLookup]:
+        """Fetch the current on-call user of every rotation in one schedule."""
+        return [self._lookup_rotation(_resolve_rotation(schedule, config)) for config in schedule.rotations]
+
+    def _lookup_rotation(self, rotation: OnCallRotation) -> _RotationLookup:
+        try:
+            email = self._on_call.get_current_on_call_email(rotation)
+        except OnCallSyncError as exc:
+            _log_rotation_failure(rotation, exc)
+            return _RotationLookup(rotation=rotation, failed=True)
+        return _RotationLookup(rotation=rotation, email=email)
+
+    def _sync_schedule(self, schedule: OnCallScheduleConfig, lookups: list[_RotationLookup]) -> None:
         log = logger.bind(slack_handle=schedule.slack_handle)
         on_call_emails: list[str] = []
         any_rotation_failed = False
 
-        for rotation_config in schedule.rotations:
-            rotation = _resolve_rotation(schedule, rotation_config)
+        for lookup in lookups:
+            if lookup.failed:
+                any_rotation_failed = True
+                continue
             try:
-                email = self._sync_rotation(rotation)
+                email = self._sync_rotation(lookup)
             except OnCallSyncError:
                 any_rotation_failed = True
                 continue
@@ -88,30 +130,16 @@ class OnCallSyncService:
             return
         log.info("oncall_sync_schedule_group_synced")
 
-    def _sync_rotation(self, rotation: OnCallRotation) -> str | None:
-        """Sync one rotation's user group.
+    def _sync_rotation(self, lookup: _RotationLookup) -> str | None:
+        """Sync one rotation's user group from its looked-up on-call user.
 
         Returns the on-call email on success, or ``None`` if the rotation has
         no current participant. Raises ``OnCallSyncError`` (already logged) on
-        provider or target failure.
+        target failure.
         """
-        log = logger.bind(
-            slack_handle=rotation.slack_handle,
-            opsgenie_schedule_id=rotation.opsgenie_schedule_id,
-            opsgenie_rotation_name=rotation.opsgenie_rotation_name,
-        )
-        try:
-            email = self._on_call.get_current_on_call_email(rotation)
-        except OnCallSyncError as exc:
-            cause = exc.__cause__
-            log.error(
-                "oncall_sync_rotation_failed",
-                error=str(exc),
-                error_type=type(cause).__name__ if cause is not None else None,
-            )
-            raise
-
-        if email is None:
+        rotation = lookup.rotation
+        log = _rotation_logger(rotation)
+        if lookup.email is None:
             log.info("oncall_sync_rotation_empty")
             return None
 
@@ -120,19 +148,31 @@ class OnCallSyncService:
                 rotation.slack_handle,
                 rotation.slack_name,
                 rotation.slack_description,
-                [email],
+                [lookup.email],
             )
         except OnCallSyncError as exc:
-            cause = exc.__cause__
-            log.error(
-                "oncall_sync_rotation_failed",
-                error=str(exc),
-                error_type=type(cause).__name__ if cause is not None else None,
-            )
+            _log_rotation_failure(rotation, exc)
             raise
 
         log.info("oncall_sync_rotation_synced")
-        return email
+        return lookup.email
+
+
+def _rotation_logger(rotation: OnCallRotation):
+    return logger.bind(
+        slack_handle=rotation.slack_handle,
+        opsgenie_schedule_id=rotation.opsgenie_schedule_id,
+        opsgenie_rotation_name=rotation.opsgenie_rotation_name,
+    )
+
+
+def _log_rotation_failure(rotation: OnCallRotation, exc: OnCallSyncError) -> None:
+    cause = exc.__cause__
+    _rotation_logger(rotation).error(
+        "oncall_sync_rotation_failed",
+        error=str(exc),
+        error_type=type(cause).__name__ if cause is not None else None,
+    )
 
 
 def _resolve_rotation(
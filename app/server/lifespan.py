@@ -1,7 +1,8 @@
 import sys
 import threading
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
 from typing import cast
 
@@ -33,13 +34,16 @@ from infrastructure.i18n import (
 from infrastructure.logging.settings import LoggingSettings, get_logging_settings
 from infrastructure.logging.setup import configure_logging
 from infrastructure.plugins import (
-    auto_discover_plugins,
+    StartupProfiler,
+    discover_feature_plugins,
     get_plugin_manager,
     register_feature_integrations,
 )
-from infrastructure.security import get_jwks_manager
+from infrastructure.security import get_jwks_manager, get_verified_token_cache
+from integrations.sentinel import stop_sentinel_shipper
 from integrations.slack.provider import get_slack_provider
 from jobs import scheduled_tasks
+from jobs.healthchecks import shutdown_healthcheck_runner
 from modules import (
     atip,
     aws,
@@ -50,6 +54,7 @@ from modules import (
     sre,
     webhook_helper,
 )
+from server.startup import ReadinessState, StartupPhase, run_startup_phases
 
 
 def _is_test_environment() -> bool:
@@ -123,9 +128,12 @@ def _start_scheduled_tasks(
 
 
 def _stop_scheduled_tasks(stop_event: threading.Event | None) -> None:
-    if stop_event is None:
-        return
-    stop_event.set()
+    if stop_event is not None:
+        stop_event.set()
+        scheduled_tasks.shutdown()
+    # Checks still running against a hung dependency must not keep the
+    # process alive after shutdown.
+    shutdown_healthcheck_runner()
 
 
 def _initialize_security_services(
@@ -151,12 +159,26 @@ def _initialize_security_services(
 
     jwks_manager = get_jwks_manager()
     jwks_manager.warmup()
+    jwks_manager.start_background_refresh(settings.JWKS_REFRESH_INTERVAL_SECONDS)
+    get_verified_token_cache()
     log.info(
         "security_services_initialized",
         issuer_count=len(issuer_config),
+        jwks_refresh_interval_seconds=settings.JWKS_REFRESH_INTERVAL_SECONDS,
     )
 
 
+def _stop_security_services(logger: BoundLogger) -> None:
+    """Stop the JWKS refresh thread and log verified-token cache counters."""
+    get_jwks_manager().stop_background_refresh()
+    logger.info("verified_token_cache_stats", **get_verified_token_cache().stats())
+
+
+def _stop_sentinel_shipper(logger: BoundLogger) -> None:
+    """Drain queued Sentinel events and log the shipper counters."""
+    logger.info("sentinel_shipper_stats", **stop_sentinel_shipper())
+
+
 def _initialize_directory_provider(
     app: FastAPI,
     directory_settings: DirectorySettings,
@@ -180,12 +202,16 @@ def _initialize_directory_provider(
     log.info("directory_provider_initialization_completed")
 
 
-def _initialize_translation_service(pm: PluginManager, logger: BoundLogger) -> TranslationService:
+def _initialize_translation_service(
+    pm: PluginManager,
+    logger: BoundLogger,
+    profiler: StartupProfiler | None = None,
+) -> TranslationService:
     """"""
     # Phase 1: Discover feature plugins and collect i18n resource registrations.
     log = logger.bind(phase="i18n_resource_collection")
 
-    auto_discover_plugins(pm, base_paths=["packages", "modules"])
+    discover_feature_plugins(pm, profiler=profiler)
     logger.info("feature_plugins_discovered", plugin_count=len(pm.get_plugins()))
 
     i18n_registry = I18nResourceRegistry()
@@ -226,6 +252,99 @@ def _initialize_translation_service(pm: PluginManager, logger: BoundLogger) -> T
     return translation_service
 
 
+def _warm_directory_provider_in_background(app: FastAPI, logger: BoundLogger) -> None:
+    """Warm the directory provider after boot when background warmup is enabled."""
+    warmup = app.state.directory_provider.warmup()
+    if not warmup.is_success:
+        raise RuntimeError(f"directory_warmup_failed: {warmup.message}")
+    logger.bind(phase="directory").info("directory_provider_background_warmup_completed")
+
+
+def _register_features(
+    app: FastAPI,
+    pm: PluginManager,
+    translation_service: TranslationService,
+    profiler: StartupProfiler,
+    detach_profiler: Callable[[], None],
+    logger: BoundLogger,
+) -> None:
+    """Register feature commands, routes, and run startup warmup."""
+    # Inject translation service into all platform providers and their formatters
+    # before command registration so help-text translations work at startup.
+    app.state.slack_provider.set_translator(translation_service.translator)
+    # Providers now have the translator set, so description_key translations
+    # resolve correctly at registration time.
+    log = logger.bind(phase="feature_registration")
+    register_feature_integrations(
+        app=app,
+        logger=logger,
+        slack_provider=app.state.slack_provider,
+    )
+    log.info("feature_integrations_registered")
+    detach_profiler()
+    profiler.log_summary(logger)
+
+
+def _build_startup_phases(
+    app: FastAPI,
+    server_settings: ServerSettings,
+    directory_settings: DirectorySettings,
+    logger: BoundLogger,
+) -> list[StartupPhase]:
+    """Declare the startup phases that run before the Slack app starts.
+
+    Security, directory, Slack provider and plugin/i18n initialization are
+    independent and overlap; feature registration waits for the translator
+    and the Slack provider. When startup does not require the directory
+    warmup it is skipped, unless ``background_warmup`` opts in to running it
+    as an optional phase that readiness does not wait for.
+    """
+    timeout = server_settings.STARTUP_PHASE_TIMEOUT_SECONDS
+    pm = get_plugin_manager()
+    # Record per-plugin import and per-hook execution time for the startup log.
+    profiler = StartupProfiler()
+    detach_profiler = profiler.attach(pm)
+    translation: dict[str, TranslationService] = {}
+
+    def initialize_slack_provider() -> None:
+        app.state.slack_provider = get_slack_provider()
+
+    def initialize_translation() -> None:
+        translation["service"] = _initialize_translation_service(pm, logger, profiler)
+
+    phases = [
+        StartupPhase(
+            name="security",
+            run=partial(_initialize_security_services, app, server_settings, logger),
+            timeout_seconds=timeout,
+        ),
+        StartupPhase(
+            name="directory",
+            run=partial(_initialize_directory_provider, app, directory_settings, logger),
+            timeout_seconds=timeout,
+        ),
+        StartupPhase(name="slack_provider", run=initialize_slack_provider, timeout_seconds=timeout),
+        StartupPhase(name="i18n", run=initialize_translation, timeout_seconds=timeout),
+        StartupPhase(
+            name="feature_registration",
+            run=lambda: _register_features(app, pm, translation["service"], profiler, detach_profiler, logger),
+            depends_on=("i18n", "slack_provider"),
+            timeout_seconds=timeout,
+        ),
+    ]
+    if not directory_settings.require_startup_warmup and directory_settings.background_warmup:
+        phases.append(
+            StartupPhase(
+                name="directory_warmup",
+                run=partial(_warm_directory_provider_in_background, app, logger),
+                depends_on=("directory",),
+                required=False,
+                timeout_seconds=timeout,
+            )
+        )
+    return phases
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app_settings = get_app_settings()
@@ -237,6 +356,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     app.state.settings = app_settings
     app.state.logger = logger
+    app.state.readiness = ReadinessState()
 
     logger.info("application_startup")
     _list_configs_from_sections(
@@ -247,27 +367,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger,
     )
 
-    _initialize_security_services(app, server_settings, logger)
-    _initialize_directory_provider(app, directory_settings, logger)
-
-    app.state.slack_provider = get_slack_provider()
-
-    pm = get_plugin_manager()
-
-    translation_service = _initialize_translation_service(pm, logger)
-    # Inject translation service into all platform providers and their formatters
-    # before command registration so help-text translations work at startup.
-    app.state.slack_provider.set_translator(translation_service.translator)
-    # Phase 3: Register feature commands, routes, and run startup warmup.
-    # Providers now have the translator set, so description_key translations
-    # resolve correctly at registration time.
-    log = logger.bind(phase="feature_registration")
-    register_feature_integrations(
-        app=app,
-        logger=logger,
-        slack_provider=app.state.slack_provider,
+    run_startup_phases(
+        _build_startup_phases(app, server_settings, directory_settings, logger),
+        logger,
+        readiness=app.state.readiness,
     )
-    log.info("feature_integrations_registered")
 
     app.state.slack_provider.initialize_app()
     if app.state.slack_provider and getattr(app.state.slack_provider, "app", None):
@@ -313,12 +417,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             logger.info("slack_provider_start_skipped", reason="test_environment")
 
     app.state.scheduled_stop_event = scheduled_stop_event
+    app.state.readiness.mark_ready()
 
     yield
 
+    app.state.readiness.mark_not_ready()
     logger.info("application_shutdown")
 
     _stop_scheduled_tasks(app.state.scheduled_stop_event)
+    _stop_security_services(logger)
 
     if app.state.slack_provider:
         app.state.slack_provider.stop()
+
+    # Drain last so events emitted by in-flight handlers are still shipped.
+    _stop_sentinel_shipper(logger)
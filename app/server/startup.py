@@ -0,0 +1,250 @@
+"""Startup phase graph executed on a thread pool.
+
+The lifespan declares its startup work as ``StartupPhase`` objects with
+explicit dependencies. ``run_startup_phases`` starts every phase as soon as
+the phases it depends on have finished, so independent I/O-bound steps
+(JWKS prefetch, directory warmup, plugin discovery and i18n loading) overlap
+instead of running back to back.
+
+Required phases keep the fail-fast semantics of the sequential lifespan: the
+first exception is re-raised unchanged and no further phase is started. A
+required phase that exceeds its timeout raises ``TimeoutError``. Optional
+phases (non-critical warmups) are not waited for; they may finish after the
+application reports ready, and their failures are logged, not raised.
+
+``ReadinessState`` records the outcome of every phase and backs the
+``/health/readiness`` endpoint.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from structlog.stdlib import BoundLogger
+
+DEFAULT_PHASE_TIMEOUT_SECONDS = 120.0
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_POLL_SECONDS = 1.0
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    """One unit of startup work.
+
+    Attributes:
+        name: Unique phase name used in logs and the readiness payload.
+        run: Callable doing the work; its exception aborts startup when the
+            phase is required.
+        depends_on: Names of phases that must succeed before this one starts.
+        required: Whether readiness waits for this phase.
+        timeout_seconds: Maximum run time of a required phase before startup
+            is aborted; optional phases are not waited for.
+    """
+
+    name: str
+    run: Callable[[], Any]
+    depends_on: tuple[str, ...] = ()
+    required: bool = True
+    timeout_seconds: float = DEFAULT_PHASE_TIMEOUT_SECONDS
+
+
+class ReadinessState:
+    """Thread-safe record of startup phase outcomes.
+
+    The application is ready once every required phase has succeeded and the
+    lifespan has called ``mark_ready``; optional phases only show up in the
+    payload.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._phases: dict[str, dict[str, Any]] = {}
+        self._ready = False
+
+    def register(self, phase: StartupPhase) -> None:
+        """Track a phase before it starts."""
+        with self._lock:
+            self._phases[phase.name] = {"status": PENDING, "required": phase.required}
+
+    def update(self, name: str, status: str, duration_seconds: float | None = None, error: str | None = None) -> None:
+        """Record the new status of a phase."""
+        with self._lock:
+            entry = self._phases.setdefault(name, {"required": True})
+            entry["status"] = status
+            if duration_seconds is not None:
+                entry["duration_seconds"] = round(duration_seconds, 4)
+            if error is not None:
+                entry["error"] = error
+
+    def mark_ready(self) -> None:
+        """Flip readiness once startup has handed control to the server."""
+        with self._lock:
+            self._ready = True
+
+    def mark_not_ready(self) -> None:
+        """Report not ready again, e.g. while shutting down."""
+        with self._lock:
+            self._ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether startup finished and every required phase succeeded."""
+        with self._lock:
+            return self._ready and all(
+                entry["status"] == SUCCEEDED for entry in self._phases.values() if entry.get("required", True)
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the readiness flag and a copy of every phase entry."""
+        ready = self.is_ready
+        with self._lock:
+            return {"ready": ready, "phases": {name: dict(entry) for name, entry in self._phases.items()}}
+
+
+def _validate(phases: list[StartupPhase]) -> dict[str, StartupPhase]:
+    by_name: dict[str, StartupPhase] = {}
+    for phase in phases:
+        if phase.name in by_name:
+            raise ValueError(f"Duplicate startup phase: {phase.name}")
+        by_name[phase.name] = phase
+
+    for phase in phases:
+        for dependency in phase.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"Startup phase {phase.name} depends on unknown phase {dependency}")
+            # Optional phases are leaves: they start once their required
+            # dependencies succeed and nothing waits on them.
+            if not by_name[dependency].required:
+                raise ValueError(f"Startup phase {phase.name} cannot depend on optional phase {dependency}")
+
+    visiting: set[str] = set()
+    done: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Startup phase dependency cycle through {name}")
+        visiting.add(name)
+        for dependency in by_name[name].depends_on:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+
+    for phase in phases:
+        visit(phase.name)
+    return by_name
+
+
+def run_startup_phases(
+    phases: list[StartupPhase],
+    logger: BoundLogger,
+    readiness: ReadinessState | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    clock: Callable[[], float] = time.monotonic,
+) -> None:
+    """Run startup phases in dependency order, overlapping independent ones.
+
+    Returns once every required phase has succeeded. Optional phases keep
+    running on the pool's threads after this returns.
+
+    Args:
+        phases: Phases to run; dependencies must refer to required phases in the list.
+        logger: Structured logger for per-phase start/finish events.
+        readiness: Optional readiness state updated as phases progress.
+        max_workers: Maximum number of phases running at the same time.
+        clock: Monotonic clock used for durations and timeouts.
+
+    Raises:
+        ValueError: If the graph has unknown dependencies, duplicates or a cycle.
+        TimeoutError: If a required phase exceeds its timeout.
+        Exception: The first exception raised by a required phase, unchanged.
+    """
+    _validate(phases)
+    state = readiness or ReadinessState()
+    for phase in phases:
+        state.register(phase)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="startup")
+    running: dict[Future[Any], StartupPhase] = {}
+    # Written by the worker when a phase actually starts, so time spent queued
+    # behind other phases does not count against its timeout.
+    started_at: dict[str, float] = {}
+    succeeded: set[str] = set()
+    submitted: set[str] = set()
+
+    def execute(phase: StartupPhase) -> Any:
+        started_at[phase.name] = clock()
+        state.update(phase.name, RUNNING)
+        logger.info("startup_phase_started", startup_phase=phase.name, required=phase.required)
+        return phase.run()
+
+    def elapsed(phase: StartupPhase) -> float:
+        return clock() - started_at.get(phase.name, clock())
+
+    def record(future: Future[Any], phase: StartupPhase) -> BaseException | None:
+        if future.cancelled():
+            return None
+        duration = elapsed(phase)
+        error = future.exception()
+        if error is None:
+            state.update(phase.name, SUCCEEDED, duration_seconds=duration)
+            logger.info("startup_phase_completed", startup_phase=phase.name, duration_seconds=round(duration, 4))
+            return None
+        state.update(phase.name, FAILED, duration_seconds=duration, error=str(error))
+        log = logger.error if phase.required else logger.warning
+        log("startup_phase_failed", startup_phase=phase.name, duration_seconds=round(duration, 4), error=str(error))
+        return error
+
+    def submit_ready_phases() -> None:
+        for phase in phases:
+            if phase.name not in submitted and all(dependency in succeeded for dependency in phase.depends_on):
+                submitted.add(phase.name)
+                future = executor.submit(execute, phase)
+                if phase.required:
+                    running[future] = phase
+                else:
+                    future.add_done_callback(lambda done, phase=phase: record(done, phase))
+
+    failed = True
+    try:
+        submit_ready_phases()
+        while running:
+            now = clock()
+            deadlines = [started_at[phase.name] + phase.timeout_seconds for phase in running.values() if phase.name in started_at]
+            # Phases still queued have no deadline yet; poll until they start.
+            timeout = max(min(deadlines) - now, 0.0) if deadlines else DEFAULT_POLL_SECONDS
+            done, _ = wait(list(running), timeout=min(timeout, DEFAULT_POLL_SECONDS), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                phase = running.pop(future)
+                error = record(future, phase)
+                if error is not None:
+                    raise error
+                succeeded.add(phase.name)
+            submit_ready_phases()
+
+            for phase in running.values():
+                if phase.name in started_at and elapsed(phase) >= phase.timeout_seconds:
+                    state.update(phase.name, TIMED_OUT, duration_seconds=elapsed(phase))
+                    logger.error(
+                        "startup_phase_timed_out",
+                        startup_phase=phase.name,
+                        timeout_seconds=phase.timeout_seconds,
+                    )
+                    raise TimeoutError(f"startup_phase_timeout: {phase.name} exceeded {phase.timeout_seconds}s")
+        failed = False
+    finally:
+        # Never block on abandoned or optional phases. Optional phases already
+        # submitted keep running; after a failure, queued work is dropped.
+        executor.shutdown(wait=False, cancel_futures=failed)
@@ -1,8 +1,11 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
 
 from api.routes import system
+from infrastructure.health import HealthStatusRegistry
+from infrastructure.security import get_current_user
+from server.startup import SUCCEEDED, ReadinessState, StartupPhase
 from utils.tests import create_test_app
 
 test_app = create_test_app(system.router)
@@ -28,3 +31,66 @@ def test_health():
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
+
+
+def test_liveness():
+    with TestClient(test_app) as client:
+        response = client.get("/health/liveness")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+
+def test_integration_health_reads_the_status_registry():
+    registry = HealthStatusRegistry()
+    registry.record("opsgenie", "unhealthy", duration_seconds=0.5, error="HTTP 503 from api.opsgenie.com")
+    registry.record("aws", "healthy", duration_seconds=0.25)
+    test_app.dependency_overrides[get_current_user] = lambda: MagicMock()
+    try:
+        with patch("api.routes.system.get_health_status_registry", return_value=registry):
+            with TestClient(test_app) as client:
+                response = client.get("/health/integrations")
+    finally:
+        test_app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    integrations = response.json()["integrations"]
+    assert list(integrations) == ["aws", "opsgenie"]
+    assert integrations["opsgenie"]["status"] == "unhealthy"
+    assert integrations["opsgenie"]["consecutive_failures"] == 1
+    assert "error" not in integrations["opsgenie"]
+
+
+def test_integration_health_requires_authentication():
+    with TestClient(test_app) as client:
+        response = client.get("/health/integrations")
+
+    assert response.status_code == 401
+
+
+def test_readiness_is_unavailable_until_startup_completes():
+    readiness = ReadinessState()
+    readiness.register(StartupPhase(name="security", run=lambda: None))
+    test_app.state.readiness = readiness
+    try:
+        with TestClient(test_app) as client:
+            response = client.get("/health/readiness")
+            assert response.status_code == 503
+            assert response.json()["status"] == "starting"
+
+            readiness.update("security", SUCCEEDED)
+            readiness.mark_ready()
+            response = client.get("/health/readiness")
+            assert response.status_code == 200
+            assert response.json() == {
+                "status": "ready",
+                "phases": {"security": {"status": "succeeded", "required": True}},
+            }
+    finally:
+        del test_app.state.readiness
+
+
+def test_readiness_without_lifespan_state_reports_starting():
+    with TestClient(test_app) as client:
+        response = client.get("/health/readiness")
+        assert response.status_code == 503
+        assert response.json() == {"status": "starting", "phases": {}}
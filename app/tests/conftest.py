@@ -80,6 +80,87 @@ def suppress_structlog_output():
     root_logger.setLevel(original_level)
 
 
+def _clear_process_caches() -> None:
+    from infrastructure.clients.google_workspace.rate_control import get_google_api_rate_controller
+    from infrastructure.health import get_health_status_registry
+    from infrastructure.i18n.factory import get_translation_service
+    from infrastructure.logging.formatters import clear_key_decision_caches
+    from infrastructure.security.jwks import get_jwks_manager
+    from infrastructure.security.token_cache import get_verified_token_cache
+    from integrations.aws.organizations import get_account_catalog
+    from integrations.google_workspace.google_service import clear_google_api_caches
+    from integrations.slack.locales import get_user_locale_cache
+    from jobs.executor import shutdown_job_executor
+    from jobs.healthchecks import shutdown_healthcheck_runner
+    from modules.incident.incident_folder import get_incident_folder_index
+    from modules.incident.on_call import get_on_call_users_cache
+    from modules.reports.google_groups import get_sheets_write_bucket
+    from packages.access.request.providers import get_access_request_service
+    from packages.access.sync.providers import get_access_sync_coordinator
+
+    get_user_locale_cache().clear()
+    clear_google_api_caches()
+    get_account_catalog.cache_clear()
+    get_google_api_rate_controller.cache_clear()
+    get_verified_token_cache.cache_clear()
+    # The token cache subscribes to the JWKS manager; a fresh pair avoids stale listeners.
+    if get_jwks_manager.cache_info().currsize:
+        get_jwks_manager().stop_background_refresh()
+    get_jwks_manager.cache_clear()
+    get_access_request_service.cache_clear()
+    get_access_sync_coordinator.cache_clear()
+    if get_translation_service.cache_info().currsize:
+        get_translation_service().translator.clear_render_cache()
+    clear_key_decision_caches()
+    get_health_status_registry.cache_clear()
+    shutdown_healthcheck_runner()
+    get_incident_folder_index.cache_clear()
+    get_on_call_users_cache.cache_clear()
+    get_sheets_write_bucket.cache_clear()
+    shutdown_job_executor()
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Keep process-wide caches from leaking between tests.
+
+    Covers Slack user locales, Google API resources, method parameters and
+    the rate controller with its retry budget, the AWS account catalog, the
+    JWKS manager and verified-token cache, the access approver and sync group caches, rendered
+    translations, redaction key decisions, the health registry and runner,
+    the incident folder index and on-call cache, the Sheets write bucket of
+    the groups report, and the scheduled job executor. Add new module-level caches here.
+    """
+    _clear_process_caches()
+    yield
+    _clear_process_caches()
+
+
+class FakeClock:
+    """Manually advanced monotonic clock for code that takes ``clock``/``sleep`` callables.
+
+    Tests move time by assigning or incrementing ``now``; ``sleep`` advances the
+    clock instead of waiting, and ``tick`` advances it on every reading.
+    """
+
+    def __init__(self, now: float = 0.0, tick: float = 0.0) -> None:
+        self.now = now
+        self.tick = tick
+
+    def __call__(self) -> float:
+        self.now += self.tick
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """Fake monotonic clock starting at zero."""
+    return FakeClock()
+
+
 # Google API Python Client
 
 
@@ -0,0 +1,89 @@
+"""Cold-start regression benchmark for feature plugin discovery.
+
+Each discovery mode runs in a fresh interpreter so imports cached by the test
+session do not hide the cost. The script goes past discovery and fires the
+startup hooks that run whether or not Slack is enabled (i18n resources and
+routes), so lazily imported plugins are paid for inside the measurement. The
+benchmark asserts on imported modules rather than wall time, which keeps it
+stable on shared CI runners; the measured times are printed for comparison
+(``pytest -s``).
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.plugins.manager import FEATURE_BASE_PATHS, get_plugin_manager
+from infrastructure.plugins.manifest import build_plugin_manifest, dump_plugin_manifest, load_plugin_manifest
+
+pytestmark = pytest.mark.integration
+
+APP_ROOT = Path(__file__).resolve().parents[4]
+MANIFEST_PATH = APP_ROOT / "infrastructure" / "plugins" / "plugin_manifest.json"
+
+# Dependencies of app/modules packages that implement no hooks; the package
+# walk imports them, the manifest never should. geoip2 is left out because
+# packages.geolocate loads it when its routes are registered, and
+# googleapiclient because the host's own error classification imports it.
+HEAVY_MODULES = ("pandas",)
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from fastapi import FastAPI
+from infrastructure.i18n.resources import I18nResourceRegistry
+from infrastructure.plugins.manager import discover_feature_plugins, get_plugin_manager
+pm = get_plugin_manager()
+discover_feature_plugins(pm)
+discovered = time.perf_counter()
+pm.hook.register_i18n_resources(registry=I18nResourceRegistry())
+pm.hook.register_routes(app=FastAPI())
+print(json.dumps({
+    "discovery_seconds": discovered - start,
+    "seconds": time.perf_counter() - start,
+    "modules": len(sys.modules),
+    "heavy": sorted(name for name in %r if name in sys.modules),
+}))
+"""
+
+
+def _measure_startup(env: dict[str, str]) -> dict:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", STARTUP_SCRIPT % (HEAVY_MODULES,)],
+        cwd=APP_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_committed_plugin_manifest_is_up_to_date():
+    expected = dump_plugin_manifest(build_plugin_manifest(get_plugin_manager(), FEATURE_BASE_PATHS))
+
+    assert MANIFEST_PATH.read_text(encoding="utf-8") == expected, (
+        "plugin_manifest.json is stale; run python3 bin/generate_plugin_manifest.py"
+    )
+
+
+def test_manifest_lists_every_discovered_plugin():
+    modules = {entry.module for entry in load_plugin_manifest(MANIFEST_PATH)}
+
+    assert {"packages.geolocate", "packages.oncall_sync"} <= modules
+
+
+def test_manifest_startup_cold_start_imports_less_than_package_walk():
+    base_env = {key: value for key, value in os.environ.items() if key != "PLUGIN_MANIFEST_PATH"}
+
+    walk = _measure_startup(base_env)
+    manifest = _measure_startup({**base_env, "PLUGIN_MANIFEST_PATH": str(MANIFEST_PATH)})
+
+    print(f"plugin startup cold start: walk={walk}, manifest={manifest}")
+    assert manifest["heavy"] == []
+    assert manifest["modules"] < walk["modules"]
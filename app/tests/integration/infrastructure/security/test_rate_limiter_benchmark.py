@@ -0,0 +1,79 @@
+"""Per-request overhead benchmark for the rate limiter storages.
+
+Drives the limits sliding-window-counter strategy the way slowapi does (one
+``hit`` per request) against the in-process ``memory://`` storage and the
+DynamoDB storage over a fake table that adds a fixed round-trip latency.
+Like the plugin cold-start benchmark it asserts on table calls per request
+rather than wall time, which keeps it stable on shared CI runners; the
+measured overhead per request is printed for comparison (``pytest -s``).
+"""
+
+import time
+
+import pytest
+from limits import RateLimitItemPerMinute
+from limits.storage import MemoryStorage
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+from infrastructure.security.rate_limit_storage import DynamoDBRateLimitStorage
+from tests.unit.infrastructure.storage.fake_storage import FakeStorageService
+
+pytestmark = pytest.mark.integration
+
+REQUESTS = 400
+CLIENTS = 4
+ROUND_TRIP_SECONDS = 0.0005
+
+
+class _SlowTable(FakeStorageService):
+    """Fake table that counts calls and sleeps for one round trip per call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def increment(self, *args, **kwargs):
+        self._round_trip()
+        return super().increment(*args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        self._round_trip()
+        return super().get(*args, **kwargs)
+
+    def _round_trip(self) -> None:
+        self.calls += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+
+
+def _run(storage) -> float:
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    item = RateLimitItemPerMinute(REQUESTS)
+    started = time.perf_counter()
+    for index in range(REQUESTS):
+        assert limiter.hit(item, f"198.51.100.{index % CLIENTS}")
+    return (time.perf_counter() - started) / REQUESTS
+
+
+def _dynamodb(batch_size: int) -> tuple[DynamoDBRateLimitStorage, _SlowTable]:
+    table = _SlowTable()
+    storage = DynamoDBRateLimitStorage("dynamodb://bench", storage=table, batch_size=batch_size, flush_interval_seconds=60)
+    return storage, table
+
+
+def test_batched_increments_cut_table_calls_per_request():
+    memory = _run(MemoryStorage())
+    unbatched_storage, unbatched_table = _dynamodb(batch_size=1)
+    unbatched = _run(unbatched_storage)
+    batched_storage, batched_table = _dynamodb(batch_size=20)
+    batched = _run(batched_storage)
+
+    print(
+        "rate limiter overhead per request: "
+        f"memory={memory * 1e6:.1f}us, "
+        f"dynamodb(batch=1)={unbatched * 1e6:.1f}us ({unbatched_table.calls} calls), "
+        f"dynamodb(batch=20)={batched * 1e6:.1f}us ({batched_table.calls} calls)"
+    )
+    # Two window reads per client, then one write per request or per batch.
+    reads = 2 * CLIENTS
+    assert unbatched_table.calls <= REQUESTS + reads
+    assert batched_table.calls <= REQUESTS // 20 + reads
@@ -0,0 +1,121 @@
+"""Per-item cost of single versus batch storage operations.
+
+Drives DynamoDBStorageService against an in-process client that adds a
+fixed round-trip latency per request. Like the rate limiter benchmark it
+asserts on requests per item rather than wall time, which keeps it stable
+on shared CI runners; the measured cost per item is printed for comparison
+(``pytest -s``).
+"""
+
+import time
+from typing import Any
+
+import pytest
+
+from infrastructure.storage import service as service_module
+from infrastructure.storage.service import DynamoDBStorageService
+
+pytestmark = pytest.mark.integration
+
+ITEMS = 200
+ROUND_TRIP_SECONDS = 0.0005
+TABLE = "bench"
+
+
+class _LatencyClient:
+    """Minimal DynamoDB client keyed on ``pk`` that sleeps one round trip per request."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, dict[str, Any]] = {}
+        self.requests = 0
+
+    def put_item(self, TableName: str, Item: dict[str, Any]) -> dict[str, Any]:
+        self._round_trip()
+        self.items[Item["pk"]["S"]] = Item
+        return {}
+
+    def get_item(self, TableName: str, Key: dict[str, Any]) -> dict[str, Any]:
+        self._round_trip()
+        item = self.items.get(Key["pk"]["S"])
+        return {"Item": item} if item else {}
+
+    def batch_write_item(self, RequestItems: dict[str, Any]) -> dict[str, Any]:
+        self._round_trip()
+        for request in RequestItems[TABLE]:
+            item = request["PutRequest"]["Item"]
+            self.items[item["pk"]["S"]] = item
+        return {"UnprocessedItems": {}}
+
+    def batch_get_item(self, RequestItems: dict[str, Any]) -> dict[str, Any]:
+        self._round_trip()
+        keys = RequestItems[TABLE]["Keys"]
+        found = [self.items[key["pk"]["S"]] for key in keys if key["pk"]["S"] in self.items]
+        return {"Responses": {TABLE: found}, "UnprocessedKeys": {}}
+
+    def _round_trip(self) -> None:
+        self.requests += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+
+
+def _items() -> list[dict[str, Any]]:
+    return [
+        {"pk": f"request-{i}", "status": "approved", "requested_by": "user@example.com", "duration": 3600, "active": True}
+        for i in range(ITEMS)
+    ]
+
+
+def _per_item(func) -> float:
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) / ITEMS
+
+
+def test_batch_writes_cost_one_request_per_25_items():
+    single_client, batch_client = _LatencyClient(), _LatencyClient()
+    single, batch = DynamoDBStorageService(single_client), DynamoDBStorageService(batch_client)
+    items = _items()
+
+    single_cost = _per_item(lambda: [single.put(TABLE, item) for item in items])
+    batch_cost = _per_item(lambda: batch.batch_put(TABLE, items))
+
+    print(f"\nput: {single_cost * 1e6:.0f}us/item single, {batch_cost * 1e6:.0f}us/item batched")
+    assert single_client.requests == ITEMS
+    assert batch_client.requests == ITEMS // service_module.BATCH_WRITE_MAX_ITEMS
+    assert batch_client.items == single_client.items
+
+
+def test_batch_reads_cost_one_request_per_100_keys():
+    client = _LatencyClient()
+    storage = DynamoDBStorageService(client)
+    storage.batch_put(TABLE, _items())
+    keys = [{"pk": item["pk"]} for item in _items()]
+
+    client.requests = 0
+    single_cost = _per_item(lambda: [storage.get(TABLE, key) for key in keys])
+    single_requests, client.requests = client.requests, 0
+    result = None
+
+    def read_batch() -> None:
+        nonlocal result
+        result = storage.batch_get(TABLE, keys)
+
+    batch_cost = _per_item(read_batch)
+
+    print(f"\nget: {single_cost * 1e6:.0f}us/item single, {batch_cost * 1e6:.0f}us/item batched")
+    assert single_requests == ITEMS
+    assert client.requests == ITEMS // service_module.BATCH_GET_MAX_KEYS
+    assert result is not None and len(result.data) == ITEMS
+
+
+def test_fast_path_serialization_matches_type_serializer():
+    items = _items()
+
+    started = time.perf_counter()
+    expected = [{k: service_module._serializer.serialize(v) for k, v in item.items()} for item in items]
+    serializer_cost = (time.perf_counter() - started) / ITEMS
+    started = time.perf_counter()
+    serialized = [service_module._serialize_item(item) for item in items]
+    fast_path_cost = (time.perf_counter() - started) / ITEMS
+
+    print(f"\nserialize: {serializer_cost * 1e6:.1f}us/item TypeSerializer, {fast_path_cost * 1e6:.1f}us/item fast path")
+    assert serialized == expected
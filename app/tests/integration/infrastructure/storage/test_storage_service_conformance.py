@@ -107,3 +107,83 @@ class TestQuery:
         assert result.is_success
         assert result.data is not None
         assert len(result.data) == 3
+
+
+class TestBatchOperations:
+    """BatchWriteItem/BatchGetItem chunking against real request limits."""
+
+    def test_batch_put_get_delete_across_chunks(self, storage_service: DynamoDBStorageService) -> None:
+        items = [{"pk": "batch-pk", "sk": f"sk-{i:03d}", "idx": i} for i in range(120)]
+        put_result = storage_service.batch_put(TABLE, items)
+        assert put_result.is_success
+        assert put_result.data == 120
+
+        keys = [{"pk": "batch-pk", "sk": f"sk-{i:03d}"} for i in range(120)] + [{"pk": "batch-pk", "sk": "missing"}]
+        get_result = storage_service.batch_get(TABLE, keys)
+        assert get_result.is_success
+        assert get_result.data is not None
+        assert sorted(item["idx"] for item in get_result.data) == list(range(120))
+
+        delete_result = storage_service.batch_delete(TABLE, keys[:100])
+        assert delete_result.is_success
+        remaining = storage_service.query(TABLE, key_condition="pk = :pk", expression_values={":pk": "batch-pk"})
+        assert remaining.data is not None
+        assert len(remaining.data) == 20
+
+
+class TestTransactWrite:
+    """TransactWriteItems applies every operation or none of them."""
+
+    def test_failed_condition_cancels_whole_transaction(self, storage_service: DynamoDBStorageService) -> None:
+        storage_service.put(TABLE, {"pk": "txn-pk", "sk": "existing"})
+
+        result = storage_service.transact_write(
+            [
+                {"Put": {"TableName": TABLE, "Item": {"pk": "txn-pk", "sk": "new"}}},
+                {
+                    "Put": {
+                        "TableName": TABLE,
+                        "Item": {"pk": "txn-pk", "sk": "existing"},
+                        "ConditionExpression": "attribute_not_exists(pk)",
+                    }
+                },
+            ]
+        )
+
+        assert not result.is_success
+        assert result.error_code == "TransactionCanceledException"
+        assert result.data == ["None", "ConditionalCheckFailed"]
+        assert storage_service.get(TABLE, {"pk": "txn-pk", "sk": "new"}).status == OperationStatus.NOT_FOUND
+
+    def test_transaction_commits_every_operation(self, storage_service: DynamoDBStorageService) -> None:
+        storage_service.put(TABLE, {"pk": "txn-pk", "sk": "old"})
+
+        result = storage_service.transact_write(
+            [
+                {"Put": {"TableName": TABLE, "Item": {"pk": "txn-pk", "sk": "new", "count": 1}}},
+                {"Delete": {"TableName": TABLE, "Key": {"pk": "txn-pk", "sk": "old"}}},
+            ]
+        )
+
+        assert result.is_success
+        assert storage_service.get(TABLE, {"pk": "txn-pk", "sk": "new"}).is_success
+        assert storage_service.get(TABLE, {"pk": "txn-pk", "sk": "old"}).status == OperationStatus.NOT_FOUND
+
+
+class TestScan:
+    """Segmented parallel scan covers every item exactly once."""
+
+    def test_parallel_scan_returns_every_item_once(self, storage_service: DynamoDBStorageService) -> None:
+        storage_service.batch_put(TABLE, [{"pk": f"scan-{i}", "sk": "sk", "idx": i} for i in range(60)])
+
+        pages = list(storage_service.scan(TABLE, segments=4, Limit=7))
+
+        assert all(page.is_success for page in pages)
+        assert sorted(item["idx"] for page in pages for item in page.data) == list(range(60))
+
+    def test_scan_applies_filter_expression(self, storage_service: DynamoDBStorageService) -> None:
+        storage_service.batch_put(TABLE, [{"pk": f"scan-{i}", "sk": "sk", "idx": i} for i in range(10)])
+
+        pages = storage_service.scan(TABLE, FilterExpression="idx >= :min", expression_values={":min": 7})
+
+        assert sorted(item["idx"] for page in pages for item in page.data) == [7, 8, 9]
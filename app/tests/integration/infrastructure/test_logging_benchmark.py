@@ -0,0 +1,92 @@
+"""Throughput benchmark for the structlog processor chain.
+
+Logs a sync-run style event (nested member lists, no secrets) through the
+base processor chain with three configurations and prints events/sec for
+each (``pytest -s``):
+
+- before: the previous redaction (every key lowercased and scanned against
+  each pattern, every container rebuilt) with callsite capture at every level;
+- after: the current chain with its defaults;
+- after, callsite at warning and above: ``LOG_CALLSITE_LEVELS`` trimmed the
+  way a busy deployment would set it.
+
+Like the other benchmarks it asserts on behaviour rather than wall time:
+the chains redact identically and a clean event is not copied.
+"""
+
+import time
+from typing import Any
+
+import pytest
+import structlog
+from structlog.testing import ReturnLogger
+
+from infrastructure.logging.formatters import SENSITIVE_PATTERNS, mask_sensitive_data
+from infrastructure.logging.settings import LoggingSettings
+from infrastructure.logging.setup import _build_base_processors
+
+pytestmark = pytest.mark.integration
+
+EVENTS = 2000
+MEMBERS = [{"email": f"user{index}@example.com", "role": "MEMBER", "type": "USER"} for index in range(20)]
+
+
+def _legacy_mask_sensitive_data(mask_value: str = "***REDACTED***"):
+    """The redaction processor as it was before the fast path."""
+
+    def is_sensitive(key: str) -> bool:
+        key_lower = key.lower()
+        return any(pattern in key_lower for pattern in SENSITIVE_PATTERNS)
+
+    def redact(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: mask_value if isinstance(key, str) and is_sensitive(key) and nested is not None else redact(nested)
+                for key, nested in value.items()
+            }
+        if isinstance(value, list):
+            return [redact(item) for item in value]
+        return value
+
+    def processor(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+        return {
+            key: mask_value if is_sensitive(key) and value is not None else redact(value) for key, value in event_dict.items()
+        }
+
+    return processor
+
+
+def _before_processors() -> list:
+    processors = _build_base_processors(logging_settings=LoggingSettings())
+    processors[-1] = _legacy_mask_sensitive_data()
+    return processors
+
+
+def _logger(processors: list):
+    return structlog.wrap_logger(ReturnLogger(), processors=[*processors, lambda _, __, event_dict: event_dict])
+
+
+def _events_per_second(processors: list) -> float:
+    logger = _logger(processors)
+    started = time.perf_counter()
+    for index in range(EVENTS):
+        logger.info("group_synced", group_id=f"group-{index}", operation="sync", members=MEMBERS, count=len(MEMBERS))
+    return EVENTS / (time.perf_counter() - started)
+
+
+def test_redaction_fast_path_throughput():
+    before = _before_processors()
+    after = _build_base_processors(logging_settings=LoggingSettings())
+    trimmed = _build_base_processors(logging_settings=LoggingSettings(LOG_CALLSITE_LEVELS=("warning", "error", "critical")))
+
+    event = {"event": "x", "config": {"api_token": "t", "hosts": [{"password": "p", "name": "a"}]}, "user": {"name": "b"}}
+    assert _legacy_mask_sensitive_data()(None, "info", dict(event)) == mask_sensitive_data()(None, "info", dict(event))
+    clean = {"event": "group_synced", "members": MEMBERS}
+    assert mask_sensitive_data()(None, "info", clean)["members"] is MEMBERS
+
+    rates = {
+        "before": _events_per_second(before),
+        "after": _events_per_second(after),
+        "after (callsite at warning+)": _events_per_second(trimmed),
+    }
+    print("log events/sec: " + ", ".join(f"{name}={rate:,.0f}" for name, rate in rates.items()))
@@ -0,0 +1,77 @@
+"""Per-call overhead benchmark for execute_google_api_call.
+
+Builds a real Admin SDK Directory service from the bundled discovery
+document, with a mocked request builder so no HTTP is sent, and runs a
+paginated-style ``members.list`` call repeatedly: once with every cache
+cleared before each call (resource walk, docstring parsing and kwargs
+conversion on every call, as before memoization) and once with the caches
+warm. The test asserts both return the same result and that the docstring
+is parsed once for the cached run; the timings are printed for comparison
+(``pytest -s``).
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from googleapiclient.discovery import build  # type: ignore
+from googleapiclient.http import RequestMockBuilder  # type: ignore
+
+from integrations.google_workspace import google_service
+
+pytestmark = pytest.mark.integration
+
+CALLS = 500
+RESPONSE = '{"members": [{"email": "member@test.com", "role": "MEMBER"}]}'
+
+
+def _call(page_token: str):
+    return google_service.execute_google_api_call(
+        "admin",
+        "directory_v1",
+        "members",
+        "list",
+        group_key="group@test.com",
+        page_token=page_token,
+        max_results=200,
+        fields="members(email, role),nextPageToken",
+    )
+
+
+def _time(clear: bool) -> float:
+    started = time.perf_counter()
+    for index in range(CALLS):
+        if clear:
+            google_service.clear_google_api_caches()
+        _call(str(index))
+    return (time.perf_counter() - started) / CALLS
+
+
+def test_cached_introspection_matches_and_parses_once():
+    service = build(
+        "admin",
+        "directory_v1",
+        developerKey="test",
+        static_discovery=True,
+        requestBuilder=RequestMockBuilder({"directory.members.list": (None, RESPONSE)}),
+    )
+    with (
+        patch.object(google_service, "get_google_service", return_value=service),
+        patch.object(
+            google_service,
+            "get_google_api_command_parameters",
+            wraps=google_service.get_google_api_command_parameters,
+        ) as parameters,
+    ):
+        uncached = _call("first")
+        assert _call("second") == uncached
+        assert uncached == ({"members": [{"email": "member@test.com", "role": "MEMBER"}]}, set())
+
+        uncached_seconds = _time(clear=True)
+        parameters.reset_mock()
+        cached_seconds = _time(clear=False)
+
+    assert parameters.call_count == 0
+    print(
+        f"execute_google_api_call overhead per call: uncached={uncached_seconds * 1e6:.1f}us, cached={cached_seconds * 1e6:.1f}us"
+    )
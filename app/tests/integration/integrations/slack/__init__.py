@@ -0,0 +1 @@
+"""Integration tests for the Slack integration."""
@@ -0,0 +1,107 @@
+"""Help generation benchmark for precompiled translation templates.
+
+Registers every module's Slack commands, loads the core and package
+catalogs the way the lifespan does, and renders the help of the full
+command tree (the top-level tree, the tree under every parent command and
+every command's own help) in both locales. The same help is rendered through a
+translator that re-parses every message on each call, as before templates
+were precompiled. The test asserts that both produce identical help and
+that rendering never compiles a message outside ``compile_catalogs``; the
+timings are printed for comparison (``pytest -s``). The provider's help
+cache is cleared between rounds so rendering is measured, and the cached
+time is printed alongside.
+"""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from infrastructure.i18n.loader import YAMLTranslationLoader
+from infrastructure.i18n.resources import I18nResourceSpec
+from infrastructure.i18n.service import TranslationService
+from infrastructure.i18n.templates import MessageTemplate, compile_template
+from infrastructure.i18n.translator import Translator
+from integrations.slack.provider import SlackPlatformProvider
+from modules.dev.platforms import slack as dev_slack
+from modules.sre.platforms import slack as sre_slack
+from packages.access.sync.interactions import slack as access_sync_slack
+from packages.geolocate.platforms import slack as geolocate_slack
+
+pytestmark = pytest.mark.integration
+
+APP_ROOT = Path(__file__).resolve().parents[4]
+LOCALES = ("en-US", "fr-FR")
+ROUNDS = 20
+
+
+class _UncompiledTranslator(Translator):
+    """Translator that parses the message on every call."""
+
+    def _template(self, message: str) -> MessageTemplate:
+        return compile_template(message)
+
+
+def _translator(translator_class: type[Translator]) -> Translator:
+    translator = translator_class(YAMLTranslationLoader(APP_ROOT / "locales"))
+    resources = [
+        I18nResourceSpec(owner="core", path=str(APP_ROOT / "locales")),
+        I18nResourceSpec(owner="packages.geolocate", path=str(APP_ROOT / "packages/geolocate/locales"), required=False),
+        I18nResourceSpec(owner="packages.access.sync", path=str(APP_ROOT / "packages/access/sync/locales"), required=False),
+    ]
+    assert TranslationService(translator).initialize(resources=resources).is_success
+    return translator
+
+
+def _provider(translator: Translator) -> SlackPlatformProvider:
+    settings = SimpleNamespace(ENABLED=True, SOCKET_MODE=True, APP_TOKEN="xapp-test", BOT_TOKEN="xoxb-test")
+    provider = SlackPlatformProvider(settings=settings, translation_service=translator)
+    for module in (sre_slack, dev_slack, access_sync_slack, geolocate_slack):
+        module.register_commands(provider)
+    return provider
+
+
+def _full_help(provider: SlackPlatformProvider) -> list[str]:
+    pages = []
+    for locale in LOCALES:
+        pages.append(provider.generate_help(locale=locale))
+        parents = {command.parent for command in provider._commands.values() if command.parent}
+        for path in sorted(provider._commands):
+            if path in parents:
+                pages.append(provider.generate_help(locale=locale, root_command=path))
+            pages.append(provider.generate_command_help(path, locale=locale))
+    return pages
+
+
+def _time(provider: SlackPlatformProvider, cached: bool = False) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        if not cached:
+            provider._help_generator.invalidate()
+        _full_help(provider)
+    return (time.perf_counter() - started) / ROUNDS
+
+
+def test_precompiled_templates_render_identical_help():
+    compiled = _translator(Translator)
+    uncompiled = _translator(_UncompiledTranslator)
+    compiled_provider = _provider(compiled)
+    uncompiled_provider = _provider(uncompiled)
+    templates = compiled.render_cache_stats()["templates"]
+
+    pages = _full_help(compiled_provider)
+    assert pages == _full_help(uncompiled_provider)
+    assert pages[0].startswith("*Available Commands*")
+    assert pages[len(pages) // 2].startswith("*Commandes disponibles*")
+
+    compiled_seconds = _time(compiled_provider)
+    uncompiled_seconds = _time(uncompiled_provider)
+    cached_seconds = _time(compiled_provider, cached=True)
+    print(
+        f"full help for {len(compiled_provider._commands)} commands in {len(LOCALES)} locales: "
+        f"precompiled={compiled_seconds * 1e3:.2f}ms, re-parsed={uncompiled_seconds * 1e3:.2f}ms, "
+        f"cached={cached_seconds * 1e3:.3f}ms"
+    )
+    # Every message used by help was compiled when the catalogs were loaded.
+    assert compiled.render_cache_stats()["templates"] == templates
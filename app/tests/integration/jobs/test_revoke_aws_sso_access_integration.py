@@ -82,7 +82,7 @@ class TestRevokeAWSAccessWorkflow:
         # Verify complete workflow was executed
         assert mock_identity_store.get_user_id.call_count == 2
         assert mock_sso.delete_account_assignment.call_count == 2
-        assert mock_aws_requests.expire_request.call_count == 2
+        mock_aws_requests.expire_requests.assert_called_once_with(aws_expired_requests)
         assert mock_slack_client_with_validation.chat_postEphemeral.call_count == 2
         assert mock_log_ops.call_count == 2
 
@@ -123,7 +123,7 @@ class TestRevokeAWSAccessWorkflow:
 
         # First request should succeed completely
         assert mock_sso.delete_account_assignment.call_count == 1
-        assert mock_aws_requests.expire_request.call_count == 1
+        mock_aws_requests.expire_requests.assert_called_once_with([aws_expired_requests[0]])
         assert mock_slack_client_with_validation.chat_postEphemeral.call_count == 1
         assert mock_log_ops.call_count == 1
 
@@ -23,6 +23,8 @@ class TestScheduledTasksInitialization:
         - Stale incident channel notification (daily at 16:00)
         - Scheduler heartbeat (every 5 minutes)
         - Integration healthchecks (every 5 minutes)
+        - Incident folder index refresh (every 5 minutes)
+        - AWS account catalog refresh (every 10 minutes)
         - Reconciliation batch processor (every 5 minutes)
         - AWS Identity Center provisioning (every 2 hours)
         - Spending data generation (daily at 00:00)
@@ -33,7 +35,7 @@ class TestScheduledTasksInitialization:
 
         # Count schedule.do() calls - one per task
         do_calls = [call for call in mock_schedule.mock_calls if ".do(" in str(call)]
-        assert len(do_calls) == 5  # Five total scheduled tasks
+        assert len(do_calls) == 7  # Seven total scheduled tasks
 
     @patch("jobs.scheduled_tasks.schedule")
     def test_init_respects_scheduling_times(self, mock_schedule) -> None:
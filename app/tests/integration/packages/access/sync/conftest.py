@@ -128,6 +128,9 @@ class FakeDirectory:
         # The membership question is answered by check_membership / get_user_groups.
         return OperationResult.success(data=self._make_group(slug))
 
+    def get_groups_batch(self, slugs: list[str]) -> OperationResult:
+        return OperationResult.success(data={slug: self._make_group(slug) for slug in slugs})
+
     def check_membership(self, group_email: str, user_email: str) -> OperationResult:
         slug = group_email.split("@")[0]
         is_member = slug in self._transitive
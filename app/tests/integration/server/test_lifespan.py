@@ -8,6 +8,7 @@ import pytest
 
 from server import lifespan as lifespan_module
 from server.lifespan import (
+    _build_startup_phases,
     _get_logger_from_app,
     _initialize_directory_provider,
     _is_test_environment,
@@ -167,6 +168,35 @@ def test_lifespan_stop_scheduled_tasks_sets_event():
     mock_event.set.assert_called_once()
 
 
+@pytest.mark.integration
+def test_lifespan_stop_scheduled_tasks_shuts_down_scheduled_jobs(monkeypatch):
+    """Test that _stop_scheduled_tasks clears the schedule and job executor once started."""
+    # Arrange
+    shutdown = MagicMock()
+    monkeypatch.setattr("server.lifespan.scheduled_tasks.shutdown", shutdown)
+
+    # Act
+    _stop_scheduled_tasks(None)
+    _stop_scheduled_tasks(MagicMock())
+
+    # Assert
+    shutdown.assert_called_once_with()
+
+
+@pytest.mark.integration
+def test_lifespan_stop_scheduled_tasks_shuts_down_healthcheck_runner(monkeypatch):
+    """Test that _stop_scheduled_tasks stops the healthcheck worker pool."""
+    # Arrange
+    shutdown = MagicMock()
+    monkeypatch.setattr("server.lifespan.shutdown_healthcheck_runner", shutdown)
+
+    # Act
+    _stop_scheduled_tasks(None)
+
+    # Assert
+    shutdown.assert_called_once_with()
+
+
 @pytest.mark.integration
 def test_lifespan_start_scheduled_tasks_runs_when_environment_is_prod(mock_settings, mock_bot, monkeypatch):
     """Test that _start_scheduled_tasks starts when ENVIRONMENT is production."""
@@ -276,3 +306,60 @@ def test_initialize_directory_provider_allows_failed_optional_warmup(monkeypatch
     # Assert
     assert app.state.directory_provider is mock_provider
     mock_provider.warmup.assert_not_called()
+
+
+@pytest.mark.integration
+def test_build_startup_phases_declares_dependency_graph(monkeypatch):
+    """Independent phases have no dependencies; feature registration waits for i18n and Slack."""
+    # Arrange
+    app = MagicMock()
+    mock_logger = MagicMock()
+    server_settings = MagicMock(STARTUP_PHASE_TIMEOUT_SECONDS=30.0)
+    directory_settings = MagicMock(require_startup_warmup=True)
+    monkeypatch.setattr("server.lifespan.get_plugin_manager", MagicMock)
+
+    # Act
+    phases = {phase.name: phase for phase in _build_startup_phases(app, server_settings, directory_settings, mock_logger)}
+
+    # Assert
+    assert set(phases) == {"security", "directory", "slack_provider", "i18n", "feature_registration"}
+    assert all(not phases[name].depends_on for name in ("security", "directory", "slack_provider", "i18n"))
+    assert set(phases["feature_registration"].depends_on) == {"i18n", "slack_provider"}
+    assert all(phase.required and phase.timeout_seconds == 30.0 for phase in phases.values())
+
+
+@pytest.mark.integration
+def test_build_startup_phases_skips_directory_warmup_by_default(monkeypatch):
+    """Without background warmup, a non-required directory warmup makes no directory calls."""
+    # Arrange
+    app = MagicMock()
+    server_settings = MagicMock(STARTUP_PHASE_TIMEOUT_SECONDS=30.0)
+    directory_settings = MagicMock(require_startup_warmup=False, background_warmup=False)
+    monkeypatch.setattr("server.lifespan.get_plugin_manager", MagicMock)
+
+    # Act
+    phases = {phase.name: phase for phase in _build_startup_phases(app, server_settings, directory_settings, MagicMock())}
+
+    # Assert
+    assert "directory_warmup" not in phases
+
+
+@pytest.mark.integration
+def test_build_startup_phases_adds_optional_directory_warmup(monkeypatch):
+    """An opted-in directory warmup runs after readiness when startup does not require it."""
+    # Arrange
+    app = MagicMock()
+    server_settings = MagicMock(STARTUP_PHASE_TIMEOUT_SECONDS=30.0)
+    directory_settings = MagicMock(require_startup_warmup=False, background_warmup=True)
+    monkeypatch.setattr("server.lifespan.get_plugin_manager", MagicMock)
+
+    # Act
+    phases = {phase.name: phase for phase in _build_startup_phases(app, server_settings, directory_settings, MagicMock())}
+
+    # Assert
+    warmup = phases["directory_warmup"]
+    assert warmup.required is False
+    assert warmup.depends_on == ("directory",)
+    app.state.directory_provider.warmup.return_value = MagicMock(is_success=False, message="credentials_invalid")
+    with pytest.raises(RuntimeError, match="directory_warmup_failed"):
+        warmup.run()
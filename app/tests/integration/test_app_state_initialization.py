@@ -122,3 +122,15 @@ def test_app_routes_respond_without_crashes(app_with_lifespan):
 
     # Should not be a 500 ASGI crash
     assert response.status_code != 500, "Got 500 ASGI crash, indicating app.state initialization failed"
+
+
+@pytest.mark.integration
+def test_app_state_readiness_reports_every_required_phase_succeeded(app_with_lifespan):
+    """Validate that readiness flips once the lifespan has handed over to the server."""
+    readiness = app_with_lifespan.app.state.readiness
+
+    snapshot = readiness.snapshot()
+    assert snapshot["ready"] is True
+    required = {name for name, phase in snapshot["phases"].items() if phase["required"]}
+    assert {"security", "directory", "slack_provider", "i18n", "feature_registration"} <= required
+    assert all(snapshot["phases"][name]["status"] == "succeeded" for name in required)
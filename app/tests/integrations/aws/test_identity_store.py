@@ -2,6 +2,7 @@ import os
 from unittest.mock import call, patch  # type: ignore
 
 import pytest
+from botocore.exceptions import ClientError  # type: ignore
 from pytest import fixture
 
 from integrations.aws import identity_store
@@ -701,8 +702,14 @@ def test_list_group_memberships_with_custom_id(mock_execute_aws_api_call):
     ]
 
 
+def memberships_by_group_id(groups, memberships):
+    """Memberships are listed concurrently, so answer by group id rather than call order."""
+    by_group_id = {group["GroupId"]: group_memberships for group, group_memberships in zip(groups, memberships, strict=False)}
+    return lambda group_id: by_group_id[group_id]
+
+
 @patch("integrations.aws.identity_store.list_groups")
-@patch("integrations.aws.identity_store.list_group_memberships")
+@patch("integrations.aws.identity_store._list_group_memberships")
 @patch("integrations.aws.identity_store.list_users")
 def test_list_groups_with_memberships(
     mock_list_users,
@@ -774,7 +781,7 @@ def test_list_groups_with_memberships(
     ]
     mock_list_groups.return_value = groups
 
-    mock_list_group_memberships.side_effect = memberships
+    mock_list_group_memberships.side_effect = memberships_by_group_id(groups, memberships)
 
     mock_list_users.return_value = users
 
@@ -784,7 +791,7 @@ def test_list_groups_with_memberships(
 
 
 @patch("integrations.aws.identity_store.list_groups")
-@patch("integrations.aws.identity_store.list_group_memberships")
+@patch("integrations.aws.identity_store._list_group_memberships")
 @patch("integrations.aws.identity_store.describe_user")
 def test_list_groups_with_memberships_empty_groups(
     mock_describe_user,
@@ -799,7 +806,7 @@ def test_list_groups_with_memberships_empty_groups(
 
 
 @patch("integrations.aws.identity_store.list_groups")
-@patch("integrations.aws.identity_store.list_group_memberships")
+@patch("integrations.aws.identity_store._list_group_memberships")
 @patch("integrations.aws.identity_store.list_users")
 def test_list_groups_with_memberships_filtered(
     mock_list_users,
@@ -876,7 +883,7 @@ def test_list_groups_with_memberships_filtered(
     ]
     mock_list_groups.return_value = groups
 
-    mock_list_group_memberships.side_effect = memberships
+    mock_list_group_memberships.side_effect = memberships_by_group_id(groups, memberships)
 
     mock_list_users.return_value = users
     groups_filters = [lambda group: "test-" in group["DisplayName"]]
@@ -885,3 +892,75 @@ def test_list_groups_with_memberships_filtered(
     assert result == expected_output
     assert mock_list_group_memberships.call_count == 2
     assert mock_list_users.call_count == 1
+
+
+def throttling_error():
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "ListGroupMemberships")
+
+
+@patch("integrations.aws.identity_store.time.sleep")
+@patch("integrations.aws.identity_store._list_group_memberships")
+def test_list_group_memberships_with_retry_retries_throttling(mock_list_group_memberships, mock_sleep):
+    mock_list_group_memberships.side_effect = [throttling_error(), throttling_error(), ["membership"]]
+
+    assert identity_store._list_group_memberships_with_retry("group_id") == ["membership"]
+    assert mock_list_group_memberships.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("integrations.aws.identity_store.time.sleep")
+@patch("integrations.aws.identity_store._list_group_memberships")
+def test_list_group_memberships_with_retry_raises_other_errors(mock_list_group_memberships, mock_sleep):
+    mock_list_group_memberships.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}}, "ListGroupMemberships"
+    )
+
+    with pytest.raises(ClientError):
+        identity_store._list_group_memberships_with_retry("group_id")
+    assert mock_sleep.call_count == 0
+
+
+def test_index_users_by_id(aws_users):
+    users = aws_users(2, prefix="test-")
+
+    assert identity_store.index_users_by_id(users) == {user["UserId"]: user for user in users}
+
+
+@patch("integrations.aws.identity_store.list_groups")
+@patch("integrations.aws.identity_store._list_group_memberships")
+@patch("integrations.aws.identity_store.list_users")
+def test_iter_groups_with_memberships_skips_failed_and_unresolved_groups(
+    mock_list_users,
+    mock_list_group_memberships,
+    mock_list_groups,
+    aws_groups,
+    aws_groups_memberships,
+    aws_users,
+):
+    groups = aws_groups(3, prefix="test-")
+    memberships = {
+        "test-aws-group_id1": RuntimeError("listing failed"),
+        "test-aws-group_id2": aws_groups_memberships(1, prefix="test-", group_id=2)["GroupMemberships"],
+        "test-aws-group_id3": aws_groups_memberships(2, prefix="test-", group_id=3)["GroupMemberships"],
+    }
+
+    def list_memberships(group_id):
+        result = memberships[group_id]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    mock_list_groups.return_value = groups
+    mock_list_group_memberships.side_effect = list_memberships
+    # Only the first user exists, so group 3's second member cannot be resolved.
+    mock_list_users.return_value = aws_users(1, prefix="test-")
+
+    result = list(identity_store.iter_groups_with_memberships())
+
+    assert [group["GroupId"] for group in result] == ["test-aws-group_id2"]
+    assert result[0]["GroupMemberships"][0]["MemberId"]["UserName"] == "test-user-email1@test.com"
+    assert mock_list_users.call_count == 1
+
+    tolerant = identity_store.list_groups_with_memberships(tolerate_errors=True)
+
+    assert [group["GroupId"] for group in tolerant] == ["test-aws-group_id2", "test-aws-group_id3"]
@@ -1,6 +1,9 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from integrations.aws.organizations import (
+    AccountCatalog,
     get_account_details,
     get_account_id_by_name,
     get_account_tags,
@@ -422,3 +425,119 @@ def test_get_account_id_by_name_case_sensitivity(mock_list_organization_accounts
 
     account_id = get_account_id_by_name("TestAccount1")
     assert account_id == "123456789012"
+
+
+@patch("integrations.aws.organizations.list_organization_accounts")
+def test_account_lookups_share_one_listing(mock_list_organization_accounts):
+    mock_list_organization_accounts.return_value = [
+        {"Id": "123456789012", "Name": "TestAccount1", "Status": "ACTIVE"},
+        {"Id": "234567890123", "Name": "TestAccount2", "Status": "SUSPENDED"},
+    ]
+
+    assert get_account_id_by_name("TestAccount2") == "234567890123"
+    assert get_active_account_names() == ["TestAccount1"]
+
+    mock_list_organization_accounts.assert_called_once()
+
+
+@pytest.fixture
+def make_catalog(fake_clock):
+    """Build an AccountCatalog on the fake clock that queues refreshes instead of starting them."""
+
+    def _factory(loader, tags_loader=None, ttl_seconds=60):
+        refreshes = []
+        catalog = AccountCatalog(
+            loader,
+            tags_loader or MagicMock(return_value=[]),
+            ttl_seconds=ttl_seconds,
+            clock=fake_clock,
+            start_refresh=refreshes.append,
+        )
+        return catalog, refreshes
+
+    return _factory
+
+
+def test_account_catalog_indexes_accounts(make_catalog):
+    loader = MagicMock(
+        return_value=[
+            {"Id": "1", "Name": "Prod", "Status": "ACTIVE"},
+            {"Id": "2", "Name": "Dev", "Status": "ACTIVE"},
+        ]
+    )
+    catalog, _ = make_catalog(loader)
+
+    assert [account["Id"] for account in catalog.accounts()] == ["1", "2"]
+    assert catalog.get("2")["Name"] == "Dev"
+    assert catalog.find_by_name("Prod")["Id"] == "1"
+    assert catalog.get("3") is None
+    assert catalog.find_by_name("prod") is None
+    loader.assert_called_once()
+    assert catalog.stats()["accounts"] == 2
+
+
+def test_account_catalog_serves_stale_while_refreshing(make_catalog, fake_clock):
+    loader = MagicMock(side_effect=[[{"Id": "1", "Name": "Old"}], [{"Id": "1", "Name": "New"}]])
+    catalog, refreshes = make_catalog(loader)
+    catalog.accounts()
+
+    fake_clock.now = 61
+    assert catalog.get("1")["Name"] == "Old"
+    assert catalog.get("1")["Name"] == "Old"
+    # A single background refresh is started for concurrent stale reads.
+    assert len(refreshes) == 1
+
+    refreshes[0]()
+
+    assert catalog.get("1")["Name"] == "New"
+    stats = catalog.stats()
+    assert stats["stale_hits"] == 2
+    assert stats["loads"] == 2
+    assert stats["refreshing"] is False
+    assert stats["age_seconds"] == 0
+
+
+def test_account_catalog_keeps_accounts_when_refresh_fails(make_catalog):
+    loader = MagicMock(side_effect=[[{"Id": "1", "Name": "Prod"}], False])
+    catalog, _ = make_catalog(loader)
+    catalog.accounts()
+
+    catalog.refresh()
+
+    assert catalog.get("1")["Name"] == "Prod"
+    assert catalog.stats()["load_failures"] == 1
+
+
+def test_account_catalog_first_load_failure_raises(make_catalog):
+    catalog, _ = make_catalog(MagicMock(side_effect=Exception("AccessDenied")))
+
+    with pytest.raises(Exception, match="AccessDenied"):
+        catalog.accounts()
+
+
+def test_account_catalog_invalidate_schedules_refresh(make_catalog):
+    loader = MagicMock(return_value=[{"Id": "1", "Name": "Prod"}])
+    catalog, refreshes = make_catalog(loader)
+    catalog.accounts()
+
+    catalog.invalidate()
+    catalog.accounts()
+
+    assert len(refreshes) == 1
+
+
+def test_account_catalog_caches_tags_for_ttl(make_catalog, fake_clock):
+    tags_loader = MagicMock(side_effect=[[{"Key": "team", "Value": "sre"}], False, [{"Key": "team", "Value": "ops"}]])
+    catalog, _ = make_catalog(MagicMock(return_value=[{"Id": "1", "Name": "Prod"}]), tags_loader)
+
+    assert catalog.tags("1") == [{"Key": "team", "Value": "sre"}]
+    assert catalog.tags("1") == [{"Key": "team", "Value": "sre"}]
+    assert tags_loader.call_count == 1
+
+    fake_clock.now = 61
+    # A failed reload serves the previous tags and is retried on the next read.
+    assert catalog.tags("1") == [{"Key": "team", "Value": "sre"}]
+    assert catalog.tags("1") == [{"Key": "team", "Value": "ops"}]
+    stats = catalog.stats()
+    assert stats["tag_hits"] == 1
+    assert stats["tag_misses"] == 3
@@ -1,6 +1,6 @@
 """Unit tests for google_directory module."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
@@ -250,6 +250,7 @@ def test_add_users_to_group_skips_when_no_members(mock_list_group_members):
     assert group.get("members") is None
 
 
+@patch("integrations.google_workspace.google_directory._list_members_batch", return_value={})
 @patch("integrations.google_workspace.google_directory.list_users")
 @patch("integrations.google_workspace.google_directory.retry_request")
 @patch("integrations.google_workspace.google_directory.list_groups")
@@ -257,6 +258,7 @@ def test_list_groups_with_members(
     mock_list_groups,
     mock_retry_request,
     mock_list_users,
+    _mock_list_members_batch,
     google_groups,
     google_group_members,
     google_users,
@@ -276,6 +278,7 @@ def test_list_groups_with_members(
     assert google_directory.list_groups_with_members() == groups_with_users
 
 
+@patch("integrations.google_workspace.google_directory._list_members_batch", return_value={})
 @patch("integrations.google_workspace.google_directory.filters.filter_by_condition")
 @patch("integrations.google_workspace.google_directory.list_users")
 @patch("integrations.google_workspace.google_directory.retry_request")
@@ -285,6 +288,7 @@ def test_list_groups_with_members_filtered(
     mock_retry_request,
     mock_list_users,
     mock_filter_by_condition,
+    _mock_list_members_batch,
     google_groups,
     google_group_members,
     google_users,
@@ -311,6 +315,7 @@ def test_list_groups_with_members_filtered(
     assert mock_list_users.call_count == 1
 
 
+@patch("integrations.google_workspace.google_directory._list_members_batch", return_value={})
 @patch("integrations.google_workspace.google_directory.list_users")
 @patch("integrations.google_workspace.google_directory.retry_request")
 @patch("integrations.google_workspace.google_directory.list_groups")
@@ -318,6 +323,7 @@ def test_list_groups_with_members_error_in_list_group_members(
     mock_list_groups,
     mock_retry_request,
     mock_list_users,
+    _mock_list_members_batch,
     google_groups,
     google_group_members,
     google_users,
@@ -345,6 +351,7 @@ def test_list_groups_with_members_error_in_list_group_members(
     assert google_directory.list_groups_with_members() == expected_groups_with_users
 
 
+@patch("integrations.google_workspace.google_directory._list_members_batch", return_value={})
 @patch("integrations.google_workspace.google_directory.list_users")
 @patch("integrations.google_workspace.google_directory.get_members_details")
 @patch("integrations.google_workspace.google_directory.retry_request")
@@ -354,6 +361,7 @@ def test_list_groups_with_members_error_in_get_user(
     mock_retry_request,
     mock_get_members_details,
     mock_list_users,
+    _mock_list_members_batch,
     google_groups,
     google_group_members,
     google_users,
@@ -387,6 +395,7 @@ def test_list_groups_with_members_error_in_get_user(
     assert google_directory.list_groups_with_members() == expected_groups_with_users
 
 
+@patch("integrations.google_workspace.google_directory._list_members_batch", return_value={})
 @patch("integrations.google_workspace.google_directory.list_users")
 @patch("integrations.google_workspace.google_directory.retry_request")
 @patch("integrations.google_workspace.google_directory.list_groups")
@@ -394,6 +403,7 @@ def test_list_groups_with_members_tolerate_errors(
     mock_list_groups,
     mock_retry_request,
     mock_list_users,
+    _mock_list_members_batch,
     google_groups_w_users,
 ):
 
@@ -502,6 +512,7 @@ def test_list_groups_with_members_skips_when_no_groups(mock_list_groups):
     assert google_directory.list_groups_with_members() == []
 
 
+@patch("integrations.google_workspace.google_directory._list_members_batch", return_value={})
 @patch("integrations.google_workspace.google_directory.filters.filter_by_condition")
 @patch("integrations.google_workspace.google_directory.list_users")
 @patch("integrations.google_workspace.google_directory.retry_request")
@@ -511,6 +522,7 @@ def test_list_groups_with_members_filtered_dataframe(
     mock_retry_request,
     mock_list_users,
     mock_filter_by_condition,
+    _mock_list_members_batch,
     google_groups,
     google_group_members,
     google_users,
@@ -590,3 +602,178 @@ def test_get_members_details_continues_on_tolerate_errors():
         },
     ]
     assert result == expected_result
+
+
+class _FakeBatch:
+    """Fake HTTP batch that answers each members.list request with canned pages."""
+
+    def __init__(self, callback, pages, calls):
+        self._callback = callback
+        self._pages = pages
+        self._calls = calls
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        self._calls.append([params for _, params in self._requests])
+        for request_id, params in self._requests:
+            response = self._pages[(params["groupKey"], params.get("pageToken"))]
+            if isinstance(response, Exception):
+                self._callback(request_id, None, response)
+            else:
+                self._callback(request_id, response, None)
+
+
+def _fake_directory_service(pages, calls):
+    service = MagicMock()
+    service.members.return_value.list.side_effect = lambda **params: params
+    service.new_batch_http_request.side_effect = lambda callback: _FakeBatch(callback, pages, calls)
+    return service
+
+
+@patch("integrations.google_workspace.google_directory.google_service.get_google_service")
+def test_list_members_for_groups_batches_and_follows_pages(mock_get_google_service):
+    calls = []
+    pages = {
+        ("a@example.com", None): {"members": [{"email": "1@example.com"}], "nextPageToken": "next"},
+        ("a@example.com", "next"): {"members": [{"email": "2@example.com"}]},
+        ("b@example.com", None): {"members": [{"email": "3@example.com"}]},
+        ("c@example.com", None): Exception("forbidden"),
+    }
+    mock_get_google_service.return_value = _fake_directory_service(pages, calls)
+
+    members = google_directory.list_members_for_groups(
+        ["a@example.com", "b@example.com", "c@example.com"], fields="members(email)", max_workers=1
+    )
+
+    assert members == {
+        "a@example.com": [{"email": "1@example.com"}, {"email": "2@example.com"}],
+        "b@example.com": [{"email": "3@example.com"}],
+    }
+    assert len(calls) == 2
+    assert [params["groupKey"] for params in calls[0]] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert calls[0][0]["fields"] == "nextPageToken,members(email)"
+    assert calls[1] == [
+        {"groupKey": "a@example.com", "maxResults": 200, "fields": "nextPageToken,members(email)", "pageToken": "next"}
+    ]
+
+
+@patch("integrations.google_workspace.google_directory.google_service.get_google_service")
+def test_list_members_for_groups_splits_groups_into_batches(mock_get_google_service):
+    calls = []
+    keys = [f"group{index}@example.com" for index in range(5)]
+    pages = {(key, None): {"members": []} for key in keys}
+    mock_get_google_service.return_value = _fake_directory_service(pages, calls)
+
+    members = google_directory.list_members_for_groups(keys, batch_size=2)
+
+    assert set(members) == set(keys)
+    assert sorted(len(batch) for batch in calls) == [1, 2, 2]
+
+
+@patch("integrations.google_workspace.google_directory.google_service.get_google_service")
+def test_list_members_for_groups_drops_groups_of_a_failed_batch(mock_get_google_service):
+    service = MagicMock()
+    service.new_batch_http_request.return_value.execute.side_effect = Exception("connection reset")
+    mock_get_google_service.return_value = service
+
+    assert google_directory.list_members_for_groups(["a@example.com"]) == {}
+
+
+def test_list_members_for_groups_without_groups():
+    assert google_directory.list_members_for_groups([]) == {}
+
+
+@patch("integrations.google_workspace.google_directory.retry_request")
+@patch("integrations.google_workspace.google_directory.list_users")
+@patch("integrations.google_workspace.google_directory.list_groups")
+@patch("integrations.google_workspace.google_directory.google_service.get_google_service")
+def test_list_groups_with_members_joins_batched_members_with_indexed_users(
+    mock_get_google_service,
+    mock_list_groups,
+    mock_list_users,
+    mock_retry_request,
+):
+    calls = []
+    pages = {
+        ("a@example.com", None): {"members": [{"email": "1@example.com", "role": "OWNER"}], "nextPageToken": "next"},
+        ("a@example.com", "next"): {"members": [{"email": "2@example.com", "role": "MEMBER"}]},
+        ("b@example.com", None): {"members": [{"email": "2@example.com", "role": "MEMBER"}]},
+        ("c@example.com", None): {"members": []},
+    }
+    mock_get_google_service.return_value = _fake_directory_service(pages, calls)
+    mock_list_groups.return_value = [
+        {"email": "a@example.com", "name": "A"},
+        {"email": "b@example.com", "name": "B"},
+        {"email": "c@example.com", "name": "C"},
+    ]
+    mock_list_users.return_value = [
+        {"primaryEmail": "1@example.com", "id": "user1"},
+        {"primaryEmail": "2@example.com", "id": "user2"},
+    ]
+
+    result = google_directory.list_groups_with_members()
+
+    assert result == [
+        {
+            "email": "a@example.com",
+            "name": "A",
+            "members": [
+                {"email": "1@example.com", "role": "OWNER", "primaryEmail": "1@example.com", "id": "user1"},
+                {"email": "2@example.com", "role": "MEMBER", "primaryEmail": "2@example.com", "id": "user2"},
+            ],
+        },
+        {
+            "email": "b@example.com",
+            "name": "B",
+            "members": [{"email": "2@example.com", "role": "MEMBER", "primaryEmail": "2@example.com", "id": "user2"}],
+        },
+    ]
+    assert calls[0][0]["fields"] == "nextPageToken,members(email, role, type, status)"
+    mock_list_users.assert_called_once()
+    mock_retry_request.assert_not_called()
+
+
+@patch("integrations.google_workspace.google_directory.retry_request")
+@patch("integrations.google_workspace.google_directory.list_users")
+@patch("integrations.google_workspace.google_directory.list_groups")
+@patch("integrations.google_workspace.google_directory.google_service.get_google_service")
+def test_iter_groups_with_members_retries_groups_missing_from_batch(
+    mock_get_google_service,
+    mock_list_groups,
+    mock_list_users,
+    mock_retry_request,
+):
+    pages = {
+        ("a@example.com", None): Exception("backend error"),
+        ("b@example.com", None): {"members": [{"email": "1@example.com"}]},
+    }
+    mock_get_google_service.return_value = _fake_directory_service(pages, [])
+    mock_list_groups.return_value = [{"email": "a@example.com", "name": "A"}, {"email": "b@example.com", "name": "B"}]
+    mock_list_users.return_value = [{"primaryEmail": "1@example.com"}]
+    mock_retry_request.return_value = [{"email": "1@example.com"}]
+
+    groups = google_directory.iter_groups_with_members()
+
+    assert not mock_list_groups.called
+    assert sorted(group["email"] for group in groups) == ["a@example.com", "b@example.com"]
+    mock_retry_request.assert_called_once_with(
+        google_directory.list_group_members,
+        "a@example.com",
+        max_attempts=3,
+        delay=1,
+        fields="members(email, role, type, status)",
+    )
+
+
+def test_get_members_details_accepts_indexed_users():
+    users_by_email = google_directory.index_users_by_email(
+        [{"primaryEmail": "email1", "id": "first"}, {"primaryEmail": "email1", "id": "duplicate"}, {"id": "no-email"}]
+    )
+
+    result = google_directory.get_members_details([{"email": "email1"}], users_by_email)
+
+    assert users_by_email == {"email1": {"primaryEmail": "email1", "id": "first"}}
+    assert result == [{"email": "email1", "primaryEmail": "email1", "id": "first"}]
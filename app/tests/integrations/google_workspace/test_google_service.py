@@ -1,5 +1,6 @@
 """Unit Tests for the google_service module."""
 
+import threading
 from json import JSONDecodeError
 from unittest.mock import MagicMock, patch
 
@@ -277,13 +278,11 @@ def test_execute_google_api_call_calls_get_google_service_with_delegated_user_em
     )
 
 
-@patch("integrations.google_workspace.google_service.convert_kwargs_to_camel_case")
 @patch("integrations.google_workspace.google_service.get_google_service")
 @patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
 def test_execute_google_api_call_calls_getattr_with_service_and_resource(
     mock_get_google_api_command_parameters,
     mock_get_google_service,
-    mock_convert_kwargs_to_camel_case,
 ):
     mock_service = MagicMock()
     mock_get_google_service.return_value = mock_service
@@ -293,16 +292,13 @@ def test_execute_google_api_call_calls_getattr_with_service_and_resource(
     mock_service.resource.assert_called_once()
 
 
-@patch("integrations.google_workspace.google_service.convert_kwargs_to_camel_case")
 @patch("integrations.google_workspace.google_service.get_google_service")
 @patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
 def test_execute_google_api_call_when_paginate_is_false(
     mock_get_google_api_command_parameters,
     mock_get_google_service,
-    mock_convert_kwargs_to_camel_case,
 ):
     mock_get_google_api_command_parameters.return_value = ["arg1"]
-    mock_convert_kwargs_to_camel_case.return_value = {"arg1": "value1"}
 
     mock_service = MagicMock()
     mock_get_google_service.return_value = mock_service
@@ -323,16 +319,13 @@ def test_execute_google_api_call_when_paginate_is_false(
     assert result == ({"key": "value"}, set())
 
 
-@patch("integrations.google_workspace.google_service.convert_kwargs_to_camel_case")
 @patch("integrations.google_workspace.google_service.get_google_service")
 @patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
 def test_execute_google_api_call_when_paginate_is_true(
     mock_get_google_api_command_parameters,
     mock_get_google_service,
-    mock_convert_kwargs_to_camel_case,
 ):
     mock_get_google_api_command_parameters.return_value = ["arg1"]
-    mock_convert_kwargs_to_camel_case.return_value = {"arg1": "value1"}
 
     mock_service = MagicMock()
     mock_get_google_service.return_value = mock_service
@@ -379,16 +372,13 @@ def test_execute_google_api_call_when_paginate_is_true(
     assert mock_method_next.call_count == 2
 
 
-@patch("integrations.google_workspace.google_service.convert_kwargs_to_camel_case")
 @patch("integrations.google_workspace.google_service.get_google_service")
 @patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
 def test_execute_google_api_call_with_nested_resource_path(
     mock_get_google_api_command_parameters,
     mock_get_google_service,
-    mock_convert_kwargs_to_camel_case,
 ):
     mock_get_google_api_command_parameters.return_value = ["arg1"]
-    mock_convert_kwargs_to_camel_case.return_value = {"arg1": "value1"}
 
     mock_service = MagicMock()
     mock_get_google_service.return_value = mock_service
@@ -411,16 +401,13 @@ def test_execute_google_api_call_with_nested_resource_path(
     assert result == ("result", set())
 
 
-@patch("integrations.google_workspace.google_service.convert_kwargs_to_camel_case")
 @patch("integrations.google_workspace.google_service.get_google_service")
 @patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
 def test_execute_google_api_call_with_nested_resource_path_throws_error(
     mock_get_google_api_command_parameters,
     mock_get_google_service,
-    mock_convert_kwargs_to_camel_case,
 ):
     mock_get_google_api_command_parameters.return_value = ["arg1"]
-    mock_convert_kwargs_to_camel_case.return_value = {"arg1": "value1"}
 
     mock_service = MagicMock()
     mock_get_google_service.return_value = mock_service
@@ -435,7 +422,6 @@ def test_execute_google_api_call_with_nested_resource_path_throws_error(
     assert "Error accessing resource2 on resource object" in str(e.value)
 
 
-@patch("integrations.google_workspace.google_service.convert_kwargs_to_camel_case")
 @patch("integrations.google_workspace.google_service.get_google_service")
 @patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
 @patch("integrations.google_workspace.google_service.getattr")
@@ -443,10 +429,8 @@ def test_execute_google_api_call_with_generic_exception_throws_attribute_error(
     mock_getattr,
     mock_get_google_api_command_parameters,
     mock_get_google_service,
-    mock_convert_kwargs_to_camel_case,
 ):
     mock_get_google_api_command_parameters.return_value = ["arg1"]
-    mock_convert_kwargs_to_camel_case.return_value = {"arg1": "value1"}
 
     mock_service = MagicMock()
     mock_get_google_service.getattr.return_value = mock_service
@@ -480,3 +464,67 @@ Returns:
     result = google_service.get_google_api_command_parameters(mock_resource, "method")
 
     assert result == ["fields", "arg1", "arg2"]
+
+
+@patch("integrations.google_workspace.google_service.get_google_service")
+@patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
+def test_execute_google_api_call_caches_resource_and_parameters(
+    mock_get_google_api_command_parameters,
+    mock_get_google_service,
+):
+    mock_get_google_api_command_parameters.return_value = ["groupKey", "pageToken"]
+    mock_service = MagicMock()
+    mock_get_google_service.return_value = mock_service
+    mock_resource = mock_service.members.return_value
+    mock_resource.list.return_value.execute.return_value = {"members": []}
+
+    for page_token in ("one", "two"):
+        google_service.execute_google_api_call(
+            "admin", "directory_v1", "members", "list", group_key="group", page_token=page_token
+        )
+
+    mock_get_google_service.assert_called_once()
+    mock_service.members.assert_called_once()
+    mock_get_google_api_command_parameters.assert_called_once_with(mock_resource, "list")
+    mock_resource.list.assert_called_with(groupKey="group", pageToken="two")
+
+    # Another delegated user gets its own resource object.
+    google_service.execute_google_api_call("admin", "directory_v1", "members", "list", delegated_user_email="other@email.com")
+
+    assert mock_get_google_service.call_count == 2
+    mock_get_google_api_command_parameters.assert_called_once()
+
+
+@patch("integrations.google_workspace.google_service.get_google_service")
+def test_execute_google_api_call_builds_a_resource_per_thread(mock_get_google_service):
+    mock_get_google_service.side_effect = lambda *args: MagicMock()
+    resources = []
+
+    def call():
+        google_service.execute_google_api_call("drive", "v3", "files", "list")
+        resources.append(google_service._get_resource("drive", "v3", "files", None, google_service.settings.SRE_BOT_EMAIL))
+
+    call()
+    thread = threading.Thread(target=call)
+    thread.start()
+    thread.join()
+
+    assert mock_get_google_service.call_count == 2
+    assert resources[0] is not resources[1]
+
+
+@patch("integrations.google_workspace.google_service.get_google_service")
+@patch("integrations.google_workspace.google_service.get_google_api_command_parameters")
+def test_execute_google_api_call_converts_nested_kwargs(
+    mock_get_google_api_command_parameters,
+    mock_get_google_service,
+):
+    mock_get_google_api_command_parameters.return_value = ["fileId", "body"]
+    mock_resource = mock_get_google_service.return_value.files.return_value
+
+    result = google_service.execute_google_api_call(
+        "drive", "v3", "files", "update", file_id="id", body={"app_properties": {"some_key": "value"}}, extra_param=1
+    )
+
+    mock_resource.update.assert_called_once_with(fileId="id", body={"appProperties": {"someKey": "value"}})
+    assert result[1] == {"extraParam"}
@@ -111,3 +111,35 @@ def test_append_values(mock_execute_google_api_call):
         valueInputOption="USER_ENTERED",
         insertDataOption="INSERT_ROWS",
     )
+
+
+@patch("integrations.google_workspace.sheets.execute_google_api_call")
+def test_batch_update_value_ranges(mock_execute_google_api_call):
+    data = [{"range": "'Sheet 1'!A1", "values": [["a"]]}, {"range": "'Sheet 2'!A1", "values": [["b"]]}]
+
+    sheets.batch_update_value_ranges("1", data)
+
+    mock_execute_google_api_call.assert_called_once_with(
+        "sheets",
+        "v4",
+        "spreadsheets.values",
+        "batchUpdate",
+        scopes=["https://www.googleapis.com/auth/spreadsheets"],
+        spreadsheetId="1",
+        body={"valueInputOption": "USER_ENTERED", "data": data},
+    )
+
+
+@patch("integrations.google_workspace.sheets.execute_google_api_call")
+def test_get_spreadsheet(mock_execute_google_api_call):
+    sheets.get_spreadsheet("1", fields="sheets.properties.title")
+
+    mock_execute_google_api_call.assert_called_once_with(
+        "sheets",
+        "v4",
+        "spreadsheets",
+        "get",
+        scopes=["https://www.googleapis.com/auth/spreadsheets"],
+        spreadsheetId="1",
+        fields="sheets.properties.title",
+    )
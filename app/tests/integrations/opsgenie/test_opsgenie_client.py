@@ -47,46 +47,31 @@ def test_create_alert_with_exception(api_post_request_mock):
     assert opsgenie.create_alert(description) == "Could not issue alert to Opsgenie!"
 
 
-@patch("integrations.opsgenie.client.Request")
-@patch("integrations.opsgenie.client.urlopen")
-def test_api_get_request(urlopen_mock, request_mock):
-    urlopen_mock.return_value.read.return_value.decode.return_value = '{"data": {"onCallParticipants": [{"name": "test_user"}]}}'
+@patch("integrations.opsgenie.client.get_opsgenie_http_client")
+def test_api_get_request(get_client_mock):
+    get_client_mock.return_value.get.return_value = '{"data": {"onCallParticipants": [{"name": "test_user"}]}}'
     assert (
         opsgenie.api_get_request("test_url", {"name": "GenieKey", "token": "OPSGENIE_KEY"})
         == '{"data": {"onCallParticipants": [{"name": "test_user"}]}}'
     )
 
-    request_mock.assert_called_once_with("test_url")
-    request_mock.return_value.add_header.assert_called_once_with("Authorization", "GenieKey OPSGENIE_KEY")
-    urlopen_mock.assert_called_once_with(request_mock.return_value)
+    get_client_mock.return_value.get.assert_called_once_with("test_url", "GenieKey OPSGENIE_KEY")
 
 
-@patch("integrations.opsgenie.client.Request")
-@patch("integrations.opsgenie.client.urlopen")
-def test_api_post_request(urlopen_mock, request_mock):
-    urlopen_mock.return_value.read.return_value.decode.return_value = (
+@patch("integrations.opsgenie.client.get_opsgenie_http_client")
+def test_api_post_request(get_client_mock):
+    get_client_mock.return_value.post.return_value = (
         '{"result": "Request will be processed", "took": 0.302, "requestId": "43a29c5c-3dbf-4fa4-9c26-f4f71023e120"}'
     )
+    payload = {
+        "message": "Notify API Key has been compromised!",
+        "description": "test_description",
+    }
     assert (
-        opsgenie.api_post_request(
-            "test_url",
-            {"name": "GenieKey", "token": "OPSGENIE_KEY"},
-            {
-                "message": "Notify API Key has been compromised!",
-                "description": "test_description",
-            },
-        )
+        opsgenie.api_post_request("test_url", {"name": "GenieKey", "token": "OPSGENIE_KEY"}, payload)
         == '{"result": "Request will be processed", "took": 0.302, "requestId": "43a29c5c-3dbf-4fa4-9c26-f4f71023e120"}'
     )
-    request_mock.assert_called_once_with(
-        "test_url",
-        data=b'{"message": "Notify API Key has been compromised!", "description": "test_description"}',
-    )
-    request_mock.return_value.add_header.assert_called_with(
-        "Authorization",
-        "GenieKey OPSGENIE_KEY",
-    )
-    urlopen_mock.assert_called_once_with(request_mock.return_value)
+    get_client_mock.return_value.post.assert_called_once_with("test_url", "GenieKey OPSGENIE_KEY", payload)
 
 
 @patch("integrations.opsgenie.client.api_get_request")
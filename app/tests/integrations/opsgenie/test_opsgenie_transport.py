@@ -0,0 +1,142 @@
+"""Tests for the pooled OpsGenie HTTP transport against a local stub server."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from integrations.opsgenie.transport import OpsGenieHTTPClient, endpoint_name
+
+
+class _StubOpsGenie(BaseHTTPRequestHandler):
+    """Keep-alive stub that records the client port of every request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.bodies.append(json.loads(self.rfile.read(length)))  # type: ignore[attr-defined]
+        self._handle()
+
+    def _handle(self) -> None:
+        server = self.server
+        server.client_ports.append(self.client_address[1])  # type: ignore[attr-defined]
+        server.auth_headers.append(self.headers.get("Authorization"))  # type: ignore[attr-defined]
+        if server.delays:  # type: ignore[attr-defined]
+            time.sleep(server.delays.pop(0))  # type: ignore[attr-defined]
+        status, headers = server.responses.pop(0) if server.responses else (200, {})  # type: ignore[attr-defined]
+        body = json.dumps({"data": {"path": self.path}}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOpsGenie)
+    server.client_ports = []  # type: ignore[attr-defined]
+    server.auth_headers = []  # type: ignore[attr-defined]
+    server.bodies = []  # type: ignore[attr-defined]
+    server.responses = []  # type: ignore[attr-defined]
+    server.delays = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server: ThreadingHTTPServer, path: str) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{path}"
+
+
+@pytest.fixture
+def client() -> Iterator[OpsGenieHTTPClient]:
+    http_client = OpsGenieHTTPClient(connect_timeout=1, read_timeout=2, max_retries=2, backoff_factor=0)
+    yield http_client
+    http_client.close()
+
+
+def test_reuses_one_connection_for_sequential_requests(stub_server, client):
+    for schedule_id in ("a", "b", "c"):
+        body = client.get(_url(stub_server, f"/v2/schedules/{schedule_id}/timeline"), "GenieKey KEY")
+        assert json.loads(body)["data"]["path"] == f"/v2/schedules/{schedule_id}/timeline"
+
+    assert len(stub_server.client_ports) == 3
+    assert len(set(stub_server.client_ports)) == 1
+    assert stub_server.auth_headers == ["GenieKey KEY"] * 3
+
+
+def test_retries_429_honouring_retry_after(stub_server, client):
+    stub_server.responses = [(429, {"Retry-After": "0"}), (200, {})]
+
+    client.get(_url(stub_server, "/v2/schedules/a/on-calls"), "GenieKey KEY")
+
+    assert len(stub_server.client_ports) == 2
+
+
+def test_post_is_retried_on_429_but_not_on_5xx(stub_server, client):
+    stub_server.responses = [(429, {"Retry-After": "0"}), (200, {})]
+    client.post(_url(stub_server, "/v2/alerts"), "GenieKey KEY", {"message": "hi"})
+    assert stub_server.bodies == [{"message": "hi"}, {"message": "hi"}]
+
+    stub_server.responses = [(503, {})]
+    with pytest.raises(requests.HTTPError):
+        client.post(_url(stub_server, "/v2/alerts"), "GenieKey KEY", {"message": "again"})
+    assert len(stub_server.bodies) == 3
+
+
+def test_post_is_not_retried_after_read_timeout(stub_server):
+    http_client = OpsGenieHTTPClient(connect_timeout=1, read_timeout=0.2, max_retries=2, backoff_factor=0)
+    stub_server.delays = [0.5]
+
+    with pytest.raises(requests.ReadTimeout):
+        http_client.post(_url(stub_server, "/v2/alerts"), "GenieKey KEY", {"message": "hi"})
+    http_client.close()
+
+    assert stub_server.bodies == [{"message": "hi"}]
+
+
+def test_get_is_retried_after_read_timeout(stub_server):
+    http_client = OpsGenieHTTPClient(connect_timeout=1, read_timeout=0.2, max_retries=2, backoff_factor=0)
+    stub_server.delays = [0.5]
+
+    http_client.get(_url(stub_server, "/v2/schedules/a/on-calls"), "GenieKey KEY")
+    http_client.close()
+
+    assert len(stub_server.client_ports) == 2
+
+
+def test_raises_after_exhausting_retries_and_records_metrics(stub_server, client):
+    stub_server.responses = [(503, {}), (503, {}), (503, {})]
+
+    with pytest.raises(requests.HTTPError):
+        client.get(_url(stub_server, "/v2/schedules/abc/timeline"), "GenieKey KEY")
+    client.get(_url(stub_server, "/v2/schedules/def/timeline"), "GenieKey KEY")
+
+    stats = client.stats()["GET /v2/schedules/{id}/timeline"]
+    assert stats["count"] == 2
+    assert stats["errors"] == 1
+    assert stats["max_ms"] >= stats["avg_ms"] > 0
+
+
+def test_endpoint_name_collapses_identifiers():
+    assert endpoint_name("get", "https://api.opsgenie.com/v2/schedules/abc-123/timeline?x=1") == (
+        "GET /v2/schedules/{id}/timeline"
+    )
+    assert endpoint_name("POST", "https://api.opsgenie.com/v2/alerts") == "POST /v2/alerts"
@@ -20,6 +20,7 @@ def test_send_event_shared_key_not_provided():
     assert sentinel.send_event(event) is False
 
 
+@patch.object(sentinel.sentinel_settings, "SENTINEL_SHIPPER_ENABLED", False)
 @patch("integrations.sentinel.client.post_data")
 def test_send_event(post_data_mock):
     event = {}
@@ -27,6 +28,7 @@ def test_send_event(post_data_mock):
     post_data_mock.assert_called_once_with("SENTINEL_CUSTOMER_ID", "SENTINEL_SHARED_KEY", "{}", "SENTINEL_LOG_TYPE")
 
 
+@patch.object(sentinel.sentinel_settings, "SENTINEL_SHIPPER_ENABLED", False)
 @patch("integrations.sentinel.client.post_data")
 def test_send_event_serializes_datetime(post_data_mock):
     event = {"created_at": datetime(2026, 3, 12, 16, 30, tzinfo=UTC)}
@@ -36,6 +38,24 @@ def test_send_event_serializes_datetime(post_data_mock):
     assert "2026-03-12T16:30:00+00:00" in body
 
 
+@patch("integrations.sentinel.client.get_sentinel_shipper")
+@patch("integrations.sentinel.client.post_data")
+def test_send_event_queues_on_shipper_when_enabled(post_data_mock, get_shipper_mock):
+    get_shipper_mock.return_value.enqueue.return_value = True
+
+    assert sentinel.send_event({"created_at": datetime(2026, 3, 12, 16, 30, tzinfo=UTC)}) is True
+
+    get_shipper_mock.return_value.enqueue.assert_called_once_with('{"created_at": "2026-03-12T16:30:00+00:00"}')
+    post_data_mock.assert_not_called()
+
+
+@patch("integrations.sentinel.client.get_sentinel_shipper")
+def test_send_event_returns_false_when_shipper_drops(get_shipper_mock):
+    get_shipper_mock.return_value.enqueue.return_value = False
+
+    assert sentinel.send_event({}) is False
+
+
 def test_build_signature():
     body = "{}"
     method = "POST"
@@ -79,6 +99,7 @@ def test_post_data_failure(mock_requests):
     assert sentinel.post_data(customer_id, shared_key, body, log_type) is False
 
 
+@patch.object(sentinel.sentinel_settings, "SENTINEL_SHIPPER_ENABLED", False)
 @patch("integrations.sentinel.client.logger")
 @patch("integrations.sentinel.client.send_event")
 def test_log_to_sentinel(send_event_mock, logging_mock):
@@ -88,6 +109,15 @@ def test_log_to_sentinel(send_event_mock, logging_mock):
     bound_logger_mock.info.assert_called_with("sentinel_event_sent")
 
 
+@patch.object(sentinel.sentinel_settings, "SENTINEL_SHIPPER_ENABLED", True)
+@patch("integrations.sentinel.client.logger")
+@patch("integrations.sentinel.client.send_event")
+def test_log_to_sentinel_logs_enqueued_with_shipper(send_event_mock, logging_mock):
+    bound_logger_mock = logging_mock.bind.return_value
+    sentinel.log_to_sentinel("foo", {"bar": "baz"})
+    bound_logger_mock.info.assert_called_once_with("sentinel_event_enqueued")
+
+
 @patch("integrations.sentinel.client.send_event")
 @patch("integrations.sentinel.client.logger")
 def test_log_to_sentinel_logs_error(logging_mock, send_event_mock):
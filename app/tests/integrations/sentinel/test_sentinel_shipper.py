@@ -0,0 +1,143 @@
+"""Tests for the background, batched Sentinel shipper."""
+
+import json
+import threading
+from unittest.mock import patch
+
+from integrations.sentinel.shipper import SentinelShipper
+
+
+class _RecordingSender:
+    def __init__(self, results: list[bool] | None = None) -> None:
+        self.results = list(results or [])
+        self.batches: list[list] = []
+        self.sent = threading.Event()
+
+    def __call__(self, body: str) -> bool:
+        self.batches.append(json.loads(body))
+        self.sent.set()
+        return self.results.pop(0) if self.results else True
+
+
+def _event(i: int) -> str:
+    return json.dumps({"event": "e", "i": i})
+
+
+def test_flush_sends_queued_events_as_one_signed_batch():
+    sender = _RecordingSender()
+    shipper = SentinelShipper(sender, flush_interval_seconds=60)
+    for i in range(3):
+        shipper._queue.put_nowait(_event(i))
+
+    shipper.flush()
+
+    assert sender.batches == [[{"event": "e", "i": 0}, {"event": "e", "i": 1}, {"event": "e", "i": 2}]]
+    assert shipper.stats()["sent"] == 3
+    assert shipper.stats()["batches"] == 1
+
+
+@patch("integrations.sentinel.shipper.logger")
+def test_sent_batch_is_logged_after_the_post_succeeds(mock_logger):
+    sender = _RecordingSender(results=[False, True])
+    shipper = SentinelShipper(sender, sleep=lambda _: None)
+    shipper._queue.put_nowait(_event(1))
+
+    shipper.flush()
+
+    mock_logger.info.assert_called_once_with("sentinel_batch_sent", event_count=1, content_length=len(_event(1)) + 2, attempt=2)
+
+
+def test_batches_are_split_by_event_count_and_size():
+    sender = _RecordingSender()
+    shipper = SentinelShipper(sender, max_batch_events=2, max_batch_bytes=10_000)
+    for i in range(5):
+        shipper._queue.put_nowait(_event(i))
+    shipper.flush()
+    assert [len(batch) for batch in sender.batches] == [2, 2, 1]
+
+    sender = _RecordingSender()
+    event_size = len(_event(0))
+    shipper = SentinelShipper(sender, max_batch_bytes=2 * event_size + 4)
+    for i in range(3):
+        shipper._queue.put_nowait(_event(i))
+    shipper.flush()
+    assert [len(batch) for batch in sender.batches] == [2, 1]
+
+
+def test_worker_ships_events_in_background_and_drains_on_stop():
+    sender = _RecordingSender()
+    shipper = SentinelShipper(sender, flush_interval_seconds=0.05)
+
+    assert shipper.enqueue(_event(1))
+    assert sender.sent.wait(5)
+
+    shipper.enqueue(_event(2))
+    shipper.stop(timeout=5)
+
+    assert [event["i"] for batch in sender.batches for event in batch] == [1, 2]
+    assert shipper.stats()["queue_depth"] == 0
+
+
+def test_failed_batch_is_retried_with_backoff():
+    sleeps: list[float] = []
+    sender = _RecordingSender(results=[False, False, True])
+    shipper = SentinelShipper(sender, max_retries=3, backoff_seconds=0.5, sleep=sleeps.append)
+    shipper._queue.put_nowait(_event(1))
+
+    shipper.flush()
+
+    assert len(sender.batches) == 3
+    assert sleeps == [0.5, 1.0]
+    assert shipper.stats()["sent"] == 1
+
+
+def test_exhausted_batch_is_dropped_without_spill_path():
+    def failing(body: str) -> bool:
+        raise ConnectionError("unreachable")
+
+    shipper = SentinelShipper(failing, max_retries=1, sleep=lambda _: None)
+    shipper._queue.put_nowait(_event(1))
+
+    shipper.flush()
+
+    stats = shipper.stats()
+    assert stats["failed_batches"] == 1
+    assert stats["dropped"] == 1
+
+
+def test_full_queue_spills_to_disk_and_replays(tmp_path):
+    spill = tmp_path / "sentinel.jsonl"
+    sender = _RecordingSender()
+    shipper = SentinelShipper(sender, max_queue_size=1, spill_path=spill)
+    shipper._thread = threading.current_thread()  # keep the worker from starting
+
+    assert shipper.enqueue(_event(1))
+    assert shipper.enqueue(_event(2))
+
+    assert spill.read_text().splitlines() == [_event(2)]
+    assert shipper.stats()["spilled"] == 1
+
+    shipper.flush()
+    shipper._replay_spill()
+    shipper.flush()
+
+    assert [event["i"] for batch in sender.batches for event in batch] == [1, 2]
+    assert not spill.exists()
+
+
+def test_full_queue_drops_without_spill_path():
+    shipper = SentinelShipper(_RecordingSender(), max_queue_size=1)
+    shipper._thread = threading.current_thread()  # keep the worker from starting
+
+    assert shipper.enqueue(_event(1))
+    assert not shipper.enqueue(_event(2))
+
+    assert shipper.stats() == {
+        "enqueued": 1,
+        "sent": 0,
+        "batches": 0,
+        "failed_batches": 0,
+        "dropped": 1,
+        "spilled": 0,
+        "queue_depth": 1,
+    }
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, call, patch
 import pytest
 
 from integrations.utils.api import (
+    TokenBucket,
     convert_dict_to_camel_case,
     convert_dict_to_pascale_case,
     convert_kwargs_to_camel_case,
@@ -318,3 +319,32 @@ def test_retry_request_passes_args_and_kwargs():
     )
     assert result == "success"
     mock_func.assert_called_once_with("arg1", "arg2", kwarg1="kwarg1", kwarg2="kwarg2")
+
+
+def test_token_bucket_allows_bursts_up_to_capacity(fake_clock):
+    bucket = TokenBucket(1.0, 3, clock=fake_clock, sleep=fake_clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(3)]
+
+    assert waits == [0.0, 0.0, 0.0]
+    assert fake_clock.now == 0.0
+
+
+def test_token_bucket_waits_for_refill_when_empty(fake_clock):
+    bucket = TokenBucket(2.0, 1, clock=fake_clock, sleep=fake_clock.sleep)
+    bucket.acquire()
+
+    waited = bucket.acquire()
+
+    assert waited == pytest.approx(0.5)
+    assert fake_clock.now == pytest.approx(0.5)
+
+
+def test_token_bucket_refill_is_capped_at_capacity(fake_clock):
+    bucket = TokenBucket(1.0, 2, clock=fake_clock, sleep=fake_clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+    fake_clock.now += 100
+
+    assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(1.0)
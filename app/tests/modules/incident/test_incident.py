@@ -511,6 +511,47 @@ def test_submit_initiate_resources_creation_error(
     )
 
 
+@patch("modules.incident.incident.core")
+@patch("modules.incident.incident.log_to_sentinel")
+@patch("modules.incident.incident.logger")
+@patch("modules.incident.incident.incident_conversation")
+def test_submit_reports_incomplete_incident_resources(
+    mock_create_incident_conversation,
+    mock_logger,
+    _mock_log_to_sentinel,
+    mock_core,
+):
+    ack = MagicMock()
+    view = helper_generate_view()
+    say = MagicMock()
+    body = {"user": {"id": "user_id"}, "trigger_id": "trigger_id", "view": view}
+    client = MagicMock()
+    mock_create_incident_conversation.create_incident_conversation.return_value = {
+        "channel_id": "channel_id",
+        "channel_name": "channel_name",
+        "slug": "slug",
+    }
+    mock_core.initiate_resources_creation.return_value = {
+        "success": ["Set channel topic"],
+        "skipped": ["Created database record: skipped, meet did not complete"],
+        "errors": ["Created Meet space failed: meet error", "Created document timed out after 30s"],
+        "failed": ["meet", "document"],
+        "timed_out": ["document"],
+    }
+    incident.submit(ack, view, say, body, client)
+    say.assert_called_once_with(
+        text=":warning: Some incident resources could not be created:\n• `meet`\n• `document` (timed out, may still finish)\nPlease contact the SRE team.",
+        channel="channel_id",
+    )
+    mock_logger.error.assert_called_once_with(
+        "incident_resources_creation_incomplete",
+        errors=["Created Meet space failed: meet error", "Created document timed out after 30s"],
+        skipped=["Created database record: skipped, meet did not complete"],
+        incident_name="name",
+        channel_id="channel_id",
+    )
+
+
 def helper_options():
     return [{"text": {"type": "plain_text", "text": "name"}, "value": "id"}]
 
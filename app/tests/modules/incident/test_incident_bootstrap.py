@@ -0,0 +1,143 @@
+import contextvars
+import threading
+
+import pytest
+
+from modules.incident.bootstrap import BootstrapStep, StepSkipped, run_bootstrap_steps, running_abandoned_steps
+
+
+def test_independent_steps_overlap_and_dependents_receive_outputs():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def independent(value: str):
+        def run(_: dict) -> str:
+            # Both steps must be running at once to get past the barrier.
+            barrier.wait()
+            return value
+
+        return run
+
+    steps = [
+        BootstrapStep("meet", "Created Meet space", independent("meet_url")),
+        BootstrapStep("document", "Created document", independent("doc_id")),
+        BootstrapStep(
+            "record", "Created record", lambda inputs: (inputs["meet"], inputs["document"]), depends_on=("meet", "document")
+        ),
+    ]
+
+    results = run_bootstrap_steps(steps)
+
+    assert results["outputs"]["record"] == ("meet_url", "doc_id")
+    assert sorted(results["success"]) == ["Created Meet space", "Created document", "Created record"]
+    assert results["errors"] == []
+    assert set(results["timings"]) == {"meet", "document", "record"}
+
+
+def test_failed_step_skips_dependents_only():
+    def fail(_: dict) -> None:
+        raise RuntimeError("meet error")
+
+    steps = [
+        BootstrapStep("meet", "Created Meet space", fail),
+        BootstrapStep("bookmark", "Added bookmark", lambda _: None, depends_on=("meet",)),
+        BootstrapStep("message", "Posted message", lambda _: None, depends_on=("bookmark",)),
+        BootstrapStep("topic", "Set topic", lambda _: None),
+    ]
+
+    results = run_bootstrap_steps(steps)
+
+    assert results["errors"] == ["Created Meet space failed: meet error"]
+    assert results["skipped"] == [
+        "Added bookmark: skipped, meet did not complete",
+        "Posted message: skipped, bookmark did not complete",
+    ]
+    assert results["success"] == ["Set topic"]
+    assert results["failed"] == ["meet"]
+
+
+def test_steps_see_the_callers_contextvars():
+    incident_var: contextvars.ContextVar[str] = contextvars.ContextVar("incident_var")
+    incident_var.set("C123")
+
+    results = run_bootstrap_steps([BootstrapStep("topic", "Set topic", lambda _: incident_var.get())])
+
+    assert results["outputs"]["topic"] == "C123"
+
+
+def test_after_orders_steps_without_requiring_success():
+    order: list[str] = []
+
+    def skip(_: dict) -> None:
+        order.append("warning")
+        raise StepSkipped("Severity warning: no severity level given")
+
+    steps = [
+        BootstrapStep("message", "Posted message", lambda _: order.append("message"), after=("warning",)),
+        BootstrapStep("warning", "Posted warning", skip),
+    ]
+
+    results = run_bootstrap_steps(steps)
+
+    assert order == ["warning", "message"]
+    assert results["skipped"] == ["Severity warning: no severity level given"]
+    assert results["success"] == ["Posted message"]
+
+
+def test_timed_out_step_is_reported_and_abandoned():
+    release = threading.Event()
+    steps = [
+        BootstrapStep("document", "Created document", lambda _: release.wait(5), timeout_seconds=0.05),
+        BootstrapStep("sheet", "Added sheet row", lambda _: None, depends_on=("document",)),
+        BootstrapStep("topic", "Set topic", lambda _: None, marks_ready=True),
+    ]
+
+    try:
+        results = run_bootstrap_steps(steps)
+    finally:
+        release.set()
+
+    assert results["errors"] == ["Created document timed out after 0.05s"]
+    assert results["failed"] == ["document"]
+    assert results["timed_out"] == ["document"]
+    assert results["skipped"] == ["Added sheet row: skipped, document did not complete"]
+    assert results["ready_seconds"] is not None
+
+
+def test_timed_out_step_is_tracked_until_it_returns():
+    release = threading.Event()
+    returned = threading.Event()
+
+    def slow(_: dict) -> None:
+        release.wait(5)
+
+    steps = [BootstrapStep("document", "Created document", slow, timeout_seconds=0.05)]
+
+    try:
+        run_bootstrap_steps(steps, key="C123")
+        assert running_abandoned_steps("C123") == ["document"]
+        assert running_abandoned_steps("C999") == []
+    finally:
+        release.set()
+
+    for _ in range(100):
+        if not running_abandoned_steps("C123"):
+            returned.set()
+            break
+        returned.wait(0.01)
+    assert returned.is_set()
+
+
+@pytest.mark.parametrize(
+    ("steps", "message"),
+    [
+        ([BootstrapStep("a", "A", lambda _: None), BootstrapStep("a", "A", lambda _: None)], "Duplicate"),
+        ([BootstrapStep("a", "A", lambda _: None, depends_on=("b",))], "unknown step b"),
+        (
+            [BootstrapStep("a", "A", lambda _: None, after=("b",)), BootstrapStep("b", "B", lambda _: None, depends_on=("a",))],
+            "cycle",
+        ),
+    ],
+)
+def test_invalid_graph_is_rejected(steps, message):
+    with pytest.raises(ValueError, match=message):
+        run_bootstrap_steps(steps)
@@ -1,7 +1,5 @@
 from unittest.mock import ANY, MagicMock, call, patch
 
-import pytest
-
 from models.incidents import IncidentPayload
 from modules.incident import core
 
@@ -38,9 +36,7 @@ def _mock_successful_dependencies(
         "meetingUri": "https://meet.google.com/aaa-bbbb-ccc",
     }
     mock_incident_document.create_incident_document.return_value = "document_id"
-    mock_incident_folder.list_incident_folders.return_value = [
-        {"id": "folder", "name": "Team Name"},
-    ]
+    mock_incident_folder.get_incident_folder.return_value = {"id": "folder", "name": "Team Name"}
     mock_db_operations.create_incident.return_value = "incident_id"
 
 
@@ -90,9 +86,7 @@ def test_initiate_resources_creation_succeeds(
         "meetingCode": "aaa-bbbb-ccc",
     }
     mock_incident_document.create_incident_document.return_value = "document_id"  # which is used to form the url
-    mock_incident_folder.list_incident_folders.return_value = [
-        {"id": "folder", "name": "Team Name"},
-    ]
+    mock_incident_folder.get_incident_folder.return_value = {"id": "folder", "name": "Team Name"}
     mock_db_operations.create_incident.return_value = "incident_id"  # the id in the db
     client.usergroups_users_list.return_value = {
         "ok": True,
@@ -310,17 +304,22 @@ def test_initiate_resources_creation_oncall_fails(
 ):
     incident_payload = helper_generate_default_incident_params()
     mock_get_on_call_users_from_folder.side_effect = Exception("oncall error")
+    mock_google_meet.create_space.return_value = {"meetingUri": "meet_url"}
+    mock_incident_document.create_incident_document.return_value = "doc_id"
+    mock_db_operations.create_incident.return_value = "incident_id"
     client = MagicMock()
 
-    with pytest.raises(Exception) as excinfo:
-        core.initiate_resources_creation(client, incident_payload)
-    assert str(excinfo.value) == "oncall error"
+    results = core.initiate_resources_creation(client, incident_payload)
+
+    assert results["errors"] == ["Fetched on-call users failed: oncall error"]
+    assert "Invited responders: skipped, oncall did not complete" in results["skipped"]
     mock_create_incident_conversation.assert_not_called()
-    mock_google_meet.create_space.assert_not_called()
-    mock_incident_document.create_incident_document.assert_not_called()
-    mock_incident_folder.add_new_incident_to_list.assert_not_called()
-    mock_db_operations.create_incident.assert_not_called()
-    mock_logger.info.assert_not_called()
+    mock_google_meet.create_space.assert_called_once()
+    mock_incident_document.create_incident_document.assert_called_once_with("slug", "folder")
+    mock_incident_folder.add_new_incident_to_list.assert_called_once()
+    mock_db_operations.create_incident.assert_called_once()
+    mock_incident_document.update_boilerplate_text.assert_not_called()
+    client.conversations_invite.assert_called_once_with(channel="channel_id", users="user_id")
 
 
 @patch("modules.incident.core.logger")
@@ -342,17 +341,21 @@ def test_initiate_resources_creation_meet_fails(
     incident_payload = helper_generate_default_incident_params()
     mock_get_on_call_users_from_folder.return_value = []
     mock_google_meet.create_space.side_effect = Exception("meet error")
+    mock_incident_document.create_incident_document.return_value = "doc_id"
     client = MagicMock()
 
-    with pytest.raises(Exception) as excinfo:
-        core.initiate_resources_creation(client, incident_payload)
-    assert str(excinfo.value) == "meet error"
+    results = core.initiate_resources_creation(client, incident_payload)
+
+    assert results["errors"] == ["Created Meet space failed: meet error"]
+    assert results["ready_seconds"] is None
     mock_create_incident_conversation.assert_not_called()
     mock_google_meet.create_space.assert_called_once()
-    mock_incident_document.create_incident_document.assert_not_called()
-    mock_incident_folder.add_new_incident_to_list.assert_not_called()
-    mock_db_operations.create_incident.assert_not_called()
-    mock_logger.info.assert_not_called()
+    mock_incident_document.create_incident_document.assert_called_once_with("slug", "folder")
+    mock_incident_folder.add_new_incident_to_list.assert_called_once()
+    mock_db_operations.create_incident.assert_called_once()
+    assert mock_db_operations.create_incident.call_args.args[0]["meet_url"] == ""
+    assert not any(call.kwargs.get("title") == "Meet link" for call in client.bookmarks_add.call_args_list)
+    mock_logger.info.assert_any_call("incident_document_created", document_id="doc_id")
 
 
 @patch("modules.incident.core.logger")
@@ -377,15 +380,16 @@ def test_initiate_resources_creation_document_fails(
     mock_incident_document.create_incident_document.side_effect = Exception("doc error")
     client = MagicMock()
 
-    with pytest.raises(Exception) as excinfo:
-        core.initiate_resources_creation(client, incident_payload)
-    assert str(excinfo.value) == "doc error"
+    results = core.initiate_resources_creation(client, incident_payload)
+
+    assert results["errors"] == ["Created incident document failed: doc error"]
     mock_create_incident_conversation.assert_not_called()
     mock_google_meet.create_space.assert_called_once()
     mock_incident_document.create_incident_document.assert_called_once_with("slug", "folder")
     mock_incident_folder.add_new_incident_to_list.assert_not_called()
     mock_db_operations.create_incident.assert_not_called()
-    mock_logger.info.assert_not_called()
+    mock_incident_document.update_boilerplate_text.assert_not_called()
+    client.bookmarks_add.assert_called_once_with(channel_id="channel_id", title="Meet link", type="link", link="meet_url")
 
 
 @patch("modules.incident.core.logger")
@@ -411,13 +415,14 @@ def test_initiate_resources_creation_db_fails(
     mock_db_operations.create_incident.side_effect = Exception("db error")
     client = MagicMock()
 
-    with pytest.raises(Exception) as excinfo:
-        core.initiate_resources_creation(client, incident_payload)
-    assert str(excinfo.value) == "db error"
+    results = core.initiate_resources_creation(client, incident_payload)
+
+    assert results["errors"] == ["Created database record failed: db error"]
     mock_create_incident_conversation.assert_not_called()
     mock_google_meet.create_space.assert_called_once()
     mock_incident_document.create_incident_document.assert_called_once_with("slug", "folder")
     mock_incident_folder.add_new_incident_to_list.assert_called_once()
+    mock_incident_document.update_boilerplate_text.assert_called_once()
     mock_logger.info.assert_any_call("incident_document_created", document_id="doc_id")
 
 
@@ -1,14 +1,25 @@
 from unittest.mock import ANY, MagicMock, patch
 
+import pytest
+
 from modules.incident import incident_folder
 
 
+@pytest.fixture(autouse=True)
+def _reset_folder_index():
+    incident_folder.get_incident_folder_index.cache_clear()
+    yield
+    incident_folder.get_incident_folder_index.cache_clear()
+
+
 @patch("modules.incident.incident_folder.SRE_INCIDENT_FOLDER", "SRE_INCIDENT_FOLDER")
 @patch("modules.incident.incident_folder.google_drive")
 def test_list_incident_folders(google_drive_mock):
     google_drive_mock.list_folders_in_folder.return_value = [{"id": "foo", "name": "bar"}]
     assert incident_folder.list_incident_folders() == [{"id": "foo", "name": "bar"}]
-    google_drive_mock.list_folders_in_folder.assert_called_once_with("SRE_INCIDENT_FOLDER", "not name contains 'Templates'")
+    google_drive_mock.list_folders_in_folder.assert_called_once_with(
+        "SRE_INCIDENT_FOLDER", "not name contains 'Templates'", fields="files(id, name, appProperties)"
+    )
 
 
 @patch("modules.incident.incident_folder.SRE_INCIDENT_FOLDER", "SRE_INCIDENT_FOLDER")
@@ -22,7 +33,9 @@ def test_list_incident_folders_sorted(google_drive_mock):
         {"id": "foo", "name": "bar"},
         {"id": "baz", "name": "qux"},
     ]
-    google_drive_mock.list_folders_in_folder.assert_called_once_with("SRE_INCIDENT_FOLDER", "not name contains 'Templates'")
+    google_drive_mock.list_folders_in_folder.assert_called_once_with(
+        "SRE_INCIDENT_FOLDER", "not name contains 'Templates'", fields="files(id, name, appProperties)"
+    )
 
 
 @patch("modules.incident.incident_folder.google_drive.list_folders_in_folder")
@@ -108,6 +121,84 @@ def test_save_metadata(view_folder_metadata_mock, add_metadata_mock):
     )
 
 
+@patch("modules.incident.incident_folder.google_drive")
+def test_incident_folder_index_serves_lookups_from_one_listing(google_drive_mock):
+    google_drive_mock.list_folders_in_folder.return_value = [
+        {"id": "notify", "name": "Notify", "appProperties": {"genie_schedule": "schedule_id"}},
+        {"id": "forms", "name": "Forms"},
+    ]
+
+    assert incident_folder.find_incident_folder("notify")["id"] == "notify"
+    assert incident_folder.find_incident_folder("Unknown product") is None
+    assert incident_folder.get_incident_folder("forms")["name"] == "Forms"
+    assert incident_folder.get_incident_folder("missing") is None
+    assert incident_folder.get_folder_app_properties("notify") == {"genie_schedule": "schedule_id"}
+    assert incident_folder.get_folder_app_properties("forms") == {}
+    assert [folder["name"] for folder in incident_folder.list_incident_folders()] == ["Forms", "Notify"]
+    google_drive_mock.list_folders_in_folder.assert_called_once()
+    google_drive_mock.list_metadata.assert_not_called()
+
+
+@patch("modules.incident.incident_folder.google_drive")
+def test_get_folder_app_properties_falls_back_for_unindexed_folder(google_drive_mock):
+    google_drive_mock.list_folders_in_folder.return_value = []
+    google_drive_mock.list_metadata.return_value = {"id": "other", "appProperties": {"genie_schedule": "schedule_id"}}
+
+    assert incident_folder.get_folder_app_properties("other") == {"genie_schedule": "schedule_id"}
+    google_drive_mock.list_metadata.assert_called_once_with("other")
+
+
+def test_incident_folder_index_reloads_after_ttl_and_invalidate(fake_clock):
+    loader = MagicMock(return_value=[{"id": "foo", "name": "bar"}])
+    index = incident_folder.IncidentFolderIndex(loader, ttl_seconds=60, clock=fake_clock)
+
+    index.folders()
+    index.get("foo")
+    assert loader.call_count == 1
+    fake_clock.now = 60.0
+    index.folders()
+    assert loader.call_count == 2
+    index.invalidate()
+    index.get("foo")
+    assert loader.call_count == 3
+
+
+@patch("modules.incident.incident_folder.logger")
+def test_incident_folder_index_keeps_folders_when_refresh_fails(_logger_mock):
+    loader = MagicMock(side_effect=[[{"id": "foo", "name": "bar"}], RuntimeError("drive down")])
+    index = incident_folder.IncidentFolderIndex(loader, ttl_seconds=60)
+
+    index.refresh()
+    index.refresh()
+
+    assert index.find_by_name("BAR") == {"id": "foo", "name": "bar"}
+
+
+def test_incident_folder_index_raises_when_first_load_fails():
+    index = incident_folder.IncidentFolderIndex(MagicMock(side_effect=RuntimeError("drive down")), ttl_seconds=60)
+
+    with pytest.raises(RuntimeError, match="drive down"):
+        index.folders()
+
+
+@patch("modules.incident.incident_folder.google_drive")
+@patch("modules.incident.incident_folder.view_folder_metadata")
+def test_save_metadata_invalidates_folder_index(_view_folder_metadata_mock, google_drive_mock):
+    google_drive_mock.list_folders_in_folder.side_effect = [
+        [{"id": "bar", "name": "Product"}],
+        [{"id": "bar", "name": "Product", "appProperties": {"genie_schedule": "schedule_id"}}],
+    ]
+    view = {
+        "state": {"values": {"key": {"key": {"value": "genie_schedule"}}, "value": {"value": {"value": "schedule_id"}}}},
+        "private_metadata": "bar",
+    }
+    assert incident_folder.get_folder_app_properties("bar") == {}
+
+    incident_folder.save_metadata(MagicMock(), {"view": {}}, MagicMock(), view)
+
+    assert incident_folder.get_folder_app_properties("bar") == {"genie_schedule": "schedule_id"}
+
+
 @patch("modules.incident.incident_folder.google_drive")
 def test_get_folder_metadata(google_drive_mock):
     metadata = {
@@ -1,10 +1,23 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from modules.incident import on_call
 
 
+@pytest.fixture(autouse=True)
+def _folder_not_indexed():
+    # Folders missing from the index fall back to reading the folder metadata.
+    index = MagicMock()
+    index.get.return_value = None
+    on_call.get_on_call_users_cache.cache_clear()
+    with patch("modules.incident.incident_folder.get_incident_folder_index", return_value=index):
+        yield index
+    on_call.get_on_call_users_cache.cache_clear()
+
+
 @patch("modules.incident.on_call.get_on_call_users")
-@patch("modules.incident.on_call.get_folder_metadata")
+@patch("modules.incident.incident_folder.get_folder_metadata")
 def test_get_on_call_user_from_folder(
     mock_get_folder_metadata,
     mock_opsgenie_get_on_call_users,
@@ -39,7 +52,7 @@ def test_get_on_call_user_from_folder(
 
 
 @patch("modules.incident.on_call.get_on_call_users")
-@patch("modules.incident.on_call.get_folder_metadata")
+@patch("modules.incident.incident_folder.get_folder_metadata")
 def test_get_on_call_user_from_folder_tuple_metadata(
     mock_get_folder_metadata,
     mock_opsgenie_get_on_call_users,
@@ -79,7 +92,7 @@ def test_get_on_call_user_from_folder_tuple_metadata(
 
 
 @patch("modules.incident.on_call.get_on_call_users")
-@patch("modules.incident.on_call.get_folder_metadata")
+@patch("modules.incident.incident_folder.get_folder_metadata")
 def test_get_on_call_user_from_folder_no_genie_schedule(
     mock_get_folder_metadata,
     mock_opsgenie_get_on_call_users,
@@ -101,7 +114,7 @@ def test_get_on_call_user_from_folder_no_genie_schedule(
 
 
 @patch("modules.incident.on_call.get_on_call_users")
-@patch("modules.incident.on_call.get_folder_metadata")
+@patch("modules.incident.incident_folder.get_folder_metadata")
 def test_get_on_call_user_from_folder_any_type(
     mock_get_folder_metadata,
     mock_opsgenie_get_on_call_users,
@@ -121,7 +134,7 @@ def test_get_on_call_user_from_folder_any_type(
 
 
 @patch("modules.incident.on_call.get_on_call_users")
-@patch("modules.incident.on_call.get_folder_metadata")
+@patch("modules.incident.incident_folder.get_folder_metadata")
 def test_get_on_call_user_from_folder_handles_slack_lookup_exception(
     mock_get_folder_metadata,
     mock_opsgenie_get_on_call_users,
@@ -142,3 +155,61 @@ def test_get_on_call_user_from_folder_handles_slack_lookup_exception(
     assert result == []
     mock_opsgenie_get_on_call_users.assert_called_once_with("schedule_id")
     client.users_lookupByEmail.assert_called_once_with(email=email)
+
+
+@patch("modules.incident.on_call.get_on_call_users")
+@patch("modules.incident.incident_folder.get_folder_metadata")
+def test_get_on_call_user_from_folder_uses_indexed_app_properties(
+    mock_get_folder_metadata,
+    mock_opsgenie_get_on_call_users,
+    _folder_not_indexed,
+):
+    client = MagicMock()
+    _folder_not_indexed.get.return_value = {
+        "id": "folder_id",
+        "name": "Product",
+        "appProperties": {"genie_schedule": "schedule_id"},
+    }
+    mock_opsgenie_get_on_call_users.return_value = ["user@example.com"]
+    client.users_lookupByEmail.return_value = {"ok": True, "user": {"id": "U12345"}}
+
+    result = on_call.get_on_call_users_from_folder(client, "folder_id")
+
+    assert result == [{"id": "U12345"}]
+    mock_get_folder_metadata.assert_not_called()
+    mock_opsgenie_get_on_call_users.assert_called_once_with("schedule_id")
+
+
+@patch("modules.incident.on_call.get_on_call_users")
+@patch("modules.incident.incident_folder.get_folder_metadata")
+def test_get_on_call_user_from_folder_caches_schedule_users(
+    mock_get_folder_metadata,
+    mock_opsgenie_get_on_call_users,
+):
+    client = MagicMock()
+    mock_get_folder_metadata.return_value = {"appProperties": {"genie_schedule": "schedule_id"}}
+    mock_opsgenie_get_on_call_users.return_value = ["user@example.com"]
+    client.users_lookupByEmail.return_value = {"ok": True, "user": {"id": "U12345"}}
+
+    first = on_call.get_on_call_users_from_folder(client, "folder_id")
+    second = on_call.get_on_call_users_from_folder(client, "folder_id")
+
+    assert first == second == [{"id": "U12345"}]
+    mock_opsgenie_get_on_call_users.assert_called_once_with("schedule_id")
+    client.users_lookupByEmail.assert_called_once()
+
+
+def test_on_call_users_cache_expires_entries(fake_clock):
+    cache = on_call.OnCallUsersCache(ttl_seconds=60, clock=fake_clock)
+    cache.put("schedule_id", [{"id": "U12345"}])
+
+    assert cache.get("schedule_id") == [{"id": "U12345"}]
+    fake_clock.now = 60.0
+    assert cache.get("schedule_id") is None
+
+
+def test_on_call_users_cache_disabled_with_zero_ttl():
+    cache = on_call.OnCallUsersCache(ttl_seconds=0)
+    cache.put("schedule_id", [{"id": "U12345"}])
+
+    assert cache.get("schedule_id") is None
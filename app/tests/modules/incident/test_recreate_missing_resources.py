@@ -87,7 +87,7 @@ def test_recreate_missing_resources_all_missing(
     """Test recreating all resources when everything is missing."""
     # Setup mocks
     mock_db_operations.get_incident_by_channel_id.return_value = None
-    mock_incident_folder.list_incident_folders.return_value = [{"id": "folder_123", "name": "Test Product"}]
+    mock_incident_folder.find_incident_folder.return_value = {"id": "folder_123", "name": "Test Product"}
     mock_google_drive.list_files_in_folder.return_value = []
     mock_incident_document.create_incident_document.return_value = "doc_123"
     mock_on_call.get_on_call_users_from_folder.return_value = [
@@ -204,6 +204,62 @@ def test_recreate_missing_resources_all_exist(
     mock_db_operations.create_incident.assert_not_called()
 
 
+@patch("modules.incident.core.db_operations")
+@patch("modules.incident.core.incident_folder")
+@patch("modules.incident.core.incident_document")
+@patch("modules.incident.core.on_call")
+@patch("modules.incident.core.meet")
+@patch("modules.incident.core.google_drive")
+@patch("modules.incident.core.logger")
+def test_recreate_missing_resources_fills_empty_meet_url(
+    mock_logger,
+    mock_google_drive,
+    mock_meet,
+    mock_on_call,
+    mock_incident_document,
+    mock_incident_folder,
+    mock_db_operations,
+    mock_client,
+    basic_params,
+):
+    """A record created while Meet was down gets the new Meet link."""
+    mock_client.bookmarks_list.return_value = {
+        "ok": True,
+        "bookmarks": [
+            {
+                "title": "Incident report",
+                "link": "https://docs.google.com/document/d/existing_doc/edit",
+            },
+        ],
+    }
+    mock_db_operations.get_incident_by_channel_id.return_value = {
+        "id": {"S": "existing_incident"},
+        "channel_id": {"S": basic_params["channel_id"]},
+        "meet_url": {"S": ""},
+    }
+    mock_meet.create_space.return_value = {"meetingUri": "https://meet.google.com/new-meet"}
+    mock_incident_folder.get_incidents_from_sheet.return_value = [
+        {
+            "channel_id": basic_params["channel_id"],
+            "channel_name": basic_params["channel_name"],
+        }
+    ]
+
+    results = core.recreate_missing_resources(
+        mock_client,
+        basic_params["channel_id"],
+        basic_params["channel_name"],
+        basic_params["user_id"],
+    )
+
+    assert len(results["errors"]) == 0
+    assert "Added Meet link to database record" in results["success"]
+    mock_db_operations.create_incident.assert_not_called()
+    mock_db_operations.update_incident_field.assert_called_once_with(
+        "existing_incident", "meet_url", "https://meet.google.com/new-meet", basic_params["user_id"]
+    )
+
+
 @patch("modules.incident.core.db_operations")
 @patch("modules.incident.core.incident_folder")
 @patch("modules.incident.core.incident_document")
@@ -237,7 +293,7 @@ def test_recreate_missing_resources_partial_missing(
         "id": {"S": "existing_incident"},
         "channel_id": {"S": basic_params["channel_id"]},
     }
-    mock_incident_folder.list_incident_folders.return_value = [{"id": "folder_123", "name": "Test Product"}]
+    mock_incident_folder.find_incident_folder.return_value = {"id": "folder_123", "name": "Test Product"}
     mock_google_drive.list_files_in_folder.return_value = [{"id": "existing_doc_123", "name": "2024-001 Incident Report"}]
     mock_incident_folder.get_incidents_from_sheet.return_value = []
 
@@ -310,7 +366,7 @@ def test_recreate_missing_resources_unknown_product(
     """Test when product folder cannot be found."""
     # Setup mocks
     mock_db_operations.get_incident_by_channel_id.return_value = None
-    mock_incident_folder.list_incident_folders.return_value = [{"id": "folder_999", "name": "Different Product"}]
+    mock_incident_folder.find_incident_folder.return_value = None
     mock_meet.create_space.return_value = {"meetingUri": "https://meet.google.com/test-meet"}
 
     # Execute
@@ -368,3 +424,31 @@ def test_recreate_missing_resources_meet_creation_fails(
 
     # Other resources might still be created
     mock_logger.error.assert_called()
+
+
+@patch("modules.incident.core.running_abandoned_steps", return_value=["document", "meet"])
+@patch("modules.incident.core.db_operations")
+@patch("modules.incident.core.meet")
+@patch("modules.incident.core.logger")
+def test_recreate_missing_resources_waits_for_running_bootstrap(
+    mock_logger,
+    mock_meet,
+    mock_db_operations,
+    mock_running,
+    mock_client,
+    basic_params,
+):
+    """Test that nothing is recreated while timed-out bootstrap steps still run."""
+    results = core.recreate_missing_resources(
+        mock_client,
+        basic_params["channel_id"],
+        basic_params["channel_name"],
+        basic_params["user_id"],
+    )
+
+    mock_running.assert_called_once_with("C123456")
+    assert results["errors"] == ["Incident setup is still running (document, meet); try again once it has finished"]
+    assert results["success"] == []
+    mock_client.conversations_info.assert_not_called()
+    mock_meet.create_space.assert_not_called()
+    mock_db_operations.get_incident_by_channel_id.assert_not_called()
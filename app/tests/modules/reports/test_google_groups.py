@@ -0,0 +1,182 @@
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from modules.reports import core, google_groups
+
+
+def _group(name, email=None):
+    return {"name": name, "email": email or f"{name.lower()}@example.com"}
+
+
+@pytest.fixture
+def bucket():
+    with patch.object(google_groups, "get_sheets_write_bucket") as mock_get_bucket:
+        yield mock_get_bucket.return_value
+
+
+@patch.object(google_groups, "FOLDER_REPORTS_GOOGLE_GROUPS", "folder_id")
+@patch("modules.reports.google_groups.threading.Thread")
+def test_start_group_members_report_runs_in_background(mock_thread):
+    respond = MagicMock()
+
+    google_groups.start_group_members_report([], respond)
+
+    mock_thread.assert_called_once_with(
+        target=google_groups._run_group_members_report,
+        args=([], respond),
+        daemon=True,
+        name="google-groups-members-report",
+    )
+    mock_thread.return_value.start.assert_called_once()
+    respond.assert_called_once()
+
+
+@patch.object(google_groups, "FOLDER_REPORTS_GOOGLE_GROUPS", "")
+@patch("modules.reports.google_groups.threading.Thread")
+def test_start_group_members_report_requires_folder(mock_thread):
+    respond = MagicMock()
+
+    google_groups.start_group_members_report([], respond)
+
+    respond.assert_called_once_with("Google Drive folder for reports not set.")
+    mock_thread.assert_not_called()
+
+
+@patch.object(google_groups, "generate_group_members_report", side_effect=RuntimeError("boom"))
+def test_run_group_members_report_reports_failures(_mock_generate):
+    respond = MagicMock()
+
+    google_groups._run_group_members_report([], respond)
+
+    respond.assert_called_once_with("Google Groups Members report failed. Check the logs for details.")
+
+
+@patch("modules.reports.core.google_groups.start_group_members_report")
+def test_reports_command_starts_members_report(mock_start):
+    respond = MagicMock()
+
+    core.reports_command(
+        ["google-groups-members"],
+        MagicMock(),
+        {"user_id": "U1", "channel_id": "C1", "text": "google-groups-members"},
+        respond,
+        MagicMock(),
+        {},
+    )
+
+    mock_start.assert_called_once_with([], respond)
+
+
+@patch.object(google_groups, "FOLDER_REPORTS_GOOGLE_GROUPS", "folder_id")
+@patch.object(google_groups, "write_group_members_sheets")
+@patch("modules.reports.google_groups.google_directory")
+@patch("modules.reports.google_groups.google_drive")
+def test_generate_group_members_report_fetches_members_in_one_batched_call(mock_drive, mock_directory, mock_write):
+    mock_drive.find_files_by_name.return_value = [{"id": "file_id"}]
+    mock_directory.list_groups.return_value = [_group("Alpha"), _group("AWS-Admins"), _group("Beta")]
+    members = [{"email": "user@example.com", "role": "MEMBER"}]
+    mock_directory.list_members_for_groups.return_value = {"alpha@example.com": members}
+    respond = MagicMock()
+
+    google_groups.generate_group_members_report([], respond)
+
+    mock_directory.list_members_for_groups.assert_called_once_with(
+        ["alpha@example.com", "beta@example.com"], fields="members(email, role)"
+    )
+    mock_write.assert_called_once_with("file_id", [{**_group("Alpha"), "members": members}])
+    assert respond.call_args_list[-2] == call("Fetched the members of 1 groups (1 failed). Writing the report...")
+    assert respond.call_args_list[-1] == call("Google Groups Members report generated.")
+
+
+@patch.object(google_groups, "FOLDER_REPORTS_GOOGLE_GROUPS", "folder_id")
+@patch("modules.reports.google_groups.google_directory")
+@patch("modules.reports.google_groups.google_drive")
+def test_generate_group_members_report_without_groups(mock_drive, mock_directory):
+    mock_drive.find_files_by_name.return_value = []
+    mock_drive.create_file.return_value = {"id": "file_id"}
+    mock_directory.list_groups.return_value = [_group("AWS-Admins")]
+    respond = MagicMock()
+
+    google_groups.generate_group_members_report([], respond)
+
+    respond.assert_called_once_with("No groups found.")
+    mock_directory.list_members_for_groups.assert_not_called()
+
+
+@patch("modules.reports.google_groups.sheets")
+def test_write_group_members_sheets_adds_missing_sheets_and_writes_all_ranges(mock_sheets, bucket):
+    mock_sheets.get_spreadsheet.return_value = {"sheets": [{"properties": {"title": "Alpha"}}]}
+    groups = [
+        {"name": "Alpha", "members": [{"email": "a@example.com", "role": "OWNER"}]},
+        {"name": "Bob's group", "members": []},
+    ]
+
+    google_groups.write_group_members_sheets("file_id", groups)
+
+    mock_sheets.batch_update.assert_called_once_with(
+        "file_id", {"requests": [{"addSheet": {"properties": {"title": "Bob's group"}}}]}
+    )
+    mock_sheets.batch_update_value_ranges.assert_called_once_with(
+        "file_id",
+        [
+            {"range": "'Alpha'!A1", "values": [["Group Name", "Alpha"], ["Email", "Role"], ["a@example.com", "OWNER"]]},
+            {"range": "'Bob''s group'!A1", "values": [["Group Name", "Bob's group"], ["Email", "Role"]]},
+        ],
+    )
+    assert bucket.acquire.call_count == 2
+
+
+@patch("modules.reports.google_groups.sheets")
+def test_write_group_members_sheets_suffixes_colliding_titles(mock_sheets, bucket):
+    mock_sheets.get_spreadsheet.return_value = {"sheets": []}
+    prefix = "x" * 50
+    groups = [{"name": f"{prefix}-{suffix}", "members": []} for suffix in ("a", "b", "c")]
+
+    google_groups.write_group_members_sheets("file_id", groups)
+
+    titles = [request["addSheet"]["properties"]["title"] for request in mock_sheets.batch_update.call_args.args[1]["requests"]]
+    assert titles == [prefix, "x" * 46 + " (2)", "x" * 46 + " (3)"]
+    assert all(len(title) <= google_groups.SHEET_TITLE_MAX_LENGTH for title in titles)
+
+
+@patch.object(google_groups, "SHEETS_RANGES_PER_REQUEST", 2)
+@patch("modules.reports.google_groups.sheets")
+def test_write_group_members_sheets_chunks_value_ranges(mock_sheets, bucket):
+    mock_sheets.get_spreadsheet.return_value = {"sheets": []}
+    groups = [{"name": f"Group {index}", "members": []} for index in range(5)]
+
+    google_groups.write_group_members_sheets("file_id", groups)
+
+    assert mock_sheets.batch_update.call_count == 1
+    assert mock_sheets.batch_update_value_ranges.call_count == 3
+
+
+@patch("modules.reports.google_groups.time.sleep")
+def test_write_with_quota_backs_off_on_rate_limit(mock_sleep, bucket):
+    rate_limited = HttpError(MagicMock(status=429), b"quota")
+    func = MagicMock(side_effect=[rate_limited, "ok"], __name__="batch_update")
+
+    assert google_groups._write_with_quota(func, "file_id") == "ok"
+
+    mock_sleep.assert_called_once_with(google_groups.SHEETS_QUOTA_BACKOFF_SECONDS)
+    assert bucket.acquire.call_count == 2
+
+
+def test_write_with_quota_raises_other_errors(bucket):
+    func = MagicMock(side_effect=HttpError(MagicMock(status=400), b"bad"), __name__="batch_update")
+
+    with pytest.raises(HttpError):
+        google_groups._write_with_quota(func, "file_id")
+    assert func.call_count == 1
+
+
+@patch("modules.reports.google_groups.time.sleep")
+def test_write_with_quota_raises_when_rate_limited_on_every_attempt(mock_sleep, bucket):
+    func = MagicMock(side_effect=HttpError(MagicMock(status=429), b"quota"), __name__="batch_update")
+
+    with pytest.raises(HttpError):
+        google_groups._write_with_quota(func, "file_id")
+    assert func.call_count == google_groups.SHEETS_WRITE_ATTEMPTS
+    assert mock_sleep.call_count == google_groups.SHEETS_WRITE_ATTEMPTS - 1
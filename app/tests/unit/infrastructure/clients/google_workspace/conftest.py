@@ -3,11 +3,39 @@
 import json
 from collections.abc import Callable
 from typing import Any
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from googleapiclient.errors import HttpError
 
+from infrastructure.clients.google_workspace.rate_control import (
+    GoogleApiRateController,
+    RetryBudget,
+)
+
+
+@pytest.fixture
+def rate_controller(fake_clock) -> GoogleApiRateController:
+    """Rate controller on a fake clock."""
+    return GoogleApiRateController(
+        initial_rate=10.0,
+        min_rate=0.5,
+        max_rate=50.0,
+        retry_budget=RetryBudget(ratio=0.2, min_per_second=0.0, clock=fake_clock),
+        clock=fake_clock,
+        sleep=fake_clock.sleep,
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_google_api_rate_controller(rate_controller):
+    """Give every test its own fake-clock rate controller instead of the shared one."""
+    with patch(
+        "infrastructure.clients.google_workspace.executor.get_google_api_rate_controller",
+        return_value=rate_controller,
+    ):
+        yield
+
 
 @pytest.fixture
 def google_service_account_credentials() -> dict[str, Any]:
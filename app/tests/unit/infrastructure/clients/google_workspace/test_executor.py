@@ -16,35 +16,33 @@ from infrastructure.operations.result import OperationResult
 class TestCalculateRetryDelay:
     """Test suite for _calculate_retry_delay function."""
 
-    def test_rate_limit_delay(self):
-        """Test delay calculation for rate limit errors (429)."""
-        delay = _calculate_retry_delay(attempt=0, status_code=429)
-        assert delay == float(ERROR_CONFIG["rate_limit_delay"])
-        assert delay == 60.0
-
-    def test_exponential_backoff_first_attempt(self):
-        """Test exponential backoff for first retry attempt."""
-        delay = _calculate_retry_delay(attempt=0, status_code=500)
+    def test_retry_after_is_honoured(self):
+        """Test that the server's Retry-After wins over the backoff."""
+        assert _calculate_retry_delay(attempt=0, status_code=429, retry_after=7.0) == 7.0
+
+    @pytest.mark.parametrize("attempt", [0, 1, 2])
+    def test_rate_limit_without_retry_after_waits_for_quota_window(self, attempt):
+        """Test that a bare 429 waits between half and all of rate_limit_delay."""
+        rate_limit_delay = float(ERROR_CONFIG["rate_limit_delay"])
+        for _ in range(20):
+            delay = _calculate_retry_delay(attempt=attempt, status_code=429)
+            assert rate_limit_delay / 2 <= delay <= rate_limit_delay
+
+    @pytest.mark.parametrize("attempt", [0, 1, 2])
+    def test_full_jitter_backoff_is_bounded(self, attempt):
+        """Test that a 5xx backoff is drawn between 0 and factor * 2**attempt."""
         backoff_factor = float(ERROR_CONFIG["default_backoff_factor"])
-        expected = backoff_factor * (2**0)
-        assert delay == expected
-        assert delay == 1.0
+        with patch("infrastructure.clients.google_workspace.rate_control.random.uniform") as mock_uniform:
+            mock_uniform.side_effect = lambda low, high: high
+            delay = _calculate_retry_delay(attempt=attempt, status_code=503)
 
-    def test_exponential_backoff_second_attempt(self):
-        """Test exponential backoff for second retry attempt."""
-        delay = _calculate_retry_delay(attempt=1, status_code=500)
-        backoff_factor = float(ERROR_CONFIG["default_backoff_factor"])
-        expected = backoff_factor * (2**1)
-        assert delay == expected
-        assert delay == 2.0
+        mock_uniform.assert_called_once_with(0, backoff_factor * (2**attempt))
+        assert delay == backoff_factor * (2**attempt)
 
-    def test_exponential_backoff_third_attempt(self):
-        """Test exponential backoff for third retry attempt."""
-        delay = _calculate_retry_delay(attempt=2, status_code=503)
-        backoff_factor = float(ERROR_CONFIG["default_backoff_factor"])
-        expected = backoff_factor * (2**2)
-        assert delay == expected
-        assert delay == 4.0
+    def test_full_jitter_backoff_is_capped(self):
+        """Test that the backoff ceiling never exceeds max_backoff_seconds."""
+        for _ in range(20):
+            assert 0 <= _calculate_retry_delay(attempt=20, status_code=500) <= ERROR_CONFIG["max_backoff_seconds"]
 
 
 @pytest.mark.unit
@@ -87,18 +85,38 @@ class TestExecuteGoogleApiCall:
         assert result.is_success
         assert result.data == success_data
 
-    def test_rate_limit_error_uses_correct_delay(self, make_mock_request, mock_google_api_error):
-        """Test that rate limit errors use the configured delay."""
+    def test_rate_limit_error_honours_retry_after(self, make_mock_request, mock_google_api_error, rate_controller):
+        """Test that rate limit errors wait for Retry-After and slow the API down."""
         error = mock_google_api_error(status=429, reason="Rate Limit Exceeded")
+        error.resp.get = {"retry-after": "5"}.get
         success_data = {"id": "101"}
 
         api_callable = make_mock_request(side_effect=[error, success_data]).execute
 
         with patch("infrastructure.clients.google_workspace.executor.time.sleep") as mock_sleep:
-            result = execute_google_api_call("test_operation", api_callable)
+            result = execute_google_api_call("drive.files.get", api_callable, rate_controller=rate_controller)
 
         assert result.is_success
-        mock_sleep.assert_called_once_with(60.0)
+        mock_sleep.assert_called_once_with(5.0)
+        stats = rate_controller.stats()["apis"]["drive"]
+        assert stats["throttles"] == 1
+        assert stats["retries"] == 1
+        assert stats["rate_per_second"] < 10
+
+    def test_retry_budget_exhausted_stops_retrying(self, make_mock_request, mock_google_api_error, rate_controller):
+        """Test that a retry is not made when the shared budget is spent."""
+        error = mock_google_api_error(status=503, reason="Service Unavailable")
+        api_callable = make_mock_request(raise_error=error).execute
+        while rate_controller.retry_budget.try_acquire():
+            pass
+
+        with patch("infrastructure.clients.google_workspace.executor.time.sleep") as mock_sleep:
+            result = execute_google_api_call("test_operation", api_callable, rate_controller=rate_controller)
+
+        assert not result.is_success
+        assert result.error_code == "GOOGLE_API_ERROR_503"
+        mock_sleep.assert_not_called()
+        assert api_callable.call_count == 1
 
     def test_non_retryable_error_fails_immediately(self, make_mock_request, mock_google_api_error):
         """Test that non-retryable errors fail without retry."""
@@ -170,11 +188,15 @@ class TestExecuteGoogleApiCall:
         # Fail 3 times, succeed on 4th
         api_callable = make_mock_request(side_effect=[error, error, error, success_data]).execute
 
-        with patch("infrastructure.clients.google_workspace.executor.time.sleep") as mock_sleep:
+        with (
+            patch("infrastructure.clients.google_workspace.executor.time.sleep") as mock_sleep,
+            patch("infrastructure.clients.google_workspace.rate_control.random.uniform") as mock_uniform,
+        ):
+            mock_uniform.side_effect = lambda low, high: high
             result = execute_google_api_call("test_operation", api_callable)
 
         assert result.is_success
-        # Verify exponential backoff: 1.0, 2.0, 4.0
+        # Verify the jitter ceiling doubles: 1.0, 2.0, 4.0
         assert mock_sleep.call_count == 3
         delays = [call[0][0] for call in mock_sleep.call_args_list]
         assert delays == [1.0, 2.0, 4.0]
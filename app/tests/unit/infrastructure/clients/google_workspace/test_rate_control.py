@@ -0,0 +1,161 @@
+"""Unit tests for the Google Workspace adaptive rate controller."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import Mock
+
+import pytest
+
+from infrastructure.clients.google_workspace.rate_control import (
+    AdaptiveRateLimiter,
+    GoogleApiRateController,
+    RetryBudget,
+    parse_retry_after,
+)
+
+
+def make_limiter(clock, initial_rate: float = 10.0) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(
+        "directory", initial_rate=initial_rate, min_rate=1.0, max_rate=20.0, clock=clock, sleep=clock.sleep
+    )
+
+
+@pytest.mark.unit
+class TestAdaptiveRateLimiter:
+    """Test suite for AdaptiveRateLimiter."""
+
+    def test_paces_calls_at_current_rate(self, fake_clock):
+        limiter = make_limiter(fake_clock, initial_rate=2.0)
+
+        waits = [limiter.acquire() for _ in range(4)]
+
+        # The first token is available at once; the rest are spaced by 1 / rate.
+        assert waits == [0.0, 0.5, 0.5, 0.5]
+        assert fake_clock.now == pytest.approx(1.5)
+
+    def test_throttle_halves_rate_once_per_burst(self, fake_clock):
+        limiter = make_limiter(fake_clock)
+
+        for _ in range(5):
+            limiter.record_throttle()
+
+        assert limiter.rate == 5.0
+        assert limiter.stats()["throttles"] == 5
+
+        fake_clock.now += 1.0
+        limiter.record_throttle()
+
+        assert limiter.rate == 2.5
+
+    def test_rate_is_bounded(self, fake_clock):
+        limiter = make_limiter(fake_clock)
+
+        for _ in range(10):
+            limiter.record_throttle()
+            fake_clock.now += 1.0
+        assert limiter.rate == 1.0
+
+        for _ in range(1000):
+            limiter.record_success()
+        assert limiter.rate == 20.0
+
+    def test_success_increases_rate_additively(self, fake_clock):
+        limiter = make_limiter(fake_clock)
+
+        for _ in range(10):
+            limiter.record_success()
+
+        # About one request per second added per second of calls at the current rate.
+        assert 10.9 < limiter.rate < 11.0
+
+    def test_retry_after_pauses_every_caller(self, fake_clock):
+        limiter = make_limiter(fake_clock)
+
+        limiter.record_throttle(retry_after=3.0)
+        waited = limiter.acquire()
+
+        assert waited >= 3.0
+        assert fake_clock.now >= 3.0
+
+    def test_stats_report_effective_rate(self, fake_clock):
+        limiter = make_limiter(fake_clock)
+
+        for _ in range(30):
+            limiter.acquire()
+        limiter.record_retry()
+        stats = limiter.stats()
+
+        assert stats["requests"] == 30
+        assert stats["retries"] == 1
+        assert stats["effective_rate_per_second"] == 0.5
+
+        fake_clock.now += 120
+        assert limiter.stats()["effective_rate_per_second"] == 0.0
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    """Test suite for RetryBudget."""
+
+    def test_retries_limited_to_ratio_of_requests(self, fake_clock):
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, max_tokens=2.0, clock=fake_clock)
+        while budget.try_acquire():
+            pass
+
+        for _ in range(4):
+            budget.record_request()
+
+        assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+        assert budget.stats()["denied"] == 2
+
+    def test_reserve_refills_over_time(self, fake_clock):
+        budget = RetryBudget(ratio=0.0, min_per_second=1.0, clock=fake_clock)
+        while budget.try_acquire():
+            pass
+
+        fake_clock.now += 1.0
+
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+
+@pytest.mark.unit
+class TestParseRetryAfter:
+    """Test suite for parse_retry_after."""
+
+    @staticmethod
+    def error_with(headers: dict) -> Mock:
+        error = Mock()
+        error.resp.get = headers.get
+        return error
+
+    def test_seconds(self):
+        assert parse_retry_after(self.error_with({"retry-after": "12"})) == 12.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+        delay = parse_retry_after(self.error_with({"retry-after": format_datetime(retry_at, usegmt=True)}))
+
+        assert delay is not None
+        assert 25 < delay <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(self.error_with({"retry-after": value})) is None
+
+
+@pytest.mark.unit
+def test_controller_keeps_one_limiter_per_api(rate_controller: GoogleApiRateController):
+    directory = rate_controller.limiter("directory")
+
+    assert rate_controller.limiter("directory") is directory
+    assert rate_controller.limiter("drive") is not directory
+
+    directory.record_throttle()
+    stats = rate_controller.stats()
+
+    assert list(stats["apis"]) == ["directory", "drive"]
+    assert stats["apis"]["directory"]["throttles"] == 1
+    assert stats["apis"]["drive"]["throttles"] == 0
+    assert "tokens" in stats["retry_budget"]
@@ -154,6 +154,20 @@ class TestSettingsStructure:
 
         assert settings.GOOGLE_WORKSPACE_CUSTOMER_ID == "my_customer"
 
+    def test_google_workspace_settings_rate_control(self, monkeypatch):
+        """Verify Google API rate control defaults and environment overrides."""
+        monkeypatch.delenv("GOOGLE_API_INITIAL_RATE_PER_SECOND", raising=False)
+        settings = GoogleWorkspaceSettings.model_validate({})
+
+        assert settings.GOOGLE_API_INITIAL_RATE_PER_SECOND == 10.0
+        assert settings.GOOGLE_API_MIN_RATE_PER_SECOND == 0.5
+        assert settings.GOOGLE_API_MAX_RATE_PER_SECOND == 50.0
+        assert settings.GOOGLE_API_RETRY_BUDGET_RATIO == 0.2
+        assert settings.GOOGLE_API_RETRY_BUDGET_MIN_PER_SECOND == 1.0
+
+        monkeypatch.setenv("GOOGLE_API_INITIAL_RATE_PER_SECOND", "4")
+        assert GoogleWorkspaceSettings().GOOGLE_API_INITIAL_RATE_PER_SECOND == 4.0
+
     def test_all_feature_settings_classes_instantiable(self):
         """Verify all feature settings classes can be instantiated."""
         # Test that all feature settings classes are functional
@@ -933,3 +933,60 @@ class TestGetGroupMembersBatch:
 
         # Assert
         mock_google_clients.directory.get_batch_group_members.assert_called_once_with(["sg-aws-admin@example.com"])
+
+
+class TestGetGroupsBatch:
+    def test_maps_requested_keys_to_groups(self, provider, mock_google_clients):
+        # Arrange
+        mock_google_clients.directory.get_batch_groups.return_value = OperationResult.success(
+            data={
+                "sg-aws-admin@example.com": {"email": "sg-aws-admin@example.com", "id": "g1"},
+                "sg-aws-read@example.com": {"email": "sg-aws-read@example.com", "id": "g2"},
+            }
+        )
+
+        # Act
+        result = provider.get_groups_batch(["sg-aws-admin", "SG-AWS-Read@example.com"])
+
+        # Assert
+        assert result.is_success
+        assert result.data["sg-aws-admin"].provider_group_id == "g1"
+        assert result.data["SG-AWS-Read@example.com"].group_slug == "sg-aws-read"
+        mock_google_clients.directory.get_batch_groups.assert_called_once_with(
+            ["sg-aws-admin@example.com", "sg-aws-read@example.com"]
+        )
+
+    def test_omits_missing_and_invalid_groups(self, provider, mock_google_clients):
+        # Arrange
+        mock_google_clients.directory.get_batch_groups.return_value = OperationResult.success(
+            data={
+                "sg-aws-admin@example.com": {"email": "sg-aws-admin@example.com", "id": "g1"},
+                "sg-aws-gone@example.com": None,
+                "sg-aws-other@example.com": {"email": "sg-aws-other@other.org", "id": "g3"},
+            }
+        )
+
+        # Act
+        result = provider.get_groups_batch(["sg-aws-admin", "sg-aws-gone", "sg-aws-other"])
+
+        # Assert
+        assert result.is_success
+        assert set(result.data) == {"sg-aws-admin"}
+
+    def test_returns_empty_dict_for_empty_input(self, provider, mock_google_clients):
+        # Act
+        result = provider.get_groups_batch([])
+
+        # Assert
+        assert result.data == {}
+        mock_google_clients.directory.get_batch_groups.assert_not_called()
+
+    def test_propagates_batch_failure(self, provider, mock_google_clients):
+        # Arrange
+        mock_google_clients.directory.get_batch_groups.return_value = OperationResult.transient_error("batch_request_failed")
+
+        # Act
+        result = provider.get_groups_batch(["sg-aws-admin"])
+
+        # Assert
+        assert result.status == OperationStatus.TRANSIENT_ERROR
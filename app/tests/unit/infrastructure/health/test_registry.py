@@ -0,0 +1,34 @@
+"""Unit tests for the integration health status registry."""
+
+import pytest
+
+from infrastructure.health import HEALTHY, TIMED_OUT, UNHEALTHY, HealthStatusRegistry
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def registry() -> HealthStatusRegistry:
+    return HealthStatusRegistry()
+
+
+def test_registry_tracks_failure_streaks(registry):
+    registry.record("opsgenie", UNHEALTHY)
+    registry.record("opsgenie", TIMED_OUT)
+    assert registry.get("opsgenie")["consecutive_failures"] == 2
+    assert registry.get("opsgenie")["last_healthy_at"] is None
+
+    registry.record("opsgenie", HEALTHY, duration_seconds=0.12345)
+
+    entry = registry.get("opsgenie")
+    assert entry["consecutive_failures"] == 0
+    assert entry["last_healthy_at"] == entry["checked_at"]
+    assert entry["duration_seconds"] == 0.1235
+
+
+def test_snapshot_is_a_copy(registry):
+    registry.record("aws", HEALTHY)
+
+    registry.snapshot()["aws"]["status"] = UNHEALTHY
+
+    assert registry.get("aws")["status"] == HEALTHY
@@ -0,0 +1,48 @@
+"""Tests for infrastructure.i18n.templates module."""
+
+import pytest
+
+from infrastructure.i18n.templates import compile_template
+
+
+class TestCompileTemplate:
+    """Tests for compile_template()."""
+
+    def test_static_message_has_no_variables(self):
+        """Messages without placeholders compile to a single literal."""
+        template = compile_template("Available Commands")
+        assert template.is_static
+        assert template.segments == ("Available Commands",)
+        assert template.render({}) == "Available Commands"
+
+    def test_splits_literals_and_placeholders(self):
+        """Double- and single-brace placeholders become odd segments."""
+        template = compile_template("Incident {{incident_id}} has {count} item{plural}")
+        assert template.segments == ("Incident ", "incident_id", " has ", "count", " item", "plural", "")
+        assert template.variables == ("incident_id", "count", "plural")
+
+    def test_repeated_variable_is_listed_once(self):
+        """variables holds unique names in order of first occurrence."""
+        template = compile_template("{{name}} and {name}")
+        assert template.variables == ("name",)
+        assert template.render({"name": "x"}) == "x and x"
+
+    @pytest.mark.parametrize(
+        ("source", "variables", "expected"),
+        [
+            ("Incident {{incident_id}} created", {"incident_id": "INC-1"}, "Incident INC-1 created"),
+            ("Retrieved {count} group{plural}", {"count": 2, "plural": "s"}, "Retrieved 2 groups"),
+            ("{{a}}{b}", {"a": 1, "b": 2}, "12"),
+            ("Unbalanced {{name}", {"name": "x"}, "Unbalanced {x"),
+            ("Literal { braces } stay", {}, "Literal { braces } stay"),
+        ],
+    )
+    def test_render(self, source, variables, expected):
+        """render() substitutes placeholders like the previous regex passes."""
+        assert compile_template(source).render(variables) == expected
+
+    def test_missing_variable_returns_first_absent_name(self):
+        """missing_variable() reports the first placeholder without a value."""
+        template = compile_template("Retrieved {count} group{plural}")
+        assert template.missing_variable({"count": 1}) == "plural"
+        assert template.missing_variable({"count": 1, "plural": ""}) is None
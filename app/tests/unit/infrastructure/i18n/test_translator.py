@@ -236,3 +236,70 @@ class TestTranslatorInterpolation:
         message = "Retrieved {count} group{plural}"
         with pytest.raises(ValueError):
             translator._interpolate(message, {"count": 1})
+
+
+class TestTranslatorTemplates:
+    """Tests for precompiled templates and the rendered message cache."""
+
+    @pytest.fixture
+    def translator(self, yaml_loader):
+        """Create Translator instance with test loader."""
+        translator = Translator(yaml_loader, fallback_locale=Locale.EN_US, render_cache_size=2)
+        translator.load_all()
+        return translator
+
+    def test_load_all_compiles_every_message(self, translator):
+        """load_all() compiles the messages of every locale."""
+        assert translator.render_cache_stats()["templates"] == 12
+
+    def test_repeated_render_is_served_from_cache(self, translator):
+        """The same key and variables render once."""
+        key = TranslationKey("incident", "created")
+        first = translator.translate_message(key, Locale.EN_US, {"incident_id": "INC-1"})
+        second = translator.translate_message(key, Locale.EN_US, {"incident_id": "INC-1"})
+
+        assert first == second == "Incident INC-1 created"
+        stats = translator.render_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_values_of_different_types_are_cached_separately(self, translator):
+        """1 and True hash alike but render differently."""
+        key = TranslationKey("incident", "created")
+        assert translator.translate_message(key, Locale.EN_US, {"incident_id": 1}) == "Incident 1 created"
+        assert translator.translate_message(key, Locale.EN_US, {"incident_id": True}) == "Incident True created"
+
+    def test_unhashable_values_bypass_cache(self, translator):
+        """Lists render without being cached."""
+        key = TranslationKey("incident", "created")
+        assert translator.translate_message(key, Locale.EN_US, {"incident_id": [1]}) == "Incident [1] created"
+        assert translator.render_cache_stats()["size"] == 0
+
+    def test_cache_evicts_least_recently_used(self, translator):
+        """The cache keeps at most render_cache_size messages."""
+        key = TranslationKey("incident", "created")
+        for incident_id in ("a", "b", "c"):
+            translator.translate_message(key, Locale.EN_US, {"incident_id": incident_id})
+        assert translator.render_cache_stats()["size"] == 2
+
+    def test_edited_message_is_not_served_stale(self, translator):
+        """Editing a catalog in place takes effect on the next translation."""
+        key = TranslationKey("incident", "created")
+        translator.translate_message(key, Locale.EN_US, {"incident_id": "1"})
+        translator.catalogs[Locale.EN_US].messages["incident"]["created"] = "Opened {{incident_id}}"
+
+        assert translator.translate_message(key, Locale.EN_US, {"incident_id": "1"}) == "Opened 1"
+
+    def test_compile_catalogs_clears_rendered_messages(self, translator):
+        """compile_catalogs() drops rendered messages."""
+        key = TranslationKey("incident", "created")
+        translator.translate_message(key, Locale.EN_US, {"incident_id": "1"})
+        translator.compile_catalogs()
+        assert translator.render_cache_stats()["size"] == 0
+
+    def test_clear_render_cache_resets_stats(self, translator):
+        """clear_render_cache() drops rendered messages and hit counters."""
+        key = TranslationKey("incident", "created")
+        translator.translate_message(key, Locale.EN_US, {"incident_id": "1"})
+        translator.clear_render_cache()
+        stats = translator.render_cache_stats()
+        assert (stats["size"], stats["hits"], stats["misses"]) == (0, 0, 0)
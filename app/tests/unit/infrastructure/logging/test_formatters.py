@@ -14,6 +14,7 @@ from infrastructure.logging.formatters import (
     SENSITIVE_PATTERNS,
     add_app_info,
     add_environment_info,
+    clear_key_decision_caches,
     mask_sensitive_data,
     truncate_large_values,
 )
@@ -317,6 +318,48 @@ class TestMaskSensitiveData:
         for key in ("passwd", "pwd", "signature", "session", "passphrase"):
             assert result[key] == "***REDACTED***", f"{key} should be masked"
 
+    def test_mask_sensitive_data_does_not_copy_clean_events(self):
+        """Events without sensitive keys are returned without copying."""
+        processor = mask_sensitive_data()
+        user = {"name": "john", "roles": ["admin"]}
+        event_dict = {"event": "test", "user": user}
+
+        result = processor(None, "info", event_dict)
+
+        assert result is event_dict
+        assert result["user"] is user
+
+    def test_mask_sensitive_data_copies_only_redacted_branches(self):
+        """Only containers on the path to a redacted key are copied; inputs are untouched."""
+        processor = mask_sensitive_data()
+        clean = {"region": "ca-central-1"}
+        config = {"api_token": "x", "clean": clean}
+        event_dict = {"event": "test", "config": config}
+
+        result = processor(None, "info", event_dict)
+
+        assert result["config"]["api_token"] == "***REDACTED***"
+        assert result["config"]["clean"] is clean
+        assert config["api_token"] == "x"
+
+    def test_mask_sensitive_data_additional_patterns_are_case_insensitive(self):
+        """Additional patterns match regardless of case."""
+        processor = mask_sensitive_data(additional_patterns=frozenset({"SSN"}))
+
+        result = processor(None, "info", {"event": "test", "user_ssn": "123"})
+
+        assert result["user_ssn"] == "***REDACTED***"
+
+    def test_clear_key_decision_caches_keeps_masking(self):
+        """Clearing memoized key decisions does not change what is masked."""
+        processor = mask_sensitive_data()
+        processor(None, "info", {"event": "test", "password": "x"})
+
+        clear_key_decision_caches()
+        result = processor(None, "info", {"event": "test", "password": "x"})
+
+        assert result["password"] == "***REDACTED***"
+
 
 @pytest.mark.unit
 class TestTruncateLargeValues:
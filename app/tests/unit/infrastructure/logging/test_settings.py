@@ -4,6 +4,7 @@ Mirrors app/tests/unit/infrastructure/idempotency/test_idempotency_settings.py.
 """
 
 import pytest
+from pydantic import ValidationError
 
 from infrastructure.logging.settings import LoggingSettings, get_logging_settings
 
@@ -32,6 +33,21 @@ class TestLoggingSettingsEnvParsing:
         assert settings.REDACTION_EXTRA_KEYS == ("ssn", "custom_secret")
 
 
+class TestLoggingSettingsCallsiteLevels:
+    """LOG_CALLSITE_LEVELS is normalized and validated."""
+
+    def test_defaults_to_every_level(self):
+        assert LoggingSettings().LOG_CALLSITE_LEVELS == ("debug", "info", "warning", "error", "critical")
+
+    def test_reads_levels_from_env_case_insensitively(self, monkeypatch):
+        monkeypatch.setenv("LOG_CALLSITE_LEVELS", '["WARNING", "error"]')
+        assert LoggingSettings().LOG_CALLSITE_LEVELS == ("warning", "error")
+
+    def test_rejects_unknown_level(self):
+        with pytest.raises(ValidationError):
+            LoggingSettings(LOG_CALLSITE_LEVELS=("verbose",))
+
+
 class TestGetLoggingSettingsSingleton:
     """get_logging_settings() is a cached singleton provider."""
 
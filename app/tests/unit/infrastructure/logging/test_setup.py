@@ -198,6 +198,33 @@ class TestPipelineRedaction:
         assert entries[0]["password"] == "***REDACTED***"
 
 
+@pytest.mark.unit
+class TestPipelineCallsiteLevels:
+    """LOG_CALLSITE_LEVELS limits callsite capture to the listed levels."""
+
+    def test_all_levels_capture_callsite_by_default(self):
+        processors = _build_base_processors(logging_settings=LoggingSettings())
+
+        with capture_logs(processors=processors) as entries:
+            structlog.get_logger().debug("debug_event")
+
+        assert entries[0]["code.function.name"].endswith("test_all_levels_capture_callsite_by_default")
+
+    def test_only_listed_levels_capture_callsite(self):
+        logging_settings = LoggingSettings(LOG_CALLSITE_LEVELS=("warning", "error"))
+        processors = _build_base_processors(logging_settings=logging_settings)
+
+        with capture_logs(processors=processors) as entries:
+            logger = structlog.get_logger()
+            logger.info("info_event")
+            logger.warning("warning_event")
+
+        assert "code.line.number" not in entries[0]
+        # The level filter's own frame is skipped when locating the caller.
+        assert entries[1]["code.function.name"].endswith("test_only_listed_levels_capture_callsite")
+        assert entries[1]["code.file.path"].endswith("test_setup.py")
+
+
 @pytest.mark.unit
 class TestConfigureLoggingRealCodePath:
     """Exercises configure_logging's non-test-environment branch.
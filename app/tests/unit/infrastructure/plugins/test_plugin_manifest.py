@@ -0,0 +1,204 @@
+"""Unit tests for manifest-driven lazy plugin discovery."""
+
+import sys
+import textwrap
+
+import pluggy
+import pytest
+
+from infrastructure.plugins.manifest import (
+    LazyPlugin,
+    ManifestEntry,
+    ManifestHook,
+    build_plugin_manifest,
+    dump_plugin_manifest,
+    load_plugin_manifest,
+    register_plugins_from_manifest,
+)
+from infrastructure.plugins.profiler import StartupProfiler
+from infrastructure.plugins.specs import FeatureLifecycleSpecs
+
+pytestmark = pytest.mark.unit
+
+PLUGIN_SOURCE = textwrap.dedent(
+    """
+    from infrastructure.plugins import hookimpl
+
+    from fakefeatures.alpha import heavy
+
+
+    @hookimpl
+    def register_i18n_resources(registry):
+        registry.append("alpha")
+
+
+    @hookimpl(tryfirst=True)
+    def startup_warmup(logger):
+        logger.append(heavy.VALUE)
+    """
+)
+
+
+def _unload_fake_features() -> None:
+    for name in [name for name in sys.modules if name.startswith("fakefeatures")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def feature_tree(tmp_path, monkeypatch):
+    """Create a throwaway ``fakefeatures`` tree with one plugin and one plain package."""
+    root = tmp_path / "fakefeatures"
+    (root / "alpha").mkdir(parents=True)
+    (root / "plain").mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "alpha" / "__init__.py").write_text(PLUGIN_SOURCE)
+    (root / "alpha" / "heavy.py").write_text("VALUE = 'warm'\n")
+    (root / "plain" / "__init__.py").write_text("VALUE = 1\n")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    _unload_fake_features()
+
+
+def _plugin_manager() -> pluggy.PluginManager:
+    pm = pluggy.PluginManager("sre_bot")
+    pm.add_hookspecs(FeatureLifecycleSpecs)
+    return pm
+
+
+def test_build_plugin_manifest_indexes_only_packages_with_hooks(feature_tree):
+    entries = build_plugin_manifest(_plugin_manager(), ["fakefeatures"])
+
+    assert [entry.module for entry in entries] == ["fakefeatures.alpha"]
+    hooks = {hook.name: hook for hook in entries[0].hooks}
+    assert set(hooks) == {"register_i18n_resources", "startup_warmup"}
+    assert hooks["register_i18n_resources"].argnames == ("registry",)
+    assert hooks["startup_warmup"].opts == {"tryfirst": True}
+
+
+def test_manifest_round_trips_through_json(tmp_path):
+    entries = [
+        ManifestEntry(
+            module="packages.example",
+            hooks=(ManifestHook(name="register_routes", argnames=("app",), opts={"trylast": True}),),
+        )
+    ]
+    path = tmp_path / "manifest.json"
+    path.write_text(dump_plugin_manifest(entries))
+
+    assert load_plugin_manifest(path) == entries
+
+
+def test_load_plugin_manifest_rejects_unknown_version(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text('{"version": 99, "plugins": []}')
+
+    with pytest.raises(ValueError, match="Unsupported plugin manifest version"):
+        load_plugin_manifest(path)
+
+
+def test_build_plugin_manifest_rejects_hook_wrappers(feature_tree):
+    (feature_tree / "alpha" / "__init__.py").write_text(
+        textwrap.dedent(
+            """
+            from infrastructure.plugins import hookimpl
+
+
+            @hookimpl(wrapper=True)
+            def startup_warmup(logger):
+                return (yield)
+            """
+        )
+    )
+
+    with pytest.raises(ValueError, match="hook wrapper"):
+        build_plugin_manifest(_plugin_manager(), ["fakefeatures"])
+
+
+def test_lazy_plugin_imports_package_on_first_hook_call(feature_tree):
+    entries = build_plugin_manifest(_plugin_manager(), ["fakefeatures"])
+    _unload_fake_features()
+    pm = _plugin_manager()
+
+    plugins = register_plugins_from_manifest(pm, entries)
+
+    assert "fakefeatures.alpha" not in sys.modules
+    assert pm.get_plugin("fakefeatures.alpha") is plugins[0]
+    assert not plugins[0].loaded
+
+    registry: list[str] = []
+    pm.hook.register_i18n_resources(registry=registry)
+
+    assert registry == ["alpha"]
+    assert plugins[0].loaded
+    assert "fakefeatures.alpha" in sys.modules
+    assert "fakefeatures.plain" not in sys.modules
+
+
+def test_lazy_plugin_matches_eager_registration(feature_tree):
+    entries = build_plugin_manifest(_plugin_manager(), ["fakefeatures"])
+    pm = _plugin_manager()
+    register_plugins_from_manifest(pm, entries)
+
+    warmed: list[str] = []
+    pm.hook.startup_warmup(logger=warmed)
+
+    assert warmed == ["warm"]
+    impl = pm.hook.startup_warmup.get_hookimpls()[0]
+    assert impl.tryfirst is True
+    assert impl.argnames == ("logger",)
+
+
+def test_lazy_plugin_records_deferred_import_in_profiler(feature_tree):
+    entries = build_plugin_manifest(_plugin_manager(), ["fakefeatures"])
+    _unload_fake_features()
+    profiler = StartupProfiler()
+    pm = _plugin_manager()
+    register_plugins_from_manifest(pm, entries, profiler=profiler)
+
+    pm.hook.register_i18n_resources(registry=[])
+
+    assert list(profiler.import_seconds) == ["fakefeatures.alpha"]
+
+
+def test_lazy_plugin_raises_when_manifest_is_stale(feature_tree):
+    entry = ManifestEntry(
+        module="fakefeatures.plain",
+        hooks=(ManifestHook(name="register_routes", argnames=("app",)),),
+    )
+    pm = _plugin_manager()
+    register_plugins_from_manifest(pm, [entry])
+
+    with pytest.raises(RuntimeError, match="Plugin manifest is stale"):
+        pm.hook.register_routes(app=object())
+
+
+def test_lazy_plugin_import_error_propagates_from_hook_call(feature_tree):
+    (feature_tree / "broken").mkdir()
+    (feature_tree / "broken" / "__init__.py").write_text("raise ImportError('missing dependency')\n")
+    entry = ManifestEntry(
+        module="fakefeatures.broken",
+        hooks=(ManifestHook(name="register_routes", argnames=("app",)),),
+    )
+    pm = _plugin_manager()
+    register_plugins_from_manifest(pm, [entry])
+
+    with pytest.raises(ImportError, match="missing dependency"):
+        pm.hook.register_routes(app=object())
+
+
+def test_register_plugins_from_manifest_skips_blocked_and_registered():
+    entries = [
+        ManifestEntry(module="packages.blocked", hooks=(ManifestHook(name="startup_warmup", argnames=("logger",)),)),
+        ManifestEntry(module="packages.kept", hooks=(ManifestHook(name="startup_warmup", argnames=("logger",)),)),
+    ]
+    pm = _plugin_manager()
+    pm.set_blocked("packages.blocked")
+
+    first = register_plugins_from_manifest(pm, entries)
+    second = register_plugins_from_manifest(pm, entries)
+
+    assert [plugin.module_name for plugin in first] == ["packages.kept"]
+    assert second == []
+    assert isinstance(pm.get_plugin("packages.kept"), LazyPlugin)
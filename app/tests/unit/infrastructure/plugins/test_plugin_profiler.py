@@ -0,0 +1,73 @@
+"""Unit tests for infrastructure.plugins.profiler.StartupProfiler."""
+
+from unittest.mock import MagicMock
+
+import pluggy
+import pytest
+
+from infrastructure.plugins import hookimpl
+from infrastructure.plugins.profiler import StartupProfiler
+from infrastructure.plugins.specs import FeatureLifecycleSpecs
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def profiler(fake_clock) -> StartupProfiler:
+    """Profiler whose clock advances one second per reading."""
+    fake_clock.tick = 1.0
+    return StartupProfiler(clock=fake_clock)
+
+
+class WarmupPlugin:
+    @hookimpl
+    def startup_warmup(self, logger):
+        logger.append("warmed")
+
+
+def test_time_import_accumulates_elapsed_time(profiler):
+    with profiler.time_import("packages.alpha"):
+        pass
+
+    assert profiler.import_seconds == {"packages.alpha": 1.0}
+    assert profiler.import_failures == []
+
+
+def test_time_import_records_failures_and_reraises(profiler):
+    with pytest.raises(ImportError), profiler.time_import("packages.broken"):
+        raise ImportError("boom")
+
+    assert profiler.import_failures == ["packages.broken"]
+    assert "packages.broken" in profiler.import_seconds
+
+
+def test_attach_records_hook_calls_until_detached(profiler):
+    pm = pluggy.PluginManager("sre_bot")
+    pm.add_hookspecs(FeatureLifecycleSpecs)
+    pm.register(WarmupPlugin(), name="warmup")
+
+    detach = profiler.attach(pm)
+    pm.hook.startup_warmup(logger=[])
+    detach()
+    pm.hook.startup_warmup(logger=[])
+
+    timing = profiler.hook_timings["startup_warmup"]
+    assert timing.calls == 1
+    assert timing.total_seconds == 1.0
+    assert timing.plugins == {"warmup"}
+
+
+def test_summary_orders_imports_slowest_first_and_logs_once(profiler):
+    profiler.import_seconds = {"fast": 0.1, "slow": 2.0, "medium": 1.0}
+    profiler.record_hook("register_routes", ["a", "b"], 0.5)
+    logger = MagicMock()
+
+    summary = profiler.summary(top=2)
+    profiler.log_summary(logger, top=2)
+
+    assert list(summary["slowest_imports"]) == ["slow", "medium"]
+    assert summary["plugin_imports"] == 3
+    assert summary["plugin_import_seconds"] == 3.1
+    assert summary["hooks"] == {"register_routes": {"calls": 1, "seconds": 0.5, "plugins": 2}}
+    logger.info.assert_called_once()
+    assert logger.info.call_args.args == ("plugin_startup_profile",)
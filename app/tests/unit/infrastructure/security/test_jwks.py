@@ -1,5 +1,6 @@
 """Unit tests for JWKS manager."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -131,3 +132,72 @@ class TestJWKSManager:
         assert result2 == client2
         assert manager.jwks_clients["test_issuer"] == client1
         assert manager.jwks_clients["second_issuer"] == client2
+
+
+def _jwk_set(*key_ids: str) -> MagicMock:
+    jwk_set = MagicMock()
+    jwk_set.keys = [MagicMock(key_id=key_id) for key_id in key_ids]
+    return jwk_set
+
+
+@pytest.mark.unit
+class TestJWKSManagerKeyRefresh:
+    """Test suite for JWKS key prefetch and background refresh."""
+
+    def test_refresh_keys_fetches_fresh_key_set(self, mock_issuer_config):
+        manager = JWKSManager(issuer_config=mock_issuer_config)
+        mock_client = MagicMock()
+        mock_client.get_jwk_set.return_value = _jwk_set("k1", "k2")
+        manager.jwks_clients["test_issuer"] = mock_client
+
+        assert manager.refresh_keys("test_issuer") is True
+        mock_client.get_jwk_set.assert_called_once_with(refresh=True)
+        assert manager.known_key_ids["test_issuer"] == {"k1", "k2"}
+
+    def test_refresh_keys_failure_keeps_previous_keys(self, mock_issuer_config):
+        manager = JWKSManager(issuer_config=mock_issuer_config)
+        mock_client = MagicMock()
+        mock_client.get_jwk_set.side_effect = [_jwk_set("k1"), PyJWKClientError("down")]
+        manager.jwks_clients["test_issuer"] = mock_client
+
+        assert manager.refresh_keys("test_issuer") is True
+        assert manager.refresh_keys("test_issuer") is False
+        assert manager.known_key_ids["test_issuer"] == {"k1"}
+
+    def test_refresh_keys_notifies_listeners_of_removed_keys(self, mock_issuer_config):
+        manager = JWKSManager(issuer_config=mock_issuer_config)
+        mock_client = MagicMock()
+        mock_client.get_jwk_set.side_effect = [_jwk_set("old", "new"), _jwk_set("new")]
+        manager.jwks_clients["test_issuer"] = mock_client
+        listener = MagicMock()
+        manager.add_key_removal_listener(listener)
+
+        manager.refresh_keys("test_issuer")
+        listener.assert_not_called()
+        manager.refresh_keys("test_issuer")
+
+        listener.assert_called_once_with("test_issuer", {"old"})
+
+    def test_warmup_prefetches_keys_for_every_issuer(self, mock_issuer_config):
+        manager = JWKSManager(issuer_config=mock_issuer_config)
+        clients = {issuer: MagicMock() for issuer in mock_issuer_config}
+        for client in clients.values():
+            client.get_jwk_set.return_value = _jwk_set("k1")
+        manager.jwks_clients.update(clients)
+
+        manager.warmup()
+
+        for client in clients.values():
+            client.get_jwk_set.assert_called_once_with(refresh=True)
+
+    def test_background_refresh_runs_until_stopped(self, mock_issuer_config):
+        manager = JWKSManager(issuer_config=mock_issuer_config)
+        refreshed = threading.Event()
+
+        with patch.object(manager, "refresh_all_keys", side_effect=lambda: refreshed.set()):
+            stop_event = manager.start_background_refresh(interval_seconds=0.01)
+            assert manager.start_background_refresh(interval_seconds=0.01) is stop_event
+            assert refreshed.wait(timeout=2)
+            manager.stop_background_refresh()
+
+        assert stop_event.is_set()
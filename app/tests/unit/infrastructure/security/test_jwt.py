@@ -19,6 +19,7 @@ from infrastructure.security import (
     validate_jwt_token,
 )
 from infrastructure.security.jwks import JWKSManager
+from infrastructure.security.token_cache import VerifiedTokenCache
 
 
 def _mint_token(
@@ -578,3 +579,82 @@ class TestValidateJWTToken:
                     validate_jwt_token(credentials=credentials, jwks_manager=manager)
 
         assert exc_info.value.status_code == 401
+
+    def test_validate_jwt_token_serves_repeat_tokens_from_cache(
+        self,
+        mock_http_credentials,
+        es256_keypair,
+    ):
+        private_key, public_key = es256_keypair
+        issuer = "https://issuer.example.com"
+        manager = JWKSManager(
+            issuer_config={
+                issuer: {
+                    "jwks_uri": "https://issuer.example.com/.well-known/jwks.json",
+                    "audience": "expected-aud",
+                    "algorithms": ["ES256"],
+                }
+            }
+        )
+        credentials = mock_http_credentials(
+            token=_mint_token(
+                private_key,
+                issuer=issuer,
+                audience="expected-aud",
+                expires_delta=timedelta(minutes=10),
+            )
+        )
+
+        mock_jwks_client = MagicMock()
+        mock_signing_key = MagicMock(key_id="test-key")
+        mock_signing_key.key = public_key
+        mock_jwks_client.get_signing_key_from_jwt.return_value = mock_signing_key
+        token_cache = VerifiedTokenCache()
+
+        with patch.object(manager, "get_jwks_client", return_value=mock_jwks_client):
+            first = validate_jwt_token(credentials=credentials, jwks_manager=manager, token_cache=token_cache)
+            second = validate_jwt_token(credentials=credentials, jwks_manager=manager, token_cache=token_cache)
+
+        assert first == second
+        assert first["sub"] == "user-123"
+        mock_jwks_client.get_signing_key_from_jwt.assert_called_once()
+        assert token_cache.stats()["hits"] == 1
+
+    def test_validate_jwt_token_does_not_cache_rejected_tokens(
+        self,
+        mock_http_credentials,
+        es256_keypair,
+    ):
+        private_key, public_key = es256_keypair
+        issuer = "https://issuer.example.com"
+        manager = JWKSManager(
+            issuer_config={
+                issuer: {
+                    "jwks_uri": "https://issuer.example.com/.well-known/jwks.json",
+                    "audience": "expected-aud",
+                    "algorithms": ["ES256"],
+                }
+            }
+        )
+        credentials = mock_http_credentials(
+            token=_mint_token(
+                private_key,
+                issuer=issuer,
+                audience="wrong-aud",
+                expires_delta=timedelta(minutes=10),
+            )
+        )
+
+        mock_jwks_client = MagicMock()
+        mock_signing_key = MagicMock(key_id="test-key")
+        mock_signing_key.key = public_key
+        mock_jwks_client.get_signing_key_from_jwt.return_value = mock_signing_key
+        token_cache = VerifiedTokenCache()
+
+        with patch.object(manager, "get_jwks_client", return_value=mock_jwks_client):
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    validate_jwt_token(credentials=credentials, jwks_manager=manager, token_cache=token_cache)
+
+        assert token_cache.stats()["size"] == 0
+        assert mock_jwks_client.get_signing_key_from_jwt.call_count == 2
@@ -0,0 +1,182 @@
+"""Unit tests for the DynamoDB-backed rate limiter storage."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from limits import RateLimitItemPerMinute
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+from infrastructure.operations.result import OperationResult
+from infrastructure.operations.status import OperationStatus
+from infrastructure.security.rate_limit_storage import DynamoDBRateLimitStorage
+from tests.unit.infrastructure.storage.fake_storage import FakeStorageService
+
+pytestmark = pytest.mark.unit
+
+TABLE = "rate_limits"
+
+
+@pytest.fixture
+def make_storage(fake_clock):
+    """Build storages on a fake clock starting at 600s (the start of a 60s window)."""
+    fake_clock.now = 600.0
+
+    def _factory(
+        batch_size: int = 1, flush_interval_seconds: float = 1.0, service=None
+    ) -> tuple[DynamoDBRateLimitStorage, FakeStorageService]:
+        service = service or FakeStorageService()
+        storage = DynamoDBRateLimitStorage(
+            f"dynamodb://{TABLE}",
+            storage=service,
+            batch_size=batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+            clock=fake_clock,
+        )
+        return storage, service
+
+    return _factory
+
+
+def _hits(service: FakeStorageService, key: str) -> int:
+    result = service.get(TABLE, {"PK": key})
+    return result.data["hits"] if result.is_success else 0
+
+
+def test_scheme_is_registered_with_limits():
+    storage = storage_from_string(f"dynamodb://{TABLE}", storage=FakeStorageService())
+
+    assert isinstance(storage, DynamoDBRateLimitStorage)
+    assert storage._table == TABLE
+
+
+def test_admits_up_to_the_limit_then_rejects(make_storage):
+    storage, service = make_storage()
+
+    results = [storage.acquire_sliding_window_entry("client", 3, 60) for _ in range(4)]
+
+    assert results == [True, True, True, False]
+    assert _hits(service, "client/10") == 3
+
+
+def test_counter_item_expires_two_windows_later(make_storage):
+    storage, service = make_storage()
+
+    storage.acquire_sliding_window_entry("client", 3, 60)
+
+    assert service.get(TABLE, {"PK": "client/10"}).data["expires_at"] == 720
+
+
+def test_previous_window_is_weighted_by_its_remaining_share(make_storage, fake_clock):
+    storage, _ = make_storage()
+    for _ in range(4):
+        assert storage.acquire_sliding_window_entry("client", 4, 60)
+
+    # 45s into the next window a quarter of the previous window still counts.
+    fake_clock.now = 705.0
+    results = [storage.acquire_sliding_window_entry("client", 4, 60) for _ in range(4)]
+
+    assert results == [True, True, True, False]
+
+
+def test_hits_written_by_other_replicas_are_counted(make_storage):
+    service = FakeStorageService()
+    first, _ = make_storage(service=service)
+    second, _ = make_storage(service=service)
+
+    assert first.acquire_sliding_window_entry("client", 2, 60)
+    assert second.acquire_sliding_window_entry("client", 2, 60)
+
+    assert not first.acquire_sliding_window_entry("client", 2, 60)
+    assert _hits(service, "client/10") == 2
+
+
+def test_batches_writes_until_batch_size_is_reached(make_storage):
+    storage, service = make_storage(batch_size=5, flush_interval_seconds=30)
+
+    for _ in range(4):
+        assert storage.acquire_sliding_window_entry("client", 100, 60)
+    assert _hits(service, "client/10") == 0
+
+    assert storage.acquire_sliding_window_entry("client", 100, 60)
+    assert _hits(service, "client/10") == 5
+    assert storage.stats()["writes"] == 1
+
+
+def test_batched_hits_still_count_against_the_local_limit(make_storage):
+    storage, _ = make_storage(batch_size=50, flush_interval_seconds=30)
+
+    results = [storage.acquire_sliding_window_entry("client", 3, 60) for _ in range(4)]
+
+    assert results == [True, True, True, False]
+
+
+def test_pending_hits_are_written_after_the_flush_interval(make_storage, fake_clock):
+    storage, service = make_storage(batch_size=50, flush_interval_seconds=1.0)
+    storage.acquire_sliding_window_entry("client", 100, 60)
+    assert _hits(service, "client/10") == 0
+
+    fake_clock.now += 2
+    storage.acquire_sliding_window_entry("other", 100, 60)
+
+    assert _hits(service, "client/10") == 1
+
+
+def test_flush_writes_every_pending_hit(make_storage):
+    storage, service = make_storage(batch_size=50, flush_interval_seconds=30)
+    storage.acquire_sliding_window_entry("a", 100, 60)
+    storage.acquire_sliding_window_entry("b", 100, 60)
+
+    storage.flush()
+
+    assert _hits(service, "a/10") == 1
+    assert _hits(service, "b/10") == 1
+
+
+def test_closed_windows_are_dropped_from_local_state(make_storage, fake_clock):
+    storage, _ = make_storage(batch_size=1)
+    storage.acquire_sliding_window_entry("client", 100, 60)
+
+    fake_clock.now += 300
+    storage.acquire_sliding_window_entry("other", 100, 60)
+
+    assert storage.stats()["windows"] == 2
+
+
+def test_storage_errors_fail_open_and_keep_hits_pending(make_storage):
+    service = MagicMock()
+    service.get.return_value = OperationResult.error(OperationStatus.NOT_FOUND, message="missing")
+    service.increment.return_value = OperationResult.error(OperationStatus.TRANSIENT_ERROR, message="throttled")
+    storage, _ = make_storage(service=service)
+
+    assert storage.acquire_sliding_window_entry("client", 5, 60)
+    assert storage.get_sliding_window("client", 60)[2] == 1
+    assert storage.stats()["errors"] == 1
+
+
+def test_expired_items_read_as_zero(make_storage, fake_clock):
+    storage, _ = make_storage()
+    storage.incr("fixed", 60, 3)
+    assert storage.get("fixed") == 3
+
+    fake_clock.now += 61
+
+    assert storage.get("fixed") == 0
+
+
+def test_clear_sliding_window_removes_local_and_stored_counters(make_storage):
+    storage, _ = make_storage()
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    item = RateLimitItemPerMinute(1)
+    assert limiter.hit(item, "client")
+    assert not limiter.hit(item, "client")
+
+    limiter.clear(item, "client")
+
+    assert limiter.hit(item, "client")
+
+
+def test_check_treats_missing_probe_item_as_healthy(make_storage):
+    storage, _ = make_storage()
+
+    assert storage.check() is True
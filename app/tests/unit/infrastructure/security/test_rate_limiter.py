@@ -0,0 +1,83 @@
+"""Unit tests for the rate limiter key function and storage selection."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+from pydantic import ValidationError
+
+from infrastructure.configuration.infrastructure.server import ServerSettings
+from infrastructure.security import rate_limiter
+from infrastructure.security.rate_limit_storage import DynamoDBRateLimitStorage
+
+pytestmark = pytest.mark.unit
+
+TRUSTED = ["10.0.0.0/8"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    rate_limiter._trusted_proxy_networks.cache_clear()
+    rate_limiter.get_limiter.cache_clear()
+    yield
+    rate_limiter._trusted_proxy_networks.cache_clear()
+    rate_limiter.get_limiter.cache_clear()
+
+
+def _settings(**overrides) -> SimpleNamespace:
+    values = {
+        "RATE_LIMIT_STORAGE_URI": "memory://",
+        "RATE_LIMIT_BATCH_SIZE": 10,
+        "RATE_LIMIT_FLUSH_INTERVAL_SECONDS": 1.0,
+        "RATE_LIMIT_TRUSTED_PROXIES": [],
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _request(peer: str | None, forwarded_for: str | None = None) -> MagicMock:
+    request = MagicMock()
+    request.client = SimpleNamespace(host=peer) if peer else None
+    request.headers = {"x-forwarded-for": forwarded_for} if forwarded_for else {}
+    return request
+
+
+@pytest.mark.parametrize(
+    ("peer", "forwarded_for", "proxies", "expected"),
+    [
+        ("203.0.113.9", "198.51.100.10", [], "203.0.113.9"),
+        ("203.0.113.9", "198.51.100.10", TRUSTED, "203.0.113.9"),
+        ("10.0.0.5", "198.51.100.10", TRUSTED, "198.51.100.10"),
+        ("10.0.0.5", "1.2.3.4, 198.51.100.10, 10.1.1.1", TRUSTED, "198.51.100.10"),
+        ("10.0.0.5", "garbage, 10.1.1.1", TRUSTED, "10.1.1.1"),
+        ("10.0.0.5", None, TRUSTED, "10.0.0.5"),
+        (None, None, [], "127.0.0.1"),
+    ],
+)
+def test_get_client_address(peer, forwarded_for, proxies, expected):
+    with patch.object(rate_limiter, "get_server_settings", return_value=_settings(RATE_LIMIT_TRUSTED_PROXIES=proxies)):
+        assert rate_limiter.get_client_address(_request(peer, forwarded_for)) == expected
+
+
+def test_get_limiter_defaults_to_memory_fixed_window():
+    with patch.object(rate_limiter, "get_server_settings", return_value=_settings()):
+        limiter = rate_limiter.get_limiter()
+
+    assert isinstance(limiter._limiter, FixedWindowRateLimiter)
+
+
+def test_get_limiter_uses_dynamodb_sliding_window():
+    settings = _settings(RATE_LIMIT_STORAGE_URI="dynamodb://limits", RATE_LIMIT_BATCH_SIZE=25)
+    with patch.object(rate_limiter, "get_server_settings", return_value=settings):
+        limiter = rate_limiter.get_limiter()
+
+    assert isinstance(limiter._limiter, SlidingWindowCounterRateLimiter)
+    assert isinstance(limiter._storage, DynamoDBRateLimitStorage)
+    assert limiter._storage._table == "limits"
+    assert limiter._storage._batch_size == 25
+
+
+def test_settings_reject_invalid_trusted_proxy():
+    with pytest.raises(ValidationError):
+        ServerSettings(RATE_LIMIT_TRUSTED_PROXIES=["not-a-network"])
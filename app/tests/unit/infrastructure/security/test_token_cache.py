@@ -0,0 +1,97 @@
+"""Unit tests for the verified token cache."""
+
+import pytest
+
+from infrastructure.security import VerifiedTokenCache
+
+
+@pytest.fixture
+def clock(fake_clock):
+    """Fake clock at t=1000, before the ``exp`` of the test tokens."""
+    fake_clock.now = 1_000.0
+    return fake_clock
+
+
+def _claims(exp: float, iss: str = "issuer") -> dict:
+    return {"iss": iss, "sub": "user-123", "exp": exp}
+
+
+@pytest.mark.unit
+class TestVerifiedTokenCache:
+    """Test suite for VerifiedTokenCache."""
+
+    def test_get_returns_claims_for_verified_token(self, clock):
+        cache = VerifiedTokenCache(max_entries=10, expiry_skew_seconds=30, clock=clock)
+        cache.put("token-a", _claims(exp=2_000), key_id="k1", verification_seconds=0.01)
+
+        assert cache.get("token-a") == _claims(exp=2_000)
+        assert cache.get("token-b") is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["verification_seconds_saved"] == pytest.approx(0.01)
+
+    def test_returned_claims_are_copies(self, clock):
+        cache = VerifiedTokenCache(clock=clock)
+        cache.put("token-a", _claims(exp=2_000))
+
+        cache.get("token-a")["sub"] = "tampered"
+
+        assert cache.get("token-a")["sub"] == "user-123"
+
+    def test_entries_expire_at_exp_minus_skew(self, clock):
+        cache = VerifiedTokenCache(expiry_skew_seconds=30, clock=clock)
+        cache.put("token-a", _claims(exp=1_100))
+
+        clock.now = 1_069
+        assert cache.get("token-a") is not None
+        clock.now = 1_070
+        assert cache.get("token-a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_tokens_inside_skew_window_or_without_exp_are_not_cached(self, clock):
+        cache = VerifiedTokenCache(expiry_skew_seconds=30, clock=clock)
+        cache.put("almost-expired", _claims(exp=1_020))
+        cache.put("no-exp", {"iss": "issuer", "sub": "user-123"})
+
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["verifications"] == 2
+
+    def test_least_recently_used_entry_is_evicted(self, clock):
+        cache = VerifiedTokenCache(max_entries=2, clock=clock)
+        cache.put("token-a", _claims(exp=2_000))
+        cache.put("token-b", _claims(exp=2_000))
+        cache.get("token-a")
+        cache.put("token-c", _claims(exp=2_000))
+
+        assert cache.get("token-b") is None
+        assert cache.get("token-a") is not None
+        assert cache.get("token-c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_keys_drops_entries_signed_with_removed_keys(self, clock):
+        cache = VerifiedTokenCache(clock=clock)
+        cache.put("token-a", _claims(exp=2_000), key_id="old")
+        cache.put("token-b", _claims(exp=2_000), key_id="new")
+        cache.put("token-c", _claims(exp=2_000, iss="other"), key_id="old")
+
+        assert cache.invalidate_keys("issuer", {"old"}) == 1
+
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") is not None
+        assert cache.get("token-c") is not None
+
+    def test_zero_max_entries_disables_cache(self, clock):
+        cache = VerifiedTokenCache(max_entries=0, clock=clock)
+        cache.put("token-a", _claims(exp=2_000))
+
+        assert cache.enabled is False
+        assert cache.get("token-a") is None
+        assert cache.stats()["misses"] == 0
+
+    def test_raw_token_is_not_stored(self, clock):
+        cache = VerifiedTokenCache(clock=clock)
+        cache.put("secret-token-value", _claims(exp=2_000))
+
+        assert "secret-token-value" not in cache._entries
@@ -2,12 +2,56 @@
 
 from __future__ import annotations
 
+import operator
+import re
+from collections.abc import Callable, Iterator
 from copy import deepcopy
 from typing import Any
 
 from infrastructure.operations.result import OperationResult
 from infrastructure.operations.status import OperationStatus
 
+_NOT_EXISTS_CONDITION = re.compile(r"attribute_not_exists\((\w+)\)")
+_COMPARISON = re.compile(r"^\s*(#?\w+)\s*(=|<>|<=|>=|<|>)\s*(:\w+)\s*$")
+_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _matches(item: dict[str, Any], key: dict[str, Any]) -> bool:
+    return all(item.get(k) == v for k, v in key.items())
+
+
+def _filter(
+    expression: str,
+    values: dict[str, Any],
+    names: dict[str, str],
+) -> Callable[[dict[str, Any]], bool]:
+    """Build a predicate for ``attr <op> :value`` comparisons joined by ``and``.
+
+    Raises:
+        NotImplementedError: For any other filter expression syntax.
+    """
+    comparisons = []
+    for clause in re.split(r"\s+and\s+", expression, flags=re.IGNORECASE):
+        match = _COMPARISON.match(clause)
+        if match is None:
+            raise NotImplementedError(f"FakeStorageService.scan does not support FilterExpression {expression!r}")
+        attribute, comparator, placeholder = match.groups()
+        comparisons.append((names.get(attribute, attribute), _COMPARATORS[comparator], values[placeholder]))
+
+    def predicate(item: dict[str, Any]) -> bool:
+        return all(
+            attribute in item and compare(item[attribute], value) for attribute, compare, value in comparisons
+        )
+
+    return predicate
+
 
 class FakeStorageService:
     """Simple in-memory storage fake that follows StorageService protocol."""
@@ -41,6 +85,28 @@ class FakeStorageService:
         records.append(deepcopy(item))
         return OperationResult.success(data=True)
 
+    def increment(
+        self,
+        table: str,
+        key: dict[str, Any],
+        attribute: str,
+        amount: int = 1,
+        *,
+        ttl_attribute: str | None = None,
+        expires_at: int | None = None,
+    ) -> OperationResult:
+        records = self._tables.setdefault(table, [])
+        for item in records:
+            if all(item.get(k) == v for k, v in key.items()):
+                break
+        else:
+            item = deepcopy(key)
+            records.append(item)
+        item[attribute] = item.get(attribute, 0) + amount
+        if ttl_attribute is not None and expires_at is not None:
+            item.setdefault(ttl_attribute, expires_at)
+        return OperationResult.success(data=item[attribute])
+
     def get(self, table: str, key: dict[str, Any]) -> OperationResult:
         records = self._tables.get(table, [])
         for item in records:
@@ -92,3 +158,72 @@ class FakeStorageService:
             status=OperationStatus.NOT_FOUND,
             message=f"Item not found in {table}",
         )
+
+    def batch_get(self, table: str, keys: list[dict[str, Any]], **kwargs: Any) -> OperationResult:
+        records = self._tables.get(table, [])
+        found = [item for item in records if any(_matches(item, key) for key in keys)]
+        return OperationResult.success(data=deepcopy(found))
+
+    def batch_put(self, table: str, items: list[dict[str, Any]]) -> OperationResult:
+        for item in items:
+            self.put(table, item)
+        return OperationResult.success(data=len(items))
+
+    def batch_delete(self, table: str, keys: list[dict[str, Any]]) -> OperationResult:
+        records = self._tables.get(table, [])
+        records[:] = [item for item in records if not any(_matches(item, key) for key in keys)]
+        return OperationResult.success(data=len(keys))
+
+    def transact_write(self, operations: list[dict[str, Any]]) -> OperationResult:
+        """Apply Put and Delete operations atomically.
+
+        Supports ``attribute_not_exists(<attribute>)`` conditions on Put,
+        matched on that attribute like ``put_if_not_exists``.
+        """
+        reasons: list[str] = []
+        for operation in operations:
+            ((action, params),) = operation.items()
+            if action not in ("Put", "Delete"):
+                return OperationResult.permanent_error(f"Unsupported transaction action: {action}")
+            records = self._tables.get(params["TableName"], [])
+            condition = _NOT_EXISTS_CONDITION.fullmatch(params.get("ConditionExpression", ""))
+            if condition:
+                attribute = condition.group(1)
+                value = params["Item"].get(attribute)
+                if any(existing.get(attribute) == value for existing in records):
+                    reasons.append("ConditionalCheckFailed")
+                    continue
+            reasons.append("None")
+        if any(reason != "None" for reason in reasons):
+            return OperationResult.error(
+                status=OperationStatus.PERMANENT_ERROR,
+                message="Transaction cancelled",
+                error_code="TransactionCanceledException",
+                data=reasons,
+            )
+
+        for operation in operations:
+            ((action, params),) = operation.items()
+            if action == "Put":
+                self.put(params["TableName"], params["Item"])
+            else:
+                records = self._tables.get(params["TableName"], [])
+                records[:] = [item for item in records if not _matches(item, params["Key"])]
+        return OperationResult.success(data=None)
+
+    def scan(
+        self,
+        table: str,
+        segments: int = 1,
+        expression_values: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[OperationResult]:
+        records = self._tables.get(table, [])
+        expression = kwargs.get("FilterExpression")
+        if expression is not None:
+            predicate = _filter(expression, expression_values or {}, kwargs.get("ExpressionAttributeNames", {}))
+            records = [item for item in records if predicate(item)]
+        elif expression_values:
+            raise ValueError("expression_values require a FilterExpression")
+        for segment in range(max(1, segments)):
+            yield OperationResult.success(data=deepcopy(records[segment :: max(1, segments)]))
@@ -50,3 +50,58 @@ def test_fake_storage_delete() -> None:
 
     assert delete_result.is_success
     assert not get_result.is_success
+
+
+@pytest.mark.unit
+def test_fake_storage_batch_operations() -> None:
+    storage = FakeStorageService()
+
+    put_result = storage.batch_put("audit", [{"PK": "RESOURCE#1", "SK": f"EVENT#{i}"} for i in range(3)])
+    get_result = storage.batch_get("audit", [{"PK": "RESOURCE#1", "SK": "EVENT#0"}, {"PK": "RESOURCE#1", "SK": "EVENT#9"}])
+    storage.batch_delete("audit", [{"PK": "RESOURCE#1", "SK": "EVENT#0"}])
+    scanned = [item for page in storage.scan("audit", segments=2) for item in page.data]
+
+    assert put_result.data == 3
+    assert get_result.data == [{"PK": "RESOURCE#1", "SK": "EVENT#0"}]
+    assert sorted(item["SK"] for item in scanned) == ["EVENT#1", "EVENT#2"]
+
+
+@pytest.mark.unit
+def test_fake_storage_scan_applies_filter_expression() -> None:
+    storage = FakeStorageService()
+    storage.batch_put("audit", [{"PK": f"RESOURCE#{i}", "idx": i, "status": "open"} for i in range(10)])
+
+    pages = storage.scan(
+        "audit",
+        segments=3,
+        FilterExpression="idx >= :min AND #s = :status",
+        ExpressionAttributeNames={"#s": "status"},
+        expression_values={":min": 7, ":status": "open"},
+    )
+
+    assert sorted(item["idx"] for page in pages for item in page.data) == [7, 8, 9]
+
+
+@pytest.mark.unit
+def test_fake_storage_scan_rejects_unsupported_filter_expression() -> None:
+    storage = FakeStorageService()
+
+    with pytest.raises(NotImplementedError):
+        list(storage.scan("audit", FilterExpression="begins_with(PK, :p)", expression_values={":p": "RESOURCE#"}))
+
+
+@pytest.mark.unit
+def test_fake_storage_transact_write_is_all_or_nothing() -> None:
+    storage = FakeStorageService()
+    storage.put("requests", {"PK": "REQ#1"})
+
+    result = storage.transact_write(
+        [
+            {"Put": {"TableName": "requests", "Item": {"PK": "REQ#2"}}},
+            {"Put": {"TableName": "requests", "Item": {"PK": "REQ#1"}, "ConditionExpression": "attribute_not_exists(PK)"}},
+        ]
+    )
+
+    assert result.error_code == "TransactionCanceledException"
+    assert result.data == ["None", "ConditionalCheckFailed"]
+    assert not storage.get("requests", {"PK": "REQ#2"}).is_success
@@ -10,6 +10,8 @@ from unittest.mock import MagicMock
 import pytest
 from botocore.exceptions import ClientError
 
+from infrastructure.operations.status import OperationStatus
+from infrastructure.storage import service as service_module
 from infrastructure.storage.service import DynamoDBStorageService
 
 
@@ -309,13 +311,326 @@ class TestStorageServiceDelete:
         assert not result.is_success
 
 
+@pytest.mark.unit
+class TestStorageServiceIncrement:
+    """Tests for StorageService.increment."""
+
+    def test_increment_returns_new_value(self):
+        service, dynamo = _make_service()
+        dynamo.update_item.return_value = {"Attributes": {"hits": {"N": "7"}}}
+
+        result = service.increment("my_table", {"pk": "abc"}, "hits", 2)
+
+        assert result.is_success
+        assert result.data == 7
+        kwargs = dynamo.update_item.call_args[1]
+        assert kwargs["Key"] == {"pk": {"S": "abc"}}
+        assert kwargs["UpdateExpression"] == "ADD #counter :amount"
+        assert kwargs["ExpressionAttributeNames"] == {"#counter": "hits"}
+        assert kwargs["ExpressionAttributeValues"] == {":amount": {"N": "2"}}
+        assert kwargs["ReturnValues"] == "UPDATED_NEW"
+
+    def test_increment_sets_expiry_only_when_missing(self):
+        service, dynamo = _make_service()
+        dynamo.update_item.return_value = {"Attributes": {"hits": {"N": "1"}}}
+
+        service.increment("my_table", {"pk": "abc"}, "hits", ttl_attribute="expires_at", expires_at=1700000000)
+
+        kwargs = dynamo.update_item.call_args[1]
+        assert kwargs["UpdateExpression"] == "ADD #counter :amount SET #ttl = if_not_exists(#ttl, :expires_at)"
+        assert kwargs["ExpressionAttributeNames"]["#ttl"] == "expires_at"
+        assert kwargs["ExpressionAttributeValues"][":expires_at"] == {"N": "1700000000"}
+
+    def test_increment_propagates_error(self):
+        service, dynamo = _make_service()
+        dynamo.update_item.side_effect = ClientError(
+            error_response={"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "Slow down"}},
+            operation_name="UpdateItem",
+        )
+
+        result = service.increment("my_table", {"pk": "abc"}, "hits")
+
+        assert not result.is_success
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    sleep = MagicMock()
+    monkeypatch.setattr(service_module.time, "sleep", sleep)
+    return sleep
+
+
+@pytest.mark.unit
+class TestStorageServiceSerialization:
+    """Fast-path serialization matches boto3's TypeSerializer/TypeDeserializer."""
+
+    @pytest.mark.parametrize(
+        "value",
+        ["abc", "", True, False, 0, -42, 10**37, Decimal("1.5"), None, b"raw", ["a", 1], {"k": "v"}, {"a", "b"}],
+    )
+    def test_roundtrip_matches_boto3(self, value):
+        serialized = service_module._serialize_value(value)
+
+        assert serialized == service_module._serializer.serialize(value)
+        assert service_module._deserialize_value(serialized) == service_module._deserializer.deserialize(serialized)
+
+
+@pytest.mark.unit
+class TestStorageServiceBatchGet:
+    """Tests for StorageService.batch_get."""
+
+    def test_batch_get_chunks_and_deduplicates_keys(self):
+        service, dynamo = _make_service()
+        dynamo.batch_get_item.side_effect = lambda RequestItems: {
+            "Responses": {"my_table": [{"pk": key["pk"], "n": {"N": "1"}} for key in RequestItems["my_table"]["Keys"]]}
+        }
+        keys = [{"pk": f"id-{i}"} for i in range(150)] + [{"pk": "id-0"}]
+
+        result = service.batch_get("my_table", keys, ConsistentRead=True)
+
+        assert result.is_success
+        assert len(result.data) == 150
+        assert result.data[0] == {"pk": "id-0", "n": Decimal("1")}
+        requests = [call.kwargs["RequestItems"]["my_table"] for call in dynamo.batch_get_item.call_args_list]
+        assert [len(request["Keys"]) for request in requests] == [100, 50]
+        assert requests[0]["ConsistentRead"] is True
+
+    def test_batch_get_retries_unprocessed_keys(self, no_backoff):
+        service, dynamo = _make_service()
+        dynamo.batch_get_item.side_effect = [
+            {
+                "Responses": {"my_table": [{"pk": {"S": "a"}}]},
+                "UnprocessedKeys": {"my_table": {"Keys": [{"pk": {"S": "b"}}]}},
+            },
+            {"Responses": {"my_table": [{"pk": {"S": "b"}}]}, "UnprocessedKeys": {}},
+        ]
+
+        result = service.batch_get("my_table", [{"pk": "a"}, {"pk": "b"}])
+
+        assert result.data == [{"pk": "a"}, {"pk": "b"}]
+        assert dynamo.batch_get_item.call_args_list[1].kwargs["RequestItems"] == {"my_table": {"Keys": [{"pk": {"S": "b"}}]}}
+        assert no_backoff.call_count == 1
+
+    def test_batch_get_propagates_error(self):
+        service, dynamo = _make_service()
+        dynamo.batch_get_item.side_effect = ClientError(
+            error_response={"Error": {"Code": "ResourceNotFoundException", "Message": "Table not found"}},
+            operation_name="BatchGetItem",
+        )
+
+        result = service.batch_get("my_table", [{"pk": "a"}])
+
+        assert not result.is_success
+        assert result.error_code == "ResourceNotFoundException"
+
+
+@pytest.mark.unit
+class TestStorageServiceBatchWrite:
+    """Tests for StorageService.batch_put and batch_delete."""
+
+    def test_batch_put_chunks_by_25(self):
+        service, dynamo = _make_service()
+        dynamo.batch_write_item.return_value = {"UnprocessedItems": {}}
+
+        result = service.batch_put("my_table", [{"pk": f"id-{i}", "skip": None} for i in range(60)])
+
+        assert result.is_success
+        assert result.data == 60
+        chunks = [call.kwargs["RequestItems"]["my_table"] for call in dynamo.batch_write_item.call_args_list]
+        assert [len(chunk) for chunk in chunks] == [25, 25, 10]
+        assert chunks[0][0] == {"PutRequest": {"Item": {"pk": {"S": "id-0"}}}}
+
+    def test_batch_delete_serializes_keys(self):
+        service, dynamo = _make_service()
+        dynamo.batch_write_item.return_value = {}
+
+        result = service.batch_delete("my_table", [{"pk": "a", "sk": 1}])
+
+        assert result.data == 1
+        request = dynamo.batch_write_item.call_args.kwargs["RequestItems"]
+        assert request == {"my_table": [{"DeleteRequest": {"Key": {"pk": {"S": "a"}, "sk": {"N": "1"}}}}]}
+
+    def test_batch_put_resubmits_unprocessed_items_with_backoff(self, no_backoff):
+        service, dynamo = _make_service()
+        unprocessed = {"my_table": [{"PutRequest": {"Item": {"pk": {"S": "b"}}}}]}
+        dynamo.batch_write_item.side_effect = [{"UnprocessedItems": unprocessed}, {"UnprocessedItems": {}}]
+
+        result = service.batch_put("my_table", [{"pk": "a"}, {"pk": "b"}])
+
+        assert result.is_success
+        assert dynamo.batch_write_item.call_args.kwargs["RequestItems"] == unprocessed
+        assert 0 <= no_backoff.call_args.args[0] <= service_module.BATCH_RETRY_BASE_DELAY_SECONDS
+
+    def test_batch_put_gives_up_after_retry_attempts(self, no_backoff):
+        service, dynamo = _make_service()
+        unprocessed = {"my_table": [{"PutRequest": {"Item": {"pk": {"S": "a"}}}}]}
+        dynamo.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+
+        result = service.batch_put("my_table", [{"pk": "a"}])
+
+        assert not result.is_success
+        assert result.status == OperationStatus.TRANSIENT_ERROR
+        assert result.error_code == "UnprocessedItems"
+        assert dynamo.batch_write_item.call_count == service_module.BATCH_RETRY_ATTEMPTS
+        assert no_backoff.call_count == service_module.BATCH_RETRY_ATTEMPTS - 1
+
+    def test_batch_put_stops_at_first_failed_chunk(self):
+        service, dynamo = _make_service()
+        dynamo.batch_write_item.side_effect = [
+            {},
+            ClientError(
+                error_response={"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "Slow down"}},
+                operation_name="BatchWriteItem",
+            ),
+        ]
+
+        result = service.batch_put("my_table", [{"pk": f"id-{i}"} for i in range(75)])
+
+        assert not result.is_success
+        assert dynamo.batch_write_item.call_count == 2
+
+    def test_backoff_is_capped(self):
+        for attempt in range(20):
+            assert 0 <= service_module._backoff_delay(attempt) <= service_module.BATCH_RETRY_MAX_DELAY_SECONDS
+
+
+@pytest.mark.unit
+class TestStorageServiceTransactWrite:
+    """Tests for StorageService.transact_write."""
+
+    def test_transact_write_serializes_operations(self):
+        service, dynamo = _make_service()
+        dynamo.transact_write_items.return_value = {}
+
+        result = service.transact_write(
+            [
+                {"Put": {"TableName": "a", "Item": {"pk": "x", "n": 1}, "ConditionExpression": "attribute_not_exists(pk)"}},
+                {
+                    "Update": {
+                        "TableName": "b",
+                        "Key": {"pk": "y"},
+                        "UpdateExpression": "SET #s = :s",
+                        "ExpressionAttributeNames": {"#s": "status"},
+                        "ExpressionAttributeValues": {":s": "done"},
+                    }
+                },
+                {"Delete": {"TableName": "c", "Key": {"pk": "z"}}},
+            ]
+        )
+
+        assert result.is_success
+        items = dynamo.transact_write_items.call_args.kwargs["TransactItems"]
+        assert items[0]["Put"] == {
+            "TableName": "a",
+            "Item": {"pk": {"S": "x"}, "n": {"N": "1"}},
+            "ConditionExpression": "attribute_not_exists(pk)",
+        }
+        assert items[1]["Update"]["Key"] == {"pk": {"S": "y"}}
+        assert items[1]["Update"]["ExpressionAttributeValues"] == {":s": {"S": "done"}}
+        assert items[1]["Update"]["ExpressionAttributeNames"] == {"#s": "status"}
+        assert items[2]["Delete"]["Key"] == {"pk": {"S": "z"}}
+
+    def test_transact_write_returns_cancellation_reasons(self):
+        service, dynamo = _make_service()
+        dynamo.transact_write_items.side_effect = ClientError(
+            error_response={
+                "Error": {"Code": "TransactionCanceledException", "Message": "Transaction cancelled"},
+                "CancellationReasons": [{"Code": "None"}, {"Code": "ConditionalCheckFailed"}],
+            },
+            operation_name="TransactWriteItems",
+        )
+
+        result = service.transact_write([{"Delete": {"TableName": "a", "Key": {"pk": "x"}}}] * 2)
+
+        assert not result.is_success
+        assert result.error_code == "TransactionCanceledException"
+        assert result.data == ["None", "ConditionalCheckFailed"]
+
+    def test_transact_write_reports_conflicts_as_transient(self):
+        service, dynamo = _make_service()
+        dynamo.transact_write_items.side_effect = ClientError(
+            error_response={
+                "Error": {"Code": "TransactionCanceledException", "Message": "Transaction cancelled"},
+                "CancellationReasons": [{"Code": "ThrottlingError"}, {"Code": "None"}],
+            },
+            operation_name="TransactWriteItems",
+        )
+
+        result = service.transact_write([{"Delete": {"TableName": "a", "Key": {"pk": "x"}}}] * 2)
+
+        assert result.status == OperationStatus.TRANSIENT_ERROR
+        assert result.retry_after == 60
+        assert result.data == ["ThrottlingError", "None"]
+
+    def test_transact_write_rejects_oversized_transactions(self):
+        service, dynamo = _make_service()
+
+        result = service.transact_write([{"Delete": {"TableName": "a", "Key": {"pk": str(i)}}} for i in range(101)])
+
+        assert result.status == OperationStatus.PERMANENT_ERROR
+        dynamo.transact_write_items.assert_not_called()
+
+
+def _scan_paginator(pages_by_segment: dict[int | None, list[list[dict]]]) -> MagicMock:
+    paginator = MagicMock()
+    paginator.paginate.side_effect = lambda **kwargs: iter({"Items": items} for items in pages_by_segment[kwargs.get("Segment")])
+    return paginator
+
+
+@pytest.mark.unit
+class TestStorageServiceScan:
+    """Tests for StorageService.scan."""
+
+    def test_scan_yields_deserialized_pages(self):
+        service, dynamo = _make_service()
+        paginator = _scan_paginator({None: [[{"pk": {"S": "a"}}], [{"pk": {"S": "b"}}]]})
+        dynamo.get_paginator.return_value = paginator
+
+        pages = list(service.scan("my_table", FilterExpression="n > :n", expression_values={":n": 1}))
+
+        assert [page.data for page in pages] == [[{"pk": "a"}], [{"pk": "b"}]]
+        dynamo.get_paginator.assert_called_with("scan")
+        kwargs = paginator.paginate.call_args.kwargs
+        assert kwargs["ExpressionAttributeValues"] == {":n": {"N": "1"}}
+        assert "Segment" not in kwargs
+
+    def test_parallel_scan_reads_every_segment(self):
+        service, dynamo = _make_service()
+        paginator = _scan_paginator(
+            {segment: [[{"pk": {"S": f"{segment}-{page}"}}] for page in range(3)] for segment in range(4)}
+        )
+        dynamo.get_paginator.return_value = paginator
+
+        items = [item["pk"] for page in service.scan("my_table", segments=4) for item in page.data]
+
+        assert sorted(items) == sorted(f"{segment}-{page}" for segment in range(4) for page in range(3))
+        assert {call.kwargs["TotalSegments"] for call in paginator.paginate.call_args_list} == {4}
+
+    def test_scan_yields_error_and_stops(self):
+        service, dynamo = _make_service()
+        dynamo.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response={"Error": {"Code": "ResourceNotFoundException", "Message": "Table not found"}},
+            operation_name="Scan",
+        )
+
+        pages = list(service.scan("my_table", segments=2))
+
+        assert len(pages) == 1
+        assert pages[0].error_code == "ResourceNotFoundException"
+
+    def test_parallel_scan_reraises_unexpected_errors(self):
+        service, dynamo = _make_service()
+        dynamo.get_paginator.return_value.paginate.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(service.scan("my_table", segments=2))
+
+
 @pytest.mark.unit
 class TestStorageServiceProviderAndSdkExceptions:
     """Contract tests for provider wiring and SDK exception mapping."""
 
     def test_get_storage_service_uses_integrations_get_aws_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        import infrastructure.storage.service as service_module
-
         service_module.get_storage_service.cache_clear()
 
         dynamodb_client = MagicMock()
@@ -132,6 +132,52 @@ def test_classify_aws_error_expected_mappings(
     assert retry_after == expected_retry_after
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("reasons", "expected_status", "expected_retry_after"),
+    [
+        (["None", "ConditionalCheckFailed"], OperationStatus.PERMANENT_ERROR, None),
+        (["TransactionConflict", "None"], OperationStatus.TRANSIENT_ERROR, None),
+        (["ConditionalCheckFailed", "TransactionConflict"], OperationStatus.TRANSIENT_ERROR, None),
+        (["ThrottlingError"], OperationStatus.TRANSIENT_ERROR, 60),
+        (["None", "ProvisionedThroughputExceeded"], OperationStatus.TRANSIENT_ERROR, 60),
+    ],
+)
+def test_classify_aws_error_cancelled_transaction_uses_cancellation_reasons(
+    reasons: list[str],
+    expected_status: OperationStatus,
+    expected_retry_after: int | None,
+) -> None:
+    exc = ClientError(
+        error_response={
+            "Error": {"Code": "TransactionCanceledException", "Message": "Transaction cancelled"},
+            "CancellationReasons": [{"Code": reason} for reason in reasons],
+        },
+        operation_name="TransactWriteItems",
+    )
+
+    status, mapped_code, retry_after = aws_client.classify_aws_error(exc)
+
+    assert status is expected_status
+    assert mapped_code == "TransactionCanceledException"
+    assert retry_after == expected_retry_after
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("reasons", [[], ["None", "ValidationError"]])
+def test_classify_aws_error_propagates_cancelled_transaction_with_unknown_reasons(reasons: list[str]) -> None:
+    exc = ClientError(
+        error_response={
+            "Error": {"Code": "TransactionCanceledException", "Message": "Transaction cancelled"},
+            "CancellationReasons": [{"Code": reason} for reason in reasons],
+        },
+        operation_name="TransactWriteItems",
+    )
+
+    with pytest.raises(ClientError):
+        aws_client.classify_aws_error(exc)
+
+
 @pytest.mark.unit
 def test_classify_aws_error_propagates_unmapped_exception() -> None:
     with pytest.raises(KeyError):
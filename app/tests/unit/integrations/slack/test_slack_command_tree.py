@@ -0,0 +1,59 @@
+"""Unit tests for the compiled Slack command trie."""
+
+import pytest
+
+from integrations.slack.command_tree import CommandTree
+from integrations.slack.help import SLACK_HELP_KEYWORDS
+from integrations.slack.models import CommandDefinition
+
+pytestmark = pytest.mark.unit
+
+
+def _registry(*paths: str) -> dict[str, CommandDefinition]:
+    commands = {}
+    for path in paths:
+        parent, _, name = path.rpartition(".")
+        definition = CommandDefinition(name=name, handler=None, parent=parent or None)
+        commands[definition.full_path] = definition
+    return commands
+
+
+@pytest.fixture
+def tree() -> CommandTree:
+    return CommandTree(_registry("sre", "sre.groups", "sre.groups.list", "sre.groups.add", "sre.version", "geolocate"))
+
+
+def test_children_are_sorted_by_name(tree):
+    assert [command.name for command in tree.children("sre.groups")] == ["add", "list"]
+    assert [command.name for command in tree.children("")] == ["geolocate", "sre"]
+
+
+def test_children_of_leaf_or_unknown_path_are_empty(tree):
+    assert tree.children("sre.version") == ()
+    assert tree.children("unknown") == ()
+
+
+@pytest.mark.parametrize(
+    ("tokens", "expected"),
+    [
+        (["groups", "list", "--managed"], ("sre.groups.list", 2)),
+        (["groups", "help"], ("sre.groups", 1)),
+        (["Groups"], ("sre", 0)),
+        (["email@example.com"], ("sre", 0)),
+        ([], ("sre", 0)),
+    ],
+)
+def test_resolve_follows_child_tokens(tree, tokens, expected):
+    assert tree.resolve("sre", tokens, SLACK_HELP_KEYWORDS) == expected
+
+
+def test_registry_changes_apply_after_invalidate():
+    commands = _registry("sre", "sre.groups")
+    tree = CommandTree(commands)
+    assert tree.children("sre.groups") == ()
+
+    commands.update(_registry("sre.groups.list"))
+    assert tree.children("sre.groups") == ()
+
+    tree.invalidate()
+    assert [command.name for command in tree.children("sre.groups")] == ["list"]
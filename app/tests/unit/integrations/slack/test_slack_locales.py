@@ -0,0 +1,93 @@
+"""Unit tests for the shared Slack user locale cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from integrations.slack.locales import UserLocaleCache, prime_user_locales, resolve_user_locale
+
+pytestmark = pytest.mark.unit
+
+
+def _client(locale: str = "fr-FR") -> MagicMock:
+    client = MagicMock()
+    client.users_info.return_value = {"ok": True, "user": {"id": "U1", "locale": locale}}
+    return client
+
+
+def test_resolve_user_locale_serves_repeat_lookups_from_cache():
+    cache = UserLocaleCache()
+    client = _client()
+
+    assert resolve_user_locale(client, "U1", cache) == "fr-FR"
+    assert resolve_user_locale(client, "U1", cache) == "fr-FR"
+
+    client.users_info.assert_called_once_with(user="U1", include_locale=True)
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["saved_ms"] == stats["avg_lookup_ms"]
+
+
+def test_resolve_user_locale_caches_unsupported_locale_as_default():
+    cache = UserLocaleCache()
+    client = _client("es-ES")
+
+    assert resolve_user_locale(client, "U1", cache) == "en-US"
+    assert resolve_user_locale(client, "U1", cache) == "en-US"
+
+    client.users_info.assert_called_once()
+
+
+def test_resolve_user_locale_does_not_cache_failed_lookups():
+    cache = UserLocaleCache()
+    client = MagicMock()
+    client.users_info.return_value = {"ok": False}
+
+    assert resolve_user_locale(client, "U1", cache) == "en-US"
+    assert resolve_user_locale(client, "U1", cache) == "en-US"
+
+    assert client.users_info.call_count == 2
+
+
+def test_cache_entries_expire_after_ttl(fake_clock):
+    cache = UserLocaleCache(ttl_seconds=60, clock=fake_clock)
+    cache.put("U1", "fr-FR")
+
+    fake_clock.now = 59
+    assert cache.get("U1") == "fr-FR"
+    fake_clock.now = 60
+    assert cache.get("U1") is None
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = UserLocaleCache(max_entries=2)
+    cache.put("U1", "fr-FR")
+    cache.put("U2", "en-US")
+    cache.get("U1")
+
+    cache.put("U3", "fr-FR")
+
+    assert cache.get("U2") is None
+    assert cache.get("U1") == "fr-FR"
+    assert cache.get("U3") == "fr-FR"
+
+
+def test_prime_user_locales_follows_pagination_and_skips_bots():
+    cache = UserLocaleCache()
+    client = MagicMock()
+    client.users_list.side_effect = [
+        {
+            "members": [{"id": "U1", "locale": "fr-FR"}, {"id": "B1", "is_bot": True, "locale": "fr-FR"}],
+            "response_metadata": {"next_cursor": "page-2"},
+        },
+        {"members": [{"id": "U2", "locale": "es-ES"}, {"id": "U3", "deleted": True}], "response_metadata": {}},
+    ]
+
+    assert prime_user_locales(client, cache) == 2
+
+    assert client.users_list.call_args_list[1].kwargs == {"include_locale": True, "limit": 200, "cursor": "page-2"}
+    assert cache.get("U1") == "fr-FR"
+    assert cache.get("U2") == "en-US"
+    assert cache.get("B1") is None
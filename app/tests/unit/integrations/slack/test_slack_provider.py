@@ -207,6 +207,53 @@ class TestHierarchicalRouting:
         assert response.message  # Should have some help text
 
 
+@pytest.mark.unit
+class TestHelpCache:
+    """Rendered help is cached until a command is registered or the translator changes."""
+
+    def test_help_is_rendered_once_per_path_and_locale(self, slack_settings):
+        provider = SlackPlatformProvider(settings=slack_settings)
+        provider.register_command("list", handler=None, parent="sre.groups", description="List groups")
+        calls = []
+        translate = provider._help_generator._translator
+        provider._help_generator._translator = lambda *args: calls.append(args) or translate(*args)
+
+        first = provider.generate_help(locale="fr-FR", root_command="sre")
+        translated = len(calls)
+        second = provider.generate_help(locale="fr-FR", root_command="sre")
+
+        assert first == second
+        assert translated > 0
+        assert len(calls) == translated
+
+    def test_registering_a_command_refreshes_help(self, slack_settings):
+        provider = SlackPlatformProvider(settings=slack_settings)
+        provider.register_command("list", handler=None, parent="sre.groups")
+        assert "add" not in provider.generate_help(root_command="sre.groups")
+
+        provider.register_command("add", handler=None, parent="sre.groups")
+
+        assert "/sre groups add" in provider.generate_help(root_command="sre.groups")
+
+    def test_setting_translator_refreshes_help(self, slack_settings):
+        provider = SlackPlatformProvider(settings=slack_settings)
+        provider.register_command("version", handler=None, parent="sre", description_key="sre.version")
+        provider.generate_help(root_command="sre")
+        translator = MagicMock()
+        translator.translate_message.return_value = "Version traduite"
+
+        provider.set_translator(translator)
+
+        assert "Version traduite" in provider.generate_help(locale="fr-FR", root_command="sre")
+
+    def test_unknown_paths_are_not_cached(self, slack_settings):
+        provider = SlackPlatformProvider(settings=slack_settings)
+
+        provider.generate_command_help("does.not.exist")
+
+        assert provider._help_generator._cache == {}
+
+
 @pytest.mark.unit
 class TestInitializeApp:
     """Test initialize_app() method."""
@@ -323,3 +370,40 @@ class TestSlackProviderFactory:
             provider_module.get_slack_provider.cache_clear()
 
         assert captured["command_prefix"] == "dev-"
+
+
+@pytest.mark.unit
+class TestUserLocale:
+    """Test cached user locale lookups."""
+
+    def _provider(self, slack_settings) -> SlackPlatformProvider:
+        provider = SlackPlatformProvider(settings=slack_settings, locale_cache=provider_module.UserLocaleCache())
+        provider._client = MagicMock()
+        provider._client.users_info.return_value = {"ok": True, "user": {"id": "U1", "locale": "fr-FR"}}
+        return provider
+
+    def test_dispatch_reuses_cached_locale(self, slack_settings):
+        provider = self._provider(slack_settings)
+        provider.register_command("ping", lambda payload: CommandResponse(message=payload.user_locale))
+
+        for _ in range(3):
+            payload = CommandPayload(text="", user_id="U1", user_email="u@example.com", channel_id="C1")
+            response = provider.dispatch_command("ping", payload)
+            assert response.message == "fr-FR"
+
+        provider._client.users_info.assert_called_once_with(user="U1", include_locale=True)
+
+    def test_user_change_event_invalidates_cached_locale(self, slack_settings):
+        provider = self._provider(slack_settings)
+        provider.get_user_locale("U1")
+
+        provider._handle_user_change({"type": "user_change", "user": {"id": "U1"}})
+        provider.get_user_locale("U1")
+
+        assert provider._client.users_info.call_count == 2
+
+    def test_lookup_failure_falls_back_to_default(self, slack_settings):
+        provider = self._provider(slack_settings)
+        provider._client.users_info.side_effect = RuntimeError("ratelimited")
+
+        assert provider.get_user_locale("U1") == "en-US"
@@ -0,0 +1,197 @@
+"""Unit tests for the scheduled job executor."""
+
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+import schedule
+
+from jobs.executor import COALESCE, SKIP, ScheduledJobExecutor, get_job_executor, shutdown_job_executor
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def queued() -> list:
+    """Runs handed to the pool; each test starts them explicitly."""
+    return []
+
+
+@pytest.fixture
+def executor(fake_clock, queued):
+    executor = ScheduledJobExecutor(max_workers=2, misfire_grace_seconds=60, clock=fake_clock, submit=queued.append)
+    yield executor
+    executor.shutdown()
+
+
+def test_scheduled_call_is_handed_to_the_pool(executor, queued):
+    func = MagicMock()
+    job = executor.job("report", func)
+
+    job("a", client="client")
+
+    func.assert_not_called()
+    assert executor.stats()["report"]["running"] == 1
+
+    queued.pop()()
+
+    func.assert_called_once_with("a", client="client")
+    stats = executor.stats()["report"]
+    assert stats["running"] == 0
+    assert stats["runs"] == 1
+
+
+def test_skip_policy_drops_overlapping_run(executor, queued):
+    func = MagicMock()
+    job = executor.job("sync", func, misfire_policy=SKIP)
+
+    job()
+    job()
+
+    assert len(queued) == 1
+    queued.pop()()
+    func.assert_called_once()
+    assert executor.stats()["sync"]["overlaps"] == 1
+
+
+def test_coalesce_policy_runs_once_after_current_run(executor, queued, fake_clock):
+    calls = []
+    job = executor.job("report", calls.append, misfire_policy=COALESCE)
+
+    job("first")
+    job("second")
+    job("third")
+    assert len(queued) == 1
+
+    fake_clock.now = 10
+    queued.pop()()
+
+    # The due runs were merged into one, started as soon as the slot freed up.
+    assert len(queued) == 1
+    assert executor.stats()["report"]["pending"] is False
+    queued.pop()()
+
+    assert calls == ["first", "third"]
+    stats = executor.stats()["report"]
+    assert stats["coalesced"] == 2
+    assert stats["running"] == 0
+    assert stats["last_lateness_seconds"] == 10
+
+
+def test_max_instances_allows_concurrent_runs(executor, queued):
+    job = executor.job("fanout", MagicMock(), max_instances=2)
+
+    job()
+    job()
+    job()
+
+    assert len(queued) == 2
+    assert executor.stats()["fanout"]["overlaps"] == 1
+
+
+def test_late_run_misfires_under_skip_policy(executor, queued, fake_clock):
+    func = MagicMock()
+    job = executor.job("heartbeat", func)
+
+    job()
+    fake_clock.now = 61
+    queued.pop()()
+
+    func.assert_not_called()
+    stats = executor.stats()["heartbeat"]
+    assert stats["misfires"] == 1
+    assert stats["runs"] == 0
+    assert stats["running"] == 0
+
+
+def test_late_run_still_runs_under_coalesce_policy(executor, queued, fake_clock):
+    func = MagicMock()
+    job = executor.job("daily", func, misfire_policy=COALESCE)
+
+    job()
+    fake_clock.now = 120
+    queued.pop()()
+
+    func.assert_called_once()
+    assert executor.stats()["daily"]["max_lateness_seconds"] == 120
+
+
+def test_records_duration_and_failures(executor, queued, fake_clock):
+    def slow_failure():
+        fake_clock.now += 5
+        raise RuntimeError("boom")
+
+    job = executor.job("flaky", slow_failure)
+
+    job()
+    queued.pop()()
+
+    stats = executor.stats()["flaky"]
+    assert stats["failures"] == 1
+    assert stats["last_duration_seconds"] == 5
+    assert stats["avg_duration_seconds"] == 5
+
+
+def test_run_pending_counts_missed_runs(executor, queued):
+    scheduler = schedule.Scheduler()
+    func = MagicMock()
+    scheduled = scheduler.every(10).seconds.do(executor.job("tick", func))
+    scheduled.next_run = datetime.now() - timedelta(seconds=35)
+
+    executor.run_pending(scheduler)
+
+    assert len(queued) == 1
+    queued.pop()()
+    func.assert_called_once()
+    stats = executor.stats()["tick"]
+    assert stats["missed_runs"] == 3
+    assert stats["last_lateness_seconds"] >= 35
+    # schedule moved the job to its next period.
+    assert scheduled.next_run > datetime.now()
+
+
+def test_long_job_does_not_hold_up_other_jobs():
+    release = threading.Event()
+    ran = threading.Event()
+    executor = ScheduledJobExecutor(max_workers=2)
+    try:
+        executor.job("slow", lambda: release.wait(5))()
+        executor.job("fast", ran.set)()
+
+        assert ran.wait(1)
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+
+
+def test_run_on_shut_down_executor_is_dropped_and_logged(monkeypatch):
+    logger = MagicMock()
+    monkeypatch.setattr("jobs.executor.logger", logger)
+    executor = ScheduledJobExecutor(max_workers=1)
+    job = executor.job("report", MagicMock())
+    executor.shutdown()
+
+    job()
+
+    assert executor.stats()["report"]["running"] == 0
+    logger.warning.assert_called_once_with("scheduled_job_dropped_executor_shut_down", job_name="report")
+
+
+def test_shutdown_job_executor_replaces_the_singleton():
+    first = get_job_executor()
+
+    shutdown_job_executor()
+    second = get_job_executor()
+
+    assert second is not first
+    with pytest.raises(RuntimeError):
+        first._pool.submit(lambda: None)
+    ran = threading.Event()
+    second.job("report", ran.set)()
+    assert ran.wait(1)
+
+
+def test_unknown_misfire_policy_is_rejected(executor):
+    with pytest.raises(ValueError, match="Unknown misfire policy"):
+        executor.job("job", MagicMock(), misfire_policy="replay")
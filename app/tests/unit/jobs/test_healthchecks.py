@@ -0,0 +1,126 @@
+"""Unit tests for concurrent integration healthchecks."""
+
+import threading
+import time
+
+import pytest
+
+from infrastructure.health import FAILED, HEALTHY, TIMED_OUT, UNHEALTHY, HealthStatusRegistry
+from jobs.healthchecks import HealthcheckRunner, IntegrationHealthcheck, get_healthcheck_runner, shutdown_healthcheck_runner
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def registry() -> HealthStatusRegistry:
+    return HealthStatusRegistry()
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def _runner(registry: HealthStatusRegistry, timeout_seconds: float = 1.0, max_workers: int = 4) -> HealthcheckRunner:
+    return HealthcheckRunner(registry, timeout_seconds=timeout_seconds, max_workers=max_workers)
+
+
+def _raise() -> bool:
+    raise RuntimeError("connection refused")
+
+
+def test_run_records_each_outcome(registry):
+    results = _runner(registry).run(
+        [
+            IntegrationHealthcheck("google_drive", lambda: True),
+            IntegrationHealthcheck("opsgenie", lambda: False),
+            IntegrationHealthcheck("maxmind", _raise),
+        ]
+    )
+
+    assert results == {"google_drive": HEALTHY, "opsgenie": UNHEALTHY, "maxmind": FAILED}
+    assert registry.get("maxmind")["error"] == "connection refused"
+    assert registry.get("google_drive")["duration_seconds"] is not None
+
+
+def test_checks_run_concurrently(registry):
+    barrier = threading.Barrier(3, timeout=1)
+
+    def check() -> bool:
+        barrier.wait()
+        return True
+
+    results = _runner(registry).run([IntegrationHealthcheck(name, check) for name in ("a", "b", "c")])
+
+    assert set(results.values()) == {HEALTHY}
+
+
+def test_hung_check_times_out_without_delaying_others(registry, release):
+    started = time.monotonic()
+
+    results = _runner(registry).run(
+        [
+            IntegrationHealthcheck("aws", release.wait, timeout_seconds=0.05),
+            IntegrationHealthcheck("maxmind", lambda: True),
+        ]
+    )
+
+    assert results == {"aws": TIMED_OUT, "maxmind": HEALTHY}
+    assert time.monotonic() - started < 0.9
+
+
+def test_hung_check_is_not_resubmitted_until_it_returns(registry, release):
+    calls = []
+
+    def hung() -> bool:
+        calls.append(1)
+        return release.wait()
+
+    runner = _runner(registry, timeout_seconds=0.05)
+    runner.run([IntegrationHealthcheck("aws", hung)])
+    results = runner.run([IntegrationHealthcheck("aws", hung)])
+
+    assert results == {"aws": TIMED_OUT}
+    assert len(calls) == 1
+    assert registry.get("aws")["error"] == "previous check still running"
+
+    release.set()
+    time.sleep(0.05)
+    assert runner.run([IntegrationHealthcheck("aws", hung)]) == {"aws": HEALTHY}
+
+
+def test_run_is_bounded_when_every_worker_is_held(registry, release):
+    started = time.monotonic()
+
+    results = _runner(registry, timeout_seconds=0.05, max_workers=1).run(
+        [IntegrationHealthcheck("aws", release.wait), IntegrationHealthcheck("maxmind", lambda: True)]
+    )
+
+    assert results == {"aws": TIMED_OUT, "maxmind": TIMED_OUT}
+    assert time.monotonic() - started < 0.9
+
+
+def test_shutdown_does_not_wait_for_hung_checks(registry, release):
+    runner = _runner(registry, timeout_seconds=0.05, max_workers=1)
+    runner.run([IntegrationHealthcheck("aws", release.wait)])
+
+    started = time.monotonic()
+    runner.shutdown()
+
+    assert time.monotonic() - started < 0.5
+    with pytest.raises(RuntimeError):
+        runner.run([IntegrationHealthcheck("maxmind", lambda: True)])
+
+
+def test_shutdown_healthcheck_runner_forgets_the_singleton(monkeypatch):
+    monkeypatch.setattr("jobs.healthchecks.HealthcheckRunner.shutdown", lambda self: shutdown_calls.append(self))
+    shutdown_calls: list[HealthcheckRunner] = []
+    runner = get_healthcheck_runner()
+
+    shutdown_healthcheck_runner()
+    shutdown_healthcheck_runner()
+
+    assert shutdown_calls == [runner]
+    assert get_healthcheck_runner() is not runner
@@ -31,6 +31,22 @@ class TestSchedulerSettings:
 
         assert settings.DEFAULT_TIER2_LEASE_TTL_SECONDS == 3600
 
+    @pytest.mark.unit
+    def test_scheduler_settings_healthcheck_defaults(self) -> None:
+        """Integration healthchecks default to a 10s timeout on four workers."""
+        settings = SchedulerSettings()
+
+        assert settings.HEALTHCHECK_TIMEOUT_SECONDS == 10.0
+        assert settings.HEALTHCHECK_MAX_WORKERS == 4
+
+    @pytest.mark.unit
+    def test_scheduler_settings_job_pool_defaults(self) -> None:
+        """Scheduled jobs run on four workers with a five-minute misfire grace."""
+        settings = SchedulerSettings()
+
+        assert settings.SCHEDULER_MAX_WORKERS == 4
+        assert settings.SCHEDULER_MISFIRE_GRACE_SECONDS == 300.0
+
     @pytest.mark.unit
     def test_get_scheduler_settings_returns_singleton(self) -> None:
         """get_scheduler_settings() returns the same singleton instance."""
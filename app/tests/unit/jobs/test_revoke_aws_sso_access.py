@@ -83,7 +83,7 @@ def test_revoke_access_success(
     # Verify sequence of calls
     mock_identity_store.get_user_id.assert_called_once_with("user@example.com")
     mock_sso.delete_account_assignment.assert_called_once_with("aws-user-123", "123456789", "ReadOnlyAccess")
-    mock_aws_requests.expire_request.assert_called_once_with(account_id="123456789", created_at="1704067200")
+    mock_aws_requests.expire_requests.assert_called_once_with([expired_request])
 
     # Verify notifications
     assert mock_slack_client.chat_postEphemeral.call_count == 1
@@ -160,7 +160,7 @@ def test_revoke_access_handles_sso_deletion_error(
     revoke_aws_sso_access(mock_slack_client)
 
     assert mock_logger.error.call_count == 1
-    mock_aws_requests.expire_request.assert_not_called()
+    mock_aws_requests.expire_requests.assert_not_called()
     mock_slack_client.chat_postEphemeral.assert_not_called()
     mock_log_ops.assert_not_called()
 
@@ -202,7 +202,7 @@ def test_revoke_access_multiple_requests(
     # Verify both requests were processed
     assert mock_identity_store.get_user_id.call_count == 2
     assert mock_sso.delete_account_assignment.call_count == 2
-    assert mock_aws_requests.expire_request.call_count == 2
+    mock_aws_requests.expire_requests.assert_called_once_with([expired_request, request2])
     assert mock_slack_client.chat_postEphemeral.call_count == 2
 
 
@@ -234,3 +234,65 @@ def test_revoke_access_no_expired_requests(
     mock_sso.delete_account_assignment.assert_not_called()
     mock_slack_client.chat_postEphemeral.assert_not_called()
     mock_log_ops.assert_not_called()
+
+
+@pytest.mark.unit
+@patch("jobs.revoke_aws_sso_access.aws_access_requests")
+@patch("jobs.revoke_aws_sso_access.identity_store")
+@patch("jobs.revoke_aws_sso_access.sso_admin")
+@patch("jobs.revoke_aws_sso_access.log_ops_message")
+@patch("jobs.revoke_aws_sso_access.logger")
+def test_revoke_access_batches_only_revoked_requests(
+    mock_logger,
+    mock_log_ops,
+    mock_sso,
+    mock_identity_store,
+    mock_aws_requests,
+    make_expired_request,
+    mock_slack_client,
+) -> None:
+    """Test that only requests whose assignment was removed are marked expired."""
+    revoked = make_expired_request()
+    failing = make_expired_request(account_id={"S": "987654321"}, created_at={"N": "1704067300"})
+    mock_aws_requests.get_expired_requests.return_value = [revoked, failing]
+    mock_aws_requests.expire_requests.return_value = []
+    mock_identity_store.get_user_id.return_value = "aws-user-123"
+
+    def delete_assignment(user_id, account_id, access_type):
+        if account_id == "987654321":
+            raise RuntimeError("SSO API error")
+
+    mock_sso.delete_account_assignment.side_effect = delete_assignment
+
+    revoke_aws_sso_access(mock_slack_client)
+
+    mock_aws_requests.expire_requests.assert_called_once_with([revoked])
+    assert mock_slack_client.chat_postEphemeral.call_count == 1
+    assert mock_log_ops.call_count == 1
+
+
+@pytest.mark.unit
+@patch("jobs.revoke_aws_sso_access.aws_access_requests")
+@patch("jobs.revoke_aws_sso_access.identity_store")
+@patch("jobs.revoke_aws_sso_access.sso_admin")
+@patch("jobs.revoke_aws_sso_access.log_ops_message")
+@patch("jobs.revoke_aws_sso_access.logger")
+def test_revoke_access_skips_notification_when_expire_write_unprocessed(
+    mock_logger,
+    mock_log_ops,
+    mock_sso,
+    mock_identity_store,
+    mock_aws_requests,
+    expired_request,
+    mock_slack_client,
+) -> None:
+    """Test that a request left unprocessed by the batch write is not announced as revoked."""
+    mock_aws_requests.get_expired_requests.return_value = [expired_request]
+    mock_aws_requests.expire_requests.return_value = [expired_request]
+    mock_identity_store.get_user_id.return_value = "aws-user-123"
+
+    revoke_aws_sso_access(mock_slack_client)
+
+    mock_slack_client.chat_postEphemeral.assert_not_called()
+    mock_log_ops.assert_not_called()
+    assert mock_logger.error.call_args[0][0] == "failed_to_expire_aws_access_request"
@@ -7,6 +7,7 @@ executing the actual scheduled work.
 from unittest.mock import MagicMock, patch
 
 import pytest
+import schedule
 
 from infrastructure.idempotency import IdempotencySettings, InMemoryIdempotencyStore
 from jobs.scheduled_tasks import (
@@ -16,6 +17,7 @@ from jobs.scheduled_tasks import (
     reconcile_access_sync,
     safe_run,
     scheduler_heartbeat,
+    shutdown,
 )
 
 
@@ -359,3 +361,31 @@ class TestInitJobRegistration:
             "scheduler:spending_generate_spending_data",
         }
         assert mock_tier2.call_count == 3
+
+
+class TestSchedulerLoop:
+    """Tests for the heartbeat placement and shutdown of the schedule loop."""
+
+    @pytest.mark.unit
+    @patch("jobs.scheduled_tasks.get_plugin_manager")
+    @patch("jobs.scheduled_tasks._tier2")
+    def test_heartbeat_runs_on_the_loop_thread(self, _mock_tier2, _mock_get_pm) -> None:
+        """The heartbeat is scheduled directly, not handed to the job executor."""
+        try:
+            init(MagicMock())
+            funcs = [job.job_func.func for job in schedule.default_scheduler.jobs]
+        finally:
+            schedule.clear()
+
+        assert scheduler_heartbeat in funcs
+
+    @pytest.mark.unit
+    @patch("jobs.scheduled_tasks.shutdown_job_executor")
+    def test_shutdown_clears_jobs_and_stops_executor(self, mock_shutdown_executor) -> None:
+        """shutdown() forgets registered jobs and the job executor."""
+        schedule.every(5).minutes.do(MagicMock())
+
+        shutdown()
+
+        assert schedule.default_scheduler.jobs == []
+        mock_shutdown_executor.assert_called_once_with()
@@ -1,10 +1,12 @@
 """Unit tests for AWS access requests handler."""
 
 import datetime
+from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
 
+from infrastructure.operations.result import OperationResult
 from modules.aws import aws_access_requests
 
 
@@ -201,28 +203,34 @@ def test_should_return_false_when_expire_request_fails(mock_client):
     assert result is False
 
 
+def _paginate(mock_client, *pages):
+    """Configure the mocked client's paginator to yield the given pages."""
+    mock_client.get_paginator.return_value.paginate.return_value = [{"Items": items} for items in pages]
+    return mock_client.get_paginator.return_value.paginate
+
+
 @pytest.mark.unit
 @patch("modules.aws.aws_access_requests.dynamodb_client")
 def test_should_get_expired_requests_successfully(mock_client):
-    """Test get_expired_requests returns list of expired requests."""
+    """Test get_expired_requests queries every page of the sparse expiry index."""
     # Arrange
     expired_time = datetime.datetime.now().timestamp() - (5 * 60 * 60)
-    mock_client.scan.return_value = {
-        "Items": [
-            {
-                "id": {"S": "req-123"},
-                "account_id": {"S": "account-123"},
-                "created_at": {"N": str(expired_time)},
-            }
-        ]
-    }
+    first = {"id": {"S": "req-1"}, "end_date_time": {"N": str(expired_time)}}
+    second = {"id": {"S": "req-2"}, "end_date_time": {"N": str(expired_time)}}
+    paginate = _paginate(mock_client, [first], [second])
 
     # Act
     result = aws_access_requests.get_expired_requests()
 
     # Assert
-    assert isinstance(result, list)
-    mock_client.scan.assert_called_once()
+    assert result == [first, second]
+    mock_client.get_paginator.assert_called_once_with("query")
+    kwargs = paginate.call_args[1]
+    assert kwargs["IndexName"] == aws_access_requests.EXPIRY_INDEX
+    assert kwargs["KeyConditionExpression"] == "expiry_bucket = :bucket and end_date_time <= :current_time"
+    assert kwargs["ExpressionAttributeValues"][":bucket"] == {"S": "active"}
+    assert "N" in kwargs["ExpressionAttributeValues"][":current_time"]
+    mock_client.scan.assert_not_called()
 
 
 @pytest.mark.unit
@@ -230,7 +238,7 @@ def test_should_get_expired_requests_successfully(mock_client):
 def test_should_return_empty_list_when_no_expired_requests(mock_client):
     """Test get_expired_requests returns empty list when no expired records."""
     # Arrange
-    mock_client.scan.return_value = {"Items": []}
+    _paginate(mock_client, [])
 
     # Act
     result = aws_access_requests.get_expired_requests()
@@ -245,23 +253,20 @@ def test_should_get_active_requests_successfully(mock_client):
     """Test get_active_requests returns list of active requests."""
     # Arrange
     now = datetime.datetime.now().timestamp()
-    mock_client.scan.return_value = {
-        "Items": [
-            {
-                "id": {"S": "req-123"},
-                "account_id": {"S": "account-123"},
-                "created_at": {"N": str(now)},
-                "expired": {"BOOL": False},
-            }
-        ]
+    item = {
+        "id": {"S": "req-123"},
+        "account_id": {"S": "account-123"},
+        "created_at": {"N": str(now)},
+        "expired": {"BOOL": False},
     }
+    paginate = _paginate(mock_client, [item])
 
     # Act
     result = aws_access_requests.get_active_requests()
 
     # Assert
-    assert isinstance(result, list)
-    mock_client.scan.assert_called_once()
+    assert result == [item]
+    assert paginate.call_args[1]["KeyConditionExpression"] == "expiry_bucket = :bucket and end_date_time > :current_time"
 
 
 @pytest.mark.unit
@@ -269,10 +274,155 @@ def test_should_get_active_requests_successfully(mock_client):
 def test_should_return_empty_list_when_no_active_requests(mock_client):
     """Test get_active_requests returns empty list when no active records."""
     # Arrange
-    mock_client.scan.return_value = {"Items": []}
+    _paginate(mock_client, [])
 
     # Act
     result = aws_access_requests.get_active_requests()
 
     # Assert
     assert result == []
+
+
+@pytest.mark.unit
+@patch("modules.aws.aws_access_requests.dynamodb_client")
+def test_should_get_past_requests_across_scan_pages(mock_client):
+    """Test get_past_requests does not stop at the first scan page."""
+    # Arrange
+    paginate = _paginate(mock_client, [{"id": {"S": "req-1"}}], [{"id": {"S": "req-2"}}])
+
+    # Act
+    result = aws_access_requests.get_past_requests()
+
+    # Assert
+    assert [item["id"]["S"] for item in result] == ["req-1", "req-2"]
+    mock_client.get_paginator.assert_called_once_with("scan")
+    assert "N" in paginate.call_args[1]["ExpressionAttributeValues"][":current_time"]
+
+
+@pytest.mark.unit
+@patch("modules.aws.aws_access_requests.dynamodb_client")
+def test_should_store_numeric_dates_and_expiry_bucket_on_create(mock_client):
+    """Test create_aws_access_request writes the expiry index attributes."""
+    # Arrange
+    mock_client.put_item.return_value = {"ResponseMetadata": {"HTTPStatusCode": 200}}
+
+    # Act
+    aws_access_requests.create_aws_access_request(
+        "account-123", "TestAccount", "user-123", "user@example.com", "read", "Test rationale"
+    )
+
+    # Assert
+    item = mock_client.put_item.call_args[1]["Item"]
+    assert item["expiry_bucket"] == {"S": "active"}
+    assert float(item["end_date_time"]["N"]) - float(item["created_at"]["N"]) == pytest.approx(4 * 60 * 60, abs=5)
+    assert "N" in item["start_date_time"]
+
+
+@pytest.mark.unit
+@patch("modules.aws.aws_access_requests.get_storage_service")
+def test_should_expire_requests_in_batches_through_storage_service(mock_get_storage):
+    """Test expire_requests writes chunks of 25 plain items with batch_put."""
+    # Arrange
+    requests = [
+        {
+            "account_id": {"S": f"account-{i}"},
+            "created_at": {"N": str(i)},
+            "expired": {"BOOL": False},
+            "expiry_bucket": {"S": "active"},
+        }
+        for i in range(30)
+    ]
+    storage = mock_get_storage.return_value
+    storage.batch_put.return_value = OperationResult.success(data=25)
+
+    # Act
+    failed = aws_access_requests.expire_requests(requests)
+
+    # Assert
+    assert failed == []
+    assert storage.batch_put.call_count == 2
+    table, first_batch = storage.batch_put.call_args_list[0][0]
+    assert table == "aws_access_requests"
+    assert len(first_batch) == 25
+    assert first_batch[0] == {"account_id": "account-0", "created_at": Decimal("0"), "expired": True}
+    assert len(storage.batch_put.call_args_list[1][0][1]) == 5
+
+
+@pytest.mark.unit
+@patch("modules.aws.aws_access_requests.get_storage_service")
+def test_should_return_failed_chunk_and_keep_writing_the_rest(mock_get_storage):
+    """Test a failing chunk is returned as unprocessed and later chunks are still written."""
+    # Arrange
+    requests = [{"account_id": {"S": f"account-{i}"}, "created_at": {"N": str(i)}} for i in range(30)]
+    storage = mock_get_storage.return_value
+    storage.batch_put.side_effect = [
+        OperationResult.transient_error(message="ProvisionedThroughputExceededException", error_code="ThrottlingError"),
+        OperationResult.success(data=5),
+    ]
+
+    # Act
+    failed = aws_access_requests.expire_requests(requests)
+
+    # Assert
+    assert failed == [{**request, "expired": {"BOOL": True}} for request in requests[:25]]
+    assert storage.batch_put.call_count == 2
+
+
+@pytest.mark.unit
+@patch("modules.aws.aws_access_requests.get_storage_service")
+@patch("modules.aws.aws_access_requests.dynamodb_client")
+def test_should_migrate_legacy_items_to_expiry_index(mock_client, mock_get_storage):
+    """Test migrate_to_expiry_index converts legacy items and keeps the 4 hour deadline."""
+    # Arrange
+    legacy_active = {
+        "account_id": {"S": "account-1"},
+        "created_at": {"N": "1000"},
+        "start_date_time": {"S": "1000.0"},
+        "end_date_time": {"S": "4600.0"},
+        "expired": {"BOOL": False},
+    }
+    legacy_expired = {
+        "account_id": {"S": "account-2"},
+        "created_at": {"N": "1000"},
+        "start_date_time": {"S": "1000.0"},
+        "end_date_time": {"S": "4600.0"},
+        "expired": {"BOOL": True},
+    }
+    migrated_already = {
+        "account_id": {"S": "account-3"},
+        "created_at": {"N": "1000"},
+        "end_date_time": {"N": "15400.0"},
+        "expired": {"BOOL": False},
+        "expiry_bucket": {"S": "active"},
+    }
+    _paginate(mock_client, [legacy_active, legacy_expired], [migrated_already])
+    storage = mock_get_storage.return_value
+    storage.batch_put.return_value = OperationResult.success(data=2)
+
+    # Act
+    result = aws_access_requests.migrate_to_expiry_index()
+
+    # Assert
+    assert result == {"scanned": 3, "migrated": 2, "failed": 0}
+    written = storage.batch_put.call_args[0][1]
+    assert written[0]["end_date_time"] == Decimal(str(1000 + 4 * 60 * 60.0))
+    assert written[0]["expiry_bucket"] == "active"
+    assert written[0]["start_date_time"] == Decimal("1000.0")
+    assert written[1]["end_date_time"] == Decimal("4600.0")
+    assert "expiry_bucket" not in written[1]
+
+
+@pytest.mark.unit
+@patch("modules.aws.aws_access_requests.get_storage_service")
+@patch("modules.aws.aws_access_requests.dynamodb_client")
+def test_should_not_write_during_migration_dry_run(mock_client, mock_get_storage):
+    """Test migrate_to_expiry_index dry run only counts items."""
+    # Arrange
+    _paginate(mock_client, [{"account_id": {"S": "a"}, "created_at": {"N": "1"}, "expired": {"BOOL": False}}])
+
+    # Act
+    result = aws_access_requests.migrate_to_expiry_index(dry_run=True)
+
+    # Assert
+    assert result == {"scanned": 1, "migrated": 1, "failed": 0}
+    mock_get_storage.return_value.batch_put.assert_not_called()
@@ -260,7 +260,7 @@ def test_should_handle_health_view_handler(mock_get_health):
 def test_should_request_health_modal(mock_organizations):
     """Test request_health_modal fetches and displays accounts."""
     # Arrange
-    mock_organizations.list_organization_accounts.return_value = [
+    mock_organizations.list_accounts.return_value = [
         {"Id": "account-1", "Name": "Account1"},
         {"Id": "account-2", "Name": "Account2"},
     ]
@@ -271,5 +271,5 @@ def test_should_request_health_modal(mock_organizations):
     aws_account_health.request_health_modal(client, body)
 
     # Assert
-    mock_organizations.list_organization_accounts.assert_called_once()
+    mock_organizations.list_accounts.assert_called_once()
     client.views_open.assert_called_once()
@@ -13,7 +13,7 @@ from modules.aws import spending
 def test_should_generate_spending_data_successfully(mock_organizations):
     """Test successful spending data generation."""
     # Arrange
-    mock_organizations.list_organization_accounts.return_value = [{"Id": "123456789012", "Name": "TestAccount"}]
+    mock_organizations.list_accounts.return_value = [{"Id": "123456789012", "Name": "TestAccount"}]
 
     # Act - Test with actual spending data to avoid merge issues
     with patch("modules.aws.spending.get_accounts_details") as mock_get_details:
@@ -39,6 +39,8 @@ def test_access_sync_settings_defaults():
     assert s.reconciliation_schedule == "03:00"
     assert s.job_ttl_seconds == 86400
     assert s.lock_stale_seconds == 14400
+    assert s.group_cache_ttl_seconds == 300
+    assert s.desired_state_max_age_seconds == 82800
 
 
 @pytest.mark.unit
@@ -81,12 +83,14 @@ def test_access_settings_reads_sync_flat_env_vars(monkeypatch):
     monkeypatch.setenv("ACCESS_SYNC_JOB_TTL_SECONDS", "7200")
     monkeypatch.setenv("ACCESS_SYNC_LOCK_STALE_SECONDS", "1800")
     monkeypatch.setenv("ACCESS_SYNC_RECONCILIATION_SCHEDULE", "02:30")
+    monkeypatch.setenv("ACCESS_SYNC_DESIRED_STATE_MAX_AGE_SECONDS", "0")
 
     s = AccessSettings(_env_file=None).sync
     assert s.enabled is True
     assert s.job_ttl_seconds == 7200
     assert s.lock_stale_seconds == 1800
     assert s.reconciliation_schedule == "02:30"
+    assert s.desired_state_max_age_seconds == 0
 
 
 @pytest.mark.unit
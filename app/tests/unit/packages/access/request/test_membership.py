@@ -0,0 +1,114 @@
+"""Unit tests for packages/access/request/membership.py."""
+
+import pytest
+
+from infrastructure.directory.models import DirectoryMember
+from packages.access.request.membership import ApproverCache, GroupMemberSnapshot
+
+GROUP = "sg-aws-admins@example.com"
+
+
+def make_snapshot(*members: DirectoryMember) -> GroupMemberSnapshot:
+    return GroupMemberSnapshot(group_email=GROUP, members=members)
+
+
+# ---------------------------------------------------------------------------
+# GroupMemberSnapshot
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_snapshot_direct_user_member_is_a_member():
+    snapshot = make_snapshot(DirectoryMember(email="User@Example.com", member_type="USER", role="MEMBER"))
+
+    assert snapshot.is_member("user@example.com") is True
+
+
+@pytest.mark.unit
+def test_snapshot_absence_is_definite_when_all_members_are_typed_users():
+    snapshot = make_snapshot(DirectoryMember(email="owner@example.com", member_type="USER", role="OWNER"))
+
+    assert snapshot.is_member("user@example.com") is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("member_type", ["GROUP", "CUSTOMER", None])
+def test_snapshot_absence_defers_to_directory_when_membership_may_be_transitive(member_type):
+    snapshot = make_snapshot(
+        DirectoryMember(email="owner@example.com", member_type="USER", role="OWNER"),
+        DirectoryMember(email="nested@example.com", member_type=member_type),
+    )
+
+    assert snapshot.is_member("user@example.com") is None
+
+
+@pytest.mark.unit
+def test_snapshot_owner_or_manager_ignores_nested_groups_and_plain_members():
+    snapshot = make_snapshot(
+        DirectoryMember(email="owner@example.com", member_type="USER", role="OWNER"),
+        DirectoryMember(email="manager@example.com", role="manager"),
+        DirectoryMember(email="member@example.com", member_type="USER", role="MEMBER"),
+        DirectoryMember(email="team@example.com", member_type="GROUP", role="OWNER"),
+    )
+
+    assert snapshot.is_owner_or_manager("OWNER@example.com")
+    assert snapshot.is_owner_or_manager("manager@example.com")
+    assert not snapshot.is_owner_or_manager("member@example.com")
+    assert not snapshot.is_owner_or_manager("team@example.com")
+    assert [m.email for m in snapshot.user_members] == [
+        "owner@example.com",
+        "manager@example.com",
+        "member@example.com",
+    ]
+
+
+# ---------------------------------------------------------------------------
+# ApproverCache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_approver_cache_serves_until_ttl_expires(fake_clock):
+    cache = ApproverCache(ttl_seconds=60, clock=fake_clock)
+    cache.put(GROUP, ["owner@example.com"])
+
+    fake_clock.now += 59
+    assert cache.get(GROUP.upper()) == ["owner@example.com"]
+
+    fake_clock.now += 1
+    assert cache.get(GROUP) is None
+
+
+@pytest.mark.unit
+def test_approver_cache_skips_empty_lists_and_zero_ttl():
+    cache = ApproverCache(ttl_seconds=60)
+    cache.put(GROUP, [])
+    disabled = ApproverCache(ttl_seconds=0)
+    disabled.put(GROUP, ["owner@example.com"])
+
+    assert cache.get(GROUP) is None
+    assert disabled.get(GROUP) is None
+
+
+@pytest.mark.unit
+def test_approver_cache_invalidate_and_clear():
+    cache = ApproverCache(ttl_seconds=60)
+    cache.put(GROUP, ["owner@example.com"])
+    cache.put("other@example.com", ["admin@example.com"])
+
+    cache.invalidate(GROUP)
+    assert cache.get(GROUP) is None
+    assert cache.get("other@example.com") == ["admin@example.com"]
+
+    cache.clear()
+    assert cache.get("other@example.com") is None
+
+
+@pytest.mark.unit
+def test_approver_cache_returns_copies():
+    cache = ApproverCache(ttl_seconds=60)
+    cache.put(GROUP, ["owner@example.com"])
+
+    cache.get(GROUP).append("intruder@example.com")  # type: ignore[union-attr]
+
+    assert cache.get(GROUP) == ["owner@example.com"]
@@ -304,3 +304,19 @@ def test_meets_minimum_approver_count_mixed_decisions():
 @pytest.mark.unit
 def test_meets_minimum_approver_count_empty_decisions():
     assert meets_minimum_approver_count([], required_count=1) is False
+
+
+@pytest.mark.unit
+def test_resolve_approver_candidates_uses_prefetched_members():
+    directory = MagicMock()
+    group = make_directory_group()
+
+    result = resolve_approver_candidates(
+        group,
+        "sg-org-admins",
+        directory,
+        group_members=[make_member("owner@example.com", role="OWNER"), make_member("member@example.com", role="MEMBER")],
+    )
+
+    assert result == ["owner@example.com"]
+    directory.get_group_members.assert_not_called()
@@ -262,6 +262,9 @@ def test_submit_request_should_reject_when_already_provisioned():
     directory = MagicMock()
     directory.get_group.return_value = OperationResult.success(data=make_directory_group())
     directory.check_membership.return_value = OperationResult.success(data=make_membership(is_member=True))
+    directory.get_group_members.return_value = OperationResult.success(
+        data=[DirectoryMember(email="approver@example.com", role="OWNER")]
+    )
     service, _, _ = make_service(directory=directory)
 
     result = service.submit_request(
@@ -1030,3 +1033,109 @@ def test_revoke_request_type_in_approved_event_metadata():
 
     approved_event = next(e for e in dispatcher.dispatched if e.event_type == "access_request_approved")
     assert approved_event.metadata["request_type"] == "revoke"
+
+
+# ---------------------------------------------------------------------------
+# Group member snapshot / approver cache
+# ---------------------------------------------------------------------------
+
+
+def _submit(service: AccessRequestService, actor_email: str = "user@example.com", actor_type: str = "self"):
+    return service.submit_request(
+        user_email="user@example.com",
+        actor_email=actor_email,
+        actor_type=actor_type,
+        request_type="grant",
+        platform="aws",
+        group_slug="sg-aws-admins",
+        entitlement_type="group",
+        justification="Need access.",
+    )
+
+
+@pytest.mark.unit
+def test_submit_request_fetches_group_members_once_for_delegated_request():
+    service, _, _ = make_service()
+
+    result = _submit(service, actor_email="manager@example.com", actor_type="delegated")
+
+    assert result.is_success
+    service._directory.get_group_members.assert_called_once_with(group_key="sg-aws-admins@example.com")
+
+
+@pytest.mark.unit
+def test_submit_request_answers_eligibility_from_snapshot_when_members_are_typed_users():
+    directory = MagicMock()
+    directory.get_group.return_value = OperationResult.success(data=make_directory_group())
+    directory.get_group_members.return_value = OperationResult.success(
+        data=[DirectoryMember(email="approver@example.com", member_type="USER", role="OWNER")]
+    )
+    service, _, _ = make_service(directory=directory)
+
+    result = _submit(service)
+
+    assert result.is_success
+    directory.check_membership.assert_not_called()
+
+
+@pytest.mark.unit
+def test_submit_request_defers_to_check_membership_when_group_has_nested_groups():
+    directory = MagicMock()
+    directory.get_group.return_value = OperationResult.success(data=make_directory_group())
+    directory.check_membership.return_value = OperationResult.success(data=make_membership(is_member=True))
+    directory.get_group_members.return_value = OperationResult.success(
+        data=[
+            DirectoryMember(email="approver@example.com", member_type="USER", role="OWNER"),
+            DirectoryMember(email="team@example.com", member_type="GROUP", role="MEMBER"),
+        ]
+    )
+    service, _, _ = make_service(directory=directory)
+
+    result = _submit(service)
+
+    assert not result.is_success
+    assert result.error_code == "ALREADY_PROVISIONED"
+    directory.check_membership.assert_called_once()
+
+
+@pytest.mark.unit
+def test_submit_request_reuses_cached_approvers_for_self_requests():
+    service, _, _ = make_service()
+
+    first = _submit(service)
+    second = _submit(service)
+
+    assert first.is_success
+    assert second.is_success
+    assert second.data.resolved_approvers == first.data.resolved_approvers
+    service._directory.get_group_members.assert_called_once()
+
+
+@pytest.mark.unit
+def test_submit_request_auto_approval_invalidates_cached_approvers():
+    service, _, _ = make_service()
+    _submit(service)
+
+    _submit(service, actor_email="manager@example.com", actor_type="delegated")
+    _submit(service)
+
+    assert service._directory.get_group_members.call_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("metadata", "cleared"),
+    [
+        ({"applied": 2}, True),
+        ({"applied": 0}, False),
+        ({"applied": 2, "dry_run": True}, False),
+    ],
+)
+def test_on_membership_changed_clears_cache_only_for_applied_syncs(metadata, cleared):
+    service, _, _ = make_service()
+    _submit(service)
+
+    service.on_membership_changed(Event(event_type=SYNC_COMPLETED, metadata=metadata))
+    _submit(service)
+
+    assert service._directory.get_group_members.call_count == (2 if cleared else 1)
@@ -6,8 +6,10 @@ Covers:
   F-03  POLICY_NOT_FOUND and ADAPTER_NOT_FOUND errors surface correctly
   F-04  dry_run returns planned actions without executing them
   F-05  UNSUPPORTED_OPERATION from adapter sets requires_manual_action
+  F-06  sync_platform skips planning while the desired state is unchanged
 """
 
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
@@ -24,6 +26,7 @@ from packages.access.sync.desired_state import DirectoryMembershipBuilder
 from packages.access.sync.domain import (
     AdapterAssessment,
     DesiredPlatformState,
+    DesiredStateSnapshot,
     DesiredUserState,
     ReconciliationOutcome,
     SyncOutcome,
@@ -35,6 +38,8 @@ from packages.access.sync.policies import (
     PlatformReconciliationPlanner,
     PolicyEngine,
 )
+from packages.access.sync.store import DesiredStateRepository
+from tests.unit.infrastructure.storage.fake_storage import FakeStorageService
 
 # ---------------------------------------------------------------------------
 # Test doubles
@@ -54,10 +59,15 @@ class FakeAdapter:
         self._current_ids: set[str] = current_entitlement_ids or set()
         self._user_exists = user_exists
         self._disable_fails = disable_fails
+        self._apply_fails = False
+        self.failed_entitlements: list[str] = []
 
     def set_disable_fails(self) -> None:
         self._disable_fails = True
 
+    def set_apply_fails(self, fails: bool = True) -> None:
+        self._apply_fails = fails
+
     def capabilities(self) -> AdapterCapabilities:
         return AdapterCapabilities(
             supports_disable=True,
@@ -86,6 +96,12 @@ class FakeAdapter:
 
     def apply_entitlement(self, email: str, etype: str, eid: str) -> OperationResult:
         self.calls.append(("apply_entitlement", email, etype, eid))
+        if self._apply_fails:
+            return OperationResult.error(
+                OperationStatus.PERMANENT_ERROR,
+                message="Apply not supported",
+                error_code="UNSUPPORTED_OPERATION",
+            )
         return OperationResult.success()
 
     def remove_entitlement(self, email: str, etype: str, eid: str) -> OperationResult:
@@ -187,6 +203,7 @@ class FakeAdapter:
 
         per_user: dict[str, SyncOutcome] = {}
         users_converged = 0
+        requires_manual_action_count = 0
         for email, planned in sorted(actions_by_user.items()):
             if dry_run:
                 outcome = SyncOutcome(
@@ -198,15 +215,18 @@ class FakeAdapter:
             per_user[email] = outcome
             if outcome.applied_actions:
                 users_converged += 1
+            if outcome.requires_manual_action:
+                requires_manual_action_count += 1
         return OperationResult.success(
             data=ReconciliationOutcome(
                 platform=context.platform,
                 users_synced=len(desired_state.desired_users),
                 users_converged=users_converged,
                 orphans_found=0,
-                requires_manual_action_count=0,
+                requires_manual_action_count=requires_manual_action_count,
                 dry_run=dry_run,
                 per_user=per_user,
+                failed_entitlements=list(self.failed_entitlements),
             )
         )
 
@@ -253,6 +273,9 @@ class FakeDirectory:
             )
         )
 
+    def get_groups_batch(self, slugs: list[str]) -> OperationResult:
+        return OperationResult.success(data={slug: self.get_group(slug).data for slug in slugs})
+
     def check_membership(self, group_email: str, user_email: str) -> OperationResult:
         slug = group_email.split("@")[0]
         is_member = self._per_group.get(slug, self._is_member)
@@ -461,3 +484,119 @@ def test_sync_platform_unknown_platform_returns_error():
     result = coordinator.sync_platform("nonexistent")
     assert not result.is_success
     assert result.error_code == "POLICY_NOT_FOUND"
+
+
+# ---------------------------------------------------------------------------
+# F-06 sync_platform skips planning while the desired state is unchanged
+# ---------------------------------------------------------------------------
+
+
+def make_snapshot_coordinator(max_age_seconds: int = 3600) -> tuple:
+    coordinator, adapter = make_coordinator(discovered_groups={"sg-aws-admin"})
+    repository = DesiredStateRepository(FakeStorageService())
+    coordinator._desired_state_repository = repository
+    coordinator._desired_state_max_age_seconds = max_age_seconds
+    return coordinator, adapter, repository
+
+
+def _replace_snapshot(repository: DesiredStateRepository, snapshot: DesiredStateSnapshot) -> None:
+    # The fake appends on put; drop the previous item so the new one is read.
+    repository._storage.delete(DesiredStateRepository.TABLE, {"PK": "DESIRED_STATE#aws", "SK": "LATEST"})
+    repository.save(snapshot)
+
+
+def _reconcile_calls(adapter: FakeAdapter) -> int:
+    return sum(1 for call in adapter.calls if call[0] == "reconcile_platform")
+
+
+@pytest.mark.unit
+def test_sync_platform_skips_adapter_when_desired_state_unchanged():
+    coordinator, adapter, repository = make_snapshot_coordinator()
+
+    first = coordinator.sync_platform("aws")
+    second = coordinator.sync_platform("aws")
+
+    assert first.data.planning_skipped is False
+    assert second.is_success
+    assert second.data.planning_skipped is True
+    assert second.data.users_synced == first.data.users_synced
+    assert second.data.orphans_found == first.data.orphans_found
+    assert second.data.unchanged_user_count == second.data.users_synced
+    assert _reconcile_calls(adapter) == 1
+    assert repository.get("aws") is not None
+
+
+@pytest.mark.unit
+def test_sync_platform_retries_after_run_with_failed_entitlements():
+    coordinator, adapter, repository = make_snapshot_coordinator()
+    adapter.failed_entitlements = ["sg-aws-admin"]
+
+    first = coordinator.sync_platform("aws")
+    adapter.failed_entitlements = []
+    second = coordinator.sync_platform("aws")
+    third = coordinator.sync_platform("aws")
+
+    assert first.is_success
+    assert first.data.converged is False
+    assert second.data.planning_skipped is False
+    assert third.data.planning_skipped is True
+    assert _reconcile_calls(adapter) == 2
+
+
+@pytest.mark.unit
+def test_sync_platform_retries_after_run_requiring_manual_action():
+    coordinator, adapter, repository = make_snapshot_coordinator()
+    adapter.set_apply_fails()
+
+    first = coordinator.sync_platform("aws")
+    second = coordinator.sync_platform("aws")
+
+    assert first.data.requires_manual_action_count > 0
+    assert second.data.planning_skipped is False
+    assert _reconcile_calls(adapter) == 2
+    assert repository.get("aws") is None
+
+
+@pytest.mark.unit
+def test_sync_platform_reconciles_when_desired_state_changed():
+    coordinator, adapter, repository = make_snapshot_coordinator()
+    coordinator.sync_platform("aws")
+    snapshot = repository.get("aws")
+    _replace_snapshot(repository, DesiredStateSnapshot(platform="aws", state_hash="stale", state=snapshot.state))
+
+    result = coordinator.sync_platform("aws")
+
+    assert result.data.planning_skipped is False
+    assert _reconcile_calls(adapter) == 2
+    assert repository._storage._tables[DesiredStateRepository.TABLE][-1]["state_hash"] == snapshot.state_hash
+
+
+@pytest.mark.unit
+def test_sync_platform_reconciles_when_snapshot_is_too_old():
+    coordinator, adapter, repository = make_snapshot_coordinator(max_age_seconds=60)
+    coordinator.sync_platform("aws")
+    snapshot = repository.get("aws")
+    _replace_snapshot(
+        repository,
+        DesiredStateSnapshot(
+            platform="aws",
+            state_hash=snapshot.state_hash,
+            state=snapshot.state,
+            reconciled_at=datetime.now(UTC) - timedelta(seconds=120),
+        ),
+    )
+
+    coordinator.sync_platform("aws")
+
+    assert _reconcile_calls(adapter) == 2
+
+
+@pytest.mark.unit
+def test_sync_platform_dry_run_never_skips_or_records():
+    coordinator, adapter, repository = make_snapshot_coordinator()
+
+    coordinator.sync_platform("aws", dry_run=True)
+    coordinator.sync_platform("aws", dry_run=True)
+
+    assert _reconcile_calls(adapter) == 2
+    assert repository.get("aws") is None
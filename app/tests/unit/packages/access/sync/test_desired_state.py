@@ -0,0 +1,167 @@
+"""Unit tests for DirectoryMembershipBuilder group resolution and desired_state_hash."""
+
+from typing import Any
+
+import pytest
+
+from infrastructure.directory.models import DirectoryGroup, DirectoryMember, MembershipCheckResult
+from infrastructure.operations import OperationResult
+from packages.access.common.config import EntitlementRule
+from packages.access.sync.desired_state import DirectoryMembershipBuilder, desired_state_hash
+from packages.access.sync.domain import DesiredPlatformState
+from packages.access.sync.policies import EffectivePlatformPolicy, PlanningContext
+
+pytestmark = pytest.mark.unit
+
+
+class CountingDirectory:
+    """Directory double that records batch group lookups."""
+
+    def __init__(self, missing: set[str] | None = None) -> None:
+        self.group_batches: list[list[str]] = []
+        self.fail_batch = False
+        self._missing = missing or set()
+
+    def get_groups_batch(self, slugs: list[str]) -> OperationResult:
+        self.group_batches.append(list(slugs))
+        if self.fail_batch:
+            return OperationResult.transient_error("batch_request_failed")
+        return OperationResult.success(
+            data={
+                slug: DirectoryGroup(group_email=f"{slug}@example.com", group_slug=slug, provider_group_id=f"gid-{slug}")
+                for slug in slugs
+                if slug not in self._missing
+            }
+        )
+
+    def get_group_members(self, group_email: str, include_member_types: set[str] | None = None) -> OperationResult:
+        return OperationResult.success(data=[DirectoryMember(email="Alice@example.com")])
+
+    def get_group_members_batch(self, group_emails: list[str], include_member_types: set[str] | None = None) -> OperationResult:
+        return OperationResult.success(data={email: [DirectoryMember(email="alice@example.com")] for email in group_emails})
+
+    def check_membership(self, group_email: str, user_email: str) -> OperationResult:
+        return OperationResult.success(
+            data=MembershipCheckResult(
+                group_email=group_email,
+                group_slug=group_email.split("@")[0],
+                provider_group_id=None,
+                user_email=user_email,
+                is_member=True,
+            )
+        )
+
+    def get_user_groups(self, user_email: str) -> OperationResult:
+        return OperationResult.success(data=[])
+
+
+def _effective(*tokens: str) -> EffectivePlatformPolicy:
+    return EffectivePlatformPolicy(
+        platform="aws",
+        authn_group_slug="sg-aws-authn",
+        authn_removal_mode="delete",
+        entitlement_rules=[EntitlementRule(group_slug=f"sg-aws-{token}", entitlement_id=token) for token in tokens],
+    )
+
+
+def _builder(directory: Any, ttl: float = 300.0, **kwargs: Any) -> DirectoryMembershipBuilder:
+    return DirectoryMembershipBuilder(directory, group_cache_ttl_seconds=ttl, **kwargs)
+
+
+def test_platform_state_resolves_all_groups_in_one_batch():
+    directory = CountingDirectory()
+
+    result = _builder(directory).build_platform_state_from_effective(_effective("admin", "read"))
+
+    assert result.is_success
+    assert directory.group_batches == [["sg-aws-authn", "sg-aws-admin", "sg-aws-read"]]
+    assert result.data.desired_users == {"alice@example.com"}
+    assert result.data.desired_members_by_entitlement == {"admin": {"alice@example.com"}, "read": {"alice@example.com"}}
+
+
+def test_group_metadata_is_reused_until_ttl_expires(fake_clock):
+    directory = CountingDirectory()
+    builder = _builder(directory, ttl=60, clock=fake_clock)
+
+    builder.build_platform_state_from_effective(_effective("admin"))
+    builder.build_user_state_from_effective("alice@example.com", _effective("admin"))
+    builder.build_platform_state_from_effective(_effective("admin", "read"))
+    fake_clock.now = 61
+    builder.build_platform_state_from_effective(_effective("admin"))
+
+    assert directory.group_batches == [
+        ["sg-aws-authn", "sg-aws-admin"],
+        ["sg-aws-read"],
+        ["sg-aws-authn", "sg-aws-admin"],
+    ]
+
+
+def test_unresolved_groups_are_not_cached():
+    directory = CountingDirectory(missing={"sg-aws-new"})
+    builder = _builder(directory)
+
+    result = builder.build_platform_state_from_effective(_effective("new"))
+    builder.build_platform_state_from_effective(_effective("new"))
+
+    assert result.is_success
+    assert "new" not in result.data.desired_members_by_entitlement
+    assert directory.group_batches[-1] == ["sg-aws-new"]
+
+
+def test_zero_ttl_disables_cache():
+    directory = CountingDirectory()
+    builder = _builder(directory, ttl=0)
+
+    builder.build_platform_state_from_effective(_effective())
+    builder.build_platform_state_from_effective(_effective())
+
+    assert len(directory.group_batches) == 2
+
+
+def test_missing_authn_group_returns_not_found():
+    result = _builder(CountingDirectory(missing={"sg-aws-authn"})).build_platform_state_from_effective(_effective())
+
+    assert result.error_code == "GROUP_NOT_FOUND"
+
+
+def test_batch_failure_propagates():
+    directory = CountingDirectory()
+    directory.fail_batch = True
+
+    result = _builder(directory).build_platform_state_from_effective(_effective("admin"))
+
+    assert not result.is_success
+    assert result.message == "batch_request_failed"
+
+
+def _context(mode: str = "delete") -> PlanningContext:
+    return PlanningContext(
+        platform="aws",
+        authn_removal_mode=mode,
+        entitlement_rules=[EntitlementRule(group_slug="sg-aws-admin", entitlement_id="admin")],
+    )
+
+
+def test_desired_state_hash_ignores_ordering():
+    first = DesiredPlatformState(
+        desired_users={"a@example.com", "b@example.com"},
+        desired_members_by_entitlement={"admin": {"a@example.com", "b@example.com"}, "read": set()},
+        entitlement_slug_by_id={"admin": "sg-aws-admin", "read": "sg-aws-read"},
+    )
+    second = DesiredPlatformState(
+        desired_users={"b@example.com", "a@example.com"},
+        desired_members_by_entitlement={"read": set(), "admin": {"b@example.com", "a@example.com"}},
+        entitlement_slug_by_id={"read": "sg-aws-read", "admin": "sg-aws-admin"},
+    )
+
+    assert desired_state_hash(first, _context()) == desired_state_hash(second, _context())
+
+
+def test_desired_state_hash_changes_with_members_and_policy():
+    state = DesiredPlatformState(desired_users={"a@example.com"}, desired_members_by_entitlement={"admin": {"a@example.com"}})
+    baseline = desired_state_hash(state, _context())
+
+    moved = DesiredPlatformState(desired_users={"a@example.com"}, desired_members_by_entitlement={"admin": set()})
+
+    assert desired_state_hash(moved, _context()) != baseline
+    assert desired_state_hash(state, _context(mode="disable")) != baseline
@@ -0,0 +1,41 @@
+"""Unit tests for the access sync repositories."""
+
+import pytest
+
+from packages.access.sync.domain import DesiredPlatformState, DesiredStateSnapshot
+from packages.access.sync.store import DesiredStateRepository
+from tests.unit.infrastructure.storage.fake_storage import FakeStorageService
+
+pytestmark = pytest.mark.unit
+
+
+def test_desired_state_roundtrip():
+    storage = FakeStorageService()
+    repository = DesiredStateRepository(storage)
+    snapshot = DesiredStateSnapshot(
+        platform="aws",
+        state_hash="abc123",
+        state=DesiredPlatformState(
+            desired_users={"a@example.com", "b@example.com"},
+            desired_members_by_entitlement={"admin": {"a@example.com"}},
+            entitlement_slug_by_id={"admin": "sg-aws-admin"},
+        ),
+        users_synced=3,
+        orphans_found=1,
+    )
+
+    repository.save(snapshot)
+
+    assert repository.get("aws") == snapshot
+    assert isinstance(storage.get("sre_bot_access", {"PK": "DESIRED_STATE#aws", "SK": "LATEST"}).data["state_gz"], bytes)
+
+
+def test_missing_or_corrupt_snapshot_returns_none():
+    storage = FakeStorageService()
+    repository = DesiredStateRepository(storage)
+
+    assert repository.get("aws") is None
+
+    storage.put("sre_bot_access", {"PK": "DESIRED_STATE#aws", "SK": "LATEST", "state_hash": "x", "state_gz": b"junk"})
+
+    assert repository.get("aws") is None
@@ -1,5 +1,6 @@
 """Unit tests for the platform-neutral ``OnCallSyncService`` orchestrator."""
 
+import threading
 from collections.abc import Sequence
 
 import pytest
@@ -56,6 +57,10 @@ class _FakeTarget:
     def __init__(self, *, raise_for: set[str] | None = None) -> None:
         self._raise_for = raise_for or set()
         self.calls: list[tuple[str, list[str]]] = []  # (handle, emails)
+        self.runs = 0
+
+    def begin_run(self) -> None:
+        self.runs += 1
 
     def sync_user_group(self, handle: str, name: str, description: str, emails: Sequence[str]) -> None:
         if handle in self._raise_for:
@@ -171,3 +176,55 @@ def test_multiple_schedules_are_each_synced() -> None:
 
     # Each schedule has one rotation + one schedule group = 2 calls each, 4 total
     assert {h for h, _ in target.calls} == {"a", "b", "oncall-1", "oncall-2"}
+
+
+@pytest.mark.unit
+def test_sync_all_looks_up_schedules_concurrently() -> None:
+    schedules = [
+        _schedule(handle="oncall-1", rotation_handles=["a"]),
+        _schedule(handle="oncall-2", rotation_handles=["b"]),
+    ]
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _BlockingOnCall(_FakeOnCall):
+        def get_current_on_call_email(self, rotation: OnCallRotation) -> str | None:
+            # Both schedule lookups must be in flight at once to get past the barrier.
+            barrier.wait()
+            return super().get_current_on_call_email(rotation)
+
+    on_call = _BlockingOnCall(emails={"a": "alice@x.ca", "b": "bob@x.ca"})
+    target = _FakeTarget()
+
+    OnCallSyncService(on_call=on_call, target=target, schedules=schedules, max_workers=2).sync_all()
+
+    # Writes still happen serially in config order.
+    assert [h for h, _ in target.calls] == ["a", "oncall-1", "b", "oncall-2"]
+
+
+@pytest.mark.unit
+def test_sync_all_lookup_failure_is_isolated_to_its_schedule() -> None:
+    schedules = [
+        _schedule(handle="oncall-1", rotation_handles=["a"]),
+        _schedule(handle="oncall-2", rotation_handles=["b"]),
+    ]
+    on_call = _FakeOnCall(emails={"b": "bob@x.ca"}, raise_for={"a"})
+    target = _FakeTarget()
+
+    OnCallSyncService(on_call=on_call, target=target, schedules=schedules).sync_all()
+
+    assert target.calls == [("b", ["bob@x.ca"]), ("oncall-2", ["bob@x.ca"])]
+
+
+@pytest.mark.unit
+def test_sync_all_begins_one_target_run_per_sync() -> None:
+    schedules = [
+        _schedule(handle="oncall-1", rotation_handles=["a"]),
+        _schedule(handle="oncall-2", rotation_handles=["b"]),
+    ]
+    target = _FakeTarget()
+    service = OnCallSyncService(on_call=_FakeOnCall(emails={"a": "alice@x.ca"}), target=target, schedules=schedules)
+
+    service.sync_all()
+    service.sync_all()
+
+    assert target.runs == 2
@@ -129,3 +129,100 @@ def test_skips_update_when_no_emails_resolve() -> None:
 
     client.usergroups_list.assert_not_called()
     client.usergroups_users_update.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Per-run snapshot, diff-only writes and user ID cache
+# ---------------------------------------------------------------------------
+
+
+def _client_with_groups(*groups: dict) -> MagicMock:
+    client = MagicMock()
+    client.users_lookupByEmail.side_effect = lambda email: {"ok": True, "user": {"id": f"U-{email}"}}
+    client.usergroups_list.return_value = {"usergroups": list(groups)}
+    client.usergroups_create.return_value = {"usergroup": {"id": "S-new"}}
+    return client
+
+
+@pytest.mark.unit
+def test_lists_user_groups_once_per_run() -> None:
+    client = _client_with_groups(
+        {"id": "S1", "handle": "oncall-a", "date_delete": 0, "users": []},
+        {"id": "S2", "handle": "oncall-b", "date_delete": 0, "users": []},
+    )
+    target = SlackUserGroupTarget(client)
+
+    target.begin_run()
+    target.sync_user_group("oncall-a", "A", "desc", ["a@x.ca"])
+    target.sync_user_group("oncall-b", "B", "desc", ["b@x.ca"])
+    target.sync_user_group("oncall-c", "C", "desc", ["c@x.ca"])
+
+    client.usergroups_list.assert_called_once_with(include_disabled=True, include_users=True)
+    assert client.usergroups_users_update.call_count == 3
+
+    target.begin_run()
+    target.sync_user_group("oncall-a", "A", "desc", ["a@x.ca"])
+
+    assert client.usergroups_list.call_count == 2
+
+
+@pytest.mark.unit
+def test_skips_write_when_membership_already_matches() -> None:
+    client = _client_with_groups(
+        {"id": "S1", "handle": "oncall-x", "date_delete": 0, "users": ["U-b@x.ca", "U-a@x.ca"]},
+    )
+
+    _sync(client, ["a@x.ca", "b@x.ca"])
+
+    client.usergroups_users_update.assert_not_called()
+    client.usergroups_enable.assert_not_called()
+
+
+@pytest.mark.unit
+def test_created_group_is_reused_within_the_run() -> None:
+    client = _client_with_groups()
+    target = SlackUserGroupTarget(client)
+
+    target.sync_user_group("oncall-x", "X", "desc", ["a@x.ca"])
+    target.sync_user_group("oncall-x", "X", "desc", ["a@x.ca"])
+
+    client.usergroups_create.assert_called_once()
+    client.usergroups_users_update.assert_called_once_with(usergroup="S-new", users="U-a@x.ca")
+
+
+@pytest.mark.unit
+def test_reenabled_group_is_always_written() -> None:
+    client = _client_with_groups(
+        {"id": "S1", "handle": "oncall-x", "date_delete": 123456, "users": ["U-a@x.ca"]},
+    )
+
+    _sync(client, ["a@x.ca"])
+
+    client.usergroups_enable.assert_called_once_with(usergroup="S1")
+    client.usergroups_users_update.assert_called_once_with(usergroup="S1", users="U-a@x.ca")
+
+
+@pytest.mark.unit
+def test_caches_user_ids_until_ttl_expires(fake_clock) -> None:
+    client = _client_with_groups({"id": "S1", "handle": "oncall-x", "date_delete": 0, "users": []})
+    target = SlackUserGroupTarget(client, user_id_ttl_seconds=60, clock=fake_clock)
+
+    target.sync_user_group("oncall-x", "X", "desc", ["a@x.ca"])
+    target.sync_user_group("oncall-x", "X", "desc", ["A@x.ca"])
+    assert client.users_lookupByEmail.call_count == 1
+
+    fake_clock.now = 60
+    target.sync_user_group("oncall-x", "X", "desc", ["a@x.ca"])
+    assert client.users_lookupByEmail.call_count == 2
+
+
+@pytest.mark.unit
+def test_does_not_cache_failed_user_lookups() -> None:
+    client = _client_with_groups({"id": "S1", "handle": "oncall-x", "date_delete": 0, "users": []})
+    client.users_lookupByEmail.side_effect = [_slack_error("users_not_found"), {"ok": True, "user": {"id": "U1"}}]
+    target = SlackUserGroupTarget(client)
+
+    target.sync_user_group("oncall-x", "X", "desc", ["new@x.ca"])
+    target.sync_user_group("oncall-x", "X", "desc", ["new@x.ca"])
+
+    client.usergroups_users_update.assert_called_once_with(usergroup="S1", users="U1")
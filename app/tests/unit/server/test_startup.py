@@ -0,0 +1,172 @@
+"""Unit tests for the startup phase graph."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from server.startup import (
+    FAILED,
+    PENDING,
+    SUCCEEDED,
+    TIMED_OUT,
+    ReadinessState,
+    StartupPhase,
+    run_startup_phases,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_independent_phases_overlap_and_dependents_wait():
+    barrier = threading.Barrier(2, timeout=5)
+    order: list[str] = []
+
+    def independent(name: str):
+        def run() -> None:
+            # Both phases must be running at once to get past the barrier.
+            barrier.wait()
+            order.append(name)
+
+        return run
+
+    phases = [
+        StartupPhase(name="security", run=independent("security")),
+        StartupPhase(name="directory", run=independent("directory")),
+        StartupPhase(name="features", run=lambda: order.append("features"), depends_on=("security", "directory")),
+    ]
+
+    run_startup_phases(phases, MagicMock())
+
+    assert sorted(order[:2]) == ["directory", "security"]
+    assert order[2] == "features"
+
+
+def test_required_phase_failure_is_reraised_and_dependents_never_start():
+    dependent = MagicMock()
+    readiness = ReadinessState()
+    logger = MagicMock()
+
+    def fail() -> None:
+        raise RuntimeError("directory_warmup_failed: credentials_invalid")
+
+    phases = [
+        StartupPhase(name="directory", run=fail),
+        StartupPhase(name="features", run=dependent, depends_on=("directory",)),
+    ]
+
+    with pytest.raises(RuntimeError, match="directory_warmup_failed"):
+        run_startup_phases(phases, logger, readiness=readiness)
+
+    dependent.assert_not_called()
+    snapshot = readiness.snapshot()
+    assert snapshot["phases"]["directory"]["status"] == FAILED
+    assert snapshot["phases"]["features"]["status"] == PENDING
+    assert logger.error.call_args.args == ("startup_phase_failed",)
+
+
+def test_required_phase_timeout_aborts_startup():
+    release = threading.Event()
+    readiness = ReadinessState()
+    phases = [StartupPhase(name="slow", run=lambda: release.wait(5), timeout_seconds=0.05)]
+
+    try:
+        with pytest.raises(TimeoutError, match="startup_phase_timeout: slow"):
+            run_startup_phases(phases, MagicMock(), readiness=readiness)
+    finally:
+        release.set()
+
+    assert readiness.snapshot()["phases"]["slow"]["status"] == TIMED_OUT
+
+
+def test_optional_phase_finishes_after_required_phases_return():
+    release = threading.Event()
+    finished = threading.Event()
+    readiness = ReadinessState()
+
+    def warmup() -> None:
+        release.wait(5)
+        finished.set()
+
+    phases = [
+        StartupPhase(name="directory", run=lambda: None),
+        StartupPhase(name="directory_warmup", run=warmup, depends_on=("directory",), required=False),
+    ]
+
+    run_startup_phases(phases, MagicMock(), readiness=readiness)
+    readiness.mark_ready()
+
+    assert readiness.is_ready
+    assert not finished.is_set()
+    release.set()
+    assert finished.wait(5)
+    deadline = time.monotonic() + 5
+    while readiness.snapshot()["phases"]["directory_warmup"]["status"] != SUCCEEDED and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert readiness.snapshot()["phases"]["directory_warmup"]["status"] == SUCCEEDED
+
+
+def test_optional_phase_failure_is_logged_not_raised():
+    failed = threading.Event()
+    logger = MagicMock()
+    logger.warning.side_effect = lambda *args, **kwargs: failed.set()
+    readiness = ReadinessState()
+
+    def warmup() -> None:
+        raise RuntimeError("unreachable")
+
+    phases = [StartupPhase(name="warmup", run=warmup, required=False)]
+
+    run_startup_phases(phases, logger, readiness=readiness)
+    readiness.mark_ready()
+
+    assert failed.wait(5)
+    assert logger.warning.call_args.kwargs["startup_phase"] == "warmup"
+    assert readiness.is_ready
+
+
+@pytest.mark.parametrize(
+    ("phases", "message"),
+    [
+        ([StartupPhase(name="a", run=lambda: None), StartupPhase(name="a", run=lambda: None)], "Duplicate"),
+        ([StartupPhase(name="a", run=lambda: None, depends_on=("missing",))], "unknown phase"),
+        (
+            [
+                StartupPhase(name="a", run=lambda: None, depends_on=("b",)),
+                StartupPhase(name="b", run=lambda: None, depends_on=("a",)),
+            ],
+            "cycle",
+        ),
+        (
+            [
+                StartupPhase(name="warmup", run=lambda: None, required=False),
+                StartupPhase(name="a", run=lambda: None, depends_on=("warmup",)),
+            ],
+            "optional phase",
+        ),
+    ],
+)
+def test_invalid_graphs_are_rejected_before_anything_runs(phases, message):
+    with pytest.raises(ValueError, match=message):
+        run_startup_phases(phases, MagicMock())
+
+
+def test_readiness_requires_mark_ready_and_successful_required_phases():
+    readiness = ReadinessState()
+    phase = StartupPhase(name="security", run=lambda: None)
+    readiness.register(phase)
+    readiness.mark_ready()
+
+    assert not readiness.is_ready
+
+    readiness.update("security", SUCCEEDED, duration_seconds=0.123456)
+    assert readiness.is_ready
+    assert readiness.snapshot()["phases"]["security"] == {
+        "status": SUCCEEDED,
+        "required": True,
+        "duration_seconds": 0.1235,
+    }
+
+    readiness.mark_not_ready()
+    assert not readiness.is_ready
@@ -26,6 +26,27 @@ resource "aws_dynamodb_table" "aws_access_requests_table" {
     name = "created_at"
     type = "N"
   }
+
+  attribute {
+    name = "expiry_bucket"
+    type = "S"
+  }
+
+  attribute {
+    name = "end_date_time"
+    type = "N"
+  }
+
+  # Sparse index over unexpired requests: expiry_bucket is removed when a
+  # request is expired, so the revoke job only reads requests still granting access.
+  global_secondary_index {
+    name            = "expiry_bucket-end_date_time-index"
+    hash_key        = "expiry_bucket"
+    range_key       = "end_date_time"
+    projection_type = "ALL"
+    read_capacity   = 1
+    write_capacity  = 1
+  }
 }
 
 resource "aws_dynamodb_table" "sre_bot_access" {
@@ -102,6 +123,25 @@ resource "aws_dynamodb_table" "sre_bot_idempotency" {
 
 }
 
+# Shared rate limiter counters (RATE_LIMIT_STORAGE_URI=dynamodb://sre_bot_rate_limits)
+# One item per key and window, removed by TTL two windows after it closes
+resource "aws_dynamodb_table" "sre_bot_rate_limits" {
+  name           = "sre_bot_rate_limits"
+  hash_key       = "PK"
+  read_capacity  = 5
+  write_capacity = 5
+
+  attribute {
+    name = "PK"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+}
+
 # Audit trail table for operational queries
 resource "aws_dynamodb_table" "sre_bot_audit_trail" {
   name           = "sre_bot_audit_trail"
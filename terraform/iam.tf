@@ -55,7 +55,8 @@ data "aws_iam_policy_document" "sre-bot_secrets_manager" {
       aws_dynamodb_table.incidents_table.arn,
       aws_dynamodb_table.sre_bot_idempotency.arn,
       aws_dynamodb_table.sre_bot_audit_trail.arn,
-      aws_dynamodb_table.sre_bot_retry_records.arn
+      aws_dynamodb_table.sre_bot_retry_records.arn,
+      aws_dynamodb_table.sre_bot_rate_limits.arn
     ]
 
   }